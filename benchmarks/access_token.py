@@ -0,0 +1,27 @@
+import time
+from typing import List, Optional
+
+import jwt
+
+from config import JWT_SECRET_KEY
+
+
+def build_access_token(
+    tenant_id: int,
+    roles: Optional[List[str]] = None,
+    user_id: int = 1,
+    expires_in_seconds: int = 3600,
+) -> str:
+    return jwt.encode(
+        {
+            "sessionId": user_id,
+            "uid": user_id,
+            "roles": roles if roles is not None else ["*"],
+            "username": f"benchmark-{user_id}",
+            "validated": True,
+            "tenantId": tenant_id,
+            "exp": int(time.time()) + expires_in_seconds,
+        },
+        key=JWT_SECRET_KEY,
+        algorithm="HS256",
+    )
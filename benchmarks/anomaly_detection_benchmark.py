@@ -0,0 +1,101 @@
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from application.dtos import DetectAttendanceAnomaliesDTO
+from application.usecases.attendance_anomalies import DetectAttendanceAnomaliesUseCase
+from domain import TimePunchRow
+from domain.attendance_anomaly_kernel import detect_punch_anomalies
+from domain.day_timeline_kernel import punch_columns
+from domain.enums import PunchType
+from infra.database_manager import DatabaseManagerConnection
+from infra.repositories.repository_manager import RepositoryManager
+
+from .synthetic_tenant import SyntheticTenantConfig, SyntheticTenantGenerator, drop_synthetic_tenant
+
+CYCLE = [PunchType.IN, PunchType.BREAK_START, PunchType.BREAK_END, PunchType.OUT]
+FULL_YEAR_PUNCHES = 50_000 * 250 * len(CYCLE)
+
+
+def build_rows(enrollments: int, days: int) -> List[TimePunchRow]:
+    rows = []
+    start = datetime(2026, 1, 1, 8, 0)
+    for enrollment in range(enrollments):
+        for day in range(days):
+            punched_at = start + timedelta(days=day)
+            for punch_type in CYCLE[: 3 if random.random() < 0.02 else len(CYCLE)]:
+                rows.append(
+                    TimePunchRow(len(rows), 1, enrollment, "MAT", punched_at, punch_type, "bench", None)
+                )
+                punched_at += timedelta(minutes=random.randint(0, 240), seconds=random.randint(0, 59))
+    return rows
+
+
+def run_kernel(enrollments: int, days: int) -> None:
+    rows = build_rows(enrollments, days)
+
+    started = time.perf_counter()
+    _, group_keys, punched_at, punch_types = punch_columns(
+        ((row.employee_id, row.matricula, row.punched_at.date()), row.punched_at, row.punch_type) for row in rows
+    )
+    columns_elapsed = time.perf_counter() - started
+    started = time.perf_counter()
+    batch = detect_punch_anomalies(group_keys, punched_at, punch_types, min_gap_seconds=60)
+    kernel_elapsed = time.perf_counter() - started
+
+    per_punch = (columns_elapsed + kernel_elapsed) / len(rows)
+    print(f"punches:            {len(rows)}")
+    print(f"columns (python):   {columns_elapsed:.3f}s")
+    print(f"kernel (numpy):     {kernel_elapsed:.3f}s")
+    print(f"rapid punches:      {batch.rapid_punches.size}")
+    print(f"open days:          {batch.open_groups.size}")
+    print(f"50k x 1 year est.:  {per_punch * FULL_YEAR_PUNCHES:.0f}s (without the database fetch)")
+
+
+def run_database(tenant_id: int, employees: int, months: int, keep: bool) -> None:
+    drop_synthetic_tenant(tenant_id)
+    tenant = SyntheticTenantGenerator(
+        SyntheticTenantConfig(tenant_id=tenant_id, employees=employees, months=months)
+    ).generate()
+    db_manager = DatabaseManagerConnection()
+    try:
+        started = time.perf_counter()
+        found = DetectAttendanceAnomaliesUseCase(RepositoryManager(db_manager)).execute(
+            DetectAttendanceAnomaliesDTO(
+                tenant_id=tenant_id, start_date=tenant.config.start_date, end_date=tenant.end_date
+            )
+        )
+        elapsed = time.perf_counter() - started
+    finally:
+        db_manager.close_session()
+        if not keep:
+            drop_synthetic_tenant(tenant_id)
+
+    print(f"punches:            {tenant.punches_count}")
+    print(f"elapsed:            {elapsed:.3f}s ({tenant.punches_count / elapsed:.0f} punches/s)")
+    print(f"50k x 1 year est.:  {elapsed / tenant.punches_count * FULL_YEAR_PUNCHES:.0f}s")
+    for anomaly_type, count in found.items():
+        print(f"{anomaly_type.value.lower() + ':':<20}{count}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Throughput of the attendance anomaly detection pass")
+    parser.add_argument("--enrollments", type=int, default=5_000)
+    parser.add_argument("--days", type=int, default=22)
+    parser.add_argument("--database", action="store_true", help="Run the whole job against a synthetic tenant")
+    parser.add_argument("--tenant-id", type=int, default=920_004)
+    parser.add_argument("--employees", type=int, default=1_000)
+    parser.add_argument("--months", type=int, default=3)
+    parser.add_argument("--keep", action="store_true", help="Keep the synthetic tenant after the run")
+    args = parser.parse_args()
+
+    if args.database:
+        run_database(args.tenant_id, args.employees, args.months, args.keep)
+    else:
+        run_kernel(args.enrollments, args.days)
+
+
+if __name__ == "__main__":
+    main()
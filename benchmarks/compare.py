@@ -0,0 +1,49 @@
+import argparse
+import json
+from typing import Any, Dict
+
+METRICS = ["p50_ms", "p95_ms", "p99_ms", "throughput_per_s", "error_rate"]
+
+
+def load(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as source:
+        return json.load(source)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare two benchmark harness outputs")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="Percentage of p95 regression that makes the comparison fail",
+    )
+    args = parser.parse_args()
+
+    baseline = load(args.baseline)
+    candidate = load(args.candidate)
+    print(f"baseline:  {baseline.get('commit')}")
+    print(f"candidate: {candidate.get('commit')}")
+
+    regressions = []
+    for name, candidate_summary in candidate["scenarios"].items():
+        baseline_summary = baseline["scenarios"].get(name)
+        if baseline_summary is None:
+            continue
+        print(name)
+        for metric in METRICS:
+            before = baseline_summary[metric]
+            after = candidate_summary[metric]
+            change = (after - before) / before * 100 if before else 0.0
+            print(f"  {metric:<18} {before:>10.2f} -> {after:>10.2f} ({change:+.1f}%)")
+            if metric == "p95_ms" and change > args.threshold:
+                regressions.append(name)
+
+    if regressions:
+        raise SystemExit(f"p95 regression above {args.threshold}%: {', '.join(regressions)}")
+
+
+if __name__ == "__main__":
+    main()
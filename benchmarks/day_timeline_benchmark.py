@@ -0,0 +1,57 @@
+import argparse
+import timeit
+from datetime import datetime, timedelta
+from typing import List
+
+from domain import DayTimeline, TimePunch
+from domain.enums import PunchType
+
+CYCLE = [PunchType.IN, PunchType.BREAK_START, PunchType.BREAK_END, PunchType.OUT]
+
+
+def build_punches(count: int) -> List[TimePunch]:
+    start = datetime(2026, 1, 5, 0, 0)
+    return [
+        TimePunch(
+            tenant_id=1,
+            employee_id=1,
+            matricula="MAT-0001",
+            punched_at=start + timedelta(seconds=index * 20),
+            punch_type=CYCLE[index % len(CYCLE)],
+        )
+        for index in range(count)
+    ]
+
+
+def replay_per_punch(punches: List[TimePunch]) -> None:
+    for index in range(1, len(punches) + 1):
+        DayTimeline(punches[:index]).minutes()
+
+
+def append_per_punch(punches: List[TimePunch]) -> None:
+    timeline = DayTimeline()
+    for punch in punches:
+        timeline.append(punch.punched_at, punch.punch_type)
+        timeline.minutes()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="DayTimeline micro-benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[4, 16, 64, 256, 1024])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'punches':>8} {'build (us)':>12} {'replay/punch (ms)':>18} {'append/punch (ms)':>18}")
+    for size in args.sizes:
+        punches = build_punches(size)
+        number = max(1, 2048 // size)
+        build = min(timeit.repeat(lambda: DayTimeline(punches), number=number, repeat=args.repeat))
+        replay = min(timeit.repeat(lambda: replay_per_punch(punches), number=1, repeat=args.repeat))
+        append = min(timeit.repeat(lambda: append_per_punch(punches), number=1, repeat=args.repeat))
+        print(
+            f"{size:>8} {build / number * 1e6:>12.1f} {replay * 1e3:>18.2f} {append * 1e3:>18.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+from domain import DayTimeline, TimePunch
+from domain.day_timeline_kernel import compute_day_timelines, punch_columns
+from domain.enums import PunchType
+
+CYCLE = [PunchType.IN, PunchType.BREAK_START, PunchType.BREAK_END, PunchType.OUT]
+
+
+def build_rows(days: int, punches_per_day: int) -> List[Tuple[int, datetime, PunchType]]:
+    rows = []
+    start = datetime(2026, 1, 1, 8, 0)
+    for day in range(days):
+        punched_at = start + timedelta(days=day % 365)
+        for index in range(punches_per_day):
+            punched_at += timedelta(minutes=random.randint(30, 240))
+            rows.append((day, punched_at, CYCLE[index % len(CYCLE)]))
+    random.shuffle(rows)
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Scalar vs vectorized day timeline computation")
+    parser.add_argument("--days", type=int, default=100_000)
+    parser.add_argument("--punches-per-day", type=int, default=4)
+    args = parser.parse_args()
+
+    rows = build_rows(args.days, args.punches_per_day)
+
+    started = time.perf_counter()
+    by_day = {}
+    for day, punched_at, punch_type in rows:
+        by_day.setdefault(day, []).append(
+            TimePunch(
+                tenant_id=1,
+                employee_id=1,
+                matricula="MAT-0001",
+                punched_at=punched_at,
+                punch_type=punch_type,
+            )
+        )
+    scalar = {day: DayTimeline(punches).minutes() for day, punches in by_day.items()}
+    scalar_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    keys, group_keys, punched_at, punch_types = punch_columns(rows)
+    columns_elapsed = time.perf_counter() - started
+    started = time.perf_counter()
+    batch = compute_day_timelines(group_keys, punched_at, punch_types)
+    kernel_elapsed = time.perf_counter() - started
+
+    mismatches = sum(
+        1
+        for index, code in enumerate(batch.group_keys)
+        if scalar[keys[code]]
+        != (
+            int(batch.worked_minutes[index]),
+            int(batch.break_minutes[index]),
+            bool(batch.is_complete[index]),
+        )
+    )
+
+    print(f"punches:            {len(rows)}")
+    print(f"scalar:             {scalar_elapsed:.3f}s")
+    print(f"columns (python):   {columns_elapsed:.3f}s")
+    print(f"kernel (numpy):     {kernel_elapsed:.3f}s")
+    print(f"mismatches:         {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+import argparse
+import json
+import platform
+import random
+import subprocess
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi.testclient import TestClient
+from httpx import Response
+
+from api.app import create_app
+
+from .access_token import build_access_token
+from .stats import LatencyRecorder
+from .synthetic_tenant import (
+    SyntheticTenant,
+    SyntheticTenantConfig,
+    SyntheticTenantGenerator,
+    drop_synthetic_tenant,
+)
+
+PUNCH_CYCLE = ["IN", "BREAK_START", "BREAK_END", "OUT"]
+PUNCH_CYCLE_HOURS = [8, 12, 13, 17]
+
+
+class BenchmarkHarness:
+    def __init__(self, tenant: SyntheticTenant, iterations: int, seed: int):
+        self.tenant = tenant
+        self.iterations = iterations
+        self.random = random.Random(seed)
+        self.client = TestClient(create_app())
+        self.client.headers["Authorization"] = (
+            f"Bearer {build_access_token(tenant.config.tenant_id)}"
+        )
+
+    def run(self, scenarios: List[str]) -> Dict[str, Dict[str, Any]]:
+        available: Dict[str, Callable[[int], Response]] = {
+            "create_time_punch": self.__create_time_punch,
+            "recalculate_daily_summary": self.__recalculate_daily_summary,
+            "bank_hours_balance": self.__bank_hours_balance,
+            "list_time_punches": self.__list_time_punches,
+            "list_daily_attendance_summaries": self.__list_daily_attendance_summaries,
+            "list_bank_hours_ledgers": self.__list_bank_hours_ledgers,
+            "monthly_timesheet": self.__monthly_timesheet,
+        }
+        results = {}
+        for name in scenarios:
+            recorder = LatencyRecorder(name)
+            for iteration in range(self.iterations):
+                started = time.perf_counter()
+                response = available[name](iteration)
+                recorder.record(
+                    time.perf_counter() - started,
+                    failed=response.status_code >= 400,
+                )
+            results[name] = recorder.summarize()
+        return results
+
+    def __enrollment(self):
+        return self.random.choice(self.tenant.enrollments)
+
+    def __work_date(self):
+        offset = self.random.randint(0, (self.tenant.end_date - self.tenant.config.start_date).days)
+        return self.tenant.config.start_date + timedelta(days=offset)
+
+    def __create_time_punch(self, iteration: int) -> Response:
+        enrollments = self.tenant.enrollments
+        employee_id, matricula = enrollments[iteration % len(enrollments)]
+        cycle = (iteration // len(enrollments)) % len(PUNCH_CYCLE)
+        day = iteration // (len(enrollments) * len(PUNCH_CYCLE))
+        punched_at = datetime.combine(
+            self.tenant.end_date + timedelta(days=1 + day), datetime.min.time()
+        ) + timedelta(hours=PUNCH_CYCLE_HOURS[cycle])
+        return self.client.post(
+            "/time-punches",
+            json={
+                "tenantId": self.tenant.config.tenant_id,
+                "employeeId": employee_id,
+                "matricula": matricula,
+                "punchedAt": punched_at.isoformat(),
+                "punchType": PUNCH_CYCLE[cycle],
+                "source": "benchmark",
+            },
+        )
+
+    def __recalculate_daily_summary(self, iteration: int) -> Response:
+        _ = iteration
+        employee_id, matricula = self.__enrollment()
+        return self.client.post(
+            "/daily-attendance-summaries/recalculate",
+            json={
+                "tenantId": self.tenant.config.tenant_id,
+                "employeeId": employee_id,
+                "matricula": matricula,
+                "workDate": self.__work_date().isoformat(),
+            },
+        )
+
+    def __bank_hours_balance(self, iteration: int) -> Response:
+        _ = iteration
+        employee_id, matricula = self.__enrollment()
+        return self.client.get(
+            "/bank-hours-ledgers/balance",
+            params={
+                "employeeId": employee_id,
+                "matricula": matricula,
+                "untilDate": self.tenant.end_date.isoformat(),
+            },
+        )
+
+    def __list_time_punches(self, iteration: int) -> Response:
+        _ = iteration
+        employee_id, matricula = self.__enrollment()
+        return self.client.get(
+            "/time-punches",
+            params={
+                "employeeId": employee_id,
+                "matricula": matricula,
+                "startAt": datetime.combine(
+                    self.tenant.config.start_date, datetime.min.time()
+                ).isoformat(),
+                "endAt": datetime.combine(self.tenant.end_date, datetime.max.time()).isoformat(),
+                "perPage": 100,
+            },
+        )
+
+    def __list_daily_attendance_summaries(self, iteration: int) -> Response:
+        work_date = self.__work_date()
+        return self.client.get(
+            "/daily-attendance-summaries",
+            params={
+                "startDate": work_date.isoformat(),
+                "endDate": work_date.isoformat(),
+                "page": iteration % 3,
+                "perPage": 100,
+            },
+        )
+
+    def __list_bank_hours_ledgers(self, iteration: int) -> Response:
+        _ = iteration
+        employee_id, matricula = self.__enrollment()
+        return self.client.get(
+            "/bank-hours-ledgers",
+            params={"employeeId": employee_id, "matricula": matricula, "perPage": 100},
+        )
+
+    def __monthly_timesheet(self, iteration: int) -> Response:
+        _ = iteration
+        employee_id, matricula = self.__enrollment()
+        work_date = self.__work_date()
+        return self.client.get(
+            "/timesheets/monthly",
+            params={
+                "employeeId": employee_id,
+                "matricula": matricula,
+                "year": work_date.year,
+                "month": work_date.month,
+            },
+        )
+
+
+SCENARIOS = [
+    "create_time_punch",
+    "recalculate_daily_summary",
+    "bank_hours_balance",
+    "list_time_punches",
+    "list_daily_attendance_summaries",
+    "list_bank_hours_ledgers",
+    "monthly_timesheet",
+]
+
+
+def current_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the benchmark harness against a synthetic tenant")
+    parser.add_argument("--tenant-id", type=int, default=900_001)
+    parser.add_argument("--employees", type=int, default=200)
+    parser.add_argument("--months", type=int, default=3)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--output", default="bench_output.json")
+    parser.add_argument("--keep", action="store_true", help="Keep the synthetic tenant after the run")
+    args = parser.parse_args()
+
+    config = SyntheticTenantConfig(
+        tenant_id=args.tenant_id,
+        employees=args.employees,
+        months=args.months,
+        seed=args.seed,
+    )
+    drop_synthetic_tenant(args.tenant_id)
+    tenant = SyntheticTenantGenerator(config).generate()
+    try:
+        scenarios = BenchmarkHarness(tenant, args.iterations, args.seed).run(args.scenarios)
+    finally:
+        if not args.keep:
+            drop_synthetic_tenant(args.tenant_id)
+
+    result = {
+        "commit": current_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "scale": {
+            "employees": args.employees,
+            "months": args.months,
+            "punches": tenant.punches_count,
+            "adjustments": tenant.adjustments_count,
+            "iterations": args.iterations,
+        },
+        "scenarios": scenarios,
+    }
+    with open(args.output, "w", encoding="utf-8") as output:
+        json.dump(result, output, indent=2)
+
+    for name, summary in scenarios.items():
+        print(
+            f"{name:<34} p50={summary['p50_ms']:8.2f}ms p95={summary['p95_ms']:8.2f}ms "
+            f"p99={summary['p99_ms']:8.2f}ms {summary['throughput_per_s']:8.1f}/s "
+            f"errors={summary['errors']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+import argparse
+import json
+import timeit
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+from pydantic import TypeAdapter
+
+from api.schemas import FastJSONResponse, PaginatedResponse, TimePunchResponse
+from domain import TimePunch, TimePunchRow
+from domain.enums import PunchType
+
+CYCLE = [PunchType.IN, PunchType.BREAK_START, PunchType.BREAK_END, PunchType.OUT]
+
+response_adapter = TypeAdapter(PaginatedResponse[TimePunchResponse])
+
+
+def build_punches(count: int) -> List[TimePunch]:
+    start = datetime(2026, 1, 5, 8, 0, tzinfo=timezone.utc)
+    punches = []
+    for index in range(count):
+        punch = TimePunch(
+            tenant_id=1,
+            employee_id=index // 4,
+            matricula=f"MAT-{index // 4:06d}",
+            punched_at=start + timedelta(minutes=index * 7),
+            punch_type=CYCLE[index % len(CYCLE)],
+            source="terminal",
+            note=None,
+        )
+        punch.id = index + 1
+        punches.append(punch)
+    return punches
+
+
+def build_rows(punches: List[TimePunch]) -> List[TimePunchRow]:
+    return [
+        TimePunchRow(
+            punch.id,
+            punch.tenant_id,
+            punch.employee_id,
+            punch.matricula,
+            punch.punched_at,
+            punch.punch_type,
+            punch.source,
+            punch.note,
+        )
+        for punch in punches
+    ]
+
+
+def render_response_model(punches: List[TimePunch]) -> bytes:
+    # Mirrors the previous path: controller dataclasses, then response_model validation
+    # and serialization, then JSONResponse.render.
+    response = PaginatedResponse(
+        data=[
+            TimePunchResponse(
+                id=punch.id,
+                tenantId=punch.tenant_id,
+                employeeId=punch.employee_id,
+                matricula=punch.matricula,
+                punchedAt=punch.punched_at,
+                punchType=punch.punch_type.value,
+                source=punch.source,
+                note=punch.note,
+            )
+            for punch in punches
+        ],
+        count=len(punches),
+        page=0,
+    )
+    content = response_adapter.dump_python(response_adapter.validate_python(response), mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+
+def render_rows(rows: List[TimePunchRow]) -> bytes:
+    data: List[Dict[str, Any]] = [
+        {
+            "id": row.id,
+            "tenantId": row.tenant_id,
+            "employeeId": row.employee_id,
+            "matricula": row.matricula,
+            "punchedAt": row.punched_at,
+            "punchType": row.punch_type,
+            "source": row.source,
+            "note": row.note,
+        }
+        for row in rows
+    ]
+    return FastJSONResponse({"data": data, "count": len(rows), "page": 0}).body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="List response serialization: response_model vs orjson rows")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'rows':>6} {'response_model (ms)':>20} {'orjson rows (ms)':>17} {'speedup':>8}")
+    for size in args.sizes:
+        punches = build_punches(size)
+        rows = build_rows(punches)
+        if json.loads(render_response_model(punches)) != json.loads(render_rows(rows)):
+            raise SystemExit(f"payloads differ for {size} rows")
+
+        number = max(1, 2000 // size)
+        current = min(timeit.repeat(lambda: render_response_model(punches), number=number, repeat=args.repeat))
+        fast = min(timeit.repeat(lambda: render_rows(rows), number=number, repeat=args.repeat))
+        print(
+            f"{size:>6} {current / number * 1e3:>20.3f} {fast / number * 1e3:>17.3f} "
+            f"{current / fast:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import argparse
+import os
+import time
+from datetime import date
+
+from infra.jobs import ParallelRecalculationExecutor
+from infra.mappers import import_mappers
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Scaling of the parallel recalculation from 1 to N worker processes"
+    )
+    parser.add_argument("--tenant-id", type=int, required=True)
+    parser.add_argument("--start-date", type=date.fromisoformat, required=True)
+    parser.add_argument("--end-date", type=date.fromisoformat, required=True)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    import_mappers()
+
+    workers_to_try = sorted({1, *[2**power for power in range(1, 8)], args.max_workers})
+    workers_to_try = [workers for workers in workers_to_try if workers <= args.max_workers]
+
+    baseline = None
+    print(f"{'workers':>8} {'seconds':>10} {'summaries/s':>12} {'speedup':>8} {'errors':>7}")
+    for workers in workers_to_try:
+        started = time.perf_counter()
+        report = ParallelRecalculationExecutor(workers=workers).execute(
+            tenant_id=args.tenant_id,
+            start_date=args.start_date,
+            end_date=args.end_date,
+        )
+        elapsed = time.perf_counter() - started
+        baseline = baseline or elapsed
+        print(
+            f"{workers:>8} {elapsed:>10.2f} {report.summaries_count / elapsed:>12.1f} "
+            f"{baseline / elapsed:>8.2f} {len(report.errors):>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
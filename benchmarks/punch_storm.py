@@ -0,0 +1,268 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from api.app import create_app
+from infra.database_manager import get_pool_status
+
+from .access_token import build_access_token
+from .harness import current_commit
+from .stats import LatencyRecorder
+from .synthetic_tenant import (
+    SyntheticTenant,
+    SyntheticTenantConfig,
+    SyntheticTenantGenerator,
+    drop_synthetic_tenant,
+)
+
+SHIFTS = [("shift_start", "IN", 8), ("shift_end", "OUT", 17)]
+
+
+@dataclass
+class StormConfig:
+    storm_date: date
+    tenants: int = 3
+    employees: int = 2000
+    window_minutes: float = 10.0
+    time_scale: float = 60.0
+    retry_rate: float = 0.05
+    max_concurrency: int = 200
+    timeout_seconds: float = 10.0
+    first_tenant_id: int = 910_001
+    seed: int = 42
+
+
+@dataclass
+class ScheduledPunch:
+    send_at: float
+    tenant_id: int
+    employee_id: int
+    matricula: str
+    punched_at: datetime
+    punch_type: str
+    is_retry: bool = False
+
+
+class PoolSampler:
+    def __init__(self, interval_seconds: float = 0.05):
+        self.interval_seconds = interval_seconds
+        self.samples: List[Dict[str, int]] = []
+        self.__task: Optional[asyncio.Task] = None
+
+    async def __sample(self) -> None:
+        while True:
+            self.samples.append(get_pool_status())
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        self.__task = asyncio.create_task(self.__sample())
+
+    async def stop(self) -> Dict[str, Any]:
+        if self.__task is not None:
+            self.__task.cancel()
+            try:
+                await self.__task
+            except asyncio.CancelledError:
+                pass
+
+        if len(self.samples) == 0:
+            return {}
+        capacity = self.samples[0]["size"] + self.samples[0]["max_overflow"]
+        saturated = [sample for sample in self.samples if sample["checked_out"] >= capacity]
+        return {
+            "capacity": capacity,
+            "max_checked_out": max(sample["checked_out"] for sample in self.samples),
+            "max_overflow": max(sample["overflow"] for sample in self.samples),
+            "saturated_ratio": len(saturated) / len(self.samples),
+            "samples": len(self.samples),
+        }
+
+
+class PunchStorm:
+    def __init__(self, config: StormConfig, tenants: List[SyntheticTenant]):
+        self.config = config
+        self.tenants = tenants
+        self.random = random.Random(config.seed)
+
+    def schedule(self, punch_type: str, hour: int) -> List[ScheduledPunch]:
+        window_seconds = self.config.window_minutes * 60
+        shift_at = datetime.combine(self.config.storm_date, datetime.min.time()) + timedelta(hours=hour)
+        scheduled: List[ScheduledPunch] = []
+        for tenant in self.tenants:
+            for employee_id, matricula in tenant.enrollments:
+                offset = min(max(self.random.gauss(window_seconds / 2, window_seconds / 6), 0), window_seconds)
+                punch = ScheduledPunch(
+                    send_at=offset / self.config.time_scale,
+                    tenant_id=tenant.config.tenant_id,
+                    employee_id=employee_id,
+                    matricula=matricula,
+                    punched_at=shift_at + timedelta(seconds=int(offset)),
+                    punch_type=punch_type,
+                )
+                scheduled.append(punch)
+                if self.random.random() < self.config.retry_rate:
+                    scheduled.append(
+                        replace(
+                            punch,
+                            send_at=punch.send_at + self.random.uniform(0.05, 1.0),
+                            is_retry=True,
+                        )
+                    )
+        return sorted(scheduled, key=lambda item: item.send_at)
+
+    async def run_phase(
+        self, client: httpx.AsyncClient, name: str, scheduled: List[ScheduledPunch]
+    ) -> Dict[str, Any]:
+        recorder = LatencyRecorder(name)
+        statuses: Counter = Counter()
+        retry_statuses: Counter = Counter()
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+        tokens = {
+            tenant.config.tenant_id: f"Bearer {build_access_token(tenant.config.tenant_id)}"
+            for tenant in self.tenants
+        }
+
+        async def send(punch: ScheduledPunch) -> None:
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    response = await client.post(
+                        "/time-punches",
+                        headers={"Authorization": tokens[punch.tenant_id]},
+                        json={
+                            "tenantId": punch.tenant_id,
+                            "employeeId": punch.employee_id,
+                            "matricula": punch.matricula,
+                            "punchedAt": punch.punched_at.isoformat(),
+                            "punchType": punch.punch_type,
+                            "source": "terminal",
+                        },
+                    )
+                    status = str(response.status_code)
+                except httpx.HTTPError as error:
+                    status = type(error).__name__
+
+                # A retried punch that already landed is expected to conflict.
+                failed = not (status == "201" or (punch.is_retry and status == "409"))
+                recorder.record(time.perf_counter() - started, failed=failed)
+                (retry_statuses if punch.is_retry else statuses)[status] += 1
+
+        sampler = PoolSampler()
+        sampler.start()
+        started_at = time.perf_counter()
+        tasks = []
+        for punch in scheduled:
+            delay = punch.send_at - (time.perf_counter() - started_at)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(send(punch)))
+        await asyncio.gather(*tasks)
+
+        return {
+            **recorder.summarize(),
+            "requests": len(scheduled),
+            "retries": sum(1 for punch in scheduled if punch.is_retry),
+            "statuses": dict(statuses),
+            "retry_statuses": dict(retry_statuses),
+            "db_pool": await sampler.stop(),
+        }
+
+    async def run(self, base_url: Optional[str]) -> Dict[str, Any]:
+        if base_url is None:
+            transport = httpx.ASGITransport(app=create_app())
+            client = httpx.AsyncClient(
+                transport=transport,
+                base_url="http://punch-storm",
+                timeout=self.config.timeout_seconds,
+            )
+        else:
+            client = httpx.AsyncClient(base_url=base_url, timeout=self.config.timeout_seconds)
+
+        phases = {}
+        async with client:
+            for name, punch_type, hour in SHIFTS:
+                phases[name] = await self.run_phase(client, name, self.schedule(punch_type, hour))
+                if base_url is not None:
+                    phases[name]["db_pool"] = {"note": "pool is sampled only in-process"}
+        return phases
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Shift-change punch storm load test")
+    parser.add_argument("--base-url", default=None, help="Target a running uvicorn instead of in-process")
+    parser.add_argument("--storm-date", type=date.fromisoformat, default=date(2026, 6, 1))
+    parser.add_argument("--tenants", type=int, default=3)
+    parser.add_argument("--employees", type=int, default=2000, help="Employees of the largest tenant")
+    parser.add_argument("--window-minutes", type=float, default=10.0)
+    parser.add_argument("--time-scale", type=float, default=60.0, help="Replay speed-up of the window")
+    parser.add_argument("--retry-rate", type=float, default=0.05)
+    parser.add_argument("--max-concurrency", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="bench_output.json")
+    parser.add_argument("--keep", action="store_true")
+    args = parser.parse_args()
+
+    config = StormConfig(
+        storm_date=args.storm_date,
+        tenants=args.tenants,
+        employees=args.employees,
+        window_minutes=args.window_minutes,
+        time_scale=args.time_scale,
+        retry_rate=args.retry_rate,
+        max_concurrency=args.max_concurrency,
+        seed=args.seed,
+    )
+
+    tenants = []
+    for index in range(config.tenants):
+        tenant_id = config.first_tenant_id + index
+        drop_synthetic_tenant(tenant_id)
+        # Mixed tenant sizes: the largest one gets `employees`, the others shrink by half.
+        tenants.append(
+            SyntheticTenantGenerator(
+                SyntheticTenantConfig(
+                    tenant_id=tenant_id,
+                    employees=max(config.employees // (2**index), 1),
+                    months=0,
+                    start_date=config.storm_date,
+                    seed=config.seed + index,
+                )
+            ).generate()
+        )
+
+    try:
+        phases = asyncio.run(PunchStorm(config, tenants).run(args.base_url))
+    finally:
+        if not args.keep:
+            for tenant in tenants:
+                drop_synthetic_tenant(tenant.config.tenant_id)
+
+    result = {
+        "commit": current_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "mode": "in-process" if args.base_url is None else args.base_url,
+        "config": {**config.__dict__, "storm_date": config.storm_date.isoformat()},
+        "scenarios": phases,
+    }
+    with open(args.output, "w", encoding="utf-8") as output:
+        json.dump(result, output, indent=2)
+
+    for name, summary in phases.items():
+        print(
+            f"{name:<12} requests={summary['requests']} p50={summary['p50_ms']:.1f}ms "
+            f"p95={summary['p95_ms']:.1f}ms p99={summary['p99_ms']:.1f}ms "
+            f"error_rate={summary['error_rate']:.2%} statuses={summary['statuses']} "
+            f"db_pool={summary['db_pool']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from application.repositories import RepositoryManagerInterface
+from infra.database_manager import DatabaseManagerConnection
+from infra.repositories.repository_manager import RepositoryManager
+
+from .synthetic_tenant import SyntheticTenantConfig, SyntheticTenantGenerator, drop_synthetic_tenant
+
+ROWS_PER_REPORT = 100_000
+
+Load = Callable[[RepositoryManagerInterface, int], Any]
+
+
+def loaders(tenant_id: int) -> Dict[str, Dict[str, Load]]:
+    # Each pair reads the same rows: ORM entities (find_all) against Core rows in NamedTuple read models
+    # (find_all_rows).
+    return {
+        "time_punches": {
+            "orm": lambda manager, size: manager.time_punch_repository().find_all(
+                page=0, per_page=size, tenant_id=tenant_id
+            ),
+            "rows": lambda manager, size: manager.time_punch_repository().find_all_rows(
+                page=0, per_page=size, tenant_id=tenant_id
+            ),
+        },
+        "daily_attendance_summaries": {
+            "orm": lambda manager, size: manager.daily_attendance_summary_repository().find_all(
+                page=0, per_page=size, tenant_id=tenant_id
+            ),
+            "rows": lambda manager, size: manager.daily_attendance_summary_repository().find_all_rows(
+                page=0, per_page=size, tenant_id=tenant_id
+            ),
+        },
+        "bank_hours_ledgers": {
+            "orm": lambda manager, size: manager.bank_hours_ledger_repository().find_all(
+                page=0, per_page=size, tenant_id=tenant_id
+            ),
+            "rows": lambda manager, size: manager.bank_hours_ledger_repository().find_all_rows(
+                page=0, per_page=size, tenant_id=tenant_id
+            ),
+        },
+    }
+
+
+def measure_time(load: Load, size: int, repeat: int) -> Dict[str, float]:
+    best = float("inf")
+    rows = 0
+    for _ in range(repeat):
+        db_manager = DatabaseManagerConnection()
+        try:
+            started = time.perf_counter()
+            result = load(RepositoryManager(db_manager), size)
+            best = min(best, time.perf_counter() - started)
+            rows = len(result.data)
+        finally:
+            db_manager.close_session()
+    return {"rows": rows, "seconds": best, "rows_per_s": rows / best if best > 0 else 0.0}
+
+
+def measure_memory(load: Load, size: int) -> Dict[str, float]:
+    db_manager = DatabaseManagerConnection()
+    try:
+        gc.collect()
+        tracemalloc.start()
+        result = load(RepositoryManager(db_manager), size)
+        # Retained memory counts what stays alive while the result is in use, including the session identity
+        # map that keeps ORM entities tracked.
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        rows = max(len(result.data), 1)
+    finally:
+        db_manager.close_session()
+    scale = ROWS_PER_REPORT / rows / (1024 * 1024)
+    return {"retained_mb": retained * scale, "peak_mb": peak * scale}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare ORM entities and NamedTuple read models on list paths")
+    parser.add_argument("--tenant-id", type=int, default=920_003)
+    parser.add_argument("--employees", type=int, default=400)
+    parser.add_argument("--months", type=int, default=3)
+    parser.add_argument("--rows", type=int, default=ROWS_PER_REPORT, help="Rows read per call")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--keep", action="store_true", help="Keep the synthetic tenant after the run")
+    args = parser.parse_args()
+
+    drop_synthetic_tenant(args.tenant_id)
+    SyntheticTenantGenerator(
+        SyntheticTenantConfig(tenant_id=args.tenant_id, employees=args.employees, months=args.months)
+    ).generate()
+    try:
+        print(
+            f"{'path':<28} {'mode':<5} {'rows':>7} {'rows/s':>10} {'MB/100k kept':>13} {'MB/100k peak':>13}"
+        )
+        for name, paths in loaders(args.tenant_id).items():
+            results: List[Dict[str, float]] = []
+            for mode, load in paths.items():
+                timing = measure_time(load, args.rows, args.repeat)
+                memory = measure_memory(load, args.rows)
+                results.append(timing)
+                print(
+                    f"{name:<28} {mode:<5} {timing['rows']:>7.0f} {timing['rows_per_s']:>10.0f} "
+                    f"{memory['retained_mb']:>13.1f} {memory['peak_mb']:>13.1f}"
+                )
+            orm, rows = results
+            if orm["rows_per_s"] > 0:
+                print(f"{'':<28} rows/orm throughput {rows['rows_per_s'] / orm['rows_per_s']:.1f}x")
+    finally:
+        if not args.keep:
+            drop_synthetic_tenant(args.tenant_id)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+from api.routers import ROUTER_MODULES
+from infra.mappers import MAPPER_MODULES
+
+from .stats import percentile
+
+SRC_DIRECTORY = Path(__file__).resolve().parent.parent / "src"
+
+# Runs in a fresh interpreter so every sample pays the same imports a new uvicorn worker pays.
+COLD_START_SCRIPT = """
+import json
+import time
+
+started = time.perf_counter()
+from api.app import create_app
+imported = time.perf_counter()
+app = create_app()
+created = time.perf_counter()
+
+from fastapi.testclient import TestClient
+
+client = TestClient(app)
+client.get("/ping")
+first_request = time.perf_counter()
+client.get("/doc/api.json")
+first_openapi = time.perf_counter()
+
+print(json.dumps({
+    "import": imported - started,
+    "create_app": created - imported,
+    "first_request": first_request - created,
+    "ready": first_request - started,
+    "first_openapi": first_openapi - first_request,
+}))
+"""
+
+
+def check_manifests() -> List[str]:
+    problems = []
+    manifests = [
+        (SRC_DIRECTORY / "api" / "routers", ROUTER_MODULES, {"__init__"}),
+        (SRC_DIRECTORY / "infra" / "mappers", MAPPER_MODULES, {"__init__", "mapper_config"}),
+    ]
+    for directory, manifest, ignored in manifests:
+        on_disk = {path.stem for path in directory.glob("*.py")} - ignored
+        for missing in sorted(on_disk - set(manifest)):
+            problems.append(f"{directory.name}/{missing}.py is not listed in the manifest")
+        for stale in sorted(set(manifest) - on_disk):
+            problems.append(f"{directory.name} manifest lists {stale}, which does not exist")
+    return problems
+
+
+def measure_cold_start() -> Dict[str, float]:
+    environment = {**os.environ, "PYTHONPATH": str(SRC_DIRECTORY)}
+    completed = subprocess.run(
+        [sys.executable, "-c", COLD_START_SCRIPT],
+        capture_output=True,
+        check=True,
+        cwd=SRC_DIRECTORY,
+        env=environment,
+        text=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cold start time of a fresh API worker")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    problems = check_manifests()
+    if problems:
+        for problem in problems:
+            print(problem)
+        raise SystemExit(1)
+
+    samples = [measure_cold_start() for _ in range(args.repeat)]
+    summary = {}
+    for phase in samples[0]:
+        ordered = sorted(sample[phase] for sample in samples)
+        summary[phase] = {
+            "p50_ms": percentile(ordered, 50) * 1000,
+            "max_ms": ordered[-1] * 1000,
+        }
+        print(f"{phase:<14} p50={summary[phase]['p50_ms']:8.1f}ms max={summary[phase]['max_ms']:8.1f}ms")
+
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump({"repeat": args.repeat, "phases": summary}, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
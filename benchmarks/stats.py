@@ -0,0 +1,39 @@
+import math
+import time
+from typing import Any, Dict, List
+
+
+def percentile(ordered: List[float], rank: float) -> float:
+    if len(ordered) == 0:
+        return 0.0
+    index = max(0, math.ceil(rank / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+class LatencyRecorder:
+    def __init__(self, name: str):
+        self.name = name
+        self.latencies: List[float] = []
+        self.errors = 0
+        self.started_at = time.perf_counter()
+        self.finished_at = self.started_at
+
+    def record(self, seconds: float, failed: bool = False) -> None:
+        self.latencies.append(seconds)
+        self.finished_at = time.perf_counter()
+        if failed:
+            self.errors += 1
+
+    def summarize(self) -> Dict[str, Any]:
+        ordered = sorted(self.latencies)
+        elapsed = max(self.finished_at - self.started_at, 1e-9)
+        return {
+            "count": len(ordered),
+            "errors": self.errors,
+            "error_rate": self.errors / len(ordered) if ordered else 0.0,
+            "p50_ms": percentile(ordered, 50) * 1000,
+            "p95_ms": percentile(ordered, 95) * 1000,
+            "p99_ms": percentile(ordered, 99) * 1000,
+            "max_ms": (ordered[-1] if ordered else 0.0) * 1000,
+            "throughput_per_s": len(ordered) / elapsed,
+        }
@@ -0,0 +1,286 @@
+import argparse
+import random
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import delete, insert
+
+from infra.database_manager import SessionLocal
+from infra.mappers import import_mappers
+from infra.mappers.attendance_anomaly_mapper import attendance_anomaly
+from infra.mappers.bank_hours_ledger_mapper import bank_hours_ledger
+from infra.mappers.daily_attendance_rollup_mapper import daily_attendance_rollup
+from infra.mappers.daily_attendance_summary_mapper import daily_attendance_summary
+from infra.mappers.enrollment_policy_assignment_mapper import enrollment_policy_assignment
+from infra.mappers.holiday_mapper import holiday
+from infra.mappers.monthly_closing_mapper import monthly_closing
+from infra.mappers.monthly_closing_total_mapper import monthly_closing_total
+from infra.mappers.outbox_event_mapper import outbox_event
+from infra.mappers.resource_version_mapper import resource_version
+from infra.mappers.time_adjustment_item_mapper import time_adjustment_item
+from infra.mappers.time_adjustment_request_mapper import time_adjustment_request
+from infra.mappers.time_punch_archive_mapper import time_punch_archive
+from infra.mappers.time_punch_mapper import time_punch
+from infra.mappers.work_policy_template_mapper import work_policy_template
+
+TEMPLATES = [
+    ("Jornada 8h", 480, 60),
+    ("Jornada 6h", 360, 15),
+    ("Jornada 4h", 240, 0),
+]
+REST_WEEKDAYS = [5, 6]
+
+INSERT_CHUNK_SIZE = 10_000
+SYNTHETIC_TENANT_BASE = 900_000
+EMPLOYEES_PER_TENANT = 100_000
+INT32_MAX = 2**31 - 1
+
+
+@dataclass
+class SyntheticTenantConfig:
+    tenant_id: int
+    employees: int = 100
+    months: int = 3
+    start_date: date = date(2026, 1, 1)
+    incomplete_day_rate: float = 0.02
+    adjustment_rate: float = 0.01
+    seed: int = 42
+
+
+@dataclass
+class SyntheticTenant:
+    config: SyntheticTenantConfig
+    enrollments: List[Tuple[int, str]] = field(default_factory=list)
+    template_ids: List[int] = field(default_factory=list)
+    punches_count: int = 0
+    adjustments_count: int = 0
+
+    @property
+    def end_date(self) -> date:
+        return add_months(self.config.start_date, self.config.months) - timedelta(days=1)
+
+
+def add_months(value: date, months: int) -> date:
+    month_index = value.month - 1 + months
+    return date(value.year + month_index // 12, month_index % 12 + 1, 1)
+
+
+def employee_id_for(tenant_id: int, index: int) -> int:
+    # employee_id columns are 32-bit: each synthetic tenant id owns a slot of EMPLOYEES_PER_TENANT ids starting at
+    # SYNTHETIC_TENANT_BASE, so tenants generated side by side never share an employee id.
+    slot = tenant_id - SYNTHETIC_TENANT_BASE
+    if not 0 <= index < EMPLOYEES_PER_TENANT:
+        raise ValueError(f"Synthetic employee index must be in [0, {EMPLOYEES_PER_TENANT}).")
+    employee_id = slot * EMPLOYEES_PER_TENANT + index
+    if slot < 0 or employee_id > INT32_MAX:
+        raise ValueError(
+            f"Synthetic tenant id must be in [{SYNTHETIC_TENANT_BASE}, "
+            f"{SYNTHETIC_TENANT_BASE + INT32_MAX // EMPLOYEES_PER_TENANT}) to keep employee ids in int32."
+        )
+    return employee_id
+
+
+class SyntheticTenantGenerator:
+    def __init__(self, config: SyntheticTenantConfig):
+        self.config = config
+        self.random = random.Random(config.seed)
+        import_mappers()
+
+    def generate(self) -> SyntheticTenant:
+        tenant = SyntheticTenant(config=self.config)
+        session = SessionLocal()
+        try:
+            tenant.template_ids = list(
+                session.execute(
+                    insert(work_policy_template).returning(work_policy_template.c.id),
+                    [
+                        {
+                            "tenant_id": self.config.tenant_id,
+                            "name": name,
+                            "daily_work_minutes": daily_work_minutes,
+                            "break_minutes": break_minutes,
+                            "rest_weekdays": REST_WEEKDAYS,
+                        }
+                        for name, daily_work_minutes, break_minutes in TEMPLATES
+                    ],
+                ).scalars()
+            )
+
+            assignments: List[Dict[str, Any]] = []
+            for index in range(self.config.employees):
+                employee_id = employee_id_for(self.config.tenant_id, index)
+                matricula = f"MAT-{index:06d}"
+                tenant.enrollments.append((employee_id, matricula))
+                assignments.append(
+                    {
+                        "tenant_id": self.config.tenant_id,
+                        "employee_id": employee_id,
+                        "matricula": matricula,
+                        "template_id": tenant.template_ids[index % len(tenant.template_ids)],
+                        "effective_from": self.config.start_date,
+                        "effective_to": None,
+                    }
+                )
+            session.execute(insert(enrollment_policy_assignment), assignments)
+
+            punches: List[Dict[str, Any]] = []
+            adjustments: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+            for employee_id, matricula in tenant.enrollments:
+                for work_date in self.__work_dates(tenant.end_date):
+                    day_punches = self.__day_punches(work_date)
+                    for punched_at, punch_type in day_punches:
+                        punches.append(
+                            {
+                                "tenant_id": self.config.tenant_id,
+                                "employee_id": employee_id,
+                                "matricula": matricula,
+                                "punched_at": punched_at,
+                                "punch_type": punch_type,
+                                "source": "synthetic",
+                                "note": None,
+                            }
+                        )
+                    if self.random.random() < self.config.adjustment_rate:
+                        adjustments.append(
+                            self.__adjustment(employee_id, matricula, work_date)
+                        )
+
+                if len(punches) >= INSERT_CHUNK_SIZE:
+                    session.execute(insert(time_punch), punches)
+                    tenant.punches_count += len(punches)
+                    punches = []
+
+            if len(punches) > 0:
+                session.execute(insert(time_punch), punches)
+                tenant.punches_count += len(punches)
+
+            for request, item in adjustments:
+                request_id = session.execute(
+                    insert(time_adjustment_request).returning(time_adjustment_request.c.id),
+                    request,
+                ).scalar_one()
+                session.execute(insert(time_adjustment_item), {**item, "request_id": request_id})
+            tenant.adjustments_count = len(adjustments)
+
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+        return tenant
+
+    def __work_dates(self, end_date: date) -> List[date]:
+        work_dates = []
+        current = self.config.start_date
+        while current <= end_date:
+            if current.weekday() < 5:
+                work_dates.append(current)
+            current += timedelta(days=1)
+        return work_dates
+
+    def __day_punches(self, work_date: date) -> List[Tuple[datetime, str]]:
+        start = datetime.combine(work_date, datetime.min.time()) + timedelta(
+            hours=8, minutes=self.random.randint(-15, 15)
+        )
+        punches = [
+            (start, "IN"),
+            (start + timedelta(hours=4, minutes=self.random.randint(-10, 10)), "BREAK_START"),
+            (start + timedelta(hours=5, minutes=self.random.randint(-10, 10)), "BREAK_END"),
+            (start + timedelta(hours=9, minutes=self.random.randint(-20, 40)), "OUT"),
+        ]
+        if self.random.random() < self.config.incomplete_day_rate:
+            punches.pop()
+        return punches
+
+    def __adjustment(
+        self, employee_id: int, matricula: str, work_date: date
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        proposed_at = datetime.combine(work_date, datetime.min.time()) + timedelta(hours=18)
+        request = {
+            "tenant_id": self.config.tenant_id,
+            "employee_id": employee_id,
+            "matricula": matricula,
+            "request_date": work_date,
+            "type": "ADD_PUNCH",
+            "status": self.random.choice(["PENDING", "APPROVED", "REJECTED"]),
+            "reason": "Synthetic adjustment",
+            "created_by": employee_id,
+            "decided_at": None,
+            "decided_by": None,
+            "decision_reason": None,
+        }
+        item = {
+            "tenant_id": self.config.tenant_id,
+            "proposed_punch_type": "OUT",
+            "proposed_punched_at": proposed_at,
+            "original_punch_id": None,
+            "note": "Synthetic adjustment",
+        }
+        return request, item
+
+
+def drop_synthetic_tenant(tenant_id: int) -> None:
+    session = SessionLocal()
+    try:
+        for table in [
+            attendance_anomaly,
+            monthly_closing_total,
+            monthly_closing,
+            time_adjustment_item,
+            time_adjustment_request,
+            bank_hours_ledger,
+            daily_attendance_summary,
+            daily_attendance_rollup,
+            time_punch,
+            time_punch_archive,
+            enrollment_policy_assignment,
+            work_policy_template,
+            holiday,
+            resource_version,
+            outbox_event,
+        ]:
+            session.execute(delete(table).where(table.c.tenant_id == tenant_id))
+        session.commit()
+    finally:
+        session.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic tenant in the local database")
+    parser.add_argument("--tenant-id", type=int, required=True)
+    parser.add_argument("--employees", type=int, default=100)
+    parser.add_argument("--months", type=int, default=3)
+    parser.add_argument("--start-date", type=date.fromisoformat, default=date(2026, 1, 1))
+    parser.add_argument("--incomplete-day-rate", type=float, default=0.02)
+    parser.add_argument("--adjustment-rate", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--drop", action="store_true", help="Remove the tenant data and exit")
+    args = parser.parse_args()
+
+    if args.drop:
+        drop_synthetic_tenant(args.tenant_id)
+        return
+
+    tenant = SyntheticTenantGenerator(
+        SyntheticTenantConfig(
+            tenant_id=args.tenant_id,
+            employees=args.employees,
+            months=args.months,
+            start_date=args.start_date,
+            incomplete_day_rate=args.incomplete_day_rate,
+            adjustment_rate=args.adjustment_rate,
+            seed=args.seed,
+        )
+    ).generate()
+    print(
+        f"tenant_id={args.tenant_id} employees={len(tenant.enrollments)} "
+        f"punches={tenant.punches_count} adjustments={tenant.adjustments_count} "
+        f"period={args.start_date}..{tenant.end_date}"
+    )
+
+
+if __name__ == "__main__":
+    main()
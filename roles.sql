@@ -1,5 +1,17 @@
 WITH required_permissions (name, description) AS (
     VALUES (
+            'attendance_analytics:read',
+            'Visualizar Indicadores de Frequencia'
+        ),
+        (
+            'attendance_anomalies:read',
+            'Visualizar Anomalias de Frequencia'
+        ),
+        (
+            'attendance_changes:read',
+            'Acompanhar Alteracoes de Frequencia em Tempo Real'
+        ),
+        (
             'bank_hours_ledgers:create',
             'Criar Lancamentos de Banco de Horas'
         ),
@@ -43,6 +55,22 @@ WITH required_permissions (name, description) AS (
             'enrollment_policy_assignments:*',
             'Total Acesso a Atribuicoes de Politicas de Jornada'
         ),
+        (
+            'holidays:create',
+            'Criar Feriados'
+        ),
+        (
+            'holidays:read',
+            'Visualizar Feriados'
+        ),
+        (
+            'holidays:write',
+            'Remover Feriados'
+        ),
+        (
+            'holidays:*',
+            'Total Acesso a Feriados'
+        ),
         (
             'time_adjustment_requests:create',
             'Criar Solicitacoes de Ajuste de Ponto'
@@ -1,14 +1,17 @@
 # pylint: disable=unused-argument
 # pyright: reportUnusedFunction=false
+import time
 from http import HTTPStatus
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
+from api.middlewares import CompressionMiddleware
 from api.routers import create_routes
 from application.exceptions import APIError
+from commons import metrics_registry, start_request_metrics
 from infra.mappers import import_mappers
 
 URL_PREFIX = ""
@@ -17,6 +20,29 @@ API_DOC_REDOC = f"{URL_PREFIX}/doc/redoc"
 API_DOC_JSON = f"{URL_PREFIX}/doc/api.json"
 API_VERSION = "V1.0.0"
 
+REQUEST_DURATION = metrics_registry.histogram(
+    "http_request_duration_seconds",
+    "Total request duration",
+    label_names=("method", "route", "status"),
+)
+REQUEST_PHASE_DURATION = metrics_registry.histogram(
+    "http_request_phase_duration_seconds",
+    "Request duration per phase (auth, permission, session, db, app)",
+    label_names=("route", "phase"),
+)
+REQUEST_QUERIES = metrics_registry.histogram(
+    "http_request_db_queries",
+    "SQL statements executed per request",
+    label_names=("route",),
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89),
+)
+REQUEST_ROWS_FETCHED = metrics_registry.histogram(
+    "http_request_db_rows_fetched",
+    "Rows fetched from the database per request",
+    label_names=("route",),
+    buckets=(0, 1, 10, 50, 100, 500, 1000, 5000, 10000),
+)
+
 
 def create_app() -> FastAPI:
     import_mappers()
@@ -54,13 +80,44 @@ def create_app() -> FastAPI:
             content={"detail": response},
         )
 
+    @api.middleware("http")
+    async def request_instrumentation(request: Request, call_next) -> Response:
+        metrics = start_request_metrics()
+        response = await call_next(request)
+        total = time.perf_counter() - metrics.started_at
+
+        route = request.scope.get("route")
+        route_path = getattr(route, "path", "unmatched")
+        phases = {**metrics.phases, "db": metrics.query_seconds}
+        phases["app"] = max(total - sum(phases.values()), 0.0)
+
+        REQUEST_DURATION.observe(
+            total,
+            method=request.method,
+            route=route_path,
+            status=str(response.status_code),
+        )
+        for phase, seconds in phases.items():
+            REQUEST_PHASE_DURATION.observe(seconds, route=route_path, phase=phase)
+        REQUEST_QUERIES.observe(metrics.query_count, route=route_path)
+        REQUEST_ROWS_FETCHED.observe(metrics.rows_fetched, route=route_path)
+
+        response.headers["Server-Timing"] = ", ".join(
+            [f"{phase};dur={seconds * 1000:.2f}" for phase, seconds in phases.items()]
+            + [f"total;dur={total * 1000:.2f}"]
+        )
+        response.headers["X-DB-Queries"] = str(metrics.query_count)
+        return response
+
     api.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["ETag", "Server-Timing", "X-DB-Queries"],
     )
+    api.add_middleware(CompressionMiddleware, minimum_size=1024)
 
     create_routes(api, URL_PREFIX)
 
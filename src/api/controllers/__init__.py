@@ -1,7 +1,13 @@
 # pyright: reportUnusedImport=false
+from .attendance_analytics_controller import AttendanceAnalyticsController
+from .attendance_anomalies_controller import AttendanceAnomaliesController
+from .attendance_changes_controller import AttendanceChangesController
 from .bank_hours_ledgers_controller import BankHoursLedgersController
 from .daily_attendance_summaries_controller import DailyAttendanceSummariesController
 from .enrollment_policy_assignments_controller import EnrollmentPolicyAssignmentsController
+from .holidays_controller import HolidaysController
+from .monthly_closings_controller import MonthlyClosingsController
 from .time_adjustment_requests_controller import TimeAdjustmentRequestsController
 from .time_punches_controller import TimePunchesController
+from .timesheets_controller import TimesheetsController
 from .work_policy_templates_controller import WorkPolicyTemplatesController
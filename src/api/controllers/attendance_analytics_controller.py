@@ -0,0 +1,67 @@
+from datetime import date
+from typing import Optional
+
+from api.schemas import FastJSONResponse
+from application.dtos import GetAttendanceAnalyticsDTO
+from application.exceptions import BadRequestError
+from application.usecases.attendance_analytics import (
+    GetAttendanceRollupTotalsUseCase,
+    ListDailyAttendanceRollupsUseCase,
+)
+from infra.database_manager import DatabaseManagerConnection
+from infra.repositories import RepositoryManager
+
+
+class AttendanceAnalyticsController:
+    def __init__(self, db_manager: DatabaseManagerConnection):
+        self.repository_manager = RepositoryManager(db_manager=db_manager)
+
+    def list_daily(self, requester_tenant_id: Optional[int], start_date: date, end_date: date) -> FastJSONResponse:
+        rows = ListDailyAttendanceRollupsUseCase(self.repository_manager).execute(
+            self.__to_dto(requester_tenant_id, start_date, end_date)
+        )
+        return FastJSONResponse(
+            [
+                {
+                    "workDate": row.work_date,
+                    "okDays": row.ok_days,
+                    "incompleteDays": row.incomplete_days,
+                    "pendingAdjustmentDays": row.pending_adjustment_days,
+                    "noPolicyDays": row.no_policy_days,
+                    "expectedMinutes": row.expected_minutes,
+                    "workedMinutes": row.worked_minutes,
+                    "breakMinutes": row.break_minutes,
+                    "overtimeMinutes": row.overtime_minutes,
+                    "deficitMinutes": row.deficit_minutes,
+                }
+                for row in rows
+            ]
+        )
+
+    def get_totals(self, requester_tenant_id: Optional[int], start_date: date, end_date: date) -> FastJSONResponse:
+        totals = GetAttendanceRollupTotalsUseCase(self.repository_manager).execute(
+            self.__to_dto(requester_tenant_id, start_date, end_date)
+        )
+        return FastJSONResponse(
+            {
+                "startDate": start_date,
+                "endDate": end_date,
+                "okDays": totals.ok_days,
+                "incompleteDays": totals.incomplete_days,
+                "pendingAdjustmentDays": totals.pending_adjustment_days,
+                "noPolicyDays": totals.no_policy_days,
+                "expectedMinutes": totals.expected_minutes,
+                "workedMinutes": totals.worked_minutes,
+                "breakMinutes": totals.break_minutes,
+                "overtimeMinutes": totals.overtime_minutes,
+                "deficitMinutes": totals.deficit_minutes,
+            }
+        )
+
+    def __to_dto(
+        self, requester_tenant_id: Optional[int], start_date: date, end_date: date
+    ) -> GetAttendanceAnalyticsDTO:
+        if requester_tenant_id is None:
+            raise BadRequestError("tenantId is required.")
+
+        return GetAttendanceAnalyticsDTO(tenant_id=requester_tenant_id, start_date=start_date, end_date=end_date)
@@ -0,0 +1,57 @@
+from datetime import date
+from typing import Optional
+
+from api.schemas import AttendanceAnomalyResponse, AttendanceAnomalyTypeRequestEnum, PaginatedResponse
+from application.dtos import ListAttendanceAnomaliesDTO
+from application.usecases.attendance_anomalies import ListAttendanceAnomaliesUseCase
+from domain import AttendanceAnomaly
+from domain.enums import AttendanceAnomalyType
+from infra.database_manager import DatabaseManagerConnection
+from infra.repositories import RepositoryManager
+
+
+class AttendanceAnomaliesController:
+    def __init__(self, db_manager: DatabaseManagerConnection):
+        self.repository_manager = RepositoryManager(db_manager=db_manager)
+
+    def list_all(
+        self,
+        requester_tenant_id: Optional[int],
+        page: int,
+        per_page: int,
+        employee_id: Optional[int],
+        matricula: Optional[str],
+        start_date: Optional[date],
+        end_date: Optional[date],
+        anomaly_type: Optional[AttendanceAnomalyTypeRequestEnum],
+    ) -> PaginatedResponse[AttendanceAnomalyResponse]:
+        result = ListAttendanceAnomaliesUseCase(self.repository_manager).execute(
+            ListAttendanceAnomaliesDTO(
+                page=page,
+                per_page=per_page,
+                tenant_id=requester_tenant_id,
+                employee_id=employee_id,
+                matricula=matricula,
+                start_date=start_date,
+                end_date=end_date,
+                anomaly_type=AttendanceAnomalyType(anomaly_type.value) if anomaly_type is not None else None,
+            )
+        )
+        return PaginatedResponse(
+            data=[self.__to_response(item) for item in result.data],
+            count=result.count,
+            page=result.page,
+        )
+
+    def __to_response(self, item: AttendanceAnomaly) -> AttendanceAnomalyResponse:
+        return AttendanceAnomalyResponse(
+            id=item.id,
+            tenantId=item.tenant_id,
+            employeeId=item.employee_id,
+            matricula=item.matricula,
+            workDate=item.work_date,
+            anomalyType=item.anomaly_type.value,
+            detail=item.detail,
+            punchId=item.punch_id,
+            detectedAt=item.detected_at,
+        )
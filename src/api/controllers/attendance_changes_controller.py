@@ -0,0 +1,33 @@
+from typing import AsyncIterator, Optional
+
+from fastapi.responses import StreamingResponse
+
+from application.exceptions import BadRequestError
+from config import ATTENDANCE_CHANGE_KEEPALIVE_SECONDS
+from infra.integrations import attendance_change_broker
+
+RETRY_FRAME = b"retry: 3000\n\n"
+KEEPALIVE_FRAME = b": keepalive\n\n"
+
+
+class AttendanceChangesController:
+    def stream(self, requester_tenant_id: Optional[int]) -> StreamingResponse:
+        if requester_tenant_id is None:
+            raise BadRequestError("tenantId is required.")
+
+        return StreamingResponse(
+            self.__frames(requester_tenant_id),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    async def __frames(self, tenant_id: int) -> AsyncIterator[bytes]:
+        subscription = attendance_change_broker.subscribe(tenant_id)
+        try:
+            yield RETRY_FRAME
+            while not subscription.closed:
+                # Keepalives also surface a dropped connection, which is only noticed when a write fails.
+                frames = await subscription.next_frames(timeout=ATTENDANCE_CHANGE_KEEPALIVE_SECONDS)
+                yield frames if len(frames) > 0 else KEEPALIVE_FRAME
+        finally:
+            attendance_change_broker.unsubscribe(subscription)
@@ -1,31 +1,44 @@
+import csv
+import io
 from datetime import date
-from typing import Optional
+from http import HTTPStatus
+from typing import Any, Dict, List, Optional, Tuple
 
+from fastapi import Response
+
+from commons import build_etag, etag_matches
 from api.schemas import (
     BankHoursSourceRequestEnum,
     BankHoursBalanceResponse,
     BankHoursLedgerResponse,
     CreateBankHoursLedgerEntryRequest,
     DefaultCreateResponse,
-    PaginatedResponse,
+    FastJSONResponse,
 )
 from application.exceptions import BadRequestError
 from application.dtos import (
     CreateBankHoursLedgerEntryDTO,
     GetBankHoursBalanceDTO,
+    ImportBankHoursLedgerEntriesDTO,
+    ImportBankHoursLedgerEntryDTO,
     ListBankHoursLedgerEntriesDTO,
 )
 from application.usecases.bank_hours_ledgers import (
     CreateBankHoursLedgerEntryUseCase,
     FindBankHoursLedgerEntryByIdUseCase,
     GetBankHoursBalanceUseCase,
-    ListBankHoursLedgerEntriesUseCase,
+    ImportBankHoursLedgerEntriesUseCase,
+    ListBankHoursLedgerEntryRowsUseCase,
 )
-from domain import BankHoursLedger
-from domain.enums import BankHoursSource
+from application.usecases.resource_versions import GetResourceVersionUseCase
+from domain import BankHoursLedger, BankHoursLedgerImportResult, BankHoursLedgerRow
+from domain.enums import BankHoursSource, ResourceScope
 from infra.database_manager import DatabaseManagerConnection
 from infra.repositories import RepositoryManager
 
+IMPORT_COLUMNS = ("employeeId", "matricula", "eventDate", "minutesDelta", "referenceId")
+IMPORT_MAX_BYTES = 2 * 1024 * 1024
+
 
 class BankHoursLedgersController:
     def __init__(self, db_manager: DatabaseManagerConnection):
@@ -45,6 +58,29 @@ class BankHoursLedgersController:
         )
         return DefaultCreateResponse(id=entry.id)
 
+    def import_csv(self, requester_tenant_id: Optional[int], content: bytes) -> Response:
+        if requester_tenant_id is None:
+            raise BadRequestError("tenantId is required.")
+        if len(content) > IMPORT_MAX_BYTES:
+            raise BadRequestError(f"CSV is limited to {IMPORT_MAX_BYTES} bytes.")
+
+        entries, parse_errors = self.__parse_csv(content)
+        results = parse_errors
+        if len(entries) > 0:
+            results = results + ImportBankHoursLedgerEntriesUseCase(self.repository_manager).execute(
+                ImportBankHoursLedgerEntriesDTO(tenant_id=requester_tenant_id, entries=entries)
+            )
+        results.sort(key=lambda result: result.line)
+
+        created = sum(1 for result in results if result.error is None)
+        return FastJSONResponse(
+            {
+                "created": created,
+                "failed": len(results) - created,
+                "rows": [{"line": result.line, "id": result.entry_id, "error": result.error} for result in results],
+            }
+        )
+
     def find_by_id(self, entry_id: int, tenant_id: int) -> BankHoursLedgerResponse:
         entry = FindBankHoursLedgerEntryByIdUseCase(self.repository_manager).execute(
             entry_id=entry_id,
@@ -64,24 +100,35 @@ class BankHoursLedgersController:
         start_date: Optional[date],
         end_date: Optional[date],
         source: Optional[BankHoursSourceRequestEnum],
-    ) -> PaginatedResponse[BankHoursLedgerResponse]:
+        if_none_match: Optional[str] = None,
+    ) -> Response:
         mapped_source = BankHoursSource(source.value) if source is not None else None
-        result = ListBankHoursLedgerEntriesUseCase(self.repository_manager).execute(
-            ListBankHoursLedgerEntriesDTO(
-                page=page,
-                per_page=per_page,
-                tenant_id=requester_tenant_id,
-                employee_id=employee_id,
-                matricula=matricula,
-                start_date=start_date,
-                end_date=end_date,
-                source=mapped_source,
-            )
+        data = ListBankHoursLedgerEntriesDTO(
+            page=page,
+            per_page=per_page,
+            tenant_id=requester_tenant_id,
+            employee_id=employee_id,
+            matricula=matricula,
+            start_date=start_date,
+            end_date=end_date,
+            source=mapped_source,
         )
-        return PaginatedResponse(
-            data=[self.__to_response(item) for item in result.data],
-            count=result.count,
-            page=result.page,
+        version = GetResourceVersionUseCase(self.repository_manager).execute(
+            scope=ResourceScope.BANK_HOURS_LEDGERS,
+            tenant_id=requester_tenant_id,
+        )
+        etag = build_etag(ResourceScope.BANK_HOURS_LEDGERS.value, version, data)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=HTTPStatus.NOT_MODIFIED, headers={"ETag": etag})
+
+        result = ListBankHoursLedgerEntryRowsUseCase(self.repository_manager).execute(data)
+        return FastJSONResponse(
+            {
+                "data": [self.__row_to_response(row) for row in result.data],
+                "count": result.count,
+                "page": result.page,
+            },
+            headers={"ETag": etag},
         )
 
     def get_balance(
@@ -101,6 +148,45 @@ class BankHoursLedgersController:
             balanceMinutes=balance,
         )
 
+    def __parse_csv(
+        self, content: bytes
+    ) -> Tuple[List[ImportBankHoursLedgerEntryDTO], List[BankHoursLedgerImportResult]]:
+        try:
+            text = content.decode("utf-8-sig")
+        except UnicodeDecodeError as error:
+            raise BadRequestError("CSV must be UTF-8 encoded.") from error
+
+        reader = csv.DictReader(io.StringIO(text, newline=""))
+        missing = [column for column in IMPORT_COLUMNS[:4] if column not in (reader.fieldnames or [])]
+        if len(missing) > 0:
+            raise BadRequestError(f"CSV header is missing columns: {', '.join(missing)}.")
+
+        entries: List[ImportBankHoursLedgerEntryDTO] = []
+        errors: List[BankHoursLedgerImportResult] = []
+        for row in reader:
+            line = reader.line_num
+            try:
+                reference_id = (row.get("referenceId") or "").strip()
+                entries.append(
+                    ImportBankHoursLedgerEntryDTO(
+                        line=line,
+                        employee_id=int(row["employeeId"] or ""),
+                        matricula=row["matricula"] or "",
+                        event_date=date.fromisoformat((row["eventDate"] or "").strip()),
+                        minutes_delta=int(row["minutesDelta"] or ""),
+                        reference_id=int(reference_id) if reference_id else None,
+                    )
+                )
+            except ValueError:
+                errors.append(
+                    BankHoursLedgerImportResult(
+                        line=line,
+                        entry_id=None,
+                        error="employeeId, minutesDelta and referenceId must be integers and eventDate YYYY-MM-DD.",
+                    )
+                )
+        return entries, errors
+
     def __to_response(self, item: BankHoursLedger) -> BankHoursLedgerResponse:
         return BankHoursLedgerResponse(
             id=item.id,
@@ -112,3 +198,15 @@ class BankHoursLedgersController:
             source=item.source.value,
             referenceId=item.reference_id,
         )
+
+    def __row_to_response(self, row: BankHoursLedgerRow) -> Dict[str, Any]:
+        return {
+            "id": row.id,
+            "tenantId": row.tenant_id,
+            "employeeId": row.employee_id,
+            "matricula": row.matricula,
+            "eventDate": row.event_date,
+            "minutesDelta": row.minutes_delta,
+            "source": row.source,
+            "referenceId": row.reference_id,
+        }
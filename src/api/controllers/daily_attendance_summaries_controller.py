@@ -1,12 +1,16 @@
 from datetime import date
-from typing import Optional
+from http import HTTPStatus
+from typing import Any, Dict, Optional
 
+from fastapi import Response
+
+from commons import build_etag, etag_matches
 from commons.handlers import get_enum_value
 
 from api.schemas import (
     DailyAttendanceSummaryResponse,
     DailyAttendanceStatusRequestEnum,
-    PaginatedResponse,
+    FastJSONResponse,
     RecalculateDailyAttendanceSummaryRequest,
 )
 from application.exceptions import BadRequestError
@@ -16,24 +20,27 @@ from application.dtos import (
 )
 from application.usecases.daily_attendance_summaries import (
     FindDailyAttendanceSummaryByIdUseCase,
-    ListDailyAttendanceSummariesUseCase,
+    ListDailyAttendanceSummaryRowsUseCase,
     RecalculateDailyAttendanceSummaryUseCase,
 )
-from domain import DailyAttendanceSummary
-from domain.enums import DailyAttendanceStatus
+from application.usecases.resource_versions import GetResourceVersionUseCase
+from domain import DailyAttendanceSummary, DailyAttendanceSummaryRow
+from domain.enums import DailyAttendanceStatus, ResourceScope
 from infra.database_manager import DatabaseManagerConnection
+from infra.integrations import IntegrationManager
 from infra.repositories import RepositoryManager
 
 
 class DailyAttendanceSummariesController:
     def __init__(self, db_manager: DatabaseManagerConnection):
         self.repository_manager = RepositoryManager(db_manager=db_manager)
+        self.integration_manager = IntegrationManager()
 
     def recalculate(
         self, data: RecalculateDailyAttendanceSummaryRequest
     ) -> DailyAttendanceSummaryResponse:
         summary = RecalculateDailyAttendanceSummaryUseCase(
-            self.repository_manager
+            self.repository_manager, self.integration_manager
         ).execute(
             RecalculateDailyAttendanceSummaryDTO(
                 tenant_id=data.tenantId,
@@ -67,26 +74,37 @@ class DailyAttendanceSummariesController:
         start_date: Optional[date],
         end_date: Optional[date],
         status: Optional[DailyAttendanceStatusRequestEnum],
-    ) -> PaginatedResponse[DailyAttendanceSummaryResponse]:
+        if_none_match: Optional[str] = None,
+    ) -> Response:
         mapped_status = (
             DailyAttendanceStatus(status.value) if status is not None else None
         )
-        result = ListDailyAttendanceSummariesUseCase(self.repository_manager).execute(
-            ListDailyAttendanceSummariesDTO(
-                page=page,
-                per_page=per_page,
-                tenant_id=requester_tenant_id,
-                employee_id=employee_id,
-                matricula=matricula,
-                start_date=start_date,
-                end_date=end_date,
-                status=mapped_status,
-            )
+        data = ListDailyAttendanceSummariesDTO(
+            page=page,
+            per_page=per_page,
+            tenant_id=requester_tenant_id,
+            employee_id=employee_id,
+            matricula=matricula,
+            start_date=start_date,
+            end_date=end_date,
+            status=mapped_status,
         )
-        return PaginatedResponse(
-            data=[self.__to_response(item) for item in result.data],
-            count=result.count,
-            page=result.page,
+        version = GetResourceVersionUseCase(self.repository_manager).execute(
+            scope=ResourceScope.DAILY_ATTENDANCE_SUMMARIES,
+            tenant_id=requester_tenant_id,
+        )
+        etag = build_etag(ResourceScope.DAILY_ATTENDANCE_SUMMARIES.value, version, data)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=HTTPStatus.NOT_MODIFIED, headers={"ETag": etag})
+
+        result = ListDailyAttendanceSummaryRowsUseCase(self.repository_manager).execute(data)
+        return FastJSONResponse(
+            {
+                "data": [self.__row_to_response(row) for row in result.data],
+                "count": result.count,
+                "page": result.page,
+            },
+            headers={"ETag": etag},
         )
 
     def __to_response(
@@ -105,3 +123,18 @@ class DailyAttendanceSummariesController:
             deficitMinutes=item.deficit_minutes,
             status=get_enum_value(item.status),
         )
+
+    def __row_to_response(self, row: DailyAttendanceSummaryRow) -> Dict[str, Any]:
+        return {
+            "id": row.id,
+            "tenantId": row.tenant_id,
+            "employeeId": row.employee_id,
+            "matricula": row.matricula,
+            "workDate": row.work_date,
+            "expectedMinutes": row.expected_minutes,
+            "workedMinutes": row.worked_minutes,
+            "breakMinutes": row.break_minutes,
+            "overtimeMinutes": row.overtime_minutes,
+            "deficitMinutes": row.deficit_minutes,
+            "status": row.status,
+        }
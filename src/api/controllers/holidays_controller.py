@@ -0,0 +1,83 @@
+from datetime import date
+from typing import Optional
+
+from api.schemas import (
+    CreateHolidayRequest,
+    DefaultCreateResponse,
+    HolidayResponse,
+    PaginatedResponse,
+)
+from application.dtos import CreateHolidayDTO, ListHolidaysDTO
+from application.exceptions import BadRequestError
+from application.usecases.holidays import (
+    CreateHolidayUseCase,
+    DeleteHolidayUseCase,
+    FindHolidayByIdUseCase,
+    ListHolidaysUseCase,
+)
+from domain import Holiday
+from infra.database_manager import DatabaseManagerConnection
+from infra.repositories import RepositoryManager
+
+
+class HolidaysController:
+    def __init__(self, db_manager: DatabaseManagerConnection):
+        self.repository_manager = RepositoryManager(db_manager=db_manager)
+
+    def create(self, data: CreateHolidayRequest) -> DefaultCreateResponse:
+        holiday = CreateHolidayUseCase(self.repository_manager).execute(
+            CreateHolidayDTO(
+                tenant_id=data.tenantId,
+                name=data.name,
+                start_date=data.startDate,
+                end_date=data.endDate,
+            )
+        )
+        return DefaultCreateResponse(id=holiday.id)
+
+    def find_by_id(self, holiday_id: int, tenant_id: int) -> HolidayResponse:
+        holiday = FindHolidayByIdUseCase(self.repository_manager).execute(
+            holiday_id=holiday_id,
+            raise_if_is_none=True,
+        )
+        if holiday.tenant_id != tenant_id:
+            raise BadRequestError("Holiday does not belong to tenant.")
+        return self.__to_response(holiday)
+
+    def list_all(
+        self,
+        requester_tenant_id: Optional[int],
+        page: int,
+        per_page: int,
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ) -> PaginatedResponse[HolidayResponse]:
+        result = ListHolidaysUseCase(self.repository_manager).execute(
+            ListHolidaysDTO(
+                page=page,
+                per_page=per_page,
+                tenant_id=requester_tenant_id,
+                start_date=start_date,
+                end_date=end_date,
+            )
+        )
+        return PaginatedResponse(
+            data=[self.__to_response(item) for item in result.data],
+            count=result.count,
+            page=result.page,
+        )
+
+    def delete(self, holiday_id: int, tenant_id: int) -> None:
+        DeleteHolidayUseCase(self.repository_manager).execute(
+            holiday_id=holiday_id,
+            tenant_id=tenant_id,
+        )
+
+    def __to_response(self, item: Holiday) -> HolidayResponse:
+        return HolidayResponse(
+            id=item.id,
+            tenantId=item.tenant_id,
+            name=item.name,
+            startDate=item.start_date,
+            endDate=item.end_date,
+        )
@@ -0,0 +1,139 @@
+from datetime import date
+from typing import Any, Dict, Optional
+
+from api.schemas import (
+    CloseMonthRequest,
+    FastJSONResponse,
+    MonthlyClosingResponse,
+    PaginatedResponse,
+)
+from application.dtos import (
+    CloseMonthDTO,
+    ListMonthlyClosingTotalsDTO,
+    ListMonthlyClosingsDTO,
+)
+from application.exceptions import BadRequestError
+from application.usecases.monthly_closings import (
+    CloseMonthUseCase,
+    FindMonthlyClosingByIdUseCase,
+    ListMonthlyClosingTotalRowsUseCase,
+    ListMonthlyClosingsUseCase,
+    ReopenMonthUseCase,
+)
+from domain import MonthlyClosing
+from infra.database_manager import DatabaseManagerConnection
+from infra.repositories import RepositoryManager
+
+
+class MonthlyClosingsController:
+    def __init__(self, db_manager: DatabaseManagerConnection):
+        self.repository_manager = RepositoryManager(db_manager=db_manager)
+
+    def close(self, data: CloseMonthRequest, closed_by_user_id: Optional[int]) -> MonthlyClosingResponse:
+        closing = CloseMonthUseCase(self.repository_manager).execute(
+            CloseMonthDTO(
+                tenant_id=data.tenantId,
+                month=date(data.year, data.month, 1),
+                closed_by_user_id=closed_by_user_id,
+            )
+        )
+        return self.__to_response(closing)
+
+    def find_by_id(self, closing_id: int, tenant_id: int) -> MonthlyClosingResponse:
+        closing = self.__find_for_tenant(closing_id, tenant_id)
+        return self.__to_response(closing)
+
+    def list_all(
+        self,
+        requester_tenant_id: Optional[int],
+        page: int,
+        per_page: int,
+        start_month: Optional[date],
+        end_month: Optional[date],
+    ) -> PaginatedResponse[MonthlyClosingResponse]:
+        result = ListMonthlyClosingsUseCase(self.repository_manager).execute(
+            ListMonthlyClosingsDTO(
+                page=page,
+                per_page=per_page,
+                tenant_id=requester_tenant_id,
+                start_month=start_month,
+                end_month=end_month,
+            )
+        )
+        return PaginatedResponse(
+            data=[self.__to_response(item) for item in result.data],
+            count=result.count,
+            page=result.page,
+        )
+
+    def list_totals(
+        self,
+        closing_id: int,
+        tenant_id: int,
+        page: int,
+        per_page: int,
+        employee_id: Optional[int],
+        matricula: Optional[str],
+    ) -> FastJSONResponse:
+        self.__find_for_tenant(closing_id, tenant_id)
+        result = ListMonthlyClosingTotalRowsUseCase(self.repository_manager).execute(
+            ListMonthlyClosingTotalsDTO(
+                page=page,
+                per_page=per_page,
+                monthly_closing_id=closing_id,
+                employee_id=employee_id,
+                matricula=matricula,
+            )
+        )
+        return FastJSONResponse(
+            {
+                "data": [self.__total_row_to_response(row) for row in result.data],
+                "count": result.count,
+                "page": result.page,
+            }
+        )
+
+    def reopen(self, closing_id: int, tenant_id: int) -> None:
+        ReopenMonthUseCase(self.repository_manager).execute(
+            closing_id=closing_id,
+            tenant_id=tenant_id,
+        )
+
+    def __find_for_tenant(self, closing_id: int, tenant_id: int) -> MonthlyClosing:
+        closing = FindMonthlyClosingByIdUseCase(self.repository_manager).execute(
+            closing_id=closing_id,
+            raise_if_is_none=True,
+        )
+        if closing.tenant_id != tenant_id:
+            raise BadRequestError("Monthly closing does not belong to tenant.")
+        return closing
+
+    def __to_response(self, item: MonthlyClosing) -> MonthlyClosingResponse:
+        return MonthlyClosingResponse(
+            id=item.id,
+            tenantId=item.tenant_id,
+            month=f"{item.month:%Y-%m}",
+            status=item.status.value,
+            startedAt=item.started_at,
+            closedAt=item.closed_at,
+            closedByUserId=item.closed_by_user_id,
+            recalculatedDays=item.recalculated_days,
+            totalsCount=item.totals_count,
+        )
+
+    def __total_row_to_response(self, row: Any) -> Dict[str, Any]:
+        return {
+            "employeeId": row.employee_id,
+            "matricula": row.matricula,
+            "expectedMinutes": row.expected_minutes,
+            "workedMinutes": row.worked_minutes,
+            "breakMinutes": row.break_minutes,
+            "overtimeMinutes": row.overtime_minutes,
+            "deficitMinutes": row.deficit_minutes,
+            "okDays": row.ok_days,
+            "incompleteDays": row.incomplete_days,
+            "pendingAdjustmentDays": row.pending_adjustment_days,
+            "noPolicyDays": row.no_policy_days,
+            "openingBalanceMinutes": row.opening_balance_minutes,
+            "closingBalanceMinutes": row.closing_balance_minutes,
+        }
@@ -1,10 +1,10 @@
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from api.schemas import (
     CreateTimePunchRequest,
     DefaultCreateResponse,
-    PaginatedResponse,
+    FastJSONResponse,
     PunchTypeRequestEnum,
     TimePunchResponse,
 )
@@ -14,20 +14,22 @@ from application.usecases.time_punches import (
     CreateTimePunchUseCase,
     DeleteTimePunchUseCase,
     FindTimePunchByIdUseCase,
-    ListTimePunchesUseCase,
+    ListTimePunchRowsUseCase,
 )
-from domain import TimePunch
+from domain import TimePunch, TimePunchRow
 from domain.enums import PunchType
 from infra.database_manager import DatabaseManagerConnection
+from infra.integrations import IntegrationManager
 from infra.repositories import RepositoryManager
 
 
 class TimePunchesController:
     def __init__(self, db_manager: DatabaseManagerConnection):
         self.repository_manager = RepositoryManager(db_manager=db_manager)
+        self.integration_manager = IntegrationManager()
 
     def create(self, data: CreateTimePunchRequest) -> DefaultCreateResponse:
-        punch = CreateTimePunchUseCase(self.repository_manager).execute(
+        punch = CreateTimePunchUseCase(self.repository_manager, self.integration_manager).execute(
             CreateTimePunchDTO(
                 tenant_id=data.tenantId,
                 employee_id=data.employeeId,
@@ -60,11 +62,11 @@ class TimePunchesController:
         start_at: Optional[datetime],
         end_at: Optional[datetime],
         punch_type: Optional[PunchTypeRequestEnum],
-    ) -> PaginatedResponse[TimePunchResponse]:
+    ) -> FastJSONResponse:
         mapped_punch_type = (
             PunchType(punch_type.value) if punch_type is not None else None
         )
-        result = ListTimePunchesUseCase(self.repository_manager).execute(
+        result = ListTimePunchRowsUseCase(self.repository_manager).execute(
             ListTimePunchesDTO(
                 page=page,
                 per_page=per_page,
@@ -77,14 +79,16 @@ class TimePunchesController:
             )
         )
 
-        return PaginatedResponse(
-            data=[self.__to_response(item) for item in result.data],
-            count=result.count,
-            page=result.page,
+        return FastJSONResponse(
+            {
+                "data": [self.__row_to_response(row) for row in result.data],
+                "count": result.count,
+                "page": result.page,
+            }
         )
 
     def delete(self, punch_id: int, tenant_id: int) -> None:
-        DeleteTimePunchUseCase(self.repository_manager).execute(
+        DeleteTimePunchUseCase(self.repository_manager, self.integration_manager).execute(
             punch_id=punch_id,
             tenant_id=tenant_id,
         )
@@ -100,3 +104,15 @@ class TimePunchesController:
             source=item.source,
             note=item.note,
         )
+
+    def __row_to_response(self, row: TimePunchRow) -> Dict[str, Any]:
+        return {
+            "id": row.id,
+            "tenantId": row.tenant_id,
+            "employeeId": row.employee_id,
+            "matricula": row.matricula,
+            "punchedAt": row.punched_at,
+            "punchType": row.punch_type,
+            "source": row.source,
+            "note": row.note,
+        }
@@ -0,0 +1,87 @@
+from datetime import date
+from typing import Any, Dict, Optional
+
+from api.schemas import FastJSONResponse
+from application.dtos import GetMonthlyTimesheetDTO
+from application.exceptions import BadRequestError
+from application.usecases.timesheets import GetMonthlyTimesheetUseCase
+from domain import MonthlyTimesheet
+from infra.database_manager import DatabaseManagerConnection
+from infra.repositories import RepositoryManager
+
+
+class TimesheetsController:
+    def __init__(self, db_manager: DatabaseManagerConnection):
+        self.repository_manager = RepositoryManager(db_manager=db_manager)
+
+    def get_monthly(
+        self,
+        requester_tenant_id: Optional[int],
+        employee_id: int,
+        matricula: str,
+        year: int,
+        month: int,
+    ) -> FastJSONResponse:
+        if requester_tenant_id is None:
+            raise BadRequestError("tenantId is required.")
+
+        matricula = matricula.strip()
+        if len(matricula) == 0:
+            raise BadRequestError("matricula is required.")
+
+        timesheet = GetMonthlyTimesheetUseCase(self.repository_manager).execute(
+            GetMonthlyTimesheetDTO(
+                tenant_id=requester_tenant_id,
+                employee_id=employee_id,
+                matricula=matricula,
+                month=date(year, month, 1),
+            )
+        )
+        return FastJSONResponse(self.__to_response(timesheet))
+
+    def __to_response(self, timesheet: MonthlyTimesheet) -> Dict[str, Any]:
+        start_date, end_date = MonthlyTimesheet.month_bounds(timesheet.month)
+        totals = timesheet.totals
+        return {
+            "tenantId": timesheet.tenant_id,
+            "employeeId": timesheet.employee_id,
+            "matricula": timesheet.matricula,
+            "month": f"{timesheet.month:%Y-%m}",
+            "closed": timesheet.closed,
+            "startDate": start_date,
+            "endDate": end_date,
+            "punches": [
+                {
+                    "id": punch.id,
+                    "punchedAt": punch.punched_at,
+                    "punchType": punch.punch_type,
+                    "source": punch.source,
+                    "note": punch.note,
+                }
+                for punch in timesheet.punches
+            ],
+            "days": [
+                {
+                    "id": summary.id,
+                    "workDate": summary.work_date,
+                    "expectedMinutes": summary.expected_minutes,
+                    "workedMinutes": summary.worked_minutes,
+                    "breakMinutes": summary.break_minutes,
+                    "overtimeMinutes": summary.overtime_minutes,
+                    "deficitMinutes": summary.deficit_minutes,
+                    "status": summary.status,
+                }
+                for summary in timesheet.summaries
+            ],
+            "totals": {
+                "expectedMinutes": totals["expected_minutes"],
+                "workedMinutes": totals["worked_minutes"],
+                "breakMinutes": totals["break_minutes"],
+                "overtimeMinutes": totals["overtime_minutes"],
+                "deficitMinutes": totals["deficit_minutes"],
+                "daysByStatus": totals["days_by_status"],
+            },
+            "openingBalanceMinutes": timesheet.opening_balance_minutes,
+            "monthBalanceMinutes": timesheet.closing_balance_minutes - timesheet.opening_balance_minutes,
+            "closingBalanceMinutes": timesheet.closing_balance_minutes,
+        }
@@ -36,6 +36,7 @@ class WorkPolicyTemplatesController:
                 name=data.name,
                 daily_work_minutes=data.dailyWorkMinutes,
                 break_minutes=data.breakMinutes,
+                rest_weekdays=data.restWeekdays,
             )
         )
         return DefaultCreateResponse(id=template.id)
@@ -83,6 +84,7 @@ class WorkPolicyTemplatesController:
                 name=data.name,
                 daily_work_minutes=data.dailyWorkMinutes,
                 break_minutes=data.breakMinutes,
+                rest_weekdays=data.restWeekdays,
             ),
         )
         return self.__to_response(template)
@@ -100,4 +102,5 @@ class WorkPolicyTemplatesController:
             name=item.name,
             dailyWorkMinutes=item.daily_work_minutes,
             breakMinutes=item.break_minutes,
+            restWeekdays=list(item.rest_weekdays),
         )
@@ -0,0 +1,2 @@
+# pyright: reportUnusedImport=false
+from .compression_middleware import CompressionMiddleware
@@ -0,0 +1,104 @@
+import gzip
+from typing import List, Optional
+
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+COMPRESSIBLE_CONTENT_TYPES = ("application/json", "text/plain", "text/html", "text/csv")
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        brotli_quality: int = 4,
+        gzip_level: int = 6,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.brotli_quality = brotli_quality
+        self.gzip_level = gzip_level
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self.__negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        pending_start: Optional[Message] = None
+        chunks: List[bytes] = []
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal pending_start
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                if not self.__is_compressible(headers):
+                    await send(message)
+                    return
+                headers.add_vary_header("Accept-Encoding")
+                # Responses without a Content-Length (SSE, file streams) are relayed untouched; anything with a
+                # known size is buffered even if the app below hands it over in several chunks.
+                if int(headers.get("content-length", "0")) < self.minimum_size:
+                    await send(message)
+                    return
+                pending_start = message
+                return
+
+            if message["type"] != "http.response.body" or pending_start is None:
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            start, pending_start = pending_start, None
+            compressed = self.__compress(encoding, b"".join(chunks))
+            headers = MutableHeaders(raw=start["headers"])
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            await send(start)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
+
+    def __negotiate(self, accept_encoding: str) -> Optional[str]:
+        accepted, rejected = set(), set()
+        for part in accept_encoding.lower().split(","):
+            coding, _, params = part.strip().partition(";")
+            if self.__quality(params) == 0:
+                rejected.add(coding.strip())
+            else:
+                accepted.add(coding.strip())
+
+        for coding in ("br", "gzip"):
+            if coding in accepted or ("*" in accepted and coding not in rejected):
+                return coding
+        return None
+
+    @staticmethod
+    def __quality(params: str) -> float:
+        quality = params.strip().replace(" ", "")
+        if not quality.startswith("q="):
+            return 1.0
+        try:
+            return float(quality[2:])
+        except ValueError:
+            return 0.0
+
+    def __is_compressible(self, headers: MutableHeaders) -> bool:
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        return content_type in COMPRESSIBLE_CONTENT_TYPES
+
+    def __compress(self, encoding: str, body: bytes) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level)
@@ -1,10 +1,13 @@
 # pyright: reportUnusedImport=false
-import os
-from importlib import util
-from pathlib import Path
+from functools import partial
+from importlib import import_module
+from typing import Any, Dict
 
 from fastapi import APIRouter, FastAPI
 from fastapi.openapi.utils import get_openapi
+from fastapi.responses import PlainTextResponse
+
+from commons import metrics_registry
 
 health_router = APIRouter()
 
@@ -14,30 +17,46 @@ def ping() -> str:
     return "pong"
 
 
+@health_router.get("/metrics", response_class=PlainTextResponse)
+def metrics() -> str:
+    return metrics_registry.render()
+
+
+ROUTER_MODULES = (
+    "attendance_analytics",
+    "attendance_anomalies",
+    "attendance_changes",
+    "bank_hours_ledgers",
+    "daily_attendance_summaries",
+    "enrollment_policy_assignments",
+    "holidays",
+    "monthly_closings",
+    "time_adjustment_requests",
+    "time_punches",
+    "timesheets",
+    "work_policy_templates",
+)
+
+
 def create_routes(app: FastAPI, url_prefix: str) -> FastAPI:
     app.include_router(health_router, prefix=f"{url_prefix}", tags=["health"])
 
-    routes_directory = Path(__file__).parent
-    for filename in os.listdir(routes_directory):
-        if filename.endswith(".py") and filename not in ["__init__.py"]:
-            module_name = filename[:-3]
-            module_path = f"{routes_directory}/{filename}"
+    for module_name in ROUTER_MODULES:
+        module = import_module(f"{__name__}.{module_name}")
+        app.include_router(
+            getattr(module, "router"),
+            prefix=f"{url_prefix}/{module_name.replace('_', '-')}",
+            tags=[module_name.replace("_", " ").capitalize()],
+        )
 
-            spec = util.spec_from_file_location(module_name, str(module_path))
-            if spec is None or spec.loader is None:
-                continue
+    # The schema walks every route and response model; build it on the first docs request instead of in
+    # every worker at boot.
+    app.openapi = partial(build_openapi_schema, app)
 
-            module = util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+    return app
 
-            if hasattr(module, "router"):
-                router = getattr(module, "router")
-                app.include_router(
-                    router,
-                    prefix=f"{url_prefix}/{module_name.replace('_', '-')}",
-                    tags=[module_name.replace("_", " ").capitalize()],
-                )
 
+def build_openapi_schema(app: FastAPI) -> Dict[str, Any]:
     if not app.openapi_schema:
         app.openapi_schema = get_openapi(
             title=app.title,
@@ -57,4 +76,4 @@ def create_routes(app: FastAPI, url_prefix: str) -> FastAPI:
                 if "422" in responses:
                     del responses["422"]
 
-    return app
+    return app.openapi_schema
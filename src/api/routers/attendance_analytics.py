@@ -0,0 +1,58 @@
+from datetime import date
+from http import HTTPStatus
+from typing import List, Optional
+
+from fastapi import APIRouter
+
+from api.controllers import AttendanceAnalyticsController
+from api.routers.dependencies import (
+    CurrentUser,
+    DBManager,
+    require_role,
+    resolve_tenant_id,
+)
+from api.schemas import AttendanceAnalyticsDayResponse, AttendanceAnalyticsTotalsResponse
+
+router = APIRouter()
+
+
+@router.get(
+    "/daily",
+    status_code=HTTPStatus.OK,
+    response_model=List[AttendanceAnalyticsDayResponse],
+    dependencies=[require_role("attendance_analytics:read")],
+)
+async def list_daily_attendance_analytics(
+    startDate: date,
+    endDate: date,
+    db_manager: DBManager,
+    current_user: CurrentUser,
+    tenantId: Optional[int] = None,
+):
+    tenant_id = resolve_tenant_id(current_user, tenantId)
+    return AttendanceAnalyticsController(db_manager).list_daily(
+        requester_tenant_id=tenant_id,
+        start_date=startDate,
+        end_date=endDate,
+    )
+
+
+@router.get(
+    "/totals",
+    status_code=HTTPStatus.OK,
+    response_model=AttendanceAnalyticsTotalsResponse,
+    dependencies=[require_role("attendance_analytics:read")],
+)
+async def get_attendance_analytics_totals(
+    startDate: date,
+    endDate: date,
+    db_manager: DBManager,
+    current_user: CurrentUser,
+    tenantId: Optional[int] = None,
+):
+    tenant_id = resolve_tenant_id(current_user, tenantId)
+    return AttendanceAnalyticsController(db_manager).get_totals(
+        requester_tenant_id=tenant_id,
+        start_date=startDate,
+        end_date=endDate,
+    )
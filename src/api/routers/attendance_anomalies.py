@@ -0,0 +1,51 @@
+from datetime import date
+from http import HTTPStatus
+from typing import Optional
+
+from fastapi import APIRouter, Query
+
+from api.controllers import AttendanceAnomaliesController
+from api.routers.dependencies import (
+    CurrentUser,
+    DBManager,
+    require_role,
+    resolve_tenant_id,
+)
+from api.schemas import (
+    AttendanceAnomalyResponse,
+    AttendanceAnomalyTypeRequestEnum,
+    PaginatedResponse,
+)
+
+router = APIRouter()
+
+
+@router.get(
+    "",
+    status_code=HTTPStatus.OK,
+    response_model=PaginatedResponse[AttendanceAnomalyResponse],
+    dependencies=[require_role("attendance_anomalies:read")],
+)
+async def list_attendance_anomalies(
+    db_manager: DBManager,
+    current_user: CurrentUser,
+    page: int = Query(default=0, ge=0),
+    perPage: int = Query(default=20, ge=1, le=1000),
+    employeeId: Optional[int] = None,
+    matricula: Optional[str] = None,
+    startDate: Optional[date] = None,
+    endDate: Optional[date] = None,
+    anomalyType: Optional[AttendanceAnomalyTypeRequestEnum] = None,
+    tenantId: Optional[int] = None,
+):
+    tenant_id = resolve_tenant_id(current_user, tenantId)
+    return AttendanceAnomaliesController(db_manager).list_all(
+        requester_tenant_id=tenant_id,
+        page=page,
+        per_page=perPage,
+        employee_id=employeeId,
+        matricula=matricula,
+        start_date=startDate,
+        end_date=endDate,
+        anomaly_type=anomalyType,
+    )
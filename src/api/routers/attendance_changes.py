@@ -0,0 +1,28 @@
+from http import HTTPStatus
+from typing import Optional
+
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+
+from api.controllers import AttendanceChangesController
+from api.routers.dependencies import (
+    CurrentUser,
+    require_role,
+    resolve_tenant_id,
+)
+
+router = APIRouter()
+
+
+@router.get(
+    "/stream",
+    status_code=HTTPStatus.OK,
+    response_class=StreamingResponse,
+    dependencies=[require_role("attendance_changes:read")],
+)
+async def stream_attendance_changes(
+    current_user: CurrentUser,
+    tenantId: Optional[int] = None,
+):
+    tenant_id = resolve_tenant_id(current_user, tenantId)
+    return AttendanceChangesController().stream(requester_tenant_id=tenant_id)
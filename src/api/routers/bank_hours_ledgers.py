@@ -2,7 +2,8 @@ from datetime import date
 from http import HTTPStatus
 from typing import Optional
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Header, Query, Request
+from starlette.concurrency import run_in_threadpool
 
 from api.controllers import BankHoursLedgersController
 from api.routers.dependencies import (
@@ -14,6 +15,7 @@ from api.routers.dependencies import (
 from api.schemas import (
     BankHoursSourceRequestEnum,
     BankHoursBalanceResponse,
+    BankHoursLedgerImportResponse,
     BankHoursLedgerResponse,
     CreateBankHoursLedgerEntryRequest,
     DefaultCreateResponse,
@@ -38,6 +40,26 @@ async def create_bank_hours_ledger_entry(
     return BankHoursLedgersController(db_manager).create(data)
 
 
+@router.post(
+    "/bulk",
+    status_code=HTTPStatus.OK,
+    response_model=BankHoursLedgerImportResponse,
+    dependencies=[require_role("bank_hours_ledgers:create")],
+)
+async def import_bank_hours_ledger_entries(
+    request: Request,
+    db_manager: DBManager,
+    current_user: CurrentUser,
+    tenantId: Optional[int] = None,
+):
+    tenant_id = resolve_tenant_id(current_user, tenantId)
+    content = await request.body()
+    # Parsing and the bulk insert are synchronous; they run in the threadpool so a large file does not block the loop.
+    return await run_in_threadpool(
+        BankHoursLedgersController(db_manager).import_csv, requester_tenant_id=tenant_id, content=content
+    )
+
+
 @router.get(
     "",
     status_code=HTTPStatus.OK,
@@ -55,6 +77,7 @@ async def list_bank_hours_ledger_entries(
     endDate: Optional[date] = None,
     source: Optional[BankHoursSourceRequestEnum] = None,
     tenantId: Optional[int] = None,
+    ifNoneMatch: Optional[str] = Header(default=None, alias="If-None-Match"),
 ):
     tenant_id = resolve_tenant_id(current_user, tenantId)
     return BankHoursLedgersController(db_manager).list_all(
@@ -66,6 +89,7 @@ async def list_bank_hours_ledger_entries(
         start_date=startDate,
         end_date=endDate,
         source=source,
+        if_none_match=ifNoneMatch,
     )
 
 
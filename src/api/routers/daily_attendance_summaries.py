@@ -2,7 +2,7 @@ from datetime import date
 from http import HTTPStatus
 from typing import Optional
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Header, Query
 
 from api.controllers import DailyAttendanceSummariesController
 from api.routers.dependencies import (
@@ -70,6 +70,7 @@ async def list_daily_attendance_summaries(
     endDate: Optional[date] = None,
     status: Optional[DailyAttendanceStatusRequestEnum] = None,
     tenantId: Optional[int] = None,
+    ifNoneMatch: Optional[str] = Header(default=None, alias="If-None-Match"),
 ):
     tenant_id = resolve_tenant_id(current_user, tenantId)
     return DailyAttendanceSummariesController(db_manager).list_all(
@@ -81,4 +82,5 @@ async def list_daily_attendance_summaries(
         start_date=startDate,
         end_date=endDate,
         status=status,
+        if_none_match=ifNoneMatch,
     )
@@ -1,6 +1,7 @@
 # pyright: reportUnusedImport=false
 from .access_token_data import AccessTokenData
 from .current_user import CurrentUser
+from .permission_set import PermissionSet
 from .role_checker import require_role
 from .tenancy import resolve_tenant_id
 from .utils import DBManager, login_required
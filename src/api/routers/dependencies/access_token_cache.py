@@ -0,0 +1,79 @@
+import hashlib
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+
+from commons import metrics_registry
+from config import ACCESS_TOKEN_CACHE_MAX_TTL_SECONDS, ACCESS_TOKEN_CACHE_SIZE
+
+from .access_token_data import AccessTokenData
+
+access_token_cache_lookups = metrics_registry.counter(
+    "access_token_cache_lookups_total",
+    "Verified access token cache lookups by result",
+    label_names=("result",),
+)
+
+
+class AccessTokenCache:
+    def __init__(self, max_size: int, max_ttl_seconds: int):
+        self.max_size = max_size
+        self.max_ttl_seconds = max_ttl_seconds
+        self.__entries: "OrderedDict[bytes, Tuple[AccessTokenData, float]]" = OrderedDict()
+        self.__lock = Lock()
+
+    def get(self, token: str) -> Optional[AccessTokenData]:
+        key = self.__key(token)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                access_token_cache_lookups.inc(result="miss")
+                return None
+
+            data, expires_at = entry
+            if time.time() >= expires_at:
+                del self.__entries[key]
+                access_token_cache_lookups.inc(result="expired")
+                return None
+
+            self.__entries.move_to_end(key)
+            access_token_cache_lookups.inc(result="hit")
+            return data
+
+    def put(self, token: str, data: AccessTokenData, payload: Dict[str, Any]) -> None:
+        if self.max_size <= 0:
+            return
+
+        expires_at = time.time() + self.max_ttl_seconds
+        if isinstance(payload.get("exp"), (int, float)):
+            expires_at = min(expires_at, float(payload["exp"]))
+
+        key = self.__key(token)
+        with self.__lock:
+            self.__entries[key] = (data, expires_at)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __key(self, token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+
+access_token_cache = AccessTokenCache(
+    max_size=ACCESS_TOKEN_CACHE_SIZE,
+    max_ttl_seconds=ACCESS_TOKEN_CACHE_MAX_TTL_SECONDS,
+)
+
+metrics_registry.gauge(
+    "access_token_cache_entries",
+    "Verified access tokens currently cached",
+    lambda: {(): float(len(access_token_cache))},
+)
@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional
 
+from .permission_set import PermissionSet
+
 
 @dataclass
 class AccessTokenData:
@@ -11,3 +13,7 @@ class AccessTokenData:
     validated: bool
     tenant_id: int
     email: Optional[str]
+    permissions: PermissionSet = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.permissions = PermissionSet(self.roles)
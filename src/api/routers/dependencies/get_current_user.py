@@ -5,12 +5,25 @@ from fastapi import Request
 from jwt import DecodeError, ExpiredSignatureError, InvalidSignatureError
 
 from application.exceptions import UnauthorizedError
+from commons import measure_phase
 from config import JWT_SECRET_KEY
 
+from .access_token_cache import access_token_cache
 from .access_token_data import AccessTokenData
 
 
 def get_current_user(request: Request) -> AccessTokenData:
+    current_user = getattr(request.state, "current_user", None)
+    if current_user is not None:
+        return current_user
+
+    with measure_phase("auth"):
+        current_user = _decode_current_user(request)
+    request.state.current_user = current_user
+    return current_user
+
+
+def _decode_current_user(request: Request) -> AccessTokenData:
     authorization = request.headers.get("Authorization")
 
     if authorization is None:
@@ -22,9 +35,13 @@ def get_current_user(request: Request) -> AccessTokenData:
 
     token = parts[1]
 
+    cached = access_token_cache.get(token)
+    if cached is not None:
+        return cached
+
     try:
         payload: Dict[str, Any] = jwt.decode(token, key=JWT_SECRET_KEY, algorithms=["HS256"])
-        return AccessTokenData(
+        current_user = AccessTokenData(
             session_id=payload["sessionId"],
             user_id=payload["uid"],
             roles=payload["roles"],
@@ -39,3 +56,6 @@ def get_current_user(request: Request) -> AccessTokenData:
         raise UnauthorizedError("Invalid Access Token")
     except (ValueError, KeyError, DecodeError):
         raise UnauthorizedError("Invalid Access Token")
+
+    access_token_cache.put(token, current_user, payload)
+    return current_user
@@ -2,6 +2,7 @@ from collections.abc import Generator
 
 from fastapi import Request
 
+from commons import measure_phase
 from infra.database_manager import DatabaseManagerConnection
 
 
@@ -9,6 +10,9 @@ def get_database_manager(
     request: Request,
 ) -> Generator[DatabaseManagerConnection, None, None]:
     _ = request
-    db_manager = DatabaseManagerConnection()
+    with measure_phase("session"):
+        db_manager = DatabaseManagerConnection()
+        # Checks the connection out of the pool here so pool waits show up in this phase.
+        db_manager.session.connection()
     yield db_manager
     db_manager.close_session()
@@ -0,0 +1,36 @@
+from typing import FrozenSet, Iterable, Set, Tuple
+
+
+class PermissionSet:
+    def __init__(self, permissions: Iterable[str]):
+        allows_all = False
+        resources: Set[str] = set()
+        grants: Set[Tuple[str, str]] = set()
+
+        for permission in permissions:
+            if permission == "*":
+                allows_all = True
+                continue
+
+            parts = permission.split(":")
+            if len(parts) != 2:
+                continue
+
+            resource, action = parts
+            if resource == "*":
+                allows_all = True
+            elif action == "*":
+                resources.add(resource)
+            else:
+                grants.add((resource, action))
+
+        self.allows_all = allows_all
+        self.resources: FrozenSet[str] = frozenset(resources)
+        self.grants: FrozenSet[Tuple[str, str]] = frozenset(grants)
+
+    def allows(self, resource: str, action: str) -> bool:
+        return (
+            self.allows_all
+            or resource in self.resources
+            or (resource, action) in self.grants
+        )
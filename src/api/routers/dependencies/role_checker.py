@@ -1,10 +1,10 @@
-from typing import List
-
 from fastapi import Depends
 
 from application.exceptions import AccessDeniedError
+from commons import measure_phase
 
 from .current_user import CurrentUser
+from .permission_set import PermissionSet
 
 
 class PermissionChecker:
@@ -13,31 +13,15 @@ class PermissionChecker:
         self.resource, self.action = required_permission.split(":")
 
     async def __call__(self, current_user: CurrentUser) -> None:
-        if self._has_permission(current_user.roles):
+        with measure_phase("permission"):
+            has_permission = self._has_permission(current_user.permissions)
+        if has_permission:
             return
 
         raise AccessDeniedError("Access denied")
 
-    def _has_permission(self, user_permissions: List[str]) -> bool:
-        for permission in user_permissions:
-            if permission == "*":
-                return True
-
-            if ":" not in permission:
-                continue
-
-            resource, action = permission.split(":")
-
-            if resource == "*":
-                return True
-
-            if resource == self.resource and action == "*":
-                return True
-
-            if resource == self.resource and action == self.action:
-                return True
-
-        return False
+    def _has_permission(self, permissions: PermissionSet) -> bool:
+        return permissions.allows(self.resource, self.action)
 
 
 def require_role(permission: str):
@@ -0,0 +1,97 @@
+from datetime import date
+from http import HTTPStatus
+from typing import Optional
+
+from fastapi import APIRouter, Query
+
+from api.controllers import HolidaysController
+from api.routers.dependencies import (
+    CurrentUser,
+    DBManager,
+    require_role,
+    resolve_tenant_id,
+)
+from api.schemas import (
+    CreateHolidayRequest,
+    DefaultCreateResponse,
+    DefaultResponse,
+    HolidayResponse,
+    PaginatedResponse,
+)
+
+router = APIRouter()
+
+
+@router.post(
+    "",
+    status_code=HTTPStatus.CREATED,
+    response_model=DefaultCreateResponse,
+    dependencies=[require_role("holidays:create")],
+)
+async def create_holiday(
+    data: CreateHolidayRequest,
+    db_manager: DBManager,
+    current_user: CurrentUser,
+):
+    _ = current_user
+    return HolidaysController(db_manager).create(data)
+
+
+@router.get(
+    "/{holidayId}",
+    status_code=HTTPStatus.OK,
+    response_model=HolidayResponse,
+    dependencies=[require_role("holidays:read")],
+)
+async def get_holiday(
+    holidayId: int,
+    db_manager: DBManager,
+    current_user: CurrentUser,
+):
+    return HolidaysController(db_manager).find_by_id(
+        holiday_id=holidayId,
+        tenant_id=current_user.tenant_id,
+    )
+
+
+@router.get(
+    "",
+    status_code=HTTPStatus.OK,
+    response_model=PaginatedResponse[HolidayResponse],
+    dependencies=[require_role("holidays:read")],
+)
+async def list_holidays(
+    db_manager: DBManager,
+    current_user: CurrentUser,
+    page: int = Query(default=0, ge=0),
+    perPage: int = Query(default=20, ge=1, le=1000),
+    startDate: Optional[date] = None,
+    endDate: Optional[date] = None,
+    tenantId: Optional[int] = None,
+):
+    tenant_id = resolve_tenant_id(current_user, tenantId)
+    return HolidaysController(db_manager).list_all(
+        requester_tenant_id=tenant_id,
+        page=page,
+        per_page=perPage,
+        start_date=startDate,
+        end_date=endDate,
+    )
+
+
+@router.delete(
+    "/{holidayId}",
+    status_code=HTTPStatus.OK,
+    response_model=DefaultResponse,
+    dependencies=[require_role("holidays:write")],
+)
+async def delete_holiday(
+    holidayId: int,
+    db_manager: DBManager,
+    current_user: CurrentUser,
+):
+    HolidaysController(db_manager).delete(
+        holiday_id=holidayId,
+        tenant_id=current_user.tenant_id,
+    )
+    return DefaultResponse(message="Holiday deleted successfully")
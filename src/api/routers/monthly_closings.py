@@ -0,0 +1,124 @@
+from datetime import date
+from http import HTTPStatus
+from typing import Optional
+
+from fastapi import APIRouter, Query
+
+from api.controllers import MonthlyClosingsController
+from api.routers.dependencies import (
+    CurrentUser,
+    DBManager,
+    require_role,
+    resolve_tenant_id,
+)
+from api.schemas import (
+    CloseMonthRequest,
+    DefaultResponse,
+    MonthlyClosingResponse,
+    MonthlyClosingTotalResponse,
+    PaginatedResponse,
+)
+
+router = APIRouter()
+
+
+@router.post(
+    "",
+    status_code=HTTPStatus.CREATED,
+    response_model=MonthlyClosingResponse,
+    dependencies=[require_role("monthly_closings:create")],
+)
+async def close_month(
+    data: CloseMonthRequest,
+    db_manager: DBManager,
+    current_user: CurrentUser,
+):
+    return MonthlyClosingsController(db_manager).close(
+        data,
+        closed_by_user_id=current_user.user_id,
+    )
+
+
+@router.get(
+    "",
+    status_code=HTTPStatus.OK,
+    response_model=PaginatedResponse[MonthlyClosingResponse],
+    dependencies=[require_role("monthly_closings:read")],
+)
+async def list_monthly_closings(
+    db_manager: DBManager,
+    current_user: CurrentUser,
+    page: int = Query(default=0, ge=0),
+    perPage: int = Query(default=20, ge=1, le=1000),
+    startMonth: Optional[date] = None,
+    endMonth: Optional[date] = None,
+    tenantId: Optional[int] = None,
+):
+    tenant_id = resolve_tenant_id(current_user, tenantId)
+    return MonthlyClosingsController(db_manager).list_all(
+        requester_tenant_id=tenant_id,
+        page=page,
+        per_page=perPage,
+        start_month=startMonth,
+        end_month=endMonth,
+    )
+
+
+@router.get(
+    "/{closingId}",
+    status_code=HTTPStatus.OK,
+    response_model=MonthlyClosingResponse,
+    dependencies=[require_role("monthly_closings:read")],
+)
+async def get_monthly_closing(
+    closingId: int,
+    db_manager: DBManager,
+    current_user: CurrentUser,
+):
+    return MonthlyClosingsController(db_manager).find_by_id(
+        closing_id=closingId,
+        tenant_id=current_user.tenant_id,
+    )
+
+
+@router.get(
+    "/{closingId}/totals",
+    status_code=HTTPStatus.OK,
+    response_model=PaginatedResponse[MonthlyClosingTotalResponse],
+    dependencies=[require_role("monthly_closings:read")],
+)
+async def list_monthly_closing_totals(
+    closingId: int,
+    db_manager: DBManager,
+    current_user: CurrentUser,
+    page: int = Query(default=0, ge=0),
+    perPage: int = Query(default=20, ge=1, le=1000),
+    employeeId: Optional[int] = None,
+    matricula: Optional[str] = None,
+):
+    return MonthlyClosingsController(db_manager).list_totals(
+        closing_id=closingId,
+        tenant_id=current_user.tenant_id,
+        page=page,
+        per_page=perPage,
+        employee_id=employeeId,
+        matricula=matricula,
+    )
+
+
+@router.delete(
+    "/{closingId}",
+    status_code=HTTPStatus.OK,
+    response_model=DefaultResponse,
+    dependencies=[require_role("monthly_closings:delete")],
+)
+async def reopen_monthly_closing(
+    closingId: int,
+    db_manager: DBManager,
+    current_user: CurrentUser,
+):
+    MonthlyClosingsController(db_manager).reopen(
+        closing_id=closingId,
+        tenant_id=current_user.tenant_id,
+    )
+    return DefaultResponse(message="Monthly closing reopened successfully")
@@ -0,0 +1,40 @@
+from http import HTTPStatus
+from typing import Optional
+
+from fastapi import APIRouter, Query
+
+from api.controllers import TimesheetsController
+from api.routers.dependencies import (
+    CurrentUser,
+    DBManager,
+    require_role,
+    resolve_tenant_id,
+)
+from api.schemas import MonthlyTimesheetResponse
+
+router = APIRouter()
+
+
+@router.get(
+    "/monthly",
+    status_code=HTTPStatus.OK,
+    response_model=MonthlyTimesheetResponse,
+    dependencies=[require_role("timesheets:read")],
+)
+async def get_monthly_timesheet(
+    employeeId: int,
+    matricula: str,
+    db_manager: DBManager,
+    current_user: CurrentUser,
+    year: int = Query(ge=2000, le=2100),
+    month: int = Query(ge=1, le=12),
+    tenantId: Optional[int] = None,
+):
+    tenant_id = resolve_tenant_id(current_user, tenantId)
+    return TimesheetsController(db_manager).get_monthly(
+        requester_tenant_id=tenant_id,
+        employee_id=employeeId,
+        matricula=matricula,
+        year=year,
+        month=month,
+    )
@@ -1,10 +1,15 @@
 # pyright: reportUnusedImport=false
+from .attendance_analytics_response import AttendanceAnalyticsDayResponse, AttendanceAnalyticsTotalsResponse
+from .attendance_anomaly_response import AttendanceAnomalyResponse
 from .bank_hours_balance_response import BankHoursBalanceResponse
+from .bank_hours_ledger_import_response import BankHoursLedgerImportResponse, BankHoursLedgerImportRowResponse
 from .bank_hours_ledger_response import BankHoursLedgerResponse
+from .close_month_request import CloseMonthRequest
 from .create_bank_hours_ledger_entry_request import CreateBankHoursLedgerEntryRequest
 from .create_enrollment_policy_assignment_request import (
     CreateEnrollmentPolicyAssignmentRequest,
 )
+from .create_holiday_request import CreateHolidayRequest
 from .create_time_adjustment_request import CreateTimeAdjustmentRequest
 from .create_time_punch_request import CreateTimePunchRequest
 from .create_work_policy_template_request import CreateWorkPolicyTemplateRequest
@@ -14,6 +19,7 @@ from .default_create_response import DefaultCreateResponse
 from .default_response import DefaultResponse
 from .enrollment_policy_assignment_response import EnrollmentPolicyAssignmentResponse
 from .enums import (
+    AttendanceAnomalyTypeRequestEnum,
     BankHoursSourceRequestEnum,
     DailyAttendanceStatusRequestEnum,
     PunchTypeRequestEnum,
@@ -21,6 +27,16 @@ from .enums import (
     TimeAdjustmentStatusRequestEnum,
     TimeAdjustmentTypeRequestEnum,
 )
+from .fast_json_response import FastJSONResponse
+from .holiday_response import HolidayResponse
+from .monthly_closing_response import MonthlyClosingResponse
+from .monthly_closing_total_response import MonthlyClosingTotalResponse
+from .monthly_timesheet_response import (
+    MonthlyTimesheetDayResponse,
+    MonthlyTimesheetPunchResponse,
+    MonthlyTimesheetResponse,
+    MonthlyTimesheetTotalsResponse,
+)
 from .paginated_response import PaginatedResponse
 from .recalculate_daily_attendance_summary_request import (
     RecalculateDailyAttendanceSummaryRequest,
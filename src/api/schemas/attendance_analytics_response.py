@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass
+class AttendanceAnalyticsDayResponse:
+    workDate: date
+    okDays: int
+    incompleteDays: int
+    pendingAdjustmentDays: int
+    noPolicyDays: int
+    expectedMinutes: int
+    workedMinutes: int
+    breakMinutes: int
+    overtimeMinutes: int
+    deficitMinutes: int
+
+
+@dataclass
+class AttendanceAnalyticsTotalsResponse:
+    startDate: date
+    endDate: date
+    okDays: int
+    incompleteDays: int
+    pendingAdjustmentDays: int
+    noPolicyDays: int
+    expectedMinutes: int
+    workedMinutes: int
+    breakMinutes: int
+    overtimeMinutes: int
+    deficitMinutes: int
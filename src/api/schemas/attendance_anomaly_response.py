@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Optional
+
+
+@dataclass
+class AttendanceAnomalyResponse:
+    id: int
+    tenantId: int
+    employeeId: int
+    matricula: str
+    workDate: date
+    anomalyType: str
+    detail: str
+    punchId: Optional[int]
+    detectedAt: datetime
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass
+class BankHoursLedgerImportRowResponse:
+    line: int
+    id: Optional[int]
+    error: Optional[str]
+
+
+@dataclass
+class BankHoursLedgerImportResponse:
+    created: int
+    failed: int
+    rows: List[BankHoursLedgerImportRowResponse]
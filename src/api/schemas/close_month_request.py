@@ -0,0 +1,7 @@
+from pydantic import BaseModel, Field
+
+
+class CloseMonthRequest(BaseModel):
+    tenantId: int
+    year: int = Field(ge=2000, le=2100)
+    month: int = Field(ge=1, le=12)
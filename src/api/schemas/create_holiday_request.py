@@ -0,0 +1,11 @@
+from datetime import date
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class CreateHolidayRequest(BaseModel):
+    tenantId: int
+    name: str
+    startDate: date
+    endDate: Optional[date] = None
@@ -1,3 +1,5 @@
+from typing import List
+
 from pydantic import BaseModel
 
 
@@ -6,3 +8,4 @@ class CreateWorkPolicyTemplateRequest(BaseModel):
     name: str
     dailyWorkMinutes: int
     breakMinutes: int
+    restWeekdays: List[int] = []
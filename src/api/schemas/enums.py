@@ -38,3 +38,10 @@ class BankHoursSourceRequestEnum(str, Enum):
     DAILY_APURATION = "DAILY_APURATION"
     MANUAL_ADJUST = "MANUAL_ADJUST"
     ADJUSTMENT_REQUEST = "ADJUSTMENT_REQUEST"
+
+
+class AttendanceAnomalyTypeRequestEnum(str, Enum):
+    RAPID_PUNCHES = "RAPID_PUNCHES"
+    IMPOSSIBLE_SHIFT = "IMPOSSIBLE_SHIFT"
+    SHARED_PUNCH_TIME = "SHARED_PUNCH_TIME"
+    RECURRING_MISSING_OUT = "RECURRING_MISSING_OUT"
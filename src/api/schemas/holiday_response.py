@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass
+class HolidayResponse:
+    id: int
+    tenantId: int
+    name: str
+    startDate: date
+    endDate: date
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass
+class MonthlyClosingResponse:
+    id: int
+    tenantId: int
+    month: str
+    status: str
+    startedAt: datetime
+    closedAt: Optional[datetime]
+    closedByUserId: Optional[int]
+    recalculatedDays: int
+    totalsCount: int
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class MonthlyClosingTotalResponse:
+    employeeId: int
+    matricula: str
+    expectedMinutes: int
+    workedMinutes: int
+    breakMinutes: int
+    overtimeMinutes: int
+    deficitMinutes: int
+    okDays: int
+    incompleteDays: int
+    pendingAdjustmentDays: int
+    noPolicyDays: int
+    openingBalanceMinutes: int
+    closingBalanceMinutes: int
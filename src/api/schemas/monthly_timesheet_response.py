@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+
+@dataclass
+class MonthlyTimesheetPunchResponse:
+    id: int
+    punchedAt: datetime
+    punchType: str
+    source: str
+    note: Optional[str]
+
+
+@dataclass
+class MonthlyTimesheetDayResponse:
+    id: int
+    workDate: date
+    expectedMinutes: int
+    workedMinutes: int
+    breakMinutes: int
+    overtimeMinutes: int
+    deficitMinutes: int
+    status: str
+
+
+@dataclass
+class MonthlyTimesheetTotalsResponse:
+    expectedMinutes: int
+    workedMinutes: int
+    breakMinutes: int
+    overtimeMinutes: int
+    deficitMinutes: int
+    daysByStatus: Dict[str, int]
+
+
+@dataclass
+class MonthlyTimesheetResponse:
+    tenantId: int
+    employeeId: int
+    matricula: str
+    month: str
+    closed: bool
+    startDate: date
+    endDate: date
+    punches: List[MonthlyTimesheetPunchResponse]
+    days: List[MonthlyTimesheetDayResponse]
+    totals: MonthlyTimesheetTotalsResponse
+    openingBalanceMinutes: int
+    monthBalanceMinutes: int
+    closingBalanceMinutes: int
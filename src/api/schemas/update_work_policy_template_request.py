@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel
 
@@ -7,3 +7,4 @@ class UpdateWorkPolicyTemplateRequest(BaseModel):
     name: Optional[str] = None
     dailyWorkMinutes: Optional[int] = None
     breakMinutes: Optional[int] = None
+    restWeekdays: Optional[List[int]] = None
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import List
 
 
 @dataclass
@@ -8,3 +9,4 @@ class WorkPolicyTemplateResponse:
     name: str
     dailyWorkMinutes: int
     breakMinutes: int
+    restWeekdays: List[int]
@@ -1,19 +1,34 @@
 # pyright: reportUnusedImport=false
+from .close_month_dto import CloseMonthDTO
 from .create_bank_hours_ledger_entry_dto import CreateBankHoursLedgerEntryDTO
 from .create_enrollment_policy_assignment_dto import CreateEnrollmentPolicyAssignmentDTO
+from .create_holiday_dto import CreateHolidayDTO
 from .create_time_adjustment_item_dto import CreateTimeAdjustmentItemDTO
 from .create_time_adjustment_request_dto import CreateTimeAdjustmentRequestDTO
 from .create_time_punch_dto import CreateTimePunchDTO
 from .create_work_policy_template_dto import CreateWorkPolicyTemplateDTO
 from .decide_time_adjustment_request_dto import DecideTimeAdjustmentRequestDTO
+from .detect_attendance_anomalies_dto import DetectAttendanceAnomaliesDTO
+from .get_attendance_analytics_dto import GetAttendanceAnalyticsDTO
 from .get_bank_hours_balance_dto import GetBankHoursBalanceDTO
+from .get_monthly_timesheet_dto import GetMonthlyTimesheetDTO
+from .import_bank_hours_ledger_entries_dto import ImportBankHoursLedgerEntriesDTO
+from .import_bank_hours_ledger_entry_dto import ImportBankHoursLedgerEntryDTO
+from .list_attendance_anomalies_dto import ListAttendanceAnomaliesDTO
 from .list_bank_hours_ledger_entries_dto import ListBankHoursLedgerEntriesDTO
 from .list_daily_attendance_summaries_dto import ListDailyAttendanceSummariesDTO
 from .list_enrollment_policy_assignments_dto import ListEnrollmentPolicyAssignmentsDTO
+from .list_holidays_dto import ListHolidaysDTO
+from .list_monthly_closing_totals_dto import ListMonthlyClosingTotalsDTO
+from .list_monthly_closings_dto import ListMonthlyClosingsDTO
 from .list_time_adjustment_requests_dto import ListTimeAdjustmentRequestsDTO
 from .list_time_punches_dto import ListTimePunchesDTO
 from .list_work_policy_templates_dto import ListWorkPolicyTemplatesDTO
 from .paginated_result import PaginatedResult
+from .recalculate_daily_attendance_summaries_by_period_dto import (
+    RecalculateDailyAttendanceSummariesByPeriodDTO,
+)
 from .recalculate_daily_attendance_summary_dto import RecalculateDailyAttendanceSummaryDTO
+from .relay_outbox_events_dto import RelayOutboxEventsDTO
 from .update_enrollment_policy_assignment_dto import UpdateEnrollmentPolicyAssignmentDTO
 from .update_work_policy_template_dto import UpdateWorkPolicyTemplateDTO
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+
+@dataclass
+class CloseMonthDTO:
+    tenant_id: int
+    month: date
+    closed_by_user_id: Optional[int] = None
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+
+@dataclass
+class CreateHolidayDTO:
+    tenant_id: int
+    name: str
+    start_date: date
+    end_date: Optional[date] = None
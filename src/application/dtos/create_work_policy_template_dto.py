@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import List, Optional
 
 
 @dataclass
@@ -7,3 +8,4 @@ class CreateWorkPolicyTemplateDTO:
     name: str
     daily_work_minutes: int
     break_minutes: int
+    rest_weekdays: Optional[List[int]] = None
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass
+class DetectAttendanceAnomaliesDTO:
+    tenant_id: int
+    start_date: date
+    end_date: date
+    min_punch_gap_seconds: int = 60
+    max_worked_minutes: int = 960
+    shared_punch_min_employees: int = 10
+    missing_out_min_days: int = 3
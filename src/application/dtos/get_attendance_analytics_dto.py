@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass
+class GetAttendanceAnalyticsDTO:
+    tenant_id: int
+    start_date: date
+    end_date: date
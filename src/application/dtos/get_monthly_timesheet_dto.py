@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass
+class GetMonthlyTimesheetDTO:
+    tenant_id: int
+    employee_id: int
+    matricula: str
+    month: date
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from typing import List
+
+from .import_bank_hours_ledger_entry_dto import ImportBankHoursLedgerEntryDTO
+
+
+@dataclass
+class ImportBankHoursLedgerEntriesDTO:
+    tenant_id: int
+    entries: List[ImportBankHoursLedgerEntryDTO]
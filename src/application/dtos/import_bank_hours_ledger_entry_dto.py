@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+
+@dataclass
+class ImportBankHoursLedgerEntryDTO:
+    line: int
+    employee_id: int
+    matricula: str
+    event_date: date
+    minutes_delta: int
+    reference_id: Optional[int] = None
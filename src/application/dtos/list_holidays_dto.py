@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+
+@dataclass
+class ListHolidaysDTO:
+    page: int
+    per_page: int
+    tenant_id: Optional[int] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
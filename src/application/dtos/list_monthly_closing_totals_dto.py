@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class ListMonthlyClosingTotalsDTO:
+    page: int
+    per_page: int
+    monthly_closing_id: int
+    employee_id: Optional[int] = None
+    matricula: Optional[str] = None
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+
+@dataclass
+class ListMonthlyClosingsDTO:
+    page: int
+    per_page: int
+    tenant_id: Optional[int] = None
+    start_month: Optional[date] = None
+    end_month: Optional[date] = None
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass
+class RecalculateDailyAttendanceSummariesByPeriodDTO:
+    tenant_id: int
+    employee_id: int
+    matricula: str
+    start_date: date
+    end_date: date
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class RelayOutboxEventsDTO:
+    batch_size: int = 500
+    max_attempts: int = 10
+    retry_base_seconds: int = 5
+    retry_max_seconds: int = 900
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 
 
 @dataclass
@@ -7,3 +7,4 @@ class UpdateWorkPolicyTemplateDTO:
     name: Optional[str] = None
     daily_work_minutes: Optional[int] = None
     break_minutes: Optional[int] = None
+    rest_weekdays: Optional[List[int]] = None
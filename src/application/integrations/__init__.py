@@ -1,3 +1,4 @@
 # pyright: reportUnusedImport=false
+from .attendance_change_publisher_interface import AttendanceChangePublisherInterface
 from .integration_manager_interface import IntegrationManagerInterface
 from .queue_integration_interface import QueueIntegrationInterface
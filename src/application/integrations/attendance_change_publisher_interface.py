@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+
+from domain import AttendanceChange
+
+
+class AttendanceChangePublisherInterface(ABC):
+    @abstractmethod
+    def publish(self, change: AttendanceChange) -> None:
+        raise NotImplementedError
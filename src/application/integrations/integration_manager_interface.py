@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+from .attendance_change_publisher_interface import AttendanceChangePublisherInterface
 from .queue_integration_interface import QueueIntegrationInterface
 
 
@@ -7,3 +8,7 @@ class IntegrationManagerInterface(ABC):
     @abstractmethod
     def queue_integration(self) -> QueueIntegrationInterface:
         raise NotImplementedError
+
+    @abstractmethod
+    def attendance_change_publisher(self) -> AttendanceChangePublisherInterface:
+        raise NotImplementedError
@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
 
 class QueueIntegrationInterface(ABC):
     @abstractmethod
     def publish(self, topic: str, payload: Dict[str, Any]) -> None:
         raise NotImplementedError
+
+    def publish_many(self, messages: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """Publishes (topic, payload) pairs in order; raises if any of them was not accepted."""
+        for topic, payload in messages:
+            self.publish(topic, payload)
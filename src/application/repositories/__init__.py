@@ -1,16 +1,24 @@
 # pyright: reportUnusedImport=false
+from .attendance_anomaly_repository_interface import AttendanceAnomalyRepositoryInterface
 from .bank_hours_ledger_repository_interface import BankHoursLedgerRepositoryInterface
+from .daily_attendance_rollup_repository_interface import DailyAttendanceRollupRepositoryInterface
 from .daily_attendance_summary_repository_interface import (
     DailyAttendanceSummaryRepositoryInterface,
 )
 from .enrollment_policy_assignment_repository_interface import (
     EnrollmentPolicyAssignmentRepositoryInterface,
 )
+from .holiday_repository_interface import HolidayRepositoryInterface
+from .monthly_closing_repository_interface import MonthlyClosingRepositoryInterface
+from .monthly_closing_total_repository_interface import MonthlyClosingTotalRepositoryInterface
+from .outbox_event_repository_interface import OutboxEventRepositoryInterface
 from .repository_manager_interface import RepositoryManagerInterface
+from .resource_version_repository_interface import ResourceVersionRepositoryInterface
 from .time_adjustment_item_repository_interface import TimeAdjustmentItemRepositoryInterface
 from .time_adjustment_request_repository_interface import (
     TimeAdjustmentRequestRepositoryInterface,
 )
+from .time_punch_archive_repository_interface import TimePunchArchiveRepositoryInterface
 from .time_punch_repository_interface import TimePunchRepositoryInterface
 from .types import DBPaginatedResult
 from .work_policy_template_repository_interface import WorkPolicyTemplateRepositoryInterface
@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List, Optional
+
+from application.repositories.types import DBPaginatedResult
+from domain import AttendanceAnomaly
+from domain.enums import AttendanceAnomalyType
+
+
+class AttendanceAnomalyRepositoryInterface(ABC):
+    @abstractmethod
+    def replace_in_period(
+        self, tenant_id: int, start_date: date, end_date: date, anomalies: List[AttendanceAnomaly]
+    ) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_all(
+        self,
+        page: int,
+        per_page: int,
+        tenant_id: Optional[int] = None,
+        employee_id: Optional[int] = None,
+        matricula: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        anomaly_type: Optional[AttendanceAnomalyType] = None,
+    ) -> DBPaginatedResult[AttendanceAnomaly]:
+        raise NotImplementedError
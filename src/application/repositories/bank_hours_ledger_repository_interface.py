@@ -1,9 +1,9 @@
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple
 
 from application.repositories.types import DBPaginatedResult
-from domain import BankHoursLedger
+from domain import BankHoursLedger, BankHoursLedgerRow
 from domain.enums import BankHoursSource
 
 
@@ -12,6 +12,10 @@ class BankHoursLedgerRepositoryInterface(ABC):
     def create(self, entry: BankHoursLedger) -> BankHoursLedger:
         raise NotImplementedError
 
+    @abstractmethod
+    def create_many(self, entries: List[BankHoursLedger]) -> List[BankHoursLedgerRow]:
+        raise NotImplementedError
+
     @abstractmethod
     def find_by_id(self, entry_id: int) -> Optional[BankHoursLedger]:
         raise NotImplementedError
@@ -30,12 +34,38 @@ class BankHoursLedgerRepositoryInterface(ABC):
     ) -> DBPaginatedResult[BankHoursLedger]:
         raise NotImplementedError
 
+    @abstractmethod
+    def find_all_rows(
+        self,
+        page: int,
+        per_page: int,
+        tenant_id: Optional[int] = None,
+        employee_id: Optional[int] = None,
+        matricula: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        source: Optional[BankHoursSource] = None,
+    ) -> DBPaginatedResult[BankHoursLedgerRow]:
+        raise NotImplementedError
+
     @abstractmethod
     def get_balance_until(self, employee_id: int, matricula: str, until_date: date) -> int:
         raise NotImplementedError
 
+    @abstractmethod
+    def get_balances_around_period(
+        self, tenant_id: int, employee_id: int, matricula: str, start_date: date, end_date: date
+    ) -> Tuple[int, int]:
+        raise NotImplementedError
+
     @abstractmethod
     def delete_auto_generated_for_day(
         self, employee_id: int, matricula: str, event_date: date, source: BankHoursSource
     ) -> None:
         raise NotImplementedError
+
+    @abstractmethod
+    def delete_auto_generated_for_days(
+        self, employee_id: int, matricula: str, event_dates: Sequence[date], source: BankHoursSource
+    ) -> None:
+        raise NotImplementedError
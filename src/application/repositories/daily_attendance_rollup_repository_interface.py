@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List, Optional, Sequence, Tuple
+
+from domain import AttendanceRollupRow, AttendanceRollupTotals, DailyAttendanceSummary, DailyAttendanceSummaryRow
+
+
+class DailyAttendanceRollupRepositoryInterface(ABC):
+    @abstractmethod
+    def record_change(
+        self, previous: Optional[DailyAttendanceSummaryRow], current: DailyAttendanceSummary
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def record_changes(
+        self, changes: Sequence[Tuple[Optional[DailyAttendanceSummaryRow], DailyAttendanceSummary]]
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def rebuild(self, tenant_id: int, start_date: date, end_date: date) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_daily_rows(self, tenant_id: int, start_date: date, end_date: date) -> List[AttendanceRollupRow]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_totals(self, tenant_id: int, start_date: date, end_date: date) -> AttendanceRollupTotals:
+        raise NotImplementedError
@@ -1,9 +1,9 @@
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from application.repositories.types import DBPaginatedResult
-from domain import DailyAttendanceSummary
+from domain import DailyAttendanceSummary, DailyAttendanceSummaryRow
 from domain.enums import DailyAttendanceStatus
 
 
@@ -12,6 +12,10 @@ class DailyAttendanceSummaryRepositoryInterface(ABC):
     def upsert(self, summary: DailyAttendanceSummary) -> DailyAttendanceSummary:
         raise NotImplementedError
 
+    @abstractmethod
+    def upsert_many(self, summaries: List[DailyAttendanceSummary]) -> List[DailyAttendanceSummaryRow]:
+        raise NotImplementedError
+
     @abstractmethod
     def find_by_id(self, summary_id: int) -> Optional[DailyAttendanceSummary]:
         raise NotImplementedError
@@ -22,6 +26,28 @@ class DailyAttendanceSummaryRepositoryInterface(ABC):
     ) -> Optional[DailyAttendanceSummary]:
         raise NotImplementedError
 
+    @abstractmethod
+    def find_by_employee_and_matricula_and_period(
+        self, employee_id: int, matricula: str, start_date: date, end_date: date
+    ) -> List[DailyAttendanceSummary]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_rows_by_enrollment_and_period(
+        self, tenant_id: int, employee_id: int, matricula: str, start_date: date, end_date: date
+    ) -> List[DailyAttendanceSummaryRow]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_dirty_days(self, tenant_id: int, start_date: date, end_date: date) -> List[Tuple[int, str, date]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_rows_with_worked_minutes_above(
+        self, tenant_id: int, start_date: date, end_date: date, worked_minutes: int
+    ) -> List[DailyAttendanceSummaryRow]:
+        raise NotImplementedError
+
     @abstractmethod
     def find_all(
         self,
@@ -35,3 +61,17 @@ class DailyAttendanceSummaryRepositoryInterface(ABC):
         status: Optional[DailyAttendanceStatus] = None,
     ) -> DBPaginatedResult[DailyAttendanceSummary]:
         raise NotImplementedError
+
+    @abstractmethod
+    def find_all_rows(
+        self,
+        page: int,
+        per_page: int,
+        tenant_id: Optional[int] = None,
+        employee_id: Optional[int] = None,
+        matricula: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        status: Optional[DailyAttendanceStatus] = None,
+    ) -> DBPaginatedResult[DailyAttendanceSummaryRow]:
+        raise NotImplementedError
@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List, Optional, Tuple
+
+from application.repositories.types import DBPaginatedResult
+from domain import Holiday
+
+
+class HolidayRepositoryInterface(ABC):
+    @abstractmethod
+    def create(self, entry: Holiday) -> Holiday:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, holiday_id: int) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_by_id(self, holiday_id: int) -> Optional[Holiday]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_periods_by_tenant(self, tenant_id: int) -> List[Tuple[date, date]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_all(
+        self,
+        page: int,
+        per_page: int,
+        tenant_id: Optional[int] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> DBPaginatedResult[Holiday]:
+        raise NotImplementedError
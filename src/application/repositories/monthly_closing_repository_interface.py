@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from application.repositories.types import DBPaginatedResult
+from domain import MonthlyClosing
+
+
+class MonthlyClosingRepositoryInterface(ABC):
+    @abstractmethod
+    def create(self, closing: MonthlyClosing) -> MonthlyClosing:
+        raise NotImplementedError
+
+    @abstractmethod
+    def update(self, closing_id: int, data: Dict[str, Any]) -> Optional[MonthlyClosing]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, closing_id: int) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_by_id(self, closing_id: int) -> Optional[MonthlyClosing]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_by_tenant_and_month(self, tenant_id: int, month: date) -> Optional[MonthlyClosing]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_closed_months(self, tenant_id: int, months: List[date]) -> List[date]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_all(
+        self,
+        page: int,
+        per_page: int,
+        tenant_id: Optional[int] = None,
+        start_month: Optional[date] = None,
+        end_month: Optional[date] = None,
+    ) -> DBPaginatedResult[MonthlyClosing]:
+        raise NotImplementedError
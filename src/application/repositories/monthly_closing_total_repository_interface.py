@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Any, Optional
+
+from application.repositories.types import DBPaginatedResult
+from domain import MonthlyClosing, MonthlyClosingTotal
+
+
+class MonthlyClosingTotalRepositoryInterface(ABC):
+    @abstractmethod
+    def materialize(self, closing: MonthlyClosing) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_closed_by_enrollment_and_month(
+        self, tenant_id: int, employee_id: int, matricula: str, month: date
+    ) -> Optional[MonthlyClosingTotal]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_all_rows(
+        self,
+        page: int,
+        per_page: int,
+        monthly_closing_id: int,
+        employee_id: Optional[int] = None,
+        matricula: Optional[str] = None,
+    ) -> DBPaginatedResult[Any]:
+        raise NotImplementedError
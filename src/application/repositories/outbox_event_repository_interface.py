@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, NamedTuple, Sequence
+
+from domain import OutboxEventRow
+from domain.enums import OutboxTopic
+
+
+class OutboxEventRepositoryInterface(ABC):
+    @abstractmethod
+    def add(self, topic: OutboxTopic, rows: Sequence[NamedTuple]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def claim_batch(self, limit: int, max_attempts: int) -> List[OutboxEventRow]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def mark_sent(self, event_ids: List[int]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def mark_failed(
+        self, event_ids: List[int], error: str, base_delay_seconds: int, max_delay_seconds: int
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def count_pending(self, max_attempts: int) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_sent_before(self, sent_before: datetime) -> int:
+        raise NotImplementedError
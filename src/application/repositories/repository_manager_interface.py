@@ -1,16 +1,24 @@
 from abc import ABC, abstractmethod
 
+from .attendance_anomaly_repository_interface import AttendanceAnomalyRepositoryInterface
 from .bank_hours_ledger_repository_interface import BankHoursLedgerRepositoryInterface
+from .daily_attendance_rollup_repository_interface import DailyAttendanceRollupRepositoryInterface
 from .daily_attendance_summary_repository_interface import (
     DailyAttendanceSummaryRepositoryInterface,
 )
 from .enrollment_policy_assignment_repository_interface import (
     EnrollmentPolicyAssignmentRepositoryInterface,
 )
+from .holiday_repository_interface import HolidayRepositoryInterface
+from .monthly_closing_repository_interface import MonthlyClosingRepositoryInterface
+from .monthly_closing_total_repository_interface import MonthlyClosingTotalRepositoryInterface
+from .outbox_event_repository_interface import OutboxEventRepositoryInterface
+from .resource_version_repository_interface import ResourceVersionRepositoryInterface
 from .time_adjustment_item_repository_interface import TimeAdjustmentItemRepositoryInterface
 from .time_adjustment_request_repository_interface import (
     TimeAdjustmentRequestRepositoryInterface,
 )
+from .time_punch_archive_repository_interface import TimePunchArchiveRepositoryInterface
 from .time_punch_repository_interface import TimePunchRepositoryInterface
 from .work_policy_template_repository_interface import WorkPolicyTemplateRepositoryInterface
 
@@ -47,3 +55,35 @@ class RepositoryManagerInterface(ABC):
     @abstractmethod
     def bank_hours_ledger_repository(self) -> BankHoursLedgerRepositoryInterface:
         raise NotImplementedError
+
+    @abstractmethod
+    def resource_version_repository(self) -> ResourceVersionRepositoryInterface:
+        raise NotImplementedError
+
+    @abstractmethod
+    def monthly_closing_repository(self) -> MonthlyClosingRepositoryInterface:
+        raise NotImplementedError
+
+    @abstractmethod
+    def monthly_closing_total_repository(self) -> MonthlyClosingTotalRepositoryInterface:
+        raise NotImplementedError
+
+    @abstractmethod
+    def time_punch_archive_repository(self) -> TimePunchArchiveRepositoryInterface:
+        raise NotImplementedError
+
+    @abstractmethod
+    def daily_attendance_rollup_repository(self) -> DailyAttendanceRollupRepositoryInterface:
+        raise NotImplementedError
+
+    @abstractmethod
+    def attendance_anomaly_repository(self) -> AttendanceAnomalyRepositoryInterface:
+        raise NotImplementedError
+
+    @abstractmethod
+    def outbox_event_repository(self) -> OutboxEventRepositoryInterface:
+        raise NotImplementedError
+
+    @abstractmethod
+    def holiday_repository(self) -> HolidayRepositoryInterface:
+        raise NotImplementedError
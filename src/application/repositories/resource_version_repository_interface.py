@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional, Tuple
+
+from domain.enums import ResourceScope
+
+
+class ResourceVersionRepositoryInterface(ABC):
+    @abstractmethod
+    def get_version(
+        self, scope: ResourceScope, tenant_id: Optional[int] = None, key: Optional[str] = None
+    ) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def bump(self, scope: ResourceScope, tenant_id: int, key: Optional[str] = None) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def bump_many(self, versions: Iterable[Tuple[ResourceScope, int, Optional[str]]]) -> None:
+        raise NotImplementedError
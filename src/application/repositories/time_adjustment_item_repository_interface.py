@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import List
 
 from domain import TimeAdjustmentItem
@@ -16,3 +17,11 @@ class TimeAdjustmentItemRepositoryInterface(ABC):
     @abstractmethod
     def delete_by_request_id(self, request_id: int) -> None:
         raise NotImplementedError
+
+    @abstractmethod
+    def has_open_items_for_punch(self, punch_id: int) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def has_open_items_for_punches_in_period(self, tenant_id: int, start_at: datetime, end_at: datetime) -> bool:
+        raise NotImplementedError
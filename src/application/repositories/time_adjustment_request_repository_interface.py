@@ -26,6 +26,12 @@ class TimeAdjustmentRequestRepositoryInterface(ABC):
     def find_by_id(self, request_id: int) -> Optional[TimeAdjustmentRequest]:
         raise NotImplementedError
 
+    @abstractmethod
+    def exists_with_status_for_enrollment_and_date(
+        self, tenant_id: int, employee_id: int, matricula: str, request_date: date, status: TimeAdjustmentStatus
+    ) -> bool:
+        raise NotImplementedError
+
     @abstractmethod
     def find_all(
         self,
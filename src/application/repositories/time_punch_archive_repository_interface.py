@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import List, Optional
+
+from domain import TimePunch, TimePunchArchive
+
+
+class TimePunchArchiveRepositoryInterface(ABC):
+    @abstractmethod
+    def archive_month(self, tenant_id: int, month: date) -> TimePunchArchive:
+        raise NotImplementedError
+
+    @abstractmethod
+    def restore(self, archive: TimePunchArchive) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_by_tenant_and_month(self, tenant_id: int, month: date) -> Optional[TimePunchArchive]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_punches(
+        self,
+        employee_id: int,
+        matricula: str,
+        start_at: datetime,
+        end_at: datetime,
+        tenant_id: Optional[int] = None,
+    ) -> List[TimePunch]:
+        raise NotImplementedError
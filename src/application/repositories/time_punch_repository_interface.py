@@ -1,9 +1,9 @@
 from abc import ABC, abstractmethod
 from datetime import date, datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from application.repositories.types import DBPaginatedResult
-from domain import TimePunch
+from domain import TimePunch, TimePunchRow
 from domain.enums import PunchType
 
 
@@ -12,6 +12,10 @@ class TimePunchRepositoryInterface(ABC):
     def create(self, punch: TimePunch) -> TimePunch:
         raise NotImplementedError
 
+    @abstractmethod
+    def create_many(self, punches: List[TimePunch]) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     def update(self, punch_id: int, data: Dict[str, Any]) -> Optional[TimePunch]:
         raise NotImplementedError
@@ -38,7 +42,12 @@ class TimePunchRepositoryInterface(ABC):
 
     @abstractmethod
     def find_by_employee_and_matricula_and_period(
-        self, employee_id: int, matricula: str, start_at: datetime, end_at: datetime
+        self,
+        employee_id: int,
+        matricula: str,
+        start_at: datetime,
+        end_at: datetime,
+        tenant_id: Optional[int] = None,
     ) -> List[TimePunch]:
         raise NotImplementedError
 
@@ -48,6 +57,12 @@ class TimePunchRepositoryInterface(ABC):
     ) -> List[TimePunch]:
         raise NotImplementedError
 
+    @abstractmethod
+    def find_rows_by_enrollment_and_period(
+        self, tenant_id: int, employee_id: int, matricula: str, start_at: datetime, end_at: datetime
+    ) -> List[TimePunchRow]:
+        raise NotImplementedError
+
     @abstractmethod
     def find_other_matriculas_with_punch_on_date(
         self,
@@ -58,6 +73,28 @@ class TimePunchRepositoryInterface(ABC):
     ) -> List[TimePunch]:
         raise NotImplementedError
 
+    @abstractmethod
+    def find_enrollments_with_punch_in_period(
+        self,
+        tenant_id: int,
+        start_at: datetime,
+        end_at: datetime,
+        employee_id: Optional[int] = None,
+    ) -> List[Tuple[int, str]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_row_chunks_in_period(
+        self, tenant_id: int, start_at: datetime, end_at: datetime, chunk_size: int
+    ) -> Iterator[List[TimePunchRow]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_rows_sharing_punch_time(
+        self, tenant_id: int, start_at: datetime, end_at: datetime, min_employees: int
+    ) -> List[TimePunchRow]:
+        raise NotImplementedError
+
     @abstractmethod
     def find_all(
         self,
@@ -71,3 +108,17 @@ class TimePunchRepositoryInterface(ABC):
         punch_type: Optional[PunchType] = None,
     ) -> DBPaginatedResult[TimePunch]:
         raise NotImplementedError
+
+    @abstractmethod
+    def find_all_rows(
+        self,
+        page: int,
+        per_page: int,
+        tenant_id: Optional[int] = None,
+        employee_id: Optional[int] = None,
+        matricula: Optional[str] = None,
+        start_at: Optional[datetime] = None,
+        end_at: Optional[datetime] = None,
+        punch_type: Optional[PunchType] = None,
+    ) -> DBPaginatedResult[TimePunchRow]:
+        raise NotImplementedError
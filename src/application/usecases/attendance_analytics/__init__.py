@@ -0,0 +1,4 @@
+# pyright: reportUnusedImport=false
+from .get_attendance_rollup_totals_usecase import GetAttendanceRollupTotalsUseCase
+from .list_daily_attendance_rollups_usecase import ListDailyAttendanceRollupsUseCase
+from .rebuild_attendance_rollups_usecase import RebuildAttendanceRollupsUseCase
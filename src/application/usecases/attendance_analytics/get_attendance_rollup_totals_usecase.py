@@ -0,0 +1,19 @@
+from application.dtos import GetAttendanceAnalyticsDTO
+from application.exceptions import BadRequestError
+from application.repositories import RepositoryManagerInterface
+from domain import AttendanceRollupTotals
+
+
+class GetAttendanceRollupTotalsUseCase:
+    def __init__(self, repository_manager: RepositoryManagerInterface):
+        self.daily_attendance_rollup_repository = repository_manager.daily_attendance_rollup_repository()
+
+    def execute(self, data: GetAttendanceAnalyticsDTO) -> AttendanceRollupTotals:
+        if data.start_date > data.end_date:
+            raise BadRequestError("start_date must be less than or equal to end_date.")
+
+        return self.daily_attendance_rollup_repository.find_totals(
+            tenant_id=data.tenant_id,
+            start_date=data.start_date,
+            end_date=data.end_date,
+        )
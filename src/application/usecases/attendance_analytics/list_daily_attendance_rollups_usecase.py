@@ -0,0 +1,26 @@
+from typing import List
+
+from application.dtos import GetAttendanceAnalyticsDTO
+from application.exceptions import BadRequestError
+from application.repositories import RepositoryManagerInterface
+from domain import AttendanceRollupRow
+
+MAX_PERIOD_DAYS = 366
+
+
+class ListDailyAttendanceRollupsUseCase:
+    def __init__(self, repository_manager: RepositoryManagerInterface):
+        self.daily_attendance_rollup_repository = repository_manager.daily_attendance_rollup_repository()
+
+    def execute(self, data: GetAttendanceAnalyticsDTO) -> List[AttendanceRollupRow]:
+        if data.start_date > data.end_date:
+            raise BadRequestError("start_date must be less than or equal to end_date.")
+
+        if (data.end_date - data.start_date).days >= MAX_PERIOD_DAYS:
+            raise BadRequestError(f"period must not exceed {MAX_PERIOD_DAYS} days.")
+
+        return self.daily_attendance_rollup_repository.find_daily_rows(
+            tenant_id=data.tenant_id,
+            start_date=data.start_date,
+            end_date=data.end_date,
+        )
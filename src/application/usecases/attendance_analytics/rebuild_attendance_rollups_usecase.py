@@ -0,0 +1,19 @@
+from datetime import date
+
+from application.exceptions import BadRequestError
+from application.repositories import RepositoryManagerInterface
+
+
+class RebuildAttendanceRollupsUseCase:
+    def __init__(self, repository_manager: RepositoryManagerInterface):
+        self.daily_attendance_rollup_repository = repository_manager.daily_attendance_rollup_repository()
+
+    def execute(self, tenant_id: int, start_date: date, end_date: date) -> int:
+        if start_date > end_date:
+            raise BadRequestError("start_date must be less than or equal to end_date.")
+
+        return self.daily_attendance_rollup_repository.rebuild(
+            tenant_id=tenant_id,
+            start_date=start_date,
+            end_date=end_date,
+        )
@@ -0,0 +1,3 @@
+# pyright: reportUnusedImport=false
+from .detect_attendance_anomalies_usecase import DetectAttendanceAnomaliesUseCase
+from .list_attendance_anomalies_usecase import ListAttendanceAnomaliesUseCase
@@ -0,0 +1,160 @@
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Set, Tuple
+
+import numpy as np
+
+from application.dtos import DetectAttendanceAnomaliesDTO
+from application.exceptions import BadRequestError
+from application.repositories import RepositoryManagerInterface
+from domain import AttendanceAnomaly, MonthlyTimesheet, TimePunchRow
+from domain.attendance_anomaly_kernel import count_occurrences, detect_punch_anomalies
+from domain.day_timeline_kernel import punch_columns
+from domain.enums import AttendanceAnomalyType
+
+CHUNK_ROWS = 200_000
+
+
+class DetectAttendanceAnomaliesUseCase:
+    def __init__(self, repository_manager: RepositoryManagerInterface):
+        self.time_punch_repository = repository_manager.time_punch_repository()
+        self.daily_attendance_summary_repository = repository_manager.daily_attendance_summary_repository()
+        self.attendance_anomaly_repository = repository_manager.attendance_anomaly_repository()
+
+    def execute(self, data: DetectAttendanceAnomaliesDTO) -> Dict[AttendanceAnomalyType, int]:
+        if data.start_date > data.end_date:
+            raise BadRequestError("start_date must be less than or equal to end_date.")
+
+        found = dict.fromkeys(AttendanceAnomalyType, 0)
+        period_start = data.start_date
+        # One month at a time: findings are committed per month, which also bounds "recurring" missing OUTs.
+        while period_start <= data.end_date:
+            period_end = min(MonthlyTimesheet.month_bounds(period_start)[1], data.end_date)
+            anomalies = self.__detect_period(data, period_start, period_end)
+            self.attendance_anomaly_repository.replace_in_period(data.tenant_id, period_start, period_end, anomalies)
+            for anomaly in anomalies:
+                found[anomaly.anomaly_type] += 1
+            period_start = period_end + timedelta(days=1)
+        return found
+
+    def __detect_period(
+        self, data: DetectAttendanceAnomaliesDTO, start_date: date, end_date: date
+    ) -> List[AttendanceAnomaly]:
+        detected_at = datetime.utcnow()
+        start_at = datetime.combine(start_date, time.min)
+        end_at = datetime.combine(end_date, time.max)
+
+        anomalies: List[AttendanceAnomaly] = []
+        pending: List[TimePunchRow] = []
+        for chunk in self.time_punch_repository.iter_row_chunks_in_period(
+            data.tenant_id, start_at, end_at, CHUNK_ROWS
+        ):
+            rows = pending + chunk
+            # The last enrollment of a chunk may continue in the next one, so it waits to be analyzed whole.
+            split = len(rows)
+            last_enrollment = (rows[-1].employee_id, rows[-1].matricula)
+            while split > 0 and (rows[split - 1].employee_id, rows[split - 1].matricula) == last_enrollment:
+                split -= 1
+            anomalies.extend(self.__punch_sequence_anomalies(data, rows[:split], detected_at))
+            pending = rows[split:]
+        anomalies.extend(self.__punch_sequence_anomalies(data, pending, detected_at))
+
+        anomalies.extend(self.__shared_punch_time_anomalies(data, start_at, end_at, detected_at))
+        anomalies.extend(self.__impossible_shift_anomalies(data, start_date, end_date, detected_at))
+        return anomalies
+
+    def __punch_sequence_anomalies(
+        self, data: DetectAttendanceAnomaliesDTO, rows: List[TimePunchRow], detected_at: datetime
+    ) -> List[AttendanceAnomaly]:
+        if len(rows) == 0:
+            return []
+
+        day_keys, group_keys, punched_at, punch_types = punch_columns(
+            ((row.employee_id, row.matricula, row.punched_at.date()), row.punched_at, row.punch_type) for row in rows
+        )
+        batch = detect_punch_anomalies(group_keys, punched_at, punch_types, data.min_punch_gap_seconds)
+
+        anomalies = []
+        for index, gap_seconds in zip(batch.rapid_punches.tolist(), batch.rapid_gap_seconds.tolist()):
+            row = rows[index]
+            anomalies.append(
+                AttendanceAnomaly(
+                    tenant_id=data.tenant_id,
+                    employee_id=row.employee_id,
+                    matricula=row.matricula,
+                    work_date=row.punched_at.date(),
+                    anomaly_type=AttendanceAnomalyType.RAPID_PUNCHES,
+                    detail=f"{row.punch_type.value} punched {gap_seconds}s after the previous punch.",
+                    detected_at=detected_at,
+                    punch_id=row.id,
+                )
+            )
+
+        open_days: List[Tuple[int, str, date]] = [day_keys[code] for code in batch.open_groups.tolist()]
+        enrollment_codes: Dict[Tuple[int, ...], int] = {}
+        codes = [enrollment_codes.setdefault(day[:2], len(enrollment_codes)) for day in open_days]
+        open_days_per_enrollment = count_occurrences(np.asarray(codes, dtype=np.int64))
+        for (employee_id, matricula, work_date), days in zip(open_days, open_days_per_enrollment.tolist()):
+            if days < data.missing_out_min_days:
+                continue
+            anomalies.append(
+                AttendanceAnomaly(
+                    tenant_id=data.tenant_id,
+                    employee_id=employee_id,
+                    matricula=matricula,
+                    work_date=work_date,
+                    anomaly_type=AttendanceAnomalyType.RECURRING_MISSING_OUT,
+                    detail=f"Shift left open; {days} days without OUT in the month.",
+                    detected_at=detected_at,
+                )
+            )
+        return anomalies
+
+    def __shared_punch_time_anomalies(
+        self, data: DetectAttendanceAnomaliesDTO, start_at: datetime, end_at: datetime, detected_at: datetime
+    ) -> List[AttendanceAnomaly]:
+        # Grouping every employee's punches by source and second is left to Postgres; only the clustered punches
+        # come back.
+        rows = self.time_punch_repository.find_rows_sharing_punch_time(
+            data.tenant_id, start_at, end_at, data.shared_punch_min_employees
+        )
+        employees_by_cluster: Dict[Tuple[str, datetime], Set[int]] = defaultdict(set)
+        for row in rows:
+            employees_by_cluster[(row.source, row.punched_at.replace(microsecond=0))].add(row.employee_id)
+
+        anomalies = []
+        for row in rows:
+            punched_second = row.punched_at.replace(microsecond=0)
+            employees = len(employees_by_cluster[(row.source, punched_second)])
+            anomalies.append(
+                AttendanceAnomaly(
+                    tenant_id=data.tenant_id,
+                    employee_id=row.employee_id,
+                    matricula=row.matricula,
+                    work_date=row.punched_at.date(),
+                    anomaly_type=AttendanceAnomalyType.SHARED_PUNCH_TIME,
+                    detail=f"{employees} employees punched at {punched_second:%H:%M:%S} from source {row.source}.",
+                    detected_at=detected_at,
+                    punch_id=row.id,
+                )
+            )
+        return anomalies
+
+    def __impossible_shift_anomalies(
+        self, data: DetectAttendanceAnomaliesDTO, start_date: date, end_date: date, detected_at: datetime
+    ) -> List[AttendanceAnomaly]:
+        rows = self.daily_attendance_summary_repository.find_rows_with_worked_minutes_above(
+            data.tenant_id, start_date, end_date, data.max_worked_minutes
+        )
+        return [
+            AttendanceAnomaly(
+                tenant_id=data.tenant_id,
+                employee_id=row.employee_id,
+                matricula=row.matricula,
+                work_date=row.work_date,
+                anomaly_type=AttendanceAnomalyType.IMPOSSIBLE_SHIFT,
+                detail=f"{row.worked_minutes} worked minutes in a single day.",
+                detected_at=detected_at,
+            )
+            for row in rows
+        ]
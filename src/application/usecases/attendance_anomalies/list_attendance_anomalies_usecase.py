@@ -0,0 +1,21 @@
+from application.dtos import ListAttendanceAnomaliesDTO, PaginatedResult
+from application.repositories import RepositoryManagerInterface
+from domain import AttendanceAnomaly
+
+
+class ListAttendanceAnomaliesUseCase:
+    def __init__(self, repository_manager: RepositoryManagerInterface):
+        self.attendance_anomaly_repository = repository_manager.attendance_anomaly_repository()
+
+    def execute(self, data: ListAttendanceAnomaliesDTO) -> PaginatedResult[AttendanceAnomaly]:
+        result = self.attendance_anomaly_repository.find_all(
+            page=data.page,
+            per_page=data.per_page,
+            tenant_id=data.tenant_id,
+            employee_id=data.employee_id,
+            matricula=data.matricula,
+            start_date=data.start_date,
+            end_date=data.end_date,
+            anomaly_type=data.anomaly_type,
+        )
+        return PaginatedResult(data=result.data, count=result.total_count, page=data.page)
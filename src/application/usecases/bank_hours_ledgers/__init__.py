@@ -4,4 +4,6 @@ from .find_bank_hours_ledger_entry_by_id_usecase import (
     FindBankHoursLedgerEntryByIdUseCase,
 )
 from .get_bank_hours_balance_usecase import GetBankHoursBalanceUseCase
+from .import_bank_hours_ledger_entries_usecase import ImportBankHoursLedgerEntriesUseCase
 from .list_bank_hours_ledger_entries_usecase import ListBankHoursLedgerEntriesUseCase
+from .list_bank_hours_ledger_entry_rows_usecase import ListBankHoursLedgerEntryRowsUseCase
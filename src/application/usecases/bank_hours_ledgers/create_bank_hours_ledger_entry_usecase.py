@@ -1,20 +1,32 @@
+from typing import Optional
+
 from application.dtos import CreateBankHoursLedgerEntryDTO
 from application.exceptions import BadRequestError
 from application.repositories import RepositoryManagerInterface
+from application.usecases.closed_periods import EnsurePeriodIsOpenUseCase
 from domain import BankHoursLedger
 
 
+def validate_ledger_entry(matricula: str, minutes_delta: int) -> Optional[str]:
+    if len(matricula) == 0:
+        return "matricula is required."
+    if minutes_delta == 0:
+        return "minutes_delta cannot be zero."
+    return None
+
+
 class CreateBankHoursLedgerEntryUseCase:
     def __init__(self, repository_manager: RepositoryManagerInterface):
         self.bank_hours_ledger_repository = repository_manager.bank_hours_ledger_repository()
+        self.ensure_period_is_open = EnsurePeriodIsOpenUseCase(repository_manager)
 
     def execute(self, data: CreateBankHoursLedgerEntryDTO) -> BankHoursLedger:
         matricula = data.matricula.strip()
-        if len(matricula) == 0:
-            raise BadRequestError("matricula is required.")
+        error = validate_ledger_entry(matricula, data.minutes_delta)
+        if error is not None:
+            raise BadRequestError(error)
 
-        if data.minutes_delta == 0:
-            raise BadRequestError("minutes_delta cannot be zero.")
+        self.ensure_period_is_open.execute(data.tenant_id, [data.event_date])
 
         entry = BankHoursLedger(
             tenant_id=data.tenant_id,
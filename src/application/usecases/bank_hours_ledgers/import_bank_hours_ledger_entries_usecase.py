@@ -0,0 +1,80 @@
+from datetime import date
+from typing import Dict, List, Optional, Set, Tuple
+
+from application.dtos import ImportBankHoursLedgerEntriesDTO, ImportBankHoursLedgerEntryDTO
+from application.exceptions import BadRequestError
+from application.repositories import RepositoryManagerInterface
+from application.usecases.closed_periods import EnsurePeriodIsOpenUseCase
+from domain import BankHoursLedger, BankHoursLedgerImportResult
+from domain.enums import BankHoursSource
+
+from .create_bank_hours_ledger_entry_usecase import validate_ledger_entry
+
+MAX_ENTRIES = 10_000
+
+
+class ImportBankHoursLedgerEntriesUseCase:
+    def __init__(self, repository_manager: RepositoryManagerInterface):
+        self.bank_hours_ledger_repository = repository_manager.bank_hours_ledger_repository()
+        self.ensure_period_is_open = EnsurePeriodIsOpenUseCase(repository_manager)
+
+    def execute(self, data: ImportBankHoursLedgerEntriesDTO) -> List[BankHoursLedgerImportResult]:
+        if len(data.entries) == 0:
+            raise BadRequestError("No entries to import.")
+        if len(data.entries) > MAX_ENTRIES:
+            raise BadRequestError(f"Import is limited to {MAX_ENTRIES} entries.")
+
+        # One lookup covers every month in the file instead of a check per entry.
+        closed_months = self.ensure_period_is_open.find_closed_months(
+            data.tenant_id, (entry.event_date for entry in data.entries)
+        )
+
+        results: Dict[int, BankHoursLedgerImportResult] = {}
+        accepted: List[Tuple[int, BankHoursLedger]] = []
+        seen: Dict[Tuple[int, str, object, int, Optional[int]], int] = {}
+        for entry in data.entries:
+            matricula = entry.matricula.strip()
+            error = self.__validate(entry, matricula, closed_months, seen)
+            if error is not None:
+                results[entry.line] = BankHoursLedgerImportResult(line=entry.line, entry_id=None, error=error)
+                continue
+
+            accepted.append(
+                (
+                    entry.line,
+                    BankHoursLedger(
+                        tenant_id=data.tenant_id,
+                        employee_id=entry.employee_id,
+                        matricula=matricula,
+                        event_date=entry.event_date,
+                        minutes_delta=entry.minutes_delta,
+                        source=BankHoursSource.MANUAL_ADJUST,
+                        reference_id=entry.reference_id,
+                    ),
+                )
+            )
+
+        created = self.bank_hours_ledger_repository.create_many([ledger for _, ledger in accepted])
+        for (line, _), row in zip(accepted, created):
+            results[line] = BankHoursLedgerImportResult(line=line, entry_id=row.id, error=None)
+
+        return [results[entry.line] for entry in data.entries]
+
+    def __validate(
+        self,
+        entry: ImportBankHoursLedgerEntryDTO,
+        matricula: str,
+        closed_months: Set[date],
+        seen: Dict[Tuple[int, str, object, int, Optional[int]], int],
+    ) -> Optional[str]:
+        error = validate_ledger_entry(matricula, entry.minutes_delta)
+        if error is not None:
+            return error
+        if entry.event_date.replace(day=1) in closed_months:
+            return EnsurePeriodIsOpenUseCase.error_message(entry.event_date)
+
+        key = (entry.employee_id, matricula, entry.event_date, entry.minutes_delta, entry.reference_id)
+        if key in seen:
+            return f"Duplicate of line {seen[key]}."
+        seen[key] = entry.line
+        return None
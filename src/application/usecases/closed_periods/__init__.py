@@ -0,0 +1,2 @@
+# pyright: reportUnusedImport=false
+from .ensure_period_is_open_usecase import EnsurePeriodIsOpenUseCase
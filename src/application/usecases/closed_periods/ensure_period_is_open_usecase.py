@@ -0,0 +1,28 @@
+from datetime import date, timedelta
+from typing import Iterable, Set
+
+from application.exceptions import LockedError
+from application.repositories import RepositoryManagerInterface
+
+
+class EnsurePeriodIsOpenUseCase:
+    def __init__(self, repository_manager: RepositoryManagerInterface):
+        self.monthly_closing_repository = repository_manager.monthly_closing_repository()
+
+    def execute(self, tenant_id: int, days: Iterable[date]) -> None:
+        closed_months = self.find_closed_months(tenant_id, days)
+        if len(closed_months) > 0:
+            raise LockedError(self.error_message(min(closed_months)))
+
+    def execute_for_period(self, tenant_id: int, start_date: date, end_date: date) -> None:
+        days = (end_date - start_date).days + 1
+        self.execute(tenant_id, (start_date + timedelta(days=offset) for offset in range(days)))
+
+    def find_closed_months(self, tenant_id: int, days: Iterable[date]) -> Set[date]:
+        # One lookup for every month touched by the days, for callers that report closed days one by one.
+        months = sorted({day.replace(day=1) for day in days})
+        return set(self.monthly_closing_repository.find_closed_months(tenant_id, months))
+
+    @staticmethod
+    def error_message(day: date) -> str:
+        return f"Period {day:%Y-%m} is closed for tenant."
@@ -5,6 +5,12 @@ from .find_daily_attendance_summary_by_id_usecase import (
 from .list_daily_attendance_summaries_usecase import (
     ListDailyAttendanceSummariesUseCase,
 )
+from .list_daily_attendance_summary_rows_usecase import (
+    ListDailyAttendanceSummaryRowsUseCase,
+)
+from .recalculate_daily_attendance_summaries_by_period_usecase import (
+    RecalculateDailyAttendanceSummariesByPeriodUseCase,
+)
 from .recalculate_daily_attendance_summary_usecase import (
     RecalculateDailyAttendanceSummaryUseCase,
 )
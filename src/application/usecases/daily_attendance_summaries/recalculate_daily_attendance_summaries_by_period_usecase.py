@@ -0,0 +1,67 @@
+from collections import defaultdict
+from datetime import date, datetime, time
+from typing import Dict, List
+
+from application.dtos import RecalculateDailyAttendanceSummariesByPeriodDTO
+from application.exceptions import BadRequestError
+from application.repositories import RepositoryManagerInterface
+from application.usecases.closed_periods import EnsurePeriodIsOpenUseCase
+from application.usecases.holidays import GetWorkCalendarUseCase
+from domain import DailyAttendanceSummaryRow, DayTimeline, TimePunch
+
+from .recalculate_daily_attendance_summary_usecase import (
+    RecalculateDailyAttendanceSummaryUseCase,
+)
+
+
+class RecalculateDailyAttendanceSummariesByPeriodUseCase:
+    def __init__(self, repository_manager: RepositoryManagerInterface):
+        self.time_punch_repository = repository_manager.time_punch_repository()
+        self.daily_attendance_summary_repository = (
+            repository_manager.daily_attendance_summary_repository()
+        )
+        self.recalculate_daily_summary = RecalculateDailyAttendanceSummaryUseCase(
+            repository_manager
+        )
+        self.get_work_calendar = GetWorkCalendarUseCase(repository_manager)
+        self.ensure_period_is_open = EnsurePeriodIsOpenUseCase(repository_manager)
+
+    def execute(
+        self, data: RecalculateDailyAttendanceSummariesByPeriodDTO
+    ) -> List[DailyAttendanceSummaryRow]:
+        if data.start_date > data.end_date:
+            raise BadRequestError("start_date must be less than or equal to end_date.")
+
+        # One lookup for the whole range; the days below skip their own check.
+        self.ensure_period_is_open.execute_for_period(data.tenant_id, data.start_date, data.end_date)
+
+        punches = self.time_punch_repository.find_by_employee_and_matricula_and_period(
+            employee_id=data.employee_id,
+            matricula=data.matricula,
+            start_at=datetime.combine(data.start_date, time.min),
+            end_at=datetime.combine(data.end_date, time.max),
+            tenant_id=data.tenant_id,
+        )
+        punches_by_date: Dict[date, List[TimePunch]] = defaultdict(list)
+        for punch in punches:
+            punches_by_date[punch.punched_at.date()].append(punch)
+
+        existing_summaries = (
+            self.daily_attendance_summary_repository.find_by_employee_and_matricula_and_period(
+                employee_id=data.employee_id,
+                matricula=data.matricula,
+                start_date=data.start_date,
+                end_date=data.end_date,
+            )
+        )
+        work_dates = set(punches_by_date) | {summary.work_date for summary in existing_summaries}
+        timelines = {work_date: DayTimeline(punches_by_date.get(work_date, [])) for work_date in work_dates}
+        work_calendar = self.get_work_calendar.execute(data.tenant_id)
+
+        return self.recalculate_daily_summary.execute_many(
+            tenant_id=data.tenant_id,
+            employee_id=data.employee_id,
+            matricula=data.matricula,
+            timelines=timelines,
+            work_calendar=work_calendar,
+        )
@@ -1,22 +1,35 @@
-from datetime import date, datetime
-from typing import List, Optional, Tuple
+from datetime import date
+from typing import Dict, List, Optional, Union
 
 from application.dtos import RecalculateDailyAttendanceSummaryDTO
+from application.integrations import IntegrationManagerInterface
 from application.repositories import RepositoryManagerInterface
+from application.usecases.closed_periods import EnsurePeriodIsOpenUseCase
 from application.usecases.enrollment_policy_assignments import (
     FindCurrentPolicyAssignmentByEnrollmentAndDateUseCase,
 )
-from domain import BankHoursLedger, DailyAttendanceSummary, TimePunch
+from application.usecases.holidays import GetWorkCalendarUseCase
+from domain import (
+    AttendanceChange,
+    BankHoursLedger,
+    DailyAttendanceSummary,
+    DailyAttendanceSummaryRow,
+    DayTimeline,
+    WorkCalendar,
+)
 from domain.enums import (
     BankHoursSource,
     DailyAttendanceStatus,
-    PunchType,
     TimeAdjustmentStatus,
 )
 
 
 class RecalculateDailyAttendanceSummaryUseCase:
-    def __init__(self, repository_manager: RepositoryManagerInterface):
+    def __init__(
+        self,
+        repository_manager: RepositoryManagerInterface,
+        integration_manager: Optional[IntegrationManagerInterface] = None,
+    ):
         self.daily_attendance_summary_repository = (
             repository_manager.daily_attendance_summary_repository()
         )
@@ -28,24 +41,118 @@ class RecalculateDailyAttendanceSummaryUseCase:
         self.find_assignment_by_date = (
             FindCurrentPolicyAssignmentByEnrollmentAndDateUseCase(repository_manager)
         )
+        self.get_work_calendar = GetWorkCalendarUseCase(repository_manager)
+        self.ensure_period_is_open = EnsurePeriodIsOpenUseCase(repository_manager)
+        self.attendance_change_publisher = (
+            integration_manager.attendance_change_publisher() if integration_manager is not None else None
+        )
 
-    def execute(self, data: RecalculateDailyAttendanceSummaryDTO) -> DailyAttendanceSummary:
-        assignment = self.find_assignment_by_date.execute(
+    def execute(
+        self,
+        data: RecalculateDailyAttendanceSummaryDTO,
+        timeline: Optional[DayTimeline] = None,
+        work_calendar: Optional[WorkCalendar] = None,
+        check_period: bool = True,
+    ) -> DailyAttendanceSummary:
+        # Callers that already checked the period (or that close it themselves) skip the lookup. A single day is
+        # recalculated from the hot punch table, which no longer holds punches of archived months.
+        if check_period:
+            self.ensure_period_is_open.execute(data.tenant_id, [data.work_date])
+
+        summary = self.__build_summary(data, timeline, work_calendar)
+
+        # Not committed on its own: the removal of the day's previous apuration commits with the summary upsert.
+        self.bank_hours_ledger_repository.delete_auto_generated_for_day(
             employee_id=data.employee_id,
             matricula=data.matricula,
-            reference_date=data.work_date,
+            event_date=data.work_date,
+            source=BankHoursSource.DAILY_APURATION,
+        )
+        persisted_summary = self.daily_attendance_summary_repository.upsert(summary)
+
+        entry = self.__apuration_entry(persisted_summary)
+        if entry is not None:
+            self.bank_hours_ledger_repository.create(entry)
+
+        if self.attendance_change_publisher is not None:
+            self.attendance_change_publisher.publish(AttendanceChange.of_summary(persisted_summary))
+
+        return persisted_summary
+
+    def execute_many(
+        self,
+        tenant_id: int,
+        employee_id: int,
+        matricula: str,
+        timelines: Dict[date, DayTimeline],
+        work_calendar: Optional[WorkCalendar] = None,
+    ) -> List[DailyAttendanceSummaryRow]:
+        # The batched form of execute for callers that already checked the period. A single upsert commits the
+        # summaries of every day together with the removal of their previous apuration; the new apuration entries
+        # follow in one insert.
+        if len(timelines) == 0:
+            return []
+        if work_calendar is None:
+            work_calendar = self.get_work_calendar.execute(tenant_id)
+
+        work_dates = sorted(timelines)
+        summaries = [
+            self.__build_summary(
+                RecalculateDailyAttendanceSummaryDTO(
+                    tenant_id=tenant_id,
+                    employee_id=employee_id,
+                    matricula=matricula,
+                    work_date=work_date,
+                ),
+                timelines[work_date],
+                work_calendar,
+            )
+            for work_date in work_dates
+        ]
+
+        self.bank_hours_ledger_repository.delete_auto_generated_for_days(
+            employee_id=employee_id,
+            matricula=matricula,
+            event_dates=work_dates,
+            source=BankHoursSource.DAILY_APURATION,
         )
+        persisted_summaries = self.daily_attendance_summary_repository.upsert_many(summaries)
+        entries = [self.__apuration_entry(persisted_summary) for persisted_summary in persisted_summaries]
+        self.bank_hours_ledger_repository.create_many([entry for entry in entries if entry is not None])
+
+        if self.attendance_change_publisher is not None:
+            for persisted_summary in persisted_summaries:
+                self.attendance_change_publisher.publish(AttendanceChange.of_summary(persisted_summary))
+
+        return persisted_summaries
 
-        punches = self.time_punch_repository.find_by_employee_and_matricula_and_date(
+    def __build_summary(
+        self,
+        data: RecalculateDailyAttendanceSummaryDTO,
+        timeline: Optional[DayTimeline],
+        work_calendar: Optional[WorkCalendar],
+    ) -> DailyAttendanceSummary:
+        assignment = self.find_assignment_by_date.execute(
             employee_id=data.employee_id,
             matricula=data.matricula,
-            work_date=data.work_date,
+            reference_date=data.work_date,
         )
-        worked_minutes, break_minutes, is_complete = self.__calculate_minutes(punches)
 
-        expected_minutes = (
-            assignment.template.daily_work_minutes if assignment is not None else 0
-        )
+        if timeline is None:
+            timeline = DayTimeline(
+                self.time_punch_repository.find_by_employee_and_matricula_and_date(
+                    employee_id=data.employee_id,
+                    matricula=data.matricula,
+                    work_date=data.work_date,
+                )
+            )
+        worked_minutes, break_minutes, is_complete = timeline.minutes()
+
+        expected_minutes = 0
+        if assignment is not None:
+            if work_calendar is None:
+                work_calendar = self.get_work_calendar.execute(data.tenant_id)
+            expected_minutes = work_calendar.expected_minutes(assignment.template, data.work_date)
         has_pending_adjustment = self.__has_pending_adjustment(
             tenant_id=data.tenant_id,
             employee_id=data.employee_id,
@@ -56,7 +163,7 @@ class RecalculateDailyAttendanceSummaryUseCase:
             assignment_exists=assignment is not None,
             has_pending_adjustment=has_pending_adjustment,
             is_complete=is_complete,
-            punches_count=len(punches),
+            punches_count=timeline.punches_count,
         )
 
         overtime_minutes = 0
@@ -67,7 +174,7 @@ class RecalculateDailyAttendanceSummaryUseCase:
             elif worked_minutes < expected_minutes:
                 deficit_minutes = expected_minutes - worked_minutes
 
-        summary = DailyAttendanceSummary(
+        return DailyAttendanceSummary(
             tenant_id=data.tenant_id,
             employee_id=data.employee_id,
             matricula=data.matricula,
@@ -80,45 +187,32 @@ class RecalculateDailyAttendanceSummaryUseCase:
             status=status,
         )
 
-        persisted_summary = self.daily_attendance_summary_repository.upsert(summary)
-
-        self.bank_hours_ledger_repository.delete_auto_generated_for_day(
-            employee_id=data.employee_id,
-            matricula=data.matricula,
-            event_date=data.work_date,
+    def __apuration_entry(
+        self, summary: Union[DailyAttendanceSummary, DailyAttendanceSummaryRow]
+    ) -> Optional[BankHoursLedger]:
+        daily_delta = summary.overtime_minutes - summary.deficit_minutes
+        if summary.status != DailyAttendanceStatus.OK or daily_delta == 0:
+            return None
+        return BankHoursLedger(
+            tenant_id=summary.tenant_id,
+            employee_id=summary.employee_id,
+            matricula=summary.matricula,
+            event_date=summary.work_date,
+            minutes_delta=daily_delta,
             source=BankHoursSource.DAILY_APURATION,
+            reference_id=summary.id,
         )
 
-        daily_delta = overtime_minutes - deficit_minutes
-        if status == DailyAttendanceStatus.OK and daily_delta != 0:
-            self.bank_hours_ledger_repository.create(
-                BankHoursLedger(
-                    tenant_id=data.tenant_id,
-                    employee_id=data.employee_id,
-                    matricula=data.matricula,
-                    event_date=data.work_date,
-                    minutes_delta=daily_delta,
-                    source=BankHoursSource.DAILY_APURATION,
-                    reference_id=persisted_summary.id,
-                )
-            )
-
-        return persisted_summary
-
     def __has_pending_adjustment(
         self, tenant_id: int, employee_id: int, matricula: str, work_date: date
     ) -> bool:
-        result = self.time_adjustment_request_repository.find_all(
-            page=0,
-            per_page=1,
+        return self.time_adjustment_request_repository.exists_with_status_for_enrollment_and_date(
             tenant_id=tenant_id,
             employee_id=employee_id,
             matricula=matricula,
+            request_date=work_date,
             status=TimeAdjustmentStatus.PENDING,
-            start_date=work_date,
-            end_date=work_date,
         )
-        return result.total_count > 0
 
     def __resolve_status(
         self,
@@ -136,49 +230,3 @@ class RecalculateDailyAttendanceSummaryUseCase:
         if punches_count == 0:
             return DailyAttendanceStatus.INCOMPLETE
         return DailyAttendanceStatus.OK
-
-    def __calculate_minutes(self, punches: List[TimePunch]) -> Tuple[int, int, bool]:
-        ordered = sorted(punches, key=lambda punch: punch.punched_at)
-
-        worked_minutes = 0
-        break_minutes = 0
-
-        open_interval_start: Optional[datetime] = None
-        open_break_start: Optional[datetime] = None
-
-        for punch in ordered:
-            if punch.punch_type == PunchType.IN:
-                if open_interval_start is not None or open_break_start is not None:
-                    return 0, 0, False
-                open_interval_start = punch.punched_at
-                continue
-
-            if punch.punch_type == PunchType.BREAK_START:
-                if open_interval_start is None or open_break_start is not None:
-                    return 0, 0, False
-                worked_minutes += self.__diff_in_minutes(open_interval_start, punch.punched_at)
-                open_interval_start = None
-                open_break_start = punch.punched_at
-                continue
-
-            if punch.punch_type == PunchType.BREAK_END:
-                if open_break_start is None:
-                    return 0, 0, False
-                break_minutes += self.__diff_in_minutes(open_break_start, punch.punched_at)
-                open_break_start = None
-                open_interval_start = punch.punched_at
-                continue
-
-            if punch.punch_type == PunchType.OUT:
-                if open_interval_start is None or open_break_start is not None:
-                    return 0, 0, False
-                worked_minutes += self.__diff_in_minutes(open_interval_start, punch.punched_at)
-                open_interval_start = None
-
-        is_complete = open_interval_start is None and open_break_start is None
-        return worked_minutes, break_minutes, is_complete
-
-    def __diff_in_minutes(self, start: datetime, end: datetime) -> int:
-        if end < start:
-            return 0
-        return int((end - start).total_seconds() // 60)
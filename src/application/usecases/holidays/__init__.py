@@ -0,0 +1,6 @@
+# pyright: reportUnusedImport=false
+from .create_holiday_usecase import CreateHolidayUseCase
+from .delete_holiday_usecase import DeleteHolidayUseCase
+from .find_holiday_by_id_usecase import FindHolidayByIdUseCase
+from .get_work_calendar_usecase import GetWorkCalendarUseCase
+from .list_holidays_usecase import ListHolidaysUseCase
@@ -0,0 +1,29 @@
+from application.dtos import CreateHolidayDTO
+from application.exceptions import BadRequestError
+from application.repositories import RepositoryManagerInterface
+from application.usecases.closed_periods import EnsurePeriodIsOpenUseCase
+from domain import Holiday
+
+
+class CreateHolidayUseCase:
+    def __init__(self, repository_manager: RepositoryManagerInterface):
+        self.holiday_repository = repository_manager.holiday_repository()
+        self.ensure_period_is_open = EnsurePeriodIsOpenUseCase(repository_manager)
+
+    def execute(self, data: CreateHolidayDTO) -> Holiday:
+        name = data.name.strip()
+        if len(name) == 0:
+            raise BadRequestError("Holiday name is required.")
+
+        end_date = data.end_date if data.end_date is not None else data.start_date
+        if end_date < data.start_date:
+            raise BadRequestError("start_date must be less than or equal to end_date.")
+        self.ensure_period_is_open.execute_for_period(data.tenant_id, data.start_date, end_date)
+
+        holiday = Holiday(
+            tenant_id=data.tenant_id,
+            name=name,
+            start_date=data.start_date,
+            end_date=end_date,
+        )
+        return self.holiday_repository.create(holiday)
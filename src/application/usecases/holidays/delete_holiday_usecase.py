@@ -0,0 +1,22 @@
+from application.exceptions import BadRequestError
+from application.repositories import RepositoryManagerInterface
+from application.usecases.closed_periods import EnsurePeriodIsOpenUseCase
+
+from .find_holiday_by_id_usecase import FindHolidayByIdUseCase
+
+
+class DeleteHolidayUseCase:
+    def __init__(self, repository_manager: RepositoryManagerInterface):
+        self.holiday_repository = repository_manager.holiday_repository()
+        self.find_by_id_usecase = FindHolidayByIdUseCase(repository_manager)
+        self.ensure_period_is_open = EnsurePeriodIsOpenUseCase(repository_manager)
+
+    def execute(self, holiday_id: int, tenant_id: int) -> None:
+        holiday = self.find_by_id_usecase.execute(
+            holiday_id=holiday_id,
+            raise_if_is_none=True,
+        )
+        if holiday.tenant_id != tenant_id:
+            raise BadRequestError("Holiday does not belong to tenant.")
+        self.ensure_period_is_open.execute_for_period(tenant_id, holiday.start_date, holiday.end_date)
+        self.holiday_repository.delete(holiday_id)
@@ -0,0 +1,28 @@
+from typing import Literal, Optional, overload
+
+from application.exceptions import NotFoundError
+from application.repositories import RepositoryManagerInterface
+from domain import Holiday
+
+
+class FindHolidayByIdUseCase:
+    def __init__(self, repository_manager: RepositoryManagerInterface):
+        self.holiday_repository = repository_manager.holiday_repository()
+
+    @overload
+    def execute(self, holiday_id: int) -> Optional[Holiday]:
+        pass
+
+    @overload
+    def execute(self, holiday_id: int, raise_if_is_none: Literal[True]) -> Holiday:
+        pass
+
+    @overload
+    def execute(self, holiday_id: int, raise_if_is_none: Literal[False]) -> Optional[Holiday]:
+        pass
+
+    def execute(self, holiday_id: int, raise_if_is_none: bool = False):
+        holiday = self.holiday_repository.find_by_id(holiday_id)
+        if raise_if_is_none and holiday is None:
+            raise NotFoundError("Holiday not found.")
+        return holiday
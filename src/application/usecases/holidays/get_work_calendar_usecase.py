@@ -0,0 +1,25 @@
+from application.repositories import RepositoryManagerInterface
+from commons import VersionedCache
+from config import WORK_CALENDAR_CACHE_SIZE
+from domain import WorkCalendar
+from domain.enums import ResourceScope
+
+# Holiday intervals of each tenant, checked against the tenant's holidays version so that creating or deleting a
+# holiday is seen by every process on its next recalculation.
+work_calendar_cache: VersionedCache[WorkCalendar] = VersionedCache("work_calendar", max_size=WORK_CALENDAR_CACHE_SIZE)
+
+
+class GetWorkCalendarUseCase:
+    def __init__(self, repository_manager: RepositoryManagerInterface):
+        self.holiday_repository = repository_manager.holiday_repository()
+        self.resource_version_repository = repository_manager.resource_version_repository()
+
+    def execute(self, tenant_id: int) -> WorkCalendar:
+        version = self.resource_version_repository.get_version(ResourceScope.HOLIDAYS, tenant_id=tenant_id)
+        cached = work_calendar_cache.get(tenant_id, version)
+        if cached is not None:
+            return cached
+
+        calendar = WorkCalendar(self.holiday_repository.find_periods_by_tenant(tenant_id))
+        work_calendar_cache.put(tenant_id, version, calendar)
+        return calendar
@@ -0,0 +1,22 @@
+from application.dtos import ListHolidaysDTO, PaginatedResult
+from application.exceptions import BadRequestError
+from application.repositories import RepositoryManagerInterface
+from domain import Holiday
+
+
+class ListHolidaysUseCase:
+    def __init__(self, repository_manager: RepositoryManagerInterface):
+        self.holiday_repository = repository_manager.holiday_repository()
+
+    def execute(self, data: ListHolidaysDTO) -> PaginatedResult[Holiday]:
+        if data.start_date is not None and data.end_date is not None and data.start_date > data.end_date:
+            raise BadRequestError("start_date must be less than or equal to end_date.")
+
+        result = self.holiday_repository.find_all(
+            page=data.page,
+            per_page=data.per_page,
+            tenant_id=data.tenant_id,
+            start_date=data.start_date,
+            end_date=data.end_date,
+        )
+        return PaginatedResult(data=result.data, count=result.total_count, page=data.page)
@@ -0,0 +1,6 @@
+# pyright: reportUnusedImport=false
+from .close_month_usecase import CloseMonthUseCase
+from .find_monthly_closing_by_id_usecase import FindMonthlyClosingByIdUseCase
+from .list_monthly_closing_total_rows_usecase import ListMonthlyClosingTotalRowsUseCase
+from .list_monthly_closings_usecase import ListMonthlyClosingsUseCase
+from .reopen_month_usecase import ReopenMonthUseCase
@@ -0,0 +1,101 @@
+from collections import defaultdict
+from datetime import date, datetime, time, timezone
+from typing import Dict, List, Tuple
+
+from application.dtos import CloseMonthDTO
+from application.exceptions import BadRequestError, ConflictError
+from application.repositories import RepositoryManagerInterface
+from application.usecases.daily_attendance_summaries import (
+    RecalculateDailyAttendanceSummaryUseCase,
+)
+from application.usecases.holidays import GetWorkCalendarUseCase
+from domain import DayTimeline, MonthlyClosing, MonthlyTimesheet, TimePunch, WorkCalendar
+from domain.enums import MonthlyClosingStatus
+
+
+class CloseMonthUseCase:
+    def __init__(self, repository_manager: RepositoryManagerInterface):
+        self.monthly_closing_repository = repository_manager.monthly_closing_repository()
+        self.monthly_closing_total_repository = repository_manager.monthly_closing_total_repository()
+        self.daily_attendance_summary_repository = repository_manager.daily_attendance_summary_repository()
+        self.time_punch_repository = repository_manager.time_punch_repository()
+        self.recalculate_daily_summary = RecalculateDailyAttendanceSummaryUseCase(repository_manager)
+        self.get_work_calendar = GetWorkCalendarUseCase(repository_manager)
+
+    def execute(self, data: CloseMonthDTO) -> MonthlyClosing:
+        start_date, end_date = MonthlyTimesheet.month_bounds(data.month)
+        if end_date >= date.today():
+            raise BadRequestError("Only months that already ended can be closed.")
+
+        closing = self.monthly_closing_repository.find_by_tenant_and_month(data.tenant_id, start_date)
+        if closing is not None and closing.status == MonthlyClosingStatus.CLOSED:
+            raise ConflictError("Month is already closed.")
+
+        # The CLOSING row is what freezes punch writes, so it is committed before anything is recalculated.
+        # A run that stopped halfway leaves it behind and the next run resumes from it.
+        if closing is None:
+            closing = self.monthly_closing_repository.create(
+                MonthlyClosing(
+                    tenant_id=data.tenant_id,
+                    month=start_date,
+                    started_at=datetime.now(timezone.utc),
+                    closed_by_user_id=data.closed_by_user_id,
+                )
+            )
+
+        dirty_days = self.daily_attendance_summary_repository.find_dirty_days(
+            tenant_id=data.tenant_id,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        work_calendar = self.get_work_calendar.execute(data.tenant_id)
+        days_by_enrollment: Dict[Tuple[int, str], List[date]] = defaultdict(list)
+        for employee_id, matricula, work_date in dirty_days:
+            days_by_enrollment[(employee_id, matricula)].append(work_date)
+        for (employee_id, matricula), work_dates in days_by_enrollment.items():
+            self.__recalculate_enrollment(data.tenant_id, employee_id, matricula, work_dates, work_calendar)
+
+        totals_count = self.monthly_closing_total_repository.materialize(closing)
+
+        closed = self.monthly_closing_repository.update(
+            closing_id=closing.id,
+            data={
+                "status": MonthlyClosingStatus.CLOSED,
+                "closed_at": datetime.now(timezone.utc),
+                "closed_by_user_id": data.closed_by_user_id,
+                "recalculated_days": len(dirty_days),
+                "totals_count": totals_count,
+            },
+        )
+        if closed is None:
+            raise BadRequestError("Unable to close month.")
+        return closed
+
+    def __recalculate_enrollment(
+        self,
+        tenant_id: int,
+        employee_id: int,
+        matricula: str,
+        work_dates: List[date],
+        work_calendar: WorkCalendar,
+    ) -> None:
+        # One punch query per enrollment covering its dirty days, like the period recalculation.
+        punches = self.time_punch_repository.find_by_employee_and_matricula_and_period(
+            employee_id=employee_id,
+            matricula=matricula,
+            start_at=datetime.combine(min(work_dates), time.min),
+            end_at=datetime.combine(max(work_dates), time.max),
+            tenant_id=tenant_id,
+        )
+        punches_by_date: Dict[date, List[TimePunch]] = defaultdict(list)
+        for punch in punches:
+            punches_by_date[punch.punched_at.date()].append(punch)
+
+        timelines = {work_date: DayTimeline(punches_by_date.get(work_date, [])) for work_date in work_dates}
+        self.recalculate_daily_summary.execute_many(
+            tenant_id=tenant_id,
+            employee_id=employee_id,
+            matricula=matricula,
+            timelines=timelines,
+            work_calendar=work_calendar,
+        )
@@ -0,0 +1,28 @@
+from typing import Literal, Optional, overload
+
+from application.exceptions import NotFoundError
+from application.repositories import RepositoryManagerInterface
+from domain import MonthlyClosing
+
+
+class FindMonthlyClosingByIdUseCase:
+    def __init__(self, repository_manager: RepositoryManagerInterface):
+        self.monthly_closing_repository = repository_manager.monthly_closing_repository()
+
+    @overload
+    def execute(self, closing_id: int) -> Optional[MonthlyClosing]:
+        pass
+
+    @overload
+    def execute(self, closing_id: int, raise_if_is_none: Literal[True]) -> MonthlyClosing:
+        pass
+
+    @overload
+    def execute(self, closing_id: int, raise_if_is_none: Literal[False]) -> Optional[MonthlyClosing]:
+        pass
+
+    def execute(self, closing_id: int, raise_if_is_none: bool = False):
+        closing = self.monthly_closing_repository.find_by_id(closing_id)
+        if raise_if_is_none and closing is None:
+            raise NotFoundError("Monthly closing not found.")
+        return closing
@@ -0,0 +1,19 @@
+from typing import Any
+
+from application.dtos import ListMonthlyClosingTotalsDTO, PaginatedResult
+from application.repositories import RepositoryManagerInterface
+
+
+class ListMonthlyClosingTotalRowsUseCase:
+    def __init__(self, repository_manager: RepositoryManagerInterface):
+        self.monthly_closing_total_repository = repository_manager.monthly_closing_total_repository()
+
+    def execute(self, data: ListMonthlyClosingTotalsDTO) -> PaginatedResult[Any]:
+        result = self.monthly_closing_total_repository.find_all_rows(
+            page=data.page,
+            per_page=data.per_page,
+            monthly_closing_id=data.monthly_closing_id,
+            employee_id=data.employee_id,
+            matricula=data.matricula,
+        )
+        return PaginatedResult(data=result.data, count=result.total_count, page=data.page)
@@ -0,0 +1,18 @@
+from application.dtos import ListMonthlyClosingsDTO, PaginatedResult
+from application.repositories import RepositoryManagerInterface
+from domain import MonthlyClosing
+
+
+class ListMonthlyClosingsUseCase:
+    def __init__(self, repository_manager: RepositoryManagerInterface):
+        self.monthly_closing_repository = repository_manager.monthly_closing_repository()
+
+    def execute(self, data: ListMonthlyClosingsDTO) -> PaginatedResult[MonthlyClosing]:
+        result = self.monthly_closing_repository.find_all(
+            page=data.page,
+            per_page=data.per_page,
+            tenant_id=data.tenant_id,
+            start_month=data.start_month,
+            end_month=data.end_month,
+        )
+        return PaginatedResult(data=result.data, count=result.total_count, page=data.page)
@@ -0,0 +1,21 @@
+from application.exceptions import BadRequestError, ConflictError
+from application.repositories import RepositoryManagerInterface
+
+from .find_monthly_closing_by_id_usecase import FindMonthlyClosingByIdUseCase
+
+
+class ReopenMonthUseCase:
+    def __init__(self, repository_manager: RepositoryManagerInterface):
+        self.monthly_closing_repository = repository_manager.monthly_closing_repository()
+        self.time_punch_archive_repository = repository_manager.time_punch_archive_repository()
+        self.find_closing_by_id = FindMonthlyClosingByIdUseCase(repository_manager)
+
+    def execute(self, closing_id: int, tenant_id: int) -> None:
+        closing = self.find_closing_by_id.execute(closing_id=closing_id, raise_if_is_none=True)
+        if closing.tenant_id != tenant_id:
+            raise BadRequestError("Monthly closing does not belong to tenant.")
+
+        if self.time_punch_archive_repository.find_by_tenant_and_month(tenant_id, closing.month) is not None:
+            raise ConflictError("Month punches are archived; restore them before reopening.")
+
+        self.monthly_closing_repository.delete(closing_id)
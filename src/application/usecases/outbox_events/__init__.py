@@ -0,0 +1,2 @@
+# pyright: reportUnusedImport=false
+from .relay_outbox_events_usecase import RelayOutboxEventsUseCase
@@ -0,0 +1,50 @@
+from application.dtos import RelayOutboxEventsDTO
+from application.integrations import IntegrationManagerInterface
+from application.repositories import RepositoryManagerInterface
+from domain import OutboxRelayResult
+
+MAX_ERROR_LENGTH = 1000
+
+
+class RelayOutboxEventsUseCase:
+    def __init__(
+        self,
+        repository_manager: RepositoryManagerInterface,
+        integration_manager: IntegrationManagerInterface,
+    ):
+        self.outbox_event_repository = repository_manager.outbox_event_repository()
+        self.queue_integration = integration_manager.queue_integration()
+
+    def execute(self, data: RelayOutboxEventsDTO) -> OutboxRelayResult:
+        events = self.outbox_event_repository.claim_batch(limit=data.batch_size, max_attempts=data.max_attempts)
+        if len(events) == 0:
+            return OutboxRelayResult(claimed=0, sent=0, failed=0)
+
+        event_ids = [event.id for event in events]
+        # Delivery is at least once: a crash between publishing and marking the batch sends it again, so consumers
+        # deduplicate on event_id.
+        messages = [
+            (
+                event.topic,
+                {
+                    "event_id": event.id,
+                    "tenant_id": event.tenant_id,
+                    "occurred_at": event.created_at,
+                    "data": event.payload,
+                },
+            )
+            for event in events
+        ]
+        try:
+            self.queue_integration.publish_many(messages)
+        except Exception as error:
+            self.outbox_event_repository.mark_failed(
+                event_ids,
+                error=f"{type(error).__name__}: {error}"[:MAX_ERROR_LENGTH],
+                base_delay_seconds=data.retry_base_seconds,
+                max_delay_seconds=data.retry_max_seconds,
+            )
+            return OutboxRelayResult(claimed=len(events), sent=0, failed=len(events))
+
+        self.outbox_event_repository.mark_sent(event_ids)
+        return OutboxRelayResult(claimed=len(events), sent=len(events), failed=0)
@@ -0,0 +1,2 @@
+# pyright: reportUnusedImport=false
+from .get_resource_version_usecase import GetResourceVersionUseCase
@@ -0,0 +1,12 @@
+from typing import Optional
+
+from application.repositories import RepositoryManagerInterface
+from domain.enums import ResourceScope
+
+
+class GetResourceVersionUseCase:
+    def __init__(self, repository_manager: RepositoryManagerInterface):
+        self.resource_version_repository = repository_manager.resource_version_repository()
+
+    def execute(self, scope: ResourceScope, tenant_id: Optional[int]) -> int:
+        return self.resource_version_repository.get_version(scope=scope, tenant_id=tenant_id)
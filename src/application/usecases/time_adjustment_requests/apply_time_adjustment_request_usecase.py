@@ -8,6 +8,8 @@ from application.repositories import RepositoryManagerInterface
 from application.usecases.daily_attendance_summaries import (
     RecalculateDailyAttendanceSummaryUseCase,
 )
+from application.usecases.closed_periods import EnsurePeriodIsOpenUseCase
+from application.usecases.holidays import GetWorkCalendarUseCase
 from application.usecases.time_punches import FindTimePunchByIdUseCase
 from domain import TimeAdjustmentRequest, TimePunch
 from domain.enums import PunchType, TimeAdjustmentStatus
@@ -33,6 +35,8 @@ class ApplyTimeAdjustmentRequestUseCase:
         self.recalculate_daily_summary = RecalculateDailyAttendanceSummaryUseCase(
             repository_manager
         )
+        self.ensure_period_is_open = EnsurePeriodIsOpenUseCase(repository_manager)
+        self.get_work_calendar = GetWorkCalendarUseCase(repository_manager)
 
     def execute(self, request_id: int, tenant_id: int) -> TimeAdjustmentRequest:
         request = self.find_request_by_id.execute(
@@ -58,6 +62,7 @@ class ApplyTimeAdjustmentRequestUseCase:
             request.matricula,
             items,
         )
+        self.ensure_period_is_open.execute(request.tenant_id, affected_dates)
         self.__validate_final_sequences(
             request.employee_id,
             request.matricula,
@@ -65,6 +70,7 @@ class ApplyTimeAdjustmentRequestUseCase:
             affected_dates,
         )
 
+        new_punches: List[TimePunch] = []
         for item in items:
             if item.original_punch_id is not None:
                 original_punch = self.find_punch_by_id.execute(
@@ -98,7 +104,7 @@ class ApplyTimeAdjustmentRequestUseCase:
             if item.proposed_punch_type is None or item.proposed_punched_at is None:
                 raise BadRequestError("Invalid adjustment item for new punch.")
 
-            self.time_punch_repository.create(
+            new_punches.append(
                 TimePunch(
                     tenant_id=request.tenant_id,
                     employee_id=request.employee_id,
@@ -110,6 +116,9 @@ class ApplyTimeAdjustmentRequestUseCase:
                 )
             )
 
+        if len(new_punches) > 0:
+            self.time_punch_repository.create_many(new_punches)
+
         updated_request = self.time_adjustment_request_repository.update(
             request_id=request_id,
             data={"status": TimeAdjustmentStatus.APPLIED},
@@ -117,6 +126,8 @@ class ApplyTimeAdjustmentRequestUseCase:
         if updated_request is None:
             raise BadRequestError("Unable to apply request.")
 
+        # One work calendar lookup for every affected day, not one per recalculation.
+        work_calendar = self.get_work_calendar.execute(request.tenant_id)
         for affected_date in affected_dates:
             self.recalculate_daily_summary.execute(
                 RecalculateDailyAttendanceSummaryDTO(
@@ -124,7 +135,9 @@ class ApplyTimeAdjustmentRequestUseCase:
                     employee_id=request.employee_id,
                     matricula=request.matricula,
                     work_date=affected_date,
-                )
+                ),
+                work_calendar=work_calendar,
+                check_period=False,
             )
 
         return updated_request
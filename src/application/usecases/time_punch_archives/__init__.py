@@ -0,0 +1,3 @@
+# pyright: reportUnusedImport=false
+from .archive_month_punches_usecase import ArchiveMonthPunchesUseCase
+from .restore_month_punches_usecase import RestoreMonthPunchesUseCase
@@ -0,0 +1,32 @@
+from datetime import date, datetime, time, timedelta
+
+from application.exceptions import BadRequestError, ConflictError
+from application.repositories import RepositoryManagerInterface
+from domain import MonthlyTimesheet, TimePunchArchive
+from domain.enums import MonthlyClosingStatus
+
+
+class ArchiveMonthPunchesUseCase:
+    def __init__(self, repository_manager: RepositoryManagerInterface):
+        self.monthly_closing_repository = repository_manager.monthly_closing_repository()
+        self.time_punch_archive_repository = repository_manager.time_punch_archive_repository()
+        self.time_adjustment_item_repository = repository_manager.time_adjustment_item_repository()
+
+    def execute(self, tenant_id: int, month: date) -> TimePunchArchive:
+        month = month.replace(day=1)
+        closing = self.monthly_closing_repository.find_by_tenant_and_month(tenant_id, month)
+        if closing is None or closing.status != MonthlyClosingStatus.CLOSED:
+            raise BadRequestError("Only closed months can be archived.")
+
+        if self.time_punch_archive_repository.find_by_tenant_and_month(tenant_id, month) is not None:
+            raise ConflictError("Month punches are already archived.")
+
+        start_date, end_date = MonthlyTimesheet.month_bounds(month)
+        if self.time_adjustment_item_repository.has_open_items_for_punches_in_period(
+            tenant_id,
+            datetime.combine(start_date, time.min),
+            datetime.combine(end_date + timedelta(days=1), time.min),
+        ):
+            raise ConflictError("Month punches are referenced by open time adjustment requests.")
+
+        return self.time_punch_archive_repository.archive_month(tenant_id, month)
@@ -0,0 +1,15 @@
+from datetime import date
+
+from application.exceptions import NotFoundError
+from application.repositories import RepositoryManagerInterface
+
+
+class RestoreMonthPunchesUseCase:
+    def __init__(self, repository_manager: RepositoryManagerInterface):
+        self.time_punch_archive_repository = repository_manager.time_punch_archive_repository()
+
+    def execute(self, tenant_id: int, month: date) -> int:
+        archive = self.time_punch_archive_repository.find_by_tenant_and_month(tenant_id, month)
+        if archive is None:
+            raise NotFoundError("Month punches are not archived.")
+        return self.time_punch_archive_repository.restore(archive)
@@ -2,4 +2,5 @@
 from .create_time_punch_usecase import CreateTimePunchUseCase
 from .delete_time_punch_usecase import DeleteTimePunchUseCase
 from .find_time_punch_by_id_usecase import FindTimePunchByIdUseCase
+from .list_time_punch_rows_usecase import ListTimePunchRowsUseCase
 from .list_time_punches_usecase import ListTimePunchesUseCase
@@ -1,21 +1,30 @@
-from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 from application.dtos import CreateTimePunchDTO, RecalculateDailyAttendanceSummaryDTO
 from application.exceptions import BadRequestError, ConflictError
+from application.integrations import IntegrationManagerInterface
 from application.repositories import RepositoryManagerInterface
 from application.usecases.daily_attendance_summaries import (
     RecalculateDailyAttendanceSummaryUseCase,
 )
-from domain import TimePunch
-from domain.enums import PunchType
+from application.usecases.closed_periods import EnsurePeriodIsOpenUseCase
+from domain import AttendanceChange, DayTimeline, TimePunch
+from domain.enums import AttendanceChangeType
 
 
 class CreateTimePunchUseCase:
-    def __init__(self, repository_manager: RepositoryManagerInterface):
+    def __init__(
+        self,
+        repository_manager: RepositoryManagerInterface,
+        integration_manager: Optional[IntegrationManagerInterface] = None,
+    ):
         self.time_punch_repository = repository_manager.time_punch_repository()
         self.recalculate_daily_summary = RecalculateDailyAttendanceSummaryUseCase(
-            repository_manager
+            repository_manager, integration_manager
+        )
+        self.ensure_period_is_open = EnsurePeriodIsOpenUseCase(repository_manager)
+        self.attendance_change_publisher = (
+            integration_manager.attendance_change_publisher() if integration_manager is not None else None
         )
 
     def execute(self, data: CreateTimePunchDTO) -> TimePunch:
@@ -23,6 +32,8 @@ class CreateTimePunchUseCase:
         if len(matricula) == 0:
             raise BadRequestError("matricula is required.")
 
+        self.ensure_period_is_open.execute(data.tenant_id, [data.punched_at.date()])
+
         duplicate = self.time_punch_repository.find_duplicate(
             employee_id=data.employee_id,
             matricula=matricula,
@@ -51,7 +62,9 @@ class CreateTimePunchUseCase:
             matricula=matricula,
             work_date=data.punched_at.date(),
         )
-        self.__validate_sequence(existing_punches=existing_punches, candidate=data, matricula=matricula)
+        timeline = self.__build_timeline(existing_punches=existing_punches, candidate=data, matricula=matricula)
+        if not timeline.is_valid:
+            raise BadRequestError(str(timeline.error))
 
         punch = TimePunch(
             tenant_id=data.tenant_id,
@@ -63,6 +76,10 @@ class CreateTimePunchUseCase:
             note=data.note,
         )
         created = self.time_punch_repository.create(punch)
+        if self.attendance_change_publisher is not None:
+            self.attendance_change_publisher.publish(
+                AttendanceChange.of_punch(AttendanceChangeType.TIME_PUNCH_CREATED, created)
+            )
 
         self.recalculate_daily_summary.execute(
             RecalculateDailyAttendanceSummaryDTO(
@@ -70,71 +87,32 @@ class CreateTimePunchUseCase:
                 employee_id=data.employee_id,
                 matricula=matricula,
                 work_date=data.punched_at.date(),
-            )
+            ),
+            timeline=timeline,
+            check_period=False,
         )
 
         return created
 
-    def __validate_sequence(
+    def __build_timeline(
         self, existing_punches: List[TimePunch], candidate: CreateTimePunchDTO, matricula: str
-    ) -> None:
-        all_punches: List[TimePunch] = existing_punches + [
-            TimePunch(
-                tenant_id=candidate.tenant_id,
-                employee_id=candidate.employee_id,
-                matricula=matricula,
-                punched_at=candidate.punched_at,
-                punch_type=candidate.punch_type,
-                source=candidate.source,
-                note=candidate.note,
-            )
-        ]
-
-        priority = {
-            PunchType.IN: 0,
-            PunchType.BREAK_START: 1,
-            PunchType.BREAK_END: 2,
-            PunchType.OUT: 3,
-        }
-
-        ordered = sorted(
-            all_punches,
-            key=lambda punch: (
-                punch.punched_at,
-                priority[punch.punch_type],
-            ),
+    ) -> DayTimeline:
+        timeline = DayTimeline(existing_punches)
+        if timeline.can_append(candidate.punched_at, candidate.punch_type):
+            timeline.append(candidate.punched_at, candidate.punch_type)
+            return timeline
+
+        return DayTimeline(
+            existing_punches
+            + [
+                TimePunch(
+                    tenant_id=candidate.tenant_id,
+                    employee_id=candidate.employee_id,
+                    matricula=matricula,
+                    punched_at=candidate.punched_at,
+                    punch_type=candidate.punch_type,
+                    source=candidate.source,
+                    note=candidate.note,
+                )
+            ]
         )
-
-        inside_shift = False
-        in_break = False
-
-        for punch in ordered:
-            if punch.punch_type == PunchType.IN:
-                if inside_shift:
-                    raise BadRequestError("Invalid sequence: IN cannot happen twice in a row.")
-                inside_shift = True
-                in_break = False
-                continue
-
-            if punch.punch_type == PunchType.OUT:
-                if not inside_shift:
-                    raise BadRequestError("Invalid sequence: OUT requires an open shift.")
-                if in_break:
-                    raise BadRequestError("Invalid sequence: OUT is not allowed while break is open.")
-                inside_shift = False
-                continue
-
-            if punch.punch_type == PunchType.BREAK_START:
-                if not inside_shift:
-                    raise BadRequestError("Invalid sequence: BREAK_START requires IN before it.")
-                if in_break:
-                    raise BadRequestError("Invalid sequence: BREAK_START already opened.")
-                in_break = True
-                continue
-
-            if punch.punch_type == PunchType.BREAK_END:
-                if not inside_shift:
-                    raise BadRequestError("Invalid sequence: BREAK_END requires IN before it.")
-                if not in_break:
-                    raise BadRequestError("Invalid sequence: BREAK_END requires BREAK_START.")
-                in_break = False
@@ -1,19 +1,34 @@
+from typing import Optional
+
 from application.dtos import RecalculateDailyAttendanceSummaryDTO
-from application.exceptions import BadRequestError
+from application.exceptions import BadRequestError, ConflictError
+from application.integrations import IntegrationManagerInterface
 from application.repositories import RepositoryManagerInterface
 from application.usecases.daily_attendance_summaries import (
     RecalculateDailyAttendanceSummaryUseCase,
 )
+from application.usecases.closed_periods import EnsurePeriodIsOpenUseCase
+from domain import AttendanceChange
+from domain.enums import AttendanceChangeType
 
 from .find_time_punch_by_id_usecase import FindTimePunchByIdUseCase
 
 
 class DeleteTimePunchUseCase:
-    def __init__(self, repository_manager: RepositoryManagerInterface):
+    def __init__(
+        self,
+        repository_manager: RepositoryManagerInterface,
+        integration_manager: Optional[IntegrationManagerInterface] = None,
+    ):
         self.time_punch_repository = repository_manager.time_punch_repository()
+        self.time_adjustment_item_repository = repository_manager.time_adjustment_item_repository()
         self.find_punch_by_id = FindTimePunchByIdUseCase(repository_manager)
         self.recalculate_daily_summary = RecalculateDailyAttendanceSummaryUseCase(
-            repository_manager
+            repository_manager, integration_manager
+        )
+        self.ensure_period_is_open = EnsurePeriodIsOpenUseCase(repository_manager)
+        self.attendance_change_publisher = (
+            integration_manager.attendance_change_publisher() if integration_manager is not None else None
         )
 
     def execute(self, punch_id: int, tenant_id: int) -> None:
@@ -21,7 +36,14 @@ class DeleteTimePunchUseCase:
         if punch.tenant_id != tenant_id:
             raise BadRequestError("Punch does not belong to tenant.")
 
+        self.ensure_period_is_open.execute(tenant_id, [punch.punched_at.date()])
+        if self.time_adjustment_item_repository.has_open_items_for_punch(punch_id):
+            raise ConflictError("Punch is referenced by an open time adjustment request.")
+
+        change = AttendanceChange.of_punch(AttendanceChangeType.TIME_PUNCH_DELETED, punch)
         self.time_punch_repository.delete(punch_id)
+        if self.attendance_change_publisher is not None:
+            self.attendance_change_publisher.publish(change)
 
         self.recalculate_daily_summary.execute(
             RecalculateDailyAttendanceSummaryDTO(
@@ -29,5 +51,6 @@ class DeleteTimePunchUseCase:
                 employee_id=punch.employee_id,
                 matricula=punch.matricula,
                 work_date=punch.punched_at.date(),
-            )
+            ),
+            check_period=False,
         )
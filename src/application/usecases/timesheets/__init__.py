@@ -0,0 +1,2 @@
+# pyright: reportUnusedImport=false
+from .get_monthly_timesheet_usecase import GetMonthlyTimesheetUseCase, monthly_timesheet_cache
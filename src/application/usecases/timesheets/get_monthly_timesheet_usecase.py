@@ -0,0 +1,123 @@
+from datetime import date, datetime, time
+from typing import List, Tuple
+
+from application.dtos import GetMonthlyTimesheetDTO
+from application.repositories import RepositoryManagerInterface
+from commons import VersionedCache
+from config import TIMESHEET_CACHE_SIZE
+from domain import DailyAttendanceSummaryRow, MonthlyTimesheet, TimePunchRow
+from domain.enums import DailyAttendanceStatus, ResourceScope
+
+# Punches and daily summaries of months that already ended, keyed by enrollment and month. Entries are checked
+# against the month's resource version, which every punch or summary write of that month bumps.
+monthly_timesheet_cache: VersionedCache[Tuple[List[TimePunchRow], List[DailyAttendanceSummaryRow]]] = VersionedCache(
+    "monthly_timesheet", max_size=TIMESHEET_CACHE_SIZE
+)
+
+
+class GetMonthlyTimesheetUseCase:
+    def __init__(self, repository_manager: RepositoryManagerInterface):
+        self.time_punch_repository = repository_manager.time_punch_repository()
+        self.daily_attendance_summary_repository = repository_manager.daily_attendance_summary_repository()
+        self.bank_hours_ledger_repository = repository_manager.bank_hours_ledger_repository()
+        self.resource_version_repository = repository_manager.resource_version_repository()
+        self.monthly_closing_total_repository = repository_manager.monthly_closing_total_repository()
+
+    def execute(self, data: GetMonthlyTimesheetDTO) -> MonthlyTimesheet:
+        start_date, end_date = MonthlyTimesheet.month_bounds(data.month)
+        punches, summaries = self.__load_month(data, start_date, end_date)
+
+        closing_total = None
+        if end_date < date.today():
+            closing_total = self.monthly_closing_total_repository.find_closed_by_enrollment_and_month(
+                tenant_id=data.tenant_id,
+                employee_id=data.employee_id,
+                matricula=data.matricula,
+                month=start_date,
+            )
+
+        # Balances always come from the ledger: entries dated in earlier open months still move the opening balance
+        # of a closed month, so the balances frozen at close time can go stale. Only the day totals are frozen.
+        opening_balance, closing_balance = self.bank_hours_ledger_repository.get_balances_around_period(
+            tenant_id=data.tenant_id,
+            employee_id=data.employee_id,
+            matricula=data.matricula,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        if closing_total is None:
+            return MonthlyTimesheet(
+                tenant_id=data.tenant_id,
+                employee_id=data.employee_id,
+                matricula=data.matricula,
+                month=start_date,
+                punches=punches,
+                summaries=summaries,
+                opening_balance_minutes=opening_balance,
+                closing_balance_minutes=closing_balance,
+            )
+
+        return MonthlyTimesheet(
+            tenant_id=data.tenant_id,
+            employee_id=data.employee_id,
+            matricula=data.matricula,
+            month=start_date,
+            punches=punches,
+            summaries=summaries,
+            opening_balance_minutes=opening_balance,
+            closing_balance_minutes=closing_balance,
+            totals={
+                "expected_minutes": closing_total.expected_minutes,
+                "worked_minutes": closing_total.worked_minutes,
+                "break_minutes": closing_total.break_minutes,
+                "overtime_minutes": closing_total.overtime_minutes,
+                "deficit_minutes": closing_total.deficit_minutes,
+                "days_by_status": {
+                    DailyAttendanceStatus.OK.value: closing_total.ok_days,
+                    DailyAttendanceStatus.INCOMPLETE.value: closing_total.incomplete_days,
+                    DailyAttendanceStatus.PENDING_ADJUSTMENT.value: closing_total.pending_adjustment_days,
+                    DailyAttendanceStatus.NO_POLICY.value: closing_total.no_policy_days,
+                },
+            },
+            closed=True,
+        )
+
+    def __load_month(
+        self, data: GetMonthlyTimesheetDTO, start_date: date, end_date: date
+    ) -> Tuple[List[TimePunchRow], List[DailyAttendanceSummaryRow]]:
+        if end_date >= date.today():
+            return self.__query_month(data, start_date, end_date)
+
+        cache_key = (data.tenant_id, data.employee_id, data.matricula, start_date)
+        # Read before the rows: a write landing in between leaves a stale version behind, never stale rows.
+        version = self.resource_version_repository.get_version(
+            ResourceScope.TIMESHEETS,
+            tenant_id=data.tenant_id,
+            key=MonthlyTimesheet.version_key(data.employee_id, data.matricula, start_date),
+        )
+        cached = monthly_timesheet_cache.get(cache_key, version)
+        if cached is not None:
+            return cached
+
+        month = self.__query_month(data, start_date, end_date)
+        monthly_timesheet_cache.put(cache_key, version, month)
+        return month
+
+    def __query_month(
+        self, data: GetMonthlyTimesheetDTO, start_date: date, end_date: date
+    ) -> Tuple[List[TimePunchRow], List[DailyAttendanceSummaryRow]]:
+        punches = self.time_punch_repository.find_rows_by_enrollment_and_period(
+            tenant_id=data.tenant_id,
+            employee_id=data.employee_id,
+            matricula=data.matricula,
+            start_at=datetime.combine(start_date, time.min),
+            end_at=datetime.combine(end_date, time.max),
+        )
+        summaries = self.daily_attendance_summary_repository.find_rows_by_enrollment_and_period(
+            tenant_id=data.tenant_id,
+            employee_id=data.employee_id,
+            matricula=data.matricula,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return punches, summaries
@@ -1,9 +1,20 @@
+from typing import List
+
 from application.dtos import CreateWorkPolicyTemplateDTO
 from application.exceptions import BadRequestError, ConflictError
 from application.repositories import RepositoryManagerInterface
 from domain import WorkPolicyTemplate
 
 
+def normalize_rest_weekdays(rest_weekdays: List[int]) -> List[int]:
+    weekdays = sorted(set(rest_weekdays))
+    if any(weekday < 0 or weekday > 6 for weekday in weekdays):
+        raise BadRequestError("rest_weekdays must be between 0 (Monday) and 6 (Sunday).")
+    if len(weekdays) == 7:
+        raise BadRequestError("rest_weekdays cannot cover the whole week.")
+    return weekdays
+
+
 class CreateWorkPolicyTemplateUseCase:
     def __init__(self, repository_manager: RepositoryManagerInterface):
         self.work_policy_template_repository = (
@@ -36,5 +47,6 @@ class CreateWorkPolicyTemplateUseCase:
             name=name,
             daily_work_minutes=data.daily_work_minutes,
             break_minutes=data.break_minutes,
+            rest_weekdays=normalize_rest_weekdays(data.rest_weekdays or []),
         )
         return self.work_policy_template_repository.create(template)
@@ -5,6 +5,7 @@ from application.exceptions import BadRequestError, ConflictError
 from application.repositories import RepositoryManagerInterface
 from domain import WorkPolicyTemplate
 
+from .create_work_policy_template_usecase import normalize_rest_weekdays
 from .find_work_policy_template_by_id_usecase import FindWorkPolicyTemplateByIdUseCase
 
 
@@ -63,6 +64,9 @@ class UpdateWorkPolicyTemplateUseCase:
         if data.break_minutes is not None:
             data_to_update["break_minutes"] = data.break_minutes
 
+        if data.rest_weekdays is not None:
+            data_to_update["rest_weekdays"] = normalize_rest_weekdays(data.rest_weekdays)
+
         if len(data_to_update) == 0:
             return template
 
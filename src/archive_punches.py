@@ -0,0 +1,49 @@
+import argparse
+import sys
+from datetime import date, datetime
+
+from application.exceptions import APIError
+from application.usecases.time_punch_archives import (
+    ArchiveMonthPunchesUseCase,
+    RestoreMonthPunchesUseCase,
+)
+from infra.database_manager import DatabaseManagerConnection
+from infra.mappers import import_mappers
+from infra.repositories import RepositoryManager
+
+
+def parse_month(value: str) -> date:
+    return datetime.strptime(value, "%Y-%m").date()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Move the punches of a closed month to Parquet cold storage (PUNCH_ARCHIVE_URI), or back."
+    )
+    parser.add_argument("--tenant-id", type=int, required=True)
+    parser.add_argument("--month", type=parse_month, required=True, help="YYYY-MM")
+    parser.add_argument("--restore", action="store_true")
+    args = parser.parse_args()
+
+    import_mappers()
+    db_manager = DatabaseManagerConnection()
+    try:
+        repository_manager = RepositoryManager(db_manager=db_manager)
+        if args.restore:
+            restored = RestoreMonthPunchesUseCase(repository_manager).execute(args.tenant_id, args.month)
+            print(f"restored={restored} month={args.month:%Y-%m}")
+            return 0
+
+        archive = ArchiveMonthPunchesUseCase(repository_manager).execute(args.tenant_id, args.month)
+    except APIError as error:
+        print(error.message, file=sys.stderr)
+        return 1
+    finally:
+        db_manager.close_session()
+
+    print(f"archived={archive.row_count} month={archive.month:%Y-%m} location={archive.location}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+import argparse
+import sys
+from datetime import date, datetime
+
+from application.dtos import CloseMonthDTO
+from application.exceptions import APIError
+from application.usecases.monthly_closings import CloseMonthUseCase, ReopenMonthUseCase
+from infra.database_manager import DatabaseManagerConnection
+from infra.mappers import import_mappers
+from infra.repositories import RepositoryManager
+
+
+def parse_month(value: str) -> date:
+    return datetime.strptime(value, "%Y-%m").date()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Close (or reopen) a month of a tenant, freezing its punches and materializing totals."
+    )
+    parser.add_argument("--tenant-id", type=int, required=True)
+    parser.add_argument("--month", type=parse_month, required=True, help="YYYY-MM")
+    parser.add_argument("--reopen", action="store_true")
+    args = parser.parse_args()
+
+    import_mappers()
+    db_manager = DatabaseManagerConnection()
+    try:
+        repository_manager = RepositoryManager(db_manager=db_manager)
+        if args.reopen:
+            closing = repository_manager.monthly_closing_repository().find_by_tenant_and_month(
+                args.tenant_id, args.month
+            )
+            if closing is None:
+                print(f"month {args.month:%Y-%m} is not closed", file=sys.stderr)
+                return 1
+            ReopenMonthUseCase(repository_manager).execute(closing_id=closing.id, tenant_id=args.tenant_id)
+            print(f"reopened={args.month:%Y-%m}")
+            return 0
+
+        closing = CloseMonthUseCase(repository_manager).execute(
+            CloseMonthDTO(tenant_id=args.tenant_id, month=args.month)
+        )
+    except APIError as error:
+        print(error.message, file=sys.stderr)
+        return 1
+    finally:
+        db_manager.close_session()
+
+    print(
+        f"closing={closing.id} month={closing.month:%Y-%m} "
+        f"recalculated_days={closing.recalculated_days} totals={closing.totals_count}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
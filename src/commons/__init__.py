@@ -1,2 +1,11 @@
 # pyright: reportUnusedImport=false
+from .etag import build_etag, etag_matches
 from .handlers import get_enum_value
+from .metrics import metrics_registry
+from .request_metrics import (
+    RequestMetrics,
+    get_request_metrics,
+    measure_phase,
+    start_request_metrics,
+)
+from .versioned_cache import VersionedCache
@@ -0,0 +1,19 @@
+import hashlib
+from typing import Any, Optional
+
+
+def build_etag(*parts: Any) -> str:
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'W/"{digest[:20]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if if_none_match is None:
+        return False
+
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+
+    opaque_tag = etag.removeprefix("W/")
+    return any(candidate.removeprefix("W/") == opaque_tag for candidate in candidates)
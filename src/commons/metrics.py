@@ -0,0 +1,147 @@
+from bisect import bisect_left
+from threading import Lock
+from typing import Callable, Dict, List, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Counter:
+    def __init__(self, name: str, description: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self.__values: Dict[LabelValues, float] = {}
+        self.__lock = Lock()
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = tuple(str(labels[name]) for name in self.label_names)
+        with self.__lock:
+            self.__values[key] = self.__values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        key = tuple(str(labels[name]) for name in self.label_names)
+        return self.__values.get(key, 0.0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} counter"]
+        with self.__lock:
+            for key, value in sorted(self.__values.items()):
+                lines.append(f"{self.name}{_format_labels(self.label_names, key)} {value}")
+        return lines
+
+
+class Gauge:
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        collect: Callable[[], Dict[LabelValues, float]],
+        label_names: Sequence[str] = (),
+    ):
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self.collect = collect
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} gauge"]
+        for key, value in sorted(self.collect().items()):
+            lines.append(f"{self.name}{_format_labels(self.label_names, key)} {value}")
+        return lines
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        self.__counts: Dict[LabelValues, List[int]] = {}
+        self.__sums: Dict[LabelValues, float] = {}
+        self.__lock = Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(str(labels[name]) for name in self.label_names)
+        index = bisect_left(self.buckets, value)
+        with self.__lock:
+            counts = self.__counts.setdefault(key, [0] * (len(self.buckets) + 1))
+            counts[index] += 1
+            self.__sums[key] = self.__sums.get(key, 0.0) + value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        with self.__lock:
+            for key, counts in sorted(self.__counts.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, counts):
+                    cumulative += count
+                    labels = _format_labels(self.label_names, key, f'le="{bound}"')
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                cumulative += counts[-1]
+                labels = _format_labels(self.label_names, key, 'le="+Inf"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                plain_labels = _format_labels(self.label_names, key)
+                lines.append(f"{self.name}_sum{plain_labels} {self.__sums[key]}")
+                lines.append(f"{self.name}_count{plain_labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.__metrics: Dict[str, object] = {}
+        self.__lock = Lock()
+
+    def counter(self, name: str, description: str, label_names: Sequence[str] = ()) -> Counter:
+        return self.__register(name, lambda: Counter(name, description, label_names))
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.__register(name, lambda: Histogram(name, description, label_names, buckets))
+
+    def gauge(
+        self,
+        name: str,
+        description: str,
+        collect: Callable[[], Dict[LabelValues, float]],
+        label_names: Sequence[str] = (),
+    ) -> Gauge:
+        return self.__register(name, lambda: Gauge(name, description, collect, label_names))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in list(self.__metrics.values()):
+            lines.extend(metric.render())  # type: ignore[attr-defined]
+        return "\n".join(lines) + "\n"
+
+    def __register(self, name: str, factory):
+        with self.__lock:
+            if name not in self.__metrics:
+                self.__metrics[name] = factory()
+            return self.__metrics[name]
+
+
+metrics_registry = MetricsRegistry()
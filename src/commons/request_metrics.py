@@ -0,0 +1,48 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, Optional
+
+
+@dataclass
+class RequestMetrics:
+    started_at: float = field(default_factory=time.perf_counter)
+    phases: Dict[str, float] = field(default_factory=dict)
+    query_count: int = 0
+    query_seconds: float = 0.0
+    rows_fetched: int = 0
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def add_query(self, seconds: float, rows: int) -> None:
+        self.query_count += 1
+        self.query_seconds += seconds
+        self.rows_fetched += max(rows, 0)
+
+
+_current_request_metrics: ContextVar[Optional[RequestMetrics]] = ContextVar(
+    "current_request_metrics", default=None
+)
+
+
+def start_request_metrics() -> RequestMetrics:
+    metrics = RequestMetrics()
+    _current_request_metrics.set(metrics)
+    return metrics
+
+
+def get_request_metrics() -> Optional[RequestMetrics]:
+    return _current_request_metrics.get()
+
+
+@contextmanager
+def measure_phase(name: str) -> Iterator[None]:
+    metrics = _current_request_metrics.get()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if metrics is not None:
+            metrics.add_phase(name, time.perf_counter() - started)
@@ -0,0 +1,60 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Generic, Hashable, Optional, Tuple, TypeVar
+
+from .metrics import metrics_registry
+
+T = TypeVar("T")
+
+versioned_cache_lookups = metrics_registry.counter(
+    "versioned_cache_lookups_total",
+    "Versioned cache lookups by cache and result",
+    label_names=("cache", "result"),
+)
+
+
+class VersionedCache(Generic[T]):
+    def __init__(self, name: str, max_size: int):
+        self.name = name
+        self.max_size = max_size
+        self.__entries: "OrderedDict[Hashable, Tuple[Any, T]]" = OrderedDict()
+        self.__lock = Lock()
+        metrics_registry.gauge(
+            f"{name}_cache_entries",
+            f"Entries currently held by the {name} cache",
+            lambda: {(): float(len(self))},
+        )
+
+    def get(self, key: Hashable, version: Any) -> Optional[T]:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                versioned_cache_lookups.inc(cache=self.name, result="miss")
+                return None
+
+            stored_version, value = entry
+            if stored_version != version:
+                del self.__entries[key]
+                versioned_cache_lookups.inc(cache=self.name, result="stale")
+                return None
+
+            self.__entries.move_to_end(key)
+            versioned_cache_lookups.inc(cache=self.name, result="hit")
+            return value
+
+    def put(self, key: Hashable, version: Any, value: T) -> None:
+        if self.max_size <= 0:
+            return
+
+        with self.__lock:
+            self.__entries[key] = (version, value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
@@ -17,7 +17,24 @@ HOST_DB = config("HOST_DB", default=None)
 NAME_DB = config("NAME_DB", default=None)
 PORT_DB = config("PORT_DB", default=None)
 
+DB_POOL_SIZE = int(config("DB_POOL_SIZE", cast=int, default=30))
+DB_MAX_OVERFLOW = int(config("DB_MAX_OVERFLOW", cast=int, default=10))
+SLOW_QUERY_THRESHOLD_MS = int(config("SLOW_QUERY_THRESHOLD_MS", cast=int, default=200))
+
 URL_DB = f"postgresql://{USER_DB}:{PASSWORD_DB}@{HOST_DB}:{PORT_DB}/{NAME_DB}"
 
 JWT_SECRET_KEY = cast(str, config("JWT_SECRET_KEY", default="local-key"))
 SYSTEM_TENANT_ID = int(config("SYSTEM_TENANT_ID", cast=int, default=1))
+ACCESS_TOKEN_CACHE_SIZE = int(config("ACCESS_TOKEN_CACHE_SIZE", cast=int, default=10000))
+ACCESS_TOKEN_CACHE_MAX_TTL_SECONDS = int(
+    config("ACCESS_TOKEN_CACHE_MAX_TTL_SECONDS", cast=int, default=300)
+)
+TIMESHEET_CACHE_SIZE = int(config("TIMESHEET_CACHE_SIZE", cast=int, default=5000))
+WORK_CALENDAR_CACHE_SIZE = int(config("WORK_CALENDAR_CACHE_SIZE", cast=int, default=1000))
+# Local directory (absolute path) or s3://bucket/prefix where archived punch months are written.
+PUNCH_ARCHIVE_URI = config("PUNCH_ARCHIVE_URI", default=None)
+# Frames a stream subscriber may fall behind by before it is dropped, and seconds between keepalive comments.
+ATTENDANCE_CHANGE_BUFFER_SIZE = int(config("ATTENDANCE_CHANGE_BUFFER_SIZE", cast=int, default=256))
+ATTENDANCE_CHANGE_KEEPALIVE_SECONDS = int(config("ATTENDANCE_CHANGE_KEEPALIVE_SECONDS", cast=int, default=15))
+# Unset keeps the no-op queue; memory:// holds messages in process and file:///path appends them as JSON lines.
+QUEUE_INTEGRATION_URI = config("QUEUE_INTEGRATION_URI", default=None)
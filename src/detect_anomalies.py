@@ -0,0 +1,51 @@
+import argparse
+import sys
+from datetime import date
+
+from application.dtos import DetectAttendanceAnomaliesDTO
+from application.exceptions import APIError
+from application.usecases.attendance_anomalies import DetectAttendanceAnomaliesUseCase
+from infra.database_manager import DatabaseManagerConnection
+from infra.mappers import import_mappers
+from infra.repositories import RepositoryManager
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Scan the punches and daily summaries of a tenant for suspicious patterns."
+    )
+    parser.add_argument("--tenant-id", type=int, required=True)
+    parser.add_argument("--start-date", type=date.fromisoformat, required=True)
+    parser.add_argument("--end-date", type=date.fromisoformat, required=True)
+    parser.add_argument("--min-punch-gap-seconds", type=int, default=60)
+    parser.add_argument("--max-worked-minutes", type=int, default=960)
+    parser.add_argument("--shared-punch-min-employees", type=int, default=10)
+    parser.add_argument("--missing-out-min-days", type=int, default=3)
+    args = parser.parse_args()
+
+    import_mappers()
+    db_manager = DatabaseManagerConnection()
+    try:
+        found = DetectAttendanceAnomaliesUseCase(RepositoryManager(db_manager=db_manager)).execute(
+            DetectAttendanceAnomaliesDTO(
+                tenant_id=args.tenant_id,
+                start_date=args.start_date,
+                end_date=args.end_date,
+                min_punch_gap_seconds=args.min_punch_gap_seconds,
+                max_worked_minutes=args.max_worked_minutes,
+                shared_punch_min_employees=args.shared_punch_min_employees,
+                missing_out_min_days=args.missing_out_min_days,
+            )
+        )
+    except APIError as error:
+        print(error.message, file=sys.stderr)
+        return 1
+    finally:
+        db_manager.close_session()
+
+    print(" ".join(f"{anomaly_type.value.lower()}={count}" for anomaly_type, count in found.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,38 @@
 # pyright: reportUnusedImport=false
+from .attendance_anomaly import AttendanceAnomaly
+from .attendance_change import AttendanceChange
+from .attendance_rollup_row import AttendanceRollupRow
+from .attendance_rollup_totals import AttendanceRollupTotals
 from .bank_hours_ledger import BankHoursLedger
+from .bank_hours_ledger_import_result import BankHoursLedgerImportResult
+from .bank_hours_ledger_row import BankHoursLedgerRow
+from .daily_attendance_rollup import DailyAttendanceRollup
 from .daily_attendance_summary import DailyAttendanceSummary
+from .daily_attendance_summary_row import DailyAttendanceSummaryRow
+from .day_timeline import DayTimeline
 from .enrollment_policy_assignment import EnrollmentPolicyAssignment
 from .enums import (
+    AttendanceAnomalyType,
+    AttendanceChangeType,
     BankHoursSource,
     DailyAttendanceStatus,
+    MonthlyClosingStatus,
+    OutboxTopic,
     PunchType,
+    ResourceScope,
     TimeAdjustmentStatus,
     TimeAdjustmentType,
 )
+from .holiday import Holiday
+from .monthly_closing import MonthlyClosing
+from .monthly_closing_total import MonthlyClosingTotal
+from .monthly_timesheet import MonthlyTimesheet
+from .outbox_event_row import OutboxEventRow
+from .outbox_relay_result import OutboxRelayResult
 from .time_adjustment_item import TimeAdjustmentItem
 from .time_adjustment_request import TimeAdjustmentRequest
 from .time_punch import TimePunch
+from .time_punch_archive import TimePunchArchive
+from .time_punch_row import TimePunchRow
+from .work_calendar import WorkCalendar
 from .work_policy_template import WorkPolicyTemplate
@@ -0,0 +1,36 @@
+from datetime import date, datetime
+from typing import Optional
+
+from .enums import AttendanceAnomalyType
+
+
+class AttendanceAnomaly:
+    id: int
+    tenant_id: int
+    employee_id: int
+    matricula: str
+    work_date: date
+    anomaly_type: AttendanceAnomalyType
+    detail: str
+    punch_id: Optional[int]
+    detected_at: datetime
+
+    def __init__(
+        self,
+        tenant_id: int,
+        employee_id: int,
+        matricula: str,
+        work_date: date,
+        anomaly_type: AttendanceAnomalyType,
+        detail: str,
+        detected_at: datetime,
+        punch_id: Optional[int] = None,
+    ):
+        self.tenant_id = tenant_id
+        self.employee_id = employee_id
+        self.matricula = matricula
+        self.work_date = work_date
+        self.anomaly_type = anomaly_type
+        self.detail = detail
+        self.detected_at = detected_at
+        self.punch_id = punch_id
@@ -0,0 +1,56 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from .day_timeline_kernel import RESULTING_STATE
+
+MICROSECONDS_PER_SECOND = 1_000_000
+
+
+@dataclass
+class PunchAnomalyBatch:
+    # Input positions of punches recorded too soon after the previous punch of the same group, and that gap.
+    rapid_punches: np.ndarray
+    rapid_gap_seconds: np.ndarray
+    # Groups whose last punch leaves the shift open (working or on break).
+    open_groups: np.ndarray
+
+
+def detect_punch_anomalies(
+    group_keys: np.ndarray, punched_at: np.ndarray, punch_types: np.ndarray, min_gap_seconds: int
+) -> PunchAnomalyBatch:
+    group_keys = np.asarray(group_keys)
+    timestamps = np.asarray(punched_at, dtype=np.int64)
+    codes = np.asarray(punch_types, dtype=np.int8)
+
+    if group_keys.size == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return PunchAnomalyBatch(rapid_punches=empty, rapid_gap_seconds=empty, open_groups=group_keys)
+
+    order = np.lexsort((codes, timestamps, group_keys))
+    keys = group_keys[order]
+    timestamps = timestamps[order]
+    codes = codes[order]
+
+    same_group = keys[1:] == keys[:-1]
+    gaps = timestamps[1:] - timestamps[:-1]
+    rapid = np.flatnonzero(same_group & (gaps < min_gap_seconds * MICROSECONDS_PER_SECOND)) + 1
+
+    is_group_end = np.ones(keys.size, dtype=bool)
+    is_group_end[:-1] = ~same_group
+    ends = np.flatnonzero(is_group_end)
+
+    return PunchAnomalyBatch(
+        rapid_punches=order[rapid],
+        rapid_gap_seconds=gaps[rapid - 1] // MICROSECONDS_PER_SECOND,
+        open_groups=keys[ends[RESULTING_STATE[codes[ends]] != 0]],
+    )
+
+
+def count_occurrences(values: np.ndarray) -> np.ndarray:
+    # For every element, how many times its value appears in the array.
+    values = np.asarray(values)
+    if values.size == 0:
+        return np.zeros(0, dtype=np.int64)
+    _, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    return counts[inverse]
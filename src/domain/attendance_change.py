@@ -0,0 +1,44 @@
+from datetime import date
+from typing import NamedTuple, Optional, Union
+
+from .daily_attendance_summary import DailyAttendanceSummary
+from .daily_attendance_summary_row import DailyAttendanceSummaryRow
+from .enums import AttendanceChangeType
+from .time_punch import TimePunch
+from .time_punch_row import TimePunchRow
+
+
+class AttendanceChange(NamedTuple):
+    change_type: AttendanceChangeType
+    tenant_id: int
+    employee_id: int
+    matricula: str
+    work_date: date
+    punch: Optional[TimePunchRow] = None
+    summary: Optional[DailyAttendanceSummaryRow] = None
+
+    @classmethod
+    def of_punch(cls, change_type: AttendanceChangeType, punch: TimePunch) -> "AttendanceChange":
+        return cls(
+            change_type=change_type,
+            tenant_id=punch.tenant_id,
+            employee_id=punch.employee_id,
+            matricula=punch.matricula,
+            work_date=punch.punched_at.date(),
+            punch=TimePunchRow._make(getattr(punch, name) for name in TimePunchRow._fields),
+        )
+
+    @classmethod
+    def of_summary(
+        cls, summary: Union[DailyAttendanceSummary, DailyAttendanceSummaryRow]
+    ) -> "AttendanceChange":
+        return cls(
+            change_type=AttendanceChangeType.DAILY_SUMMARY_UPDATED,
+            tenant_id=summary.tenant_id,
+            employee_id=summary.employee_id,
+            matricula=summary.matricula,
+            work_date=summary.work_date,
+            summary=DailyAttendanceSummaryRow._make(
+                getattr(summary, name) for name in DailyAttendanceSummaryRow._fields
+            ),
+        )
@@ -0,0 +1,15 @@
+from datetime import date
+from typing import NamedTuple
+
+
+class AttendanceRollupRow(NamedTuple):
+    work_date: date
+    ok_days: int
+    incomplete_days: int
+    pending_adjustment_days: int
+    no_policy_days: int
+    expected_minutes: int
+    worked_minutes: int
+    break_minutes: int
+    overtime_minutes: int
+    deficit_minutes: int
@@ -0,0 +1,13 @@
+from typing import NamedTuple
+
+
+class AttendanceRollupTotals(NamedTuple):
+    ok_days: int
+    incomplete_days: int
+    pending_adjustment_days: int
+    no_policy_days: int
+    expected_minutes: int
+    worked_minutes: int
+    break_minutes: int
+    overtime_minutes: int
+    deficit_minutes: int
@@ -0,0 +1,7 @@
+from typing import NamedTuple, Optional
+
+
+class BankHoursLedgerImportResult(NamedTuple):
+    line: int
+    entry_id: Optional[int]
+    error: Optional[str]
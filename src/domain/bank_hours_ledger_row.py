@@ -0,0 +1,15 @@
+from datetime import date
+from typing import NamedTuple, Optional
+
+from .enums import BankHoursSource
+
+
+class BankHoursLedgerRow(NamedTuple):
+    id: int
+    tenant_id: int
+    employee_id: int
+    matricula: str
+    event_date: date
+    minutes_delta: int
+    source: BankHoursSource
+    reference_id: Optional[int]
@@ -0,0 +1,41 @@
+from datetime import date
+
+from .enums import DailyAttendanceStatus
+
+
+class DailyAttendanceRollup:
+    id: int
+    tenant_id: int
+    work_date: date
+    status: DailyAttendanceStatus
+    shard: int
+    days_count: int
+    expected_minutes: int
+    worked_minutes: int
+    break_minutes: int
+    overtime_minutes: int
+    deficit_minutes: int
+
+    def __init__(
+        self,
+        tenant_id: int,
+        work_date: date,
+        status: DailyAttendanceStatus,
+        shard: int = 0,
+        days_count: int = 0,
+        expected_minutes: int = 0,
+        worked_minutes: int = 0,
+        break_minutes: int = 0,
+        overtime_minutes: int = 0,
+        deficit_minutes: int = 0,
+    ):
+        self.tenant_id = tenant_id
+        self.work_date = work_date
+        self.status = status
+        self.shard = shard
+        self.days_count = days_count
+        self.expected_minutes = expected_minutes
+        self.worked_minutes = worked_minutes
+        self.break_minutes = break_minutes
+        self.overtime_minutes = overtime_minutes
+        self.deficit_minutes = deficit_minutes
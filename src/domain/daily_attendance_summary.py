@@ -15,6 +15,7 @@ class DailyAttendanceSummary:
     overtime_minutes: int
     deficit_minutes: int
     status: DailyAttendanceStatus
+    stale: bool
 
     def __init__(
         self,
@@ -39,3 +40,4 @@ class DailyAttendanceSummary:
         self.overtime_minutes = overtime_minutes
         self.deficit_minutes = deficit_minutes
         self.status = status
+        self.stale = False
@@ -0,0 +1,18 @@
+from datetime import date
+from typing import NamedTuple
+
+from .enums import DailyAttendanceStatus
+
+
+class DailyAttendanceSummaryRow(NamedTuple):
+    id: int
+    tenant_id: int
+    employee_id: int
+    matricula: str
+    work_date: date
+    expected_minutes: int
+    worked_minutes: int
+    break_minutes: int
+    overtime_minutes: int
+    deficit_minutes: int
+    status: DailyAttendanceStatus
@@ -0,0 +1,119 @@
+from datetime import datetime
+from typing import Iterable, Optional, Tuple
+
+from .enums import PunchType
+from .time_punch import TimePunch
+
+PUNCH_TYPE_PRIORITY = {
+    PunchType.IN: 0,
+    PunchType.BREAK_START: 1,
+    PunchType.BREAK_END: 2,
+    PunchType.OUT: 3,
+}
+
+
+class DayTimeline:
+    worked_minutes: int
+    break_minutes: int
+    punches_count: int
+    error: Optional[str]
+
+    def __init__(self, punches: Iterable[TimePunch] = ()):
+        self.worked_minutes = 0
+        self.break_minutes = 0
+        self.punches_count = 0
+        self.error = None
+        self.__open_interval_start: Optional[datetime] = None
+        self.__open_break_start: Optional[datetime] = None
+        self.__inside_shift = False
+        self.__last_key: Optional[Tuple[datetime, int]] = None
+
+        ordered = sorted(
+            punches,
+            key=lambda punch: self.sort_key(punch.punched_at, punch.punch_type),
+        )
+        for punch in ordered:
+            self.__apply(punch.punched_at, PunchType(punch.punch_type))
+
+    @staticmethod
+    def sort_key(punched_at: datetime, punch_type: PunchType) -> Tuple[datetime, int]:
+        return punched_at, PUNCH_TYPE_PRIORITY[PunchType(punch_type)]
+
+    @property
+    def is_valid(self) -> bool:
+        return self.error is None
+
+    @property
+    def is_complete(self) -> bool:
+        return (
+            self.is_valid
+            and self.__open_interval_start is None
+            and self.__open_break_start is None
+        )
+
+    def minutes(self) -> Tuple[int, int, bool]:
+        if not self.is_valid:
+            return 0, 0, False
+        return self.worked_minutes, self.break_minutes, self.is_complete
+
+    def can_append(self, punched_at: datetime, punch_type: PunchType) -> bool:
+        return self.__last_key is None or self.sort_key(punched_at, punch_type) >= self.__last_key
+
+    def append(self, punched_at: datetime, punch_type: PunchType) -> None:
+        if not self.can_append(punched_at, punch_type):
+            raise ValueError("Punch must not happen before the last punch of the timeline.")
+        self.__apply(punched_at, PunchType(punch_type))
+
+    def __apply(self, punched_at: datetime, punch_type: PunchType) -> None:
+        self.punches_count += 1
+        self.__last_key = self.sort_key(punched_at, punch_type)
+        if self.error is not None:
+            return
+
+        if punch_type == PunchType.IN:
+            if self.__inside_shift:
+                self.error = "Invalid sequence: IN cannot happen twice in a row."
+                return
+            self.__inside_shift = True
+            self.__open_interval_start = punched_at
+            return
+
+        if punch_type == PunchType.OUT:
+            if not self.__inside_shift:
+                self.error = "Invalid sequence: OUT requires an open shift."
+                return
+            if self.__open_break_start is not None:
+                self.error = "Invalid sequence: OUT is not allowed while break is open."
+                return
+            self.worked_minutes += self.__diff_in_minutes(self.__open_interval_start, punched_at)
+            self.__inside_shift = False
+            self.__open_interval_start = None
+            return
+
+        if punch_type == PunchType.BREAK_START:
+            if not self.__inside_shift:
+                self.error = "Invalid sequence: BREAK_START requires IN before it."
+                return
+            if self.__open_break_start is not None:
+                self.error = "Invalid sequence: BREAK_START already opened."
+                return
+            self.worked_minutes += self.__diff_in_minutes(self.__open_interval_start, punched_at)
+            self.__open_interval_start = None
+            self.__open_break_start = punched_at
+            return
+
+        if punch_type == PunchType.BREAK_END:
+            if not self.__inside_shift:
+                self.error = "Invalid sequence: BREAK_END requires IN before it."
+                return
+            if self.__open_break_start is None:
+                self.error = "Invalid sequence: BREAK_END requires BREAK_START."
+                return
+            self.break_minutes += self.__diff_in_minutes(self.__open_break_start, punched_at)
+            self.__open_break_start = None
+            self.__open_interval_start = punched_at
+
+    def __diff_in_minutes(self, start: Optional[datetime], end: datetime) -> int:
+        if start is None or end < start:
+            return 0
+        return int((end - start).total_seconds() // 60)
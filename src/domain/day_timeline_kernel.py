@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Hashable, Iterable, List, Tuple
+
+import numpy as np
+
+from .day_timeline import PUNCH_TYPE_PRIORITY
+from .enums import PunchType
+
+MICROSECONDS_PER_MINUTE = 60_000_000
+
+# Shift state required before each punch code and the state it leaves behind:
+# 0 = outside shift, 1 = working, 2 = on break.
+REQUIRED_STATE = np.array([0, 1, 2, 1], dtype=np.int8)
+RESULTING_STATE = np.array([1, 2, 1, 0], dtype=np.int8)
+
+BREAK_START_CODE = PUNCH_TYPE_PRIORITY[PunchType.BREAK_START]
+BREAK_END_CODE = PUNCH_TYPE_PRIORITY[PunchType.BREAK_END]
+OUT_CODE = PUNCH_TYPE_PRIORITY[PunchType.OUT]
+
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+_AWARE_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass
+class DayTimelineBatch:
+    group_keys: np.ndarray
+    worked_minutes: np.ndarray
+    break_minutes: np.ndarray
+    punches_count: np.ndarray
+    is_valid: np.ndarray
+    is_complete: np.ndarray
+
+    def overtime_and_deficit(
+        self, expected_minutes: np.ndarray, eligible: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        balance = np.where(eligible, self.worked_minutes - expected_minutes, 0)
+        return np.maximum(balance, 0), np.maximum(-balance, 0)
+
+
+def punch_columns(
+    punches: Iterable[Tuple[Hashable, datetime, PunchType]],
+) -> Tuple[List[Hashable], np.ndarray, np.ndarray, np.ndarray]:
+    group_index: Dict[Hashable, int] = {}
+    group_codes = []
+    timestamps = []
+    codes = []
+    for key, punched_at, punch_type in punches:
+        epoch = _NAIVE_EPOCH if punched_at.tzinfo is None else _AWARE_EPOCH
+        group_codes.append(group_index.setdefault(key, len(group_index)))
+        timestamps.append((punched_at - epoch) // timedelta(microseconds=1))
+        codes.append(PUNCH_TYPE_PRIORITY[PunchType(punch_type)])
+
+    return (
+        list(group_index),
+        np.asarray(group_codes, dtype=np.int64),
+        np.asarray(timestamps, dtype=np.int64),
+        np.asarray(codes, dtype=np.int8),
+    )
+
+
+def compute_day_timelines(
+    group_keys: np.ndarray, punched_at: np.ndarray, punch_types: np.ndarray
+) -> DayTimelineBatch:
+    group_keys = np.asarray(group_keys)
+    timestamps = np.asarray(punched_at)
+    if np.issubdtype(timestamps.dtype, np.datetime64):
+        timestamps = timestamps.astype("datetime64[us]").astype(np.int64)
+    timestamps = timestamps.astype(np.int64, copy=False)
+    codes = np.asarray(punch_types, dtype=np.int8)
+
+    if group_keys.size == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return DayTimelineBatch(
+            group_keys=group_keys,
+            worked_minutes=empty,
+            break_minutes=empty,
+            punches_count=empty,
+            is_valid=np.zeros(0, dtype=bool),
+            is_complete=np.zeros(0, dtype=bool),
+        )
+
+    order = np.lexsort((codes, timestamps, group_keys))
+    keys = group_keys[order]
+    timestamps = timestamps[order]
+    codes = codes[order]
+
+    is_group_start = np.ones(keys.size, dtype=bool)
+    is_group_start[1:] = keys[1:] != keys[:-1]
+    starts = np.flatnonzero(is_group_start)
+    ends = np.append(starts[1:], keys.size) - 1
+
+    previous_state = np.zeros(keys.size, dtype=np.int8)
+    previous_state[1:] = RESULTING_STATE[codes[:-1]]
+    previous_state[is_group_start] = 0
+    is_invalid = REQUIRED_STATE[codes] != previous_state
+    has_error = np.logical_or.reduceat(is_invalid, starts)
+
+    elapsed = np.zeros(keys.size, dtype=np.int64)
+    elapsed[1:] = np.maximum(timestamps[1:] - timestamps[:-1], 0) // MICROSECONDS_PER_MINUTE
+    elapsed[is_group_start] = 0
+    closes_work = (codes == BREAK_START_CODE) | (codes == OUT_CODE)
+    closes_break = codes == BREAK_END_CODE
+
+    worked_minutes = np.add.reduceat(np.where(closes_work, elapsed, 0), starts)
+    break_minutes = np.add.reduceat(np.where(closes_break, elapsed, 0), starts)
+    is_closed = RESULTING_STATE[codes[ends]] == 0
+
+    return DayTimelineBatch(
+        group_keys=keys[starts],
+        worked_minutes=np.where(has_error, 0, worked_minutes),
+        break_minutes=np.where(has_error, 0, break_minutes),
+        punches_count=np.diff(np.append(starts, keys.size)),
+        is_valid=~has_error,
+        is_complete=~has_error & is_closed,
+    )
@@ -33,3 +33,37 @@ class BankHoursSource(str, Enum):
     DAILY_APURATION = "DAILY_APURATION"
     MANUAL_ADJUST = "MANUAL_ADJUST"
     ADJUSTMENT_REQUEST = "ADJUSTMENT_REQUEST"
+
+
+class MonthlyClosingStatus(str, Enum):
+    CLOSING = "CLOSING"
+    CLOSED = "CLOSED"
+
+
+class ResourceScope(str, Enum):
+    DAILY_ATTENDANCE_SUMMARIES = "daily_attendance_summaries"
+    BANK_HOURS_LEDGERS = "bank_hours_ledgers"
+    TIMESHEETS = "timesheets"
+    HOLIDAYS = "holidays"
+
+
+class AttendanceAnomalyType(str, Enum):
+    RAPID_PUNCHES = "RAPID_PUNCHES"
+    IMPOSSIBLE_SHIFT = "IMPOSSIBLE_SHIFT"
+    SHARED_PUNCH_TIME = "SHARED_PUNCH_TIME"
+    RECURRING_MISSING_OUT = "RECURRING_MISSING_OUT"
+
+
+class AttendanceChangeType(str, Enum):
+    TIME_PUNCH_CREATED = "TIME_PUNCH_CREATED"
+    TIME_PUNCH_DELETED = "TIME_PUNCH_DELETED"
+    DAILY_SUMMARY_UPDATED = "DAILY_SUMMARY_UPDATED"
+
+
+class OutboxTopic(str, Enum):
+    TIME_PUNCH_CREATED = "time_punch.created"
+    TIME_PUNCH_UPDATED = "time_punch.updated"
+    TIME_PUNCH_DELETED = "time_punch.deleted"
+    DAILY_ATTENDANCE_SUMMARY_UPSERTED = "daily_attendance_summary.upserted"
+    BANK_HOURS_LEDGER_CREATED = "bank_hours_ledger.created"
+    BANK_HOURS_LEDGER_DELETED = "bank_hours_ledger.deleted"
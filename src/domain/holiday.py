@@ -0,0 +1,21 @@
+from datetime import date
+
+
+class Holiday:
+    id: int
+    tenant_id: int
+    name: str
+    start_date: date
+    end_date: date
+
+    def __init__(
+        self,
+        tenant_id: int,
+        name: str,
+        start_date: date,
+        end_date: date,
+    ):
+        self.tenant_id = tenant_id
+        self.name = name
+        self.start_date = start_date
+        self.end_date = end_date
@@ -0,0 +1,36 @@
+from datetime import date, datetime
+from typing import Optional
+
+from .enums import MonthlyClosingStatus
+
+
+class MonthlyClosing:
+    id: int
+    tenant_id: int
+    month: date
+    status: MonthlyClosingStatus
+    started_at: datetime
+    closed_at: Optional[datetime]
+    closed_by_user_id: Optional[int]
+    recalculated_days: int
+    totals_count: int
+
+    def __init__(
+        self,
+        tenant_id: int,
+        month: date,
+        started_at: datetime,
+        status: MonthlyClosingStatus = MonthlyClosingStatus.CLOSING,
+        closed_at: Optional[datetime] = None,
+        closed_by_user_id: Optional[int] = None,
+        recalculated_days: int = 0,
+        totals_count: int = 0,
+    ):
+        self.tenant_id = tenant_id
+        self.month = month
+        self.status = status
+        self.started_at = started_at
+        self.closed_at = closed_at
+        self.closed_by_user_id = closed_by_user_id
+        self.recalculated_days = recalculated_days
+        self.totals_count = totals_count
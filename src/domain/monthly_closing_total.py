@@ -0,0 +1,57 @@
+from datetime import date
+
+
+class MonthlyClosingTotal:
+    id: int
+    monthly_closing_id: int
+    tenant_id: int
+    employee_id: int
+    matricula: str
+    month: date
+    expected_minutes: int
+    worked_minutes: int
+    break_minutes: int
+    overtime_minutes: int
+    deficit_minutes: int
+    ok_days: int
+    incomplete_days: int
+    pending_adjustment_days: int
+    no_policy_days: int
+    opening_balance_minutes: int
+    closing_balance_minutes: int
+
+    def __init__(
+        self,
+        monthly_closing_id: int,
+        tenant_id: int,
+        employee_id: int,
+        matricula: str,
+        month: date,
+        expected_minutes: int = 0,
+        worked_minutes: int = 0,
+        break_minutes: int = 0,
+        overtime_minutes: int = 0,
+        deficit_minutes: int = 0,
+        ok_days: int = 0,
+        incomplete_days: int = 0,
+        pending_adjustment_days: int = 0,
+        no_policy_days: int = 0,
+        opening_balance_minutes: int = 0,
+        closing_balance_minutes: int = 0,
+    ):
+        self.monthly_closing_id = monthly_closing_id
+        self.tenant_id = tenant_id
+        self.employee_id = employee_id
+        self.matricula = matricula
+        self.month = month
+        self.expected_minutes = expected_minutes
+        self.worked_minutes = worked_minutes
+        self.break_minutes = break_minutes
+        self.overtime_minutes = overtime_minutes
+        self.deficit_minutes = deficit_minutes
+        self.ok_days = ok_days
+        self.incomplete_days = incomplete_days
+        self.pending_adjustment_days = pending_adjustment_days
+        self.no_policy_days = no_policy_days
+        self.opening_balance_minutes = opening_balance_minutes
+        self.closing_balance_minutes = closing_balance_minutes
@@ -0,0 +1,69 @@
+from calendar import monthrange
+from datetime import date
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from .enums import DailyAttendanceStatus
+
+
+class MonthlyTimesheet:
+    tenant_id: int
+    employee_id: int
+    matricula: str
+    month: date
+    punches: Sequence[Any]
+    summaries: Sequence[Any]
+    opening_balance_minutes: int
+    closing_balance_minutes: int
+    totals: Dict[str, Any]
+    closed: bool
+
+    def __init__(
+        self,
+        tenant_id: int,
+        employee_id: int,
+        matricula: str,
+        month: date,
+        punches: Sequence[Any],
+        summaries: Sequence[Any],
+        opening_balance_minutes: int,
+        closing_balance_minutes: int,
+        totals: Optional[Dict[str, Any]] = None,
+        closed: bool = False,
+    ):
+        self.tenant_id = tenant_id
+        self.employee_id = employee_id
+        self.matricula = matricula
+        self.month = month
+        self.punches = punches
+        self.summaries = summaries
+        self.opening_balance_minutes = opening_balance_minutes
+        self.closing_balance_minutes = closing_balance_minutes
+        self.totals = totals if totals is not None else self.__sum_summaries()
+        self.closed = closed
+
+    @staticmethod
+    def month_bounds(month: date) -> Tuple[date, date]:
+        start = month.replace(day=1)
+        return start, start.replace(day=monthrange(start.year, start.month)[1])
+
+    @staticmethod
+    def version_key(employee_id: int, matricula: str, day: date) -> str:
+        return f"{employee_id}:{matricula}:{day:%Y-%m}"
+
+    def __sum_summaries(self) -> Dict[str, Any]:
+        totals: Dict[str, Any] = {
+            "expected_minutes": 0,
+            "worked_minutes": 0,
+            "break_minutes": 0,
+            "overtime_minutes": 0,
+            "deficit_minutes": 0,
+            "days_by_status": {status.value: 0 for status in DailyAttendanceStatus},
+        }
+        for summary in self.summaries:
+            totals["expected_minutes"] += summary.expected_minutes
+            totals["worked_minutes"] += summary.worked_minutes
+            totals["break_minutes"] += summary.break_minutes
+            totals["overtime_minutes"] += summary.overtime_minutes
+            totals["deficit_minutes"] += summary.deficit_minutes
+            totals["days_by_status"][summary.status] += 1
+        return totals
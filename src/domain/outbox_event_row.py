@@ -0,0 +1,11 @@
+from datetime import datetime
+from typing import Any, Dict, NamedTuple
+
+
+class OutboxEventRow(NamedTuple):
+    id: int
+    tenant_id: int
+    topic: str
+    payload: Dict[str, Any]
+    attempts: int
+    created_at: datetime
@@ -0,0 +1,7 @@
+from typing import NamedTuple
+
+
+class OutboxRelayResult(NamedTuple):
+    claimed: int
+    sent: int
+    failed: int
@@ -0,0 +1,27 @@
+from datetime import date, datetime
+
+
+class TimePunchArchive:
+    id: int
+    tenant_id: int
+    month: date
+    location: str
+    row_count: int
+    time_zone: str
+    archived_at: datetime
+
+    def __init__(
+        self,
+        tenant_id: int,
+        month: date,
+        location: str,
+        row_count: int,
+        time_zone: str,
+        archived_at: datetime,
+    ):
+        self.tenant_id = tenant_id
+        self.month = month
+        self.location = location
+        self.row_count = row_count
+        self.time_zone = time_zone
+        self.archived_at = archived_at
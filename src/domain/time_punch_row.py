@@ -0,0 +1,15 @@
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+from .enums import PunchType
+
+
+class TimePunchRow(NamedTuple):
+    id: int
+    tenant_id: int
+    employee_id: int
+    matricula: str
+    punched_at: datetime
+    punch_type: PunchType
+    source: str
+    note: Optional[str]
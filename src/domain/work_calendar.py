@@ -0,0 +1,28 @@
+from bisect import bisect_right
+from datetime import date, timedelta
+from typing import Iterable, List, Tuple
+
+from .work_policy_template import WorkPolicyTemplate
+
+
+class WorkCalendar:
+    def __init__(self, holidays: Iterable[Tuple[date, date]] = ()):
+        # Overlapping and adjacent holidays are merged, so the intervals are disjoint and both lists stay sorted.
+        self.__starts: List[date] = []
+        self.__ends: List[date] = []
+        for start_date, end_date in sorted(holidays):
+            if len(self.__ends) > 0 and start_date <= self.__ends[-1] + timedelta(days=1):
+                self.__ends[-1] = max(self.__ends[-1], end_date)
+                continue
+            self.__starts.append(start_date)
+            self.__ends.append(end_date)
+
+    def is_holiday(self, day: date) -> bool:
+        index = bisect_right(self.__starts, day) - 1
+        return index >= 0 and day <= self.__ends[index]
+
+    def is_working_day(self, template: WorkPolicyTemplate, day: date) -> bool:
+        return day.weekday() not in template.rest_weekdays and not self.is_holiday(day)
+
+    def expected_minutes(self, template: WorkPolicyTemplate, day: date) -> int:
+        return template.daily_work_minutes if self.is_working_day(template, day) else 0
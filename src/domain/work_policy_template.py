@@ -1,4 +1,4 @@
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
     from .enrollment_policy_assignment import EnrollmentPolicyAssignment
@@ -10,6 +10,7 @@ class WorkPolicyTemplate:
     name: str
     daily_work_minutes: int
     break_minutes: int
+    rest_weekdays: List[int]
 
     assignments: List["EnrollmentPolicyAssignment"]
 
@@ -19,9 +20,11 @@ class WorkPolicyTemplate:
         name: str,
         daily_work_minutes: int,
         break_minutes: int,
+        rest_weekdays: Optional[List[int]] = None,
     ):
         self.tenant_id = tenant_id
         self.name = name
         self.daily_work_minutes = daily_work_minutes
         self.break_minutes = break_minutes
+        self.rest_weekdays = rest_weekdays if rest_weekdays is not None else []
         self.assignments = []
@@ -1,19 +1,73 @@
-from sqlalchemy import create_engine
+import logging
+import time
+from typing import Any, Dict, cast
+
+import orjson
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 
-from config import HOST_DB, PASSWORD_DB, USER_DB, PORT_DB, NAME_DB
+from config import (
+    DB_MAX_OVERFLOW,
+    DB_POOL_SIZE,
+    HOST_DB,
+    NAME_DB,
+    PASSWORD_DB,
+    PORT_DB,
+    SLOW_QUERY_THRESHOLD_MS,
+    USER_DB,
+)
+from commons import get_request_metrics, metrics_registry
 
 URL_DB = f"postgresql://{USER_DB}:{PASSWORD_DB}@{HOST_DB}:{PORT_DB}/{NAME_DB}"
 
 
 _engine = create_engine(
     URL_DB,
-    pool_size=30,
-    max_overflow=10,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
     pool_pre_ping=True,
     pool_timeout=30,
     pool_recycle=30,
+    # JSONB payloads carry dates, datetimes and enum members straight from the read models.
+    json_serializer=lambda value: orjson.dumps(value).decode(),
+    json_deserializer=orjson.loads,
+)
+
+slow_query_logger = logging.getLogger("time_tracking.slow_query")
+
+query_duration_histogram = metrics_registry.histogram(
+    "db_query_duration_seconds",
+    "Duration of SQL statements executed by the service",
 )
+slow_queries_counter = metrics_registry.counter(
+    "db_slow_queries_total",
+    "SQL statements slower than SLOW_QUERY_THRESHOLD_MS",
+)
+
+
+@event.listens_for(_engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    _ = (cursor, statement, parameters, context, executemany)
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+@event.listens_for(_engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    _ = (parameters, context, executemany)
+    elapsed = time.perf_counter() - conn.info["query_started_at"].pop()
+    query_duration_histogram.observe(elapsed)
+
+    request_metrics = get_request_metrics()
+    if request_metrics is not None:
+        returns_rows = cursor.description is not None
+        request_metrics.add_query(elapsed, cursor.rowcount if returns_rows else 0)
+
+    if elapsed * 1000 >= SLOW_QUERY_THRESHOLD_MS:
+        slow_queries_counter.inc()
+        slow_query_logger.warning(
+            "slow query (%.1f ms): %s", elapsed * 1000, " ".join(statement.split())
+        )
 
 
 SessionLocal = sessionmaker(
@@ -35,3 +89,26 @@ class DatabaseManagerConnection:
 
     def commit(self):
         self.session.commit()
+
+
+def get_pool_status() -> Dict[str, int]:
+    pool = cast(QueuePool, _engine.pool)
+    return {
+        "size": pool.size(),
+        "max_overflow": DB_MAX_OVERFLOW,
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "checked_in": pool.checkedin(),
+    }
+
+
+def _collect_pool_status() -> Dict[Any, float]:
+    return {(key,): float(value) for key, value in get_pool_status().items()}
+
+
+metrics_registry.gauge(
+    "db_pool_connections",
+    "SQLAlchemy connection pool status",
+    _collect_pool_status,
+    label_names=("state",),
+)
@@ -1,3 +1,11 @@
 # pyright: reportUnusedImport=false
+from .attendance_change_broker import (
+    AttendanceChangeBroker,
+    AttendanceChangeSubscription,
+    attendance_change_broker,
+)
+from .attendance_change_publisher import AttendanceChangePublisher
+from .file_queue_integration import FileQueueIntegration
+from .in_memory_queue_integration import InMemoryQueueIntegration, in_memory_queue_integration
 from .integration_manager import IntegrationManager
 from .queue_integration import QueueIntegration
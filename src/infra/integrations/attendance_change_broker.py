@@ -0,0 +1,158 @@
+import asyncio
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Set
+
+import orjson
+
+from commons import metrics_registry
+from config import ATTENDANCE_CHANGE_BUFFER_SIZE
+from domain import AttendanceChange
+
+attendance_change_frames = metrics_registry.counter(
+    "attendance_change_frames_total",
+    "Attendance change frames fanned out to stream subscribers by change type",
+    label_names=("change_type",),
+)
+attendance_change_dropped_subscribers = metrics_registry.counter(
+    "attendance_change_dropped_subscribers_total",
+    "Stream subscribers dropped for falling behind the attendance change feed",
+)
+
+
+def encode_frame(change: AttendanceChange) -> bytes:
+    payload: Dict[str, Any] = {
+        "tenantId": change.tenant_id,
+        "employeeId": change.employee_id,
+        "matricula": change.matricula,
+        "workDate": change.work_date,
+    }
+    if change.punch is not None:
+        payload["punch"] = {
+            "id": change.punch.id,
+            "punchedAt": change.punch.punched_at,
+            "punchType": change.punch.punch_type,
+            "source": change.punch.source,
+            "note": change.punch.note,
+        }
+    if change.summary is not None:
+        payload["summary"] = {
+            "id": change.summary.id,
+            "expectedMinutes": change.summary.expected_minutes,
+            "workedMinutes": change.summary.worked_minutes,
+            "breakMinutes": change.summary.break_minutes,
+            "overtimeMinutes": change.summary.overtime_minutes,
+            "deficitMinutes": change.summary.deficit_minutes,
+            "status": change.summary.status,
+        }
+    return b"".join(
+        (
+            b"event: ",
+            change.change_type.value.encode(),
+            b"\ndata: ",
+            orjson.dumps(payload, option=orjson.OPT_UTC_Z),
+            b"\n\n",
+        )
+    )
+
+
+class AttendanceChangeSubscription:
+    __slots__ = ("tenant_id", "max_frames", "closed", "__frames", "__waiter")
+
+    def __init__(self, tenant_id: int, max_frames: int):
+        self.tenant_id = tenant_id
+        self.max_frames = max_frames
+        self.closed = False
+        self.__frames: Deque[bytes] = deque()
+        self.__waiter: Optional["asyncio.Future[None]"] = None
+
+    def offer(self, frame: bytes) -> bool:
+        if len(self.__frames) >= self.max_frames:
+            return False
+        self.__frames.append(frame)
+        self.__wake()
+        return True
+
+    def close(self) -> None:
+        self.closed = True
+        self.__wake()
+
+    async def next_frames(self, timeout: float) -> bytes:
+        """Returns every frame buffered so far, or b"" once timeout seconds pass without one."""
+        if len(self.__frames) == 0 and not self.closed:
+            self.__waiter = asyncio.get_running_loop().create_future()
+            try:
+                await asyncio.wait((self.__waiter,), timeout=timeout)
+            finally:
+                self.__waiter = None
+
+        frames = b"".join(self.__frames)
+        self.__frames.clear()
+        return frames
+
+    def __wake(self) -> None:
+        if self.__waiter is not None and not self.__waiter.done():
+            self.__waiter.set_result(None)
+
+
+class AttendanceChangeBroker:
+    """Fans attendance changes out to the stream subscribers of this worker process.
+
+    Subscriptions live on the event loop that serves the streams; publish may be called from any thread. Each change
+    is encoded once and the same bytes are queued for every subscriber of its tenant.
+    """
+
+    def __init__(self, buffer_size: int):
+        self.buffer_size = buffer_size
+        self.__subscriptions: Dict[int, Set[AttendanceChangeSubscription]] = {}
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+        metrics_registry.gauge(
+            "attendance_change_subscribers",
+            "Attendance change stream subscribers connected to this worker",
+            lambda: {(): float(self.subscriber_count())},
+        )
+
+    def subscribe(self, tenant_id: int) -> AttendanceChangeSubscription:
+        self.__loop = asyncio.get_running_loop()
+        subscription = AttendanceChangeSubscription(tenant_id, self.buffer_size)
+        self.__subscriptions.setdefault(tenant_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: AttendanceChangeSubscription) -> None:
+        subscriptions = self.__subscriptions.get(subscription.tenant_id)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if len(subscriptions) == 0:
+            del self.__subscriptions[subscription.tenant_id]
+
+    def publish(self, change: AttendanceChange) -> None:
+        loop = self.__loop
+        if loop is None or change.tenant_id not in self.__subscriptions:
+            return
+
+        frame = encode_frame(change)
+        try:
+            loop.call_soon_threadsafe(self.__fan_out, change, frame)
+        except RuntimeError:
+            # The serving loop is already closed, so nobody is left to receive the change.
+            pass
+
+    def subscriber_count(self) -> int:
+        return sum(len(subscriptions) for subscriptions in tuple(self.__subscriptions.values()))
+
+    def __fan_out(self, change: AttendanceChange, frame: bytes) -> None:
+        subscriptions = self.__subscriptions.get(change.tenant_id)
+        if subscriptions is None:
+            return
+
+        attendance_change_frames.inc(len(subscriptions), change_type=change.change_type.value)
+        for subscription in tuple(subscriptions):
+            # A subscriber that stopped reading is closed rather than buffered without bound; the client reconnects
+            # and reloads its view.
+            if not subscription.offer(frame):
+                self.unsubscribe(subscription)
+                subscription.close()
+                attendance_change_dropped_subscribers.inc()
+
+
+attendance_change_broker = AttendanceChangeBroker(buffer_size=ATTENDANCE_CHANGE_BUFFER_SIZE)
@@ -0,0 +1,9 @@
+from application.integrations import AttendanceChangePublisherInterface
+from domain import AttendanceChange
+
+from .attendance_change_broker import attendance_change_broker
+
+
+class AttendanceChangePublisher(AttendanceChangePublisherInterface):
+    def publish(self, change: AttendanceChange) -> None:
+        attendance_change_broker.publish(change)
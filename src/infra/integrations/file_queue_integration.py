@@ -0,0 +1,25 @@
+import os
+from typing import Any, Dict, List, Tuple
+
+import orjson
+
+from application.integrations import QueueIntegrationInterface
+
+
+class FileQueueIntegration(QueueIntegrationInterface):
+    """Appends each message as a JSON line to a local file, standing in for the broker in tests and local runs."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def publish(self, topic: str, payload: Dict[str, Any]) -> None:
+        self.publish_many([(topic, payload)])
+
+    def publish_many(self, messages: List[Tuple[str, Dict[str, Any]]]) -> None:
+        lines = b"".join(
+            orjson.dumps({"topic": topic, "payload": payload}) + b"\n" for topic, payload in messages
+        )
+        with open(self.path, "ab") as file:
+            file.write(lines)
+            file.flush()
+            os.fsync(file.fileno())
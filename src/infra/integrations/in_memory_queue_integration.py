@@ -0,0 +1,37 @@
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+from application.integrations import QueueIntegrationInterface
+
+
+class InMemoryQueueIntegration(QueueIntegrationInterface):
+    """Keeps published messages in process, for tests and local runs of the outbox relay.
+
+    With a capacity, publishing past it raises the way a saturated broker would, so retries and backoff can be
+    exercised without one.
+    """
+
+    def __init__(self, capacity: Optional[int] = None):
+        self.capacity = capacity
+        self.__messages: List[Tuple[str, Dict[str, Any]]] = []
+        self.__lock = Lock()
+
+    def publish(self, topic: str, payload: Dict[str, Any]) -> None:
+        self.publish_many([(topic, payload)])
+
+    def publish_many(self, messages: List[Tuple[str, Dict[str, Any]]]) -> None:
+        with self.__lock:
+            if self.capacity is not None and len(self.__messages) + len(messages) > self.capacity:
+                raise RuntimeError(f"Queue is full ({len(self.__messages)}/{self.capacity} messages).")
+            self.__messages.extend(messages)
+
+    def drain(self) -> List[Tuple[str, Dict[str, Any]]]:
+        with self.__lock:
+            messages, self.__messages = self.__messages, []
+        return messages
+
+    def __len__(self) -> int:
+        return len(self.__messages)
+
+
+in_memory_queue_integration = InMemoryQueueIntegration()
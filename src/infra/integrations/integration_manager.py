@@ -1,8 +1,23 @@
-from application.integrations import IntegrationManagerInterface, QueueIntegrationInterface
+from application.integrations import (
+    AttendanceChangePublisherInterface,
+    IntegrationManagerInterface,
+    QueueIntegrationInterface,
+)
+from config import QUEUE_INTEGRATION_URI
 
+from .attendance_change_publisher import AttendanceChangePublisher
+from .file_queue_integration import FileQueueIntegration
+from .in_memory_queue_integration import in_memory_queue_integration
 from .queue_integration import QueueIntegration
 
 
 class IntegrationManager(IntegrationManagerInterface):
     def queue_integration(self) -> QueueIntegrationInterface:
-        return QueueIntegration()
+        if QUEUE_INTEGRATION_URI is None:
+            return QueueIntegration()
+        if QUEUE_INTEGRATION_URI == "memory://":
+            return in_memory_queue_integration
+        return FileQueueIntegration(QUEUE_INTEGRATION_URI.removeprefix("file://"))
+
+    def attendance_change_publisher(self) -> AttendanceChangePublisherInterface:
+        return AttendanceChangePublisher()
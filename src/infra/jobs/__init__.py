@@ -0,0 +1,10 @@
+# pyright: reportUnusedImport=false
+from .parallel_recalculation_executor import (
+    ParallelRecalculationExecutor,
+    RecalculationReport,
+)
+from .partition_maintenance import (
+    PARTITIONED_TABLES,
+    PartitionMaintenance,
+    PartitionMaintenanceReport,
+)
@@ -0,0 +1,151 @@
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
+from multiprocessing import get_context
+from typing import Callable, Dict, List, Optional
+
+from application.dtos import RecalculateDailyAttendanceSummariesByPeriodDTO
+from application.usecases.daily_attendance_summaries import (
+    RecalculateDailyAttendanceSummariesByPeriodUseCase,
+)
+from application.usecases.closed_periods import EnsurePeriodIsOpenUseCase
+from infra.database_manager import DatabaseManagerConnection
+from infra.mappers import import_mappers
+from infra.repositories import RepositoryManager
+
+
+@dataclass
+class EmployeeRecalculationResult:
+    employee_id: int
+    summaries_count: int
+    errors: List[str]
+
+
+@dataclass
+class RecalculationReport:
+    employees_total: int = 0
+    employees_done: int = 0
+    summaries_count: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+def _init_worker() -> None:
+    import_mappers()
+
+
+def _recalculate_employee(
+    tenant_id: int,
+    employee_id: int,
+    matriculas: List[str],
+    start_date: date,
+    end_date: date,
+) -> EmployeeRecalculationResult:
+    # Runs inside a spawned worker: the engine (and its pool) belongs to this process only.
+    db_manager = DatabaseManagerConnection()
+    result = EmployeeRecalculationResult(employee_id=employee_id, summaries_count=0, errors=[])
+    try:
+        usecase = RecalculateDailyAttendanceSummariesByPeriodUseCase(
+            RepositoryManager(db_manager=db_manager)
+        )
+        for matricula in matriculas:
+            try:
+                summaries = usecase.execute(
+                    RecalculateDailyAttendanceSummariesByPeriodDTO(
+                        tenant_id=tenant_id,
+                        employee_id=employee_id,
+                        matricula=matricula,
+                        start_date=start_date,
+                        end_date=end_date,
+                    )
+                )
+                result.summaries_count += len(summaries)
+            except Exception as error:
+                db_manager.session.rollback()
+                message = getattr(error, "message", None) or repr(error)
+                result.errors.append(
+                    f"employee_id={employee_id} matricula={matricula}: {message}"
+                )
+    finally:
+        db_manager.close_session()
+    return result
+
+
+class ParallelRecalculationExecutor:
+    def __init__(
+        self,
+        workers: int,
+        on_progress: Optional[Callable[[RecalculationReport], None]] = None,
+    ):
+        if workers < 1:
+            raise ValueError("workers must be greater than zero.")
+        self.workers = workers
+        self.on_progress = on_progress
+
+    def execute(
+        self,
+        tenant_id: int,
+        start_date: date,
+        end_date: date,
+        employee_id: Optional[int] = None,
+    ) -> RecalculationReport:
+        shards = self.__load_shards(tenant_id, start_date, end_date, employee_id)
+        report = RecalculationReport(employees_total=len(shards))
+        if len(shards) == 0:
+            return report
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.workers, len(shards)),
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+        ) as pool:
+            futures = {
+                pool.submit(
+                    _recalculate_employee,
+                    tenant_id,
+                    shard_employee_id,
+                    matriculas,
+                    start_date,
+                    end_date,
+                ): shard_employee_id
+                for shard_employee_id, matriculas in shards.items()
+            }
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                    report.summaries_count += result.summaries_count
+                    report.errors.extend(result.errors)
+                except Exception as error:
+                    report.errors.append(f"employee_id={futures[future]}: {error!r}")
+
+                report.employees_done += 1
+                if self.on_progress is not None:
+                    self.on_progress(report)
+
+        return report
+
+    def __load_shards(
+        self,
+        tenant_id: int,
+        start_date: date,
+        end_date: date,
+        employee_id: Optional[int],
+    ) -> Dict[int, List[str]]:
+        db_manager = DatabaseManagerConnection()
+        try:
+            repository_manager = RepositoryManager(db_manager=db_manager)
+            # Fails the whole run before any worker starts instead of once per employee.
+            EnsurePeriodIsOpenUseCase(repository_manager).execute_for_period(tenant_id, start_date, end_date)
+            enrollments = repository_manager.time_punch_repository().find_enrollments_with_punch_in_period(
+                tenant_id=tenant_id,
+                start_at=datetime.combine(start_date, time.min),
+                end_at=datetime.combine(end_date, time.max),
+                employee_id=employee_id,
+            )
+        finally:
+            db_manager.close_session()
+
+        shards: Dict[int, List[str]] = defaultdict(list)
+        for enrollment_employee_id, matricula in enrollments:
+            shards[enrollment_employee_id].append(matricula)
+        return dict(shards)
@@ -0,0 +1,114 @@
+import re
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+
+from infra.database_manager import DatabaseManagerConnection
+
+
+@dataclass(frozen=True)
+class PartitionedTable:
+    name: str
+    column: str
+    detachable: bool
+
+
+PARTITIONED_TABLES = (
+    PartitionedTable(name="time_punch", column="punched_at", detachable=True),
+    # Balances are sums over the whole ledger history, so old ledger months must stay attached.
+    PartitionedTable(name="bank_hours_ledger", column="event_date", detachable=False),
+)
+
+
+@dataclass
+class PartitionMaintenanceReport:
+    created: List[str] = field(default_factory=list)
+    detached: List[str] = field(default_factory=list)
+    rows_moved: Dict[str, int] = field(default_factory=dict)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+class PartitionMaintenance:
+    def __init__(self, months_ahead: int = 3, detach_before: Optional[date] = None):
+        self.months_ahead = months_ahead
+        self.detach_before = detach_before.replace(day=1) if detach_before is not None else None
+
+    def execute(self, today: Optional[date] = None) -> PartitionMaintenanceReport:
+        current = (today or date.today()).replace(day=1)
+        report = PartitionMaintenanceReport()
+        db_manager = DatabaseManagerConnection()
+        try:
+            for table in PARTITIONED_TABLES:
+                existing = self.__find_month_partitions(db_manager, table)
+                for offset in range(self.months_ahead + 1):
+                    month = add_months(current, offset)
+                    if month in existing:
+                        continue
+                    name, moved = self.__create_partition(db_manager, table, month)
+                    report.created.append(name)
+                    if moved > 0:
+                        report.rows_moved[name] = moved
+
+                if self.detach_before is None or not table.detachable:
+                    continue
+                for month, name in sorted(existing.items()):
+                    if month < self.detach_before:
+                        db_manager.session.execute(text(f"ALTER TABLE {table.name} DETACH PARTITION {name}"))
+                        db_manager.commit()
+                        report.detached.append(name)
+        finally:
+            db_manager.close_session()
+        return report
+
+    def __find_month_partitions(
+        self, db_manager: DatabaseManagerConnection, table: PartitionedTable
+    ) -> Dict[date, str]:
+        rows = db_manager.session.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE parent.relname = :table"
+            ),
+            {"table": table.name},
+        ).scalars()
+        pattern = re.compile(rf"^{table.name}_p(\d{{4}})_(\d{{2}})$")
+        partitions = {}
+        for name in rows:
+            match = pattern.match(name)
+            if match is not None:
+                partitions[date(int(match.group(1)), int(match.group(2)), 1)] = name
+        return partitions
+
+    def __create_partition(
+        self, db_manager: DatabaseManagerConnection, table: PartitionedTable, month: date
+    ) -> Tuple[str, int]:
+        name = f"{table.name}_p{month:%Y_%m}"
+        default = f"{table.name}_default"
+        bounds = {"start": month, "end": add_months(month, 1)}
+        session = db_manager.session
+        in_range = f"{table.column} >= :start AND {table.column} < :end"
+
+        # Postgres refuses to create a partition while the default partition holds rows of its range, so
+        # those rows are moved out inside the same transaction.
+        moved = session.execute(text(f"SELECT count(*) FROM {default} WHERE {in_range}"), bounds).scalar_one()
+        if moved > 0:
+            session.execute(text(f"ALTER TABLE {table.name} DETACH PARTITION {default}"))
+        session.execute(
+            text(
+                f"CREATE TABLE {name} PARTITION OF {table.name} "
+                f"FOR VALUES FROM ('{bounds['start'].isoformat()}') TO ('{bounds['end'].isoformat()}')"
+            )
+        )
+        if moved > 0:
+            session.execute(text(f"INSERT INTO {table.name} SELECT * FROM {default} WHERE {in_range}"), bounds)
+            session.execute(text(f"DELETE FROM {default} WHERE {in_range}"), bounds)
+            session.execute(text(f"ALTER TABLE {table.name} ATTACH PARTITION {default} DEFAULT"))
+        db_manager.commit()
+        return name, moved
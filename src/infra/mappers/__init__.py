@@ -1,8 +1,22 @@
 # pyright: reportUnusedImport=false
-from sqlalchemy import MetaData
+from enum import Enum as PythonEnum
+from typing import Type
+
+from sqlalchemy import Enum, MetaData
 from sqlalchemy.orm import registry
 
-from .mapper_config import import_mappers
+from .mapper_config import MAPPER_MODULES, import_mappers
 
 metadata = MetaData()
 mapper_registry = registry(metadata=metadata)
+
+
+def enum_column_type(enum_class: Type[PythonEnum], name: str) -> Enum:
+    # Native Postgres enum labelled with the member values, the strings the columns held while they were Text.
+    # Rows come back as enum members and plain strings are still accepted on writes.
+    return Enum(
+        enum_class,
+        name=name,
+        values_callable=lambda members: [member.value for member in members],
+        validate_strings=True,
+    )
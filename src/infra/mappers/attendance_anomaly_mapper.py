@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Date, DateTime, Index, Integer, Table, Text
+
+from domain import AttendanceAnomaly
+from domain.enums import AttendanceAnomalyType
+
+from . import enum_column_type, mapper_registry
+
+attendance_anomaly = Table(
+    "attendance_anomaly",
+    mapper_registry.metadata,
+    Column("id", Integer, primary_key=True),
+    Column("tenant_id", Integer, nullable=False),
+    Column("employee_id", Integer, nullable=False),
+    Column("matricula", Text, nullable=False),
+    Column("work_date", Date, nullable=False),
+    Column("anomaly_type", enum_column_type(AttendanceAnomalyType, "attendance_anomaly_type"), nullable=False),
+    Column("detail", Text, nullable=False),
+    Column("punch_id", Integer, nullable=True),
+    Column("detected_at", DateTime(timezone=True), nullable=False),
+    Index("ix_attendance_anomaly_tenant_work_date", "tenant_id", "work_date"),
+    Index("ix_attendance_anomaly_enrollment_work_date", "employee_id", "matricula", "work_date"),
+)
+
+mapper_registry.map_imperatively(AttendanceAnomaly, attendance_anomaly)
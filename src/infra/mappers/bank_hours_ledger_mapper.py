@@ -1,20 +1,40 @@
-from sqlalchemy import Column, Date, Integer, Table, Text
+from sqlalchemy import Column, Date, Index, Integer, Table, Text
 
 from domain import BankHoursLedger
+from domain.enums import BankHoursSource
 
-from . import mapper_registry
+from . import enum_column_type, mapper_registry
 
 bank_hours_ledger = Table(
     "bank_hours_ledger",
     mapper_registry.metadata,
-    Column("id", Integer, primary_key=True),
-    Column("tenant_id", Integer, nullable=False, index=True),
-    Column("employee_id", Integer, nullable=False, index=True),
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("tenant_id", Integer, nullable=False),
+    Column("employee_id", Integer, nullable=False),
     Column("matricula", Text, nullable=False, index=True),
-    Column("event_date", Date, nullable=False),
+    Column("event_date", Date, primary_key=True),
     Column("minutes_delta", Integer, nullable=False),
-    Column("source", Text, nullable=False),
+    Column("source", enum_column_type(BankHoursSource, "bank_hours_source"), nullable=False),
     Column("reference_id", Integer, nullable=True),
+    Index(
+        "ix_bank_hours_ledger_enrollment_event_date",
+        "employee_id",
+        "matricula",
+        "event_date",
+        postgresql_include=["tenant_id", "minutes_delta", "source"],
+    ),
+    Index(
+        "ix_bank_hours_ledger_tenant_event_date",
+        "tenant_id",
+        "event_date",
+        "id",
+        postgresql_include=["employee_id", "matricula", "minutes_delta"],
+    ),
+    postgresql_partition_by="RANGE (event_date)",
 )
 
-mapper_registry.map_imperatively(BankHoursLedger, bank_hours_ledger)
+mapper_registry.map_imperatively(
+    BankHoursLedger,
+    bank_hours_ledger,
+    primary_key=[bank_hours_ledger.c.id],
+)
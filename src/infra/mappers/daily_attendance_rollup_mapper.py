@@ -0,0 +1,33 @@
+from sqlalchemy import Column, Date, Integer, SmallInteger, Table, UniqueConstraint
+
+from domain import DailyAttendanceRollup
+from domain.enums import DailyAttendanceStatus
+
+from . import enum_column_type, mapper_registry
+
+daily_attendance_rollup = Table(
+    "daily_attendance_rollup",
+    mapper_registry.metadata,
+    Column("id", Integer, primary_key=True),
+    Column("tenant_id", Integer, nullable=False),
+    Column("work_date", Date, nullable=False),
+    Column("status", enum_column_type(DailyAttendanceStatus, "daily_attendance_status"), nullable=False),
+    # Each tenant/day/status is split across employee_id % ROLLUP_SHARDS rows so concurrent upserts of different
+    # employees do not queue on one row; reads sum the shards.
+    Column("shard", SmallInteger, nullable=False, server_default="0"),
+    Column("days_count", Integer, nullable=False),
+    Column("expected_minutes", Integer, nullable=False),
+    Column("worked_minutes", Integer, nullable=False),
+    Column("break_minutes", Integer, nullable=False),
+    Column("overtime_minutes", Integer, nullable=False),
+    Column("deficit_minutes", Integer, nullable=False),
+    UniqueConstraint(
+        "tenant_id",
+        "work_date",
+        "status",
+        "shard",
+        name="uq_daily_attendance_rollup_tenant_work_date_status_shard",
+    ),
+)
+
+mapper_registry.map_imperatively(DailyAttendanceRollup, daily_attendance_rollup)
@@ -1,15 +1,16 @@
-from sqlalchemy import Column, Date, Integer, Table, Text
+from sqlalchemy import Boolean, Column, Date, Index, Integer, Table, Text, false, text
 
 from domain import DailyAttendanceSummary
+from domain.enums import DailyAttendanceStatus
 
-from . import mapper_registry
+from . import enum_column_type, mapper_registry
 
 daily_attendance_summary = Table(
     "daily_attendance_summary",
     mapper_registry.metadata,
     Column("id", Integer, primary_key=True),
-    Column("tenant_id", Integer, nullable=False, index=True),
-    Column("employee_id", Integer, nullable=False, index=True),
+    Column("tenant_id", Integer, nullable=False),
+    Column("employee_id", Integer, nullable=False),
     Column("matricula", Text, nullable=False, index=True),
     Column("work_date", Date, nullable=False),
     Column("expected_minutes", Integer, nullable=False),
@@ -17,6 +18,37 @@ daily_attendance_summary = Table(
     Column("break_minutes", Integer, nullable=False),
     Column("overtime_minutes", Integer, nullable=False),
     Column("deficit_minutes", Integer, nullable=False),
-    Column("status", Text, nullable=False),
+    Column("status", enum_column_type(DailyAttendanceStatus, "daily_attendance_status"), nullable=False),
+    # Set when something the summary was computed from changed without recalculating it (a holiday was created or
+    # removed); the month closing recalculates stale days and the next upsert clears the flag.
+    Column("stale", Boolean, nullable=False, server_default=false()),
+    Index(
+        "ix_daily_attendance_summary_enrollment_work_date",
+        "employee_id",
+        "matricula",
+        "work_date",
+        postgresql_include=[
+            "tenant_id",
+            "id",
+            "expected_minutes",
+            "worked_minutes",
+            "break_minutes",
+            "overtime_minutes",
+            "deficit_minutes",
+            "status",
+        ],
+    ),
+    Index(
+        "ix_daily_attendance_summary_tenant_work_date",
+        "tenant_id",
+        "work_date",
+        postgresql_include=["employee_id", "matricula", "status"],
+    ),
+    Index(
+        "ix_daily_attendance_summary_tenant_work_date_stale",
+        "tenant_id",
+        "work_date",
+        postgresql_where=text("stale"),
+    ),
 )
 mapper_registry.map_imperatively(DailyAttendanceSummary, daily_attendance_summary)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Date, ForeignKey, Integer, Table, Text
+from sqlalchemy import Column, Date, ForeignKey, Index, Integer, Table, Text
 from sqlalchemy.orm import relationship
 
 from domain import EnrollmentPolicyAssignment
@@ -10,11 +10,18 @@ enrollment_policy_assignment = Table(
     mapper_registry.metadata,
     Column("id", Integer, primary_key=True),
     Column("tenant_id", Integer, nullable=False, index=True),
-    Column("employee_id", Integer, nullable=False, index=True),
+    Column("employee_id", Integer, nullable=False),
     Column("matricula", Text, nullable=False, index=True),
-    Column("template_id", Integer, ForeignKey("work_policy_template.id"), nullable=False),
+    Column("template_id", Integer, ForeignKey("work_policy_template.id"), nullable=False, index=True),
     Column("effective_from", Date, nullable=False),
     Column("effective_to", Date, nullable=True),
+    Index(
+        "ix_enrollment_policy_assignment_enrollment_effective_from",
+        "employee_id",
+        "matricula",
+        "effective_from",
+        postgresql_include=["effective_to", "template_id"],
+    ),
 )
 
 mapper_registry.map_imperatively(
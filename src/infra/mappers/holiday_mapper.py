@@ -0,0 +1,19 @@
+from sqlalchemy import CheckConstraint, Column, Date, Index, Integer, Table, Text
+
+from domain import Holiday
+
+from . import mapper_registry
+
+holiday = Table(
+    "holiday",
+    mapper_registry.metadata,
+    Column("id", Integer, primary_key=True),
+    Column("tenant_id", Integer, nullable=False),
+    Column("name", Text, nullable=False),
+    Column("start_date", Date, nullable=False),
+    Column("end_date", Date, nullable=False),
+    CheckConstraint("end_date >= start_date", name="ck_holiday_period"),
+    Index("ix_holiday_tenant_start_date", "tenant_id", "start_date"),
+)
+
+mapper_registry.map_imperatively(Holiday, holiday)
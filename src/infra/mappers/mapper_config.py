@@ -1,11 +1,24 @@
 import importlib
-from pathlib import Path
 
+MAPPER_MODULES = (
+    "attendance_anomaly_mapper",
+    "bank_hours_ledger_mapper",
+    "daily_attendance_rollup_mapper",
+    "daily_attendance_summary_mapper",
+    "enrollment_policy_assignment_mapper",
+    "holiday_mapper",
+    "monthly_closing_mapper",
+    "monthly_closing_total_mapper",
+    "outbox_event_mapper",
+    "resource_version_mapper",
+    "time_adjustment_item_mapper",
+    "time_adjustment_request_mapper",
+    "time_punch_mapper",
+    "time_punch_archive_mapper",
+    "work_policy_template_mapper",
+)
 
-def import_mappers() -> None:
-    current_dir = Path(__file__).parent
 
-    for file_path in current_dir.glob("*.py"):
-        if file_path.name not in ("__init__.py", "mapper_config.py"):
-            module_name = f"infra.mappers.{file_path.stem}"
-            importlib.import_module(module_name)
+def import_mappers() -> None:
+    for module_name in MAPPER_MODULES:
+        importlib.import_module(f"infra.mappers.{module_name}")
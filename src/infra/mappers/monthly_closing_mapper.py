@@ -0,0 +1,29 @@
+from sqlalchemy import Column, Date, DateTime, Integer, Table, Text, UniqueConstraint
+
+from domain import MonthlyClosing
+from domain.enums import MonthlyClosingStatus
+
+from . import enum_column_type, mapper_registry
+
+monthly_closing = Table(
+    "monthly_closing",
+    mapper_registry.metadata,
+    Column("id", Integer, primary_key=True),
+    Column("tenant_id", Integer, nullable=False, index=True),
+    Column("month", Date, nullable=False),
+    Column("status", enum_column_type(MonthlyClosingStatus, "monthly_closing_status"), nullable=False),
+    Column("started_at", DateTime(timezone=True), nullable=False),
+    Column("closed_at", DateTime(timezone=True), nullable=True),
+    Column("closed_by", Integer, nullable=True),
+    Column("recalculated_days", Integer, nullable=False, default=0),
+    Column("totals_count", Integer, nullable=False, default=0),
+    UniqueConstraint("tenant_id", "month", name="uq_monthly_closing_tenant_month"),
+)
+
+mapper_registry.map_imperatively(
+    MonthlyClosing,
+    monthly_closing,
+    properties={
+        "closed_by_user_id": monthly_closing.c.closed_by,
+    },
+)
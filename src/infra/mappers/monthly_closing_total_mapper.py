@@ -0,0 +1,47 @@
+from sqlalchemy import Column, Date, ForeignKey, Index, Integer, Table, Text, UniqueConstraint
+
+from domain import MonthlyClosingTotal
+
+from . import mapper_registry
+
+monthly_closing_total = Table(
+    "monthly_closing_total",
+    mapper_registry.metadata,
+    Column("id", Integer, primary_key=True),
+    Column(
+        "monthly_closing_id",
+        Integer,
+        ForeignKey("monthly_closing.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column("tenant_id", Integer, nullable=False),
+    Column("employee_id", Integer, nullable=False),
+    Column("matricula", Text, nullable=False),
+    Column("month", Date, nullable=False),
+    Column("expected_minutes", Integer, nullable=False),
+    Column("worked_minutes", Integer, nullable=False),
+    Column("break_minutes", Integer, nullable=False),
+    Column("overtime_minutes", Integer, nullable=False),
+    Column("deficit_minutes", Integer, nullable=False),
+    Column("ok_days", Integer, nullable=False),
+    Column("incomplete_days", Integer, nullable=False),
+    Column("pending_adjustment_days", Integer, nullable=False),
+    Column("no_policy_days", Integer, nullable=False),
+    Column("opening_balance_minutes", Integer, nullable=False),
+    Column("closing_balance_minutes", Integer, nullable=False),
+    UniqueConstraint(
+        "monthly_closing_id",
+        "employee_id",
+        "matricula",
+        name="uq_monthly_closing_total_enrollment",
+    ),
+    Index(
+        "ix_monthly_closing_total_enrollment_month",
+        "tenant_id",
+        "employee_id",
+        "matricula",
+        "month",
+    ),
+)
+
+mapper_registry.map_imperatively(MonthlyClosingTotal, monthly_closing_total)
@@ -0,0 +1,24 @@
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, Table, Text, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+
+from . import mapper_registry
+
+outbox_event = Table(
+    "outbox_event",
+    mapper_registry.metadata,
+    Column("id", BigInteger, primary_key=True),
+    Column("tenant_id", Integer, nullable=False),
+    Column("topic", Text, nullable=False),
+    Column("payload", JSONB, nullable=False),
+    Column("attempts", Integer, nullable=False, server_default="0"),
+    Column("last_error", Text, nullable=True),
+    Column("created_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+    Column("available_at", DateTime(timezone=True), nullable=False, server_default=func.now()),
+    Column("sent_at", DateTime(timezone=True), nullable=True),
+    Index(
+        "ix_outbox_event_pending",
+        "available_at",
+        "id",
+        postgresql_where=text("sent_at IS NULL"),
+    ),
+)
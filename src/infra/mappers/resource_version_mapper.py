@@ -0,0 +1,12 @@
+from sqlalchemy import BigInteger, Column, Index, Integer, Table, Text
+
+from . import mapper_registry
+
+resource_version = Table(
+    "resource_version",
+    mapper_registry.metadata,
+    Column("tenant_id", Integer, primary_key=True),
+    Column("scope", Text, primary_key=True),
+    Column("version", BigInteger, nullable=False, default=0),
+    Index("ix_resource_version_scope", "scope", postgresql_include=["version"]),
+)
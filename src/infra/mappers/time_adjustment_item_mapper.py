@@ -2,18 +2,19 @@ from sqlalchemy import Column, DateTime, ForeignKey, Integer, Table, Text
 from sqlalchemy.orm import relationship
 
 from domain import TimeAdjustmentItem
+from domain.enums import PunchType
 
-from . import mapper_registry
+from . import enum_column_type, mapper_registry
 
 time_adjustment_item = Table(
     "time_adjustment_item",
     mapper_registry.metadata,
     Column("id", Integer, primary_key=True),
     Column("tenant_id", Integer, nullable=False),
-    Column("request_id", Integer, ForeignKey("time_adjustment_request.id"), nullable=False),
-    Column("proposed_punch_type", Text, nullable=True),
+    Column("request_id", Integer, ForeignKey("time_adjustment_request.id"), nullable=False, index=True),
+    Column("proposed_punch_type", enum_column_type(PunchType, "punch_type"), nullable=True),
     Column("proposed_punched_at", DateTime(timezone=True), nullable=True),
-    Column("original_punch_id", Integer, ForeignKey("time_punch.id"), nullable=True),
+    Column("original_punch_id", Integer, nullable=True, index=True),
     Column("note", Text, nullable=True),
 )
 
@@ -22,6 +23,10 @@ mapper_registry.map_imperatively(
     time_adjustment_item,
     properties={
         "request": relationship("TimeAdjustmentRequest", back_populates="items"),
-        "original_punch": relationship("TimePunch", back_populates="adjustment_items"),
+        "original_punch": relationship(
+            "TimePunch",
+            primaryjoin="foreign(TimeAdjustmentItem.original_punch_id) == TimePunch.id",
+            back_populates="adjustment_items",
+        ),
     },
 )
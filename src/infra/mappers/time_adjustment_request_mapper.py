@@ -1,25 +1,33 @@
-from sqlalchemy import Column, Date, DateTime, Integer, Table, Text
+from sqlalchemy import Column, Date, DateTime, Index, Integer, Table, Text
 from sqlalchemy.orm import relationship
 
 from domain import TimeAdjustmentRequest
+from domain.enums import TimeAdjustmentStatus, TimeAdjustmentType
 
-from . import mapper_registry
+from . import enum_column_type, mapper_registry
 
 time_adjustment_request = Table(
     "time_adjustment_request",
     mapper_registry.metadata,
     Column("id", Integer, primary_key=True),
     Column("tenant_id", Integer, nullable=False, index=True),
-    Column("employee_id", Integer, nullable=False, index=True),
+    Column("employee_id", Integer, nullable=False),
     Column("matricula", Text, nullable=False, index=True),
     Column("request_date", Date, nullable=False),
-    Column("type", Text, nullable=False),
-    Column("status", Text, nullable=False),
+    Column("type", enum_column_type(TimeAdjustmentType, "time_adjustment_type"), nullable=False),
+    Column("status", enum_column_type(TimeAdjustmentStatus, "time_adjustment_status"), nullable=False),
     Column("reason", Text, nullable=False),
     Column("created_by", Integer, nullable=False),
     Column("decided_at", DateTime(timezone=True), nullable=True),
     Column("decided_by", Integer, nullable=True),
     Column("decision_reason", Text, nullable=True),
+    Index(
+        "ix_time_adjustment_request_enrollment_request_date",
+        "employee_id",
+        "matricula",
+        "request_date",
+        postgresql_include=["status"],
+    ),
 )
 
 mapper_registry.map_imperatively(
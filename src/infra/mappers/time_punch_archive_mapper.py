@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Date, DateTime, Integer, Table, Text, UniqueConstraint
+
+from domain import TimePunchArchive
+
+from . import mapper_registry
+
+time_punch_archive = Table(
+    "time_punch_archive",
+    mapper_registry.metadata,
+    Column("id", Integer, primary_key=True),
+    Column("tenant_id", Integer, nullable=False),
+    Column("month", Date, nullable=False, index=True),
+    Column("location", Text, nullable=False),
+    Column("row_count", Integer, nullable=False),
+    Column("time_zone", Text, nullable=False),
+    Column("archived_at", DateTime(timezone=True), nullable=False),
+    UniqueConstraint("tenant_id", "month", name="uq_time_punch_archive_tenant_month"),
+)
+
+mapper_registry.map_imperatively(TimePunchArchive, time_punch_archive)
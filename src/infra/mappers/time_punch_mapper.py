@@ -1,27 +1,47 @@
-from sqlalchemy import Column, DateTime, Integer, Table, Text
+from sqlalchemy import Column, DateTime, Index, Integer, Table, Text
 from sqlalchemy.orm import relationship
 
 from domain import TimePunch
+from domain.enums import PunchType
 
-from . import mapper_registry
+from . import enum_column_type, mapper_registry
 
 time_punch = Table(
     "time_punch",
     mapper_registry.metadata,
-    Column("id", Integer, primary_key=True),
-    Column("tenant_id", Integer, nullable=False, index=True),
-    Column("employee_id", Integer, nullable=False, index=True),
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("tenant_id", Integer, nullable=False),
+    Column("employee_id", Integer, nullable=False),
     Column("matricula", Text, nullable=False, index=True),
-    Column("punched_at", DateTime(timezone=True), nullable=False),
-    Column("punch_type", Text, nullable=False),
+    Column("punched_at", DateTime(timezone=True), primary_key=True),
+    Column("punch_type", enum_column_type(PunchType, "punch_type"), nullable=False),
     Column("source", Text, nullable=False),
     Column("note", Text, nullable=True),
+    Index(
+        "ix_time_punch_enrollment_punched_at",
+        "employee_id",
+        "matricula",
+        "punched_at",
+        postgresql_include=["tenant_id", "punch_type"],
+    ),
+    Index(
+        "ix_time_punch_tenant_punched_at",
+        "tenant_id",
+        "punched_at",
+        postgresql_include=["employee_id", "matricula"],
+    ),
+    postgresql_partition_by="RANGE (punched_at)",
 )
 
 mapper_registry.map_imperatively(
     TimePunch,
     time_punch,
+    primary_key=[time_punch.c.id],
     properties={
-        "adjustment_items": relationship("TimeAdjustmentItem", back_populates="original_punch"),
+        "adjustment_items": relationship(
+            "TimeAdjustmentItem",
+            primaryjoin="TimePunch.id == foreign(TimeAdjustmentItem.original_punch_id)",
+            back_populates="original_punch",
+        ),
     },
 )
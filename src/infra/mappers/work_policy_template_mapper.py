@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, Table, Text
+from sqlalchemy import Column, Integer, SmallInteger, Table, Text
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import relationship
 
 from domain import WorkPolicyTemplate
@@ -13,6 +14,7 @@ work_policy_template = Table(
     Column("name", Text, nullable=False),
     Column("daily_work_minutes", Integer, nullable=False),
     Column("break_minutes", Integer, nullable=False),
+    Column("rest_weekdays", ARRAY(SmallInteger), nullable=False, server_default="{}"),
 )
 
 mapper_registry.map_imperatively(
@@ -0,0 +1,29 @@
+"""add resource_version
+
+Revision ID: 3b7c1d9a5f20
+Revises: e64689e11ea0
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b7c1d9a5f20'
+down_revision = 'e64689e11ea0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('resource_version',
+    sa.Column('tenant_id', sa.Integer(), nullable=False),
+    sa.Column('scope', sa.Text(), nullable=False),
+    sa.Column('version', sa.BigInteger(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('tenant_id', 'scope')
+    )
+
+
+def downgrade():
+    op.drop_table('resource_version')
@@ -0,0 +1,63 @@
+"""add monthly_closing and monthly_closing_total
+
+Revision ID: 8d2e4f6a1c73
+Revises: 3b7c1d9a5f20
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d2e4f6a1c73'
+down_revision = '3b7c1d9a5f20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('monthly_closing',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('tenant_id', sa.Integer(), nullable=False),
+    sa.Column('month', sa.Date(), nullable=False),
+    sa.Column('status', sa.Text(), nullable=False),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('closed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('closed_by', sa.Integer(), nullable=True),
+    sa.Column('recalculated_days', sa.Integer(), nullable=False),
+    sa.Column('totals_count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('tenant_id', 'month', name='uq_monthly_closing_tenant_month')
+    )
+    op.create_index(op.f('ix_monthly_closing_tenant_id'), 'monthly_closing', ['tenant_id'], unique=False)
+    op.create_table('monthly_closing_total',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('monthly_closing_id', sa.Integer(), nullable=False),
+    sa.Column('tenant_id', sa.Integer(), nullable=False),
+    sa.Column('employee_id', sa.Integer(), nullable=False),
+    sa.Column('matricula', sa.Text(), nullable=False),
+    sa.Column('month', sa.Date(), nullable=False),
+    sa.Column('expected_minutes', sa.Integer(), nullable=False),
+    sa.Column('worked_minutes', sa.Integer(), nullable=False),
+    sa.Column('break_minutes', sa.Integer(), nullable=False),
+    sa.Column('overtime_minutes', sa.Integer(), nullable=False),
+    sa.Column('deficit_minutes', sa.Integer(), nullable=False),
+    sa.Column('ok_days', sa.Integer(), nullable=False),
+    sa.Column('incomplete_days', sa.Integer(), nullable=False),
+    sa.Column('pending_adjustment_days', sa.Integer(), nullable=False),
+    sa.Column('no_policy_days', sa.Integer(), nullable=False),
+    sa.Column('opening_balance_minutes', sa.Integer(), nullable=False),
+    sa.Column('closing_balance_minutes', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['monthly_closing_id'], ['monthly_closing.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('monthly_closing_id', 'employee_id', 'matricula', name='uq_monthly_closing_total_enrollment')
+    )
+    op.create_index('ix_monthly_closing_total_enrollment_month', 'monthly_closing_total', ['tenant_id', 'employee_id', 'matricula', 'month'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_monthly_closing_total_enrollment_month', table_name='monthly_closing_total')
+    op.drop_table('monthly_closing_total')
+    op.drop_index(op.f('ix_monthly_closing_tenant_id'), table_name='monthly_closing')
+    op.drop_table('monthly_closing')
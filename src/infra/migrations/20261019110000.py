@@ -0,0 +1,144 @@
+"""partition time_punch and bank_hours_ledger by month
+
+Revision ID: 5a9c3e7b2d14
+Revises: 8d2e4f6a1c73
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5a9c3e7b2d14'
+down_revision = '8d2e4f6a1c73'
+branch_labels = None
+depends_on = None
+
+MONTHS_AHEAD = 3
+
+TIME_PUNCH_COLUMNS = 'id, tenant_id, employee_id, matricula, punched_at, punch_type, source, note'
+BANK_HOURS_LEDGER_COLUMNS = 'id, tenant_id, employee_id, matricula, event_date, minutes_delta, source, reference_id'
+
+
+def add_months(month, months):
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def create_month_partitions(table, column, legacy_table):
+    first = op.get_bind().execute(sa.text(f'SELECT min({column})::date FROM {legacy_table}')).scalar()
+    current = date.today().replace(day=1)
+    month = min(first.replace(day=1), current) if first is not None else current
+    last = add_months(current, MONTHS_AHEAD)
+    while month <= last:
+        op.execute(
+            f"CREATE TABLE {table}_p{month:%Y_%m} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+        )
+        month = add_months(month, 1)
+    op.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+
+
+def rename_to_legacy(table):
+    op.drop_index(op.f(f'ix_{table}_tenant_id'), table_name=table)
+    op.drop_index(op.f(f'ix_{table}_matricula'), table_name=table)
+    op.drop_index(op.f(f'ix_{table}_employee_id'), table_name=table)
+    op.execute(f'ALTER TABLE {table} RENAME TO {table}_legacy')
+    op.execute(f'ALTER TABLE {table}_legacy RENAME CONSTRAINT {table}_pkey TO {table}_legacy_pkey')
+    # The id sequence outlives the old table so ids keep growing from where they were.
+    op.execute(f'ALTER SEQUENCE {table}_id_seq OWNED BY NONE')
+
+
+def move_from_legacy(table, columns):
+    op.execute(f'INSERT INTO {table} ({columns}) SELECT {columns} FROM {table}_legacy')
+    op.execute(f'DROP TABLE {table}_legacy')
+    op.execute(f'ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id')
+    op.create_index(op.f(f'ix_{table}_employee_id'), table, ['employee_id'], unique=False)
+    op.create_index(op.f(f'ix_{table}_matricula'), table, ['matricula'], unique=False)
+    op.create_index(op.f(f'ix_{table}_tenant_id'), table, ['tenant_id'], unique=False)
+
+
+def upgrade():
+    # A foreign key can only target a partitioned table through a unique key that includes the partition
+    # column; items keep referencing punches by id only. Without the constraint, DeleteTimePunchUseCase and
+    # ArchiveMonthPunchesUseCase refuse punches referenced by pending or approved adjustment requests.
+    op.drop_constraint('time_adjustment_item_original_punch_id_fkey', 'time_adjustment_item', type_='foreignkey')
+
+    rename_to_legacy('time_punch')
+    op.execute("""
+        CREATE TABLE time_punch (
+            id INTEGER NOT NULL DEFAULT nextval('time_punch_id_seq'::regclass),
+            tenant_id INTEGER NOT NULL,
+            employee_id INTEGER NOT NULL,
+            matricula TEXT NOT NULL,
+            punched_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            punch_type TEXT NOT NULL,
+            source TEXT NOT NULL,
+            note TEXT,
+            CONSTRAINT time_punch_pkey PRIMARY KEY (id, punched_at)
+        ) PARTITION BY RANGE (punched_at)
+    """)
+    create_month_partitions('time_punch', 'punched_at', 'time_punch_legacy')
+    move_from_legacy('time_punch', TIME_PUNCH_COLUMNS)
+
+    rename_to_legacy('bank_hours_ledger')
+    op.execute("""
+        CREATE TABLE bank_hours_ledger (
+            id INTEGER NOT NULL DEFAULT nextval('bank_hours_ledger_id_seq'::regclass),
+            tenant_id INTEGER NOT NULL,
+            employee_id INTEGER NOT NULL,
+            matricula TEXT NOT NULL,
+            event_date DATE NOT NULL,
+            minutes_delta INTEGER NOT NULL,
+            source TEXT NOT NULL,
+            reference_id INTEGER,
+            CONSTRAINT bank_hours_ledger_pkey PRIMARY KEY (id, event_date)
+        ) PARTITION BY RANGE (event_date)
+    """)
+    create_month_partitions('bank_hours_ledger', 'event_date', 'bank_hours_ledger_legacy')
+    move_from_legacy('bank_hours_ledger', BANK_HOURS_LEDGER_COLUMNS)
+
+
+def downgrade():
+    rename_to_legacy('bank_hours_ledger')
+    op.execute("""
+        CREATE TABLE bank_hours_ledger (
+            id INTEGER NOT NULL DEFAULT nextval('bank_hours_ledger_id_seq'::regclass),
+            tenant_id INTEGER NOT NULL,
+            employee_id INTEGER NOT NULL,
+            matricula TEXT NOT NULL,
+            event_date DATE NOT NULL,
+            minutes_delta INTEGER NOT NULL,
+            source TEXT NOT NULL,
+            reference_id INTEGER,
+            CONSTRAINT bank_hours_ledger_pkey PRIMARY KEY (id)
+        )
+    """)
+    move_from_legacy('bank_hours_ledger', BANK_HOURS_LEDGER_COLUMNS)
+
+    rename_to_legacy('time_punch')
+    op.execute("""
+        CREATE TABLE time_punch (
+            id INTEGER NOT NULL DEFAULT nextval('time_punch_id_seq'::regclass),
+            tenant_id INTEGER NOT NULL,
+            employee_id INTEGER NOT NULL,
+            matricula TEXT NOT NULL,
+            punched_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            punch_type TEXT NOT NULL,
+            source TEXT NOT NULL,
+            note TEXT,
+            CONSTRAINT time_punch_pkey PRIMARY KEY (id)
+        )
+    """)
+    move_from_legacy('time_punch', TIME_PUNCH_COLUMNS)
+
+    op.create_foreign_key(
+        'time_adjustment_item_original_punch_id_fkey',
+        'time_adjustment_item',
+        'time_punch',
+        ['original_punch_id'],
+        ['id'],
+    )
@@ -0,0 +1,36 @@
+"""add time_punch_archive
+
+Revision ID: c41f8b2e6a95
+Revises: 5a9c3e7b2d14
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41f8b2e6a95'
+down_revision = '5a9c3e7b2d14'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('time_punch_archive',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('tenant_id', sa.Integer(), nullable=False),
+    sa.Column('month', sa.Date(), nullable=False),
+    sa.Column('location', sa.Text(), nullable=False),
+    sa.Column('row_count', sa.Integer(), nullable=False),
+    sa.Column('time_zone', sa.Text(), nullable=False),
+    sa.Column('archived_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('tenant_id', 'month', name='uq_time_punch_archive_tenant_month')
+    )
+    op.create_index(op.f('ix_time_punch_archive_month'), 'time_punch_archive', ['month'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_time_punch_archive_month'), table_name='time_punch_archive')
+    op.drop_table('time_punch_archive')
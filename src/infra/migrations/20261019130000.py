@@ -0,0 +1,73 @@
+"""covering indexes for repository predicates
+
+Revision ID: 7e2b5d9c4a18
+Revises: c41f8b2e6a95
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7e2b5d9c4a18'
+down_revision = 'c41f8b2e6a95'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Indexes created on the partitioned parents cascade to every partition, including the ones created later.
+    op.create_index('ix_time_punch_enrollment_punched_at', 'time_punch', ['employee_id', 'matricula', 'punched_at'], unique=False, postgresql_include=['tenant_id', 'punch_type'])
+    op.create_index('ix_time_punch_tenant_punched_at', 'time_punch', ['tenant_id', 'punched_at'], unique=False, postgresql_include=['employee_id', 'matricula'])
+    op.drop_index('ix_time_punch_employee_id', table_name='time_punch')
+    op.drop_index('ix_time_punch_tenant_id', table_name='time_punch')
+
+    op.create_index('ix_daily_attendance_summary_enrollment_work_date', 'daily_attendance_summary', ['employee_id', 'matricula', 'work_date'], unique=False, postgresql_include=['tenant_id', 'id', 'expected_minutes', 'worked_minutes', 'break_minutes', 'overtime_minutes', 'deficit_minutes', 'status'])
+    op.create_index('ix_daily_attendance_summary_tenant_work_date', 'daily_attendance_summary', ['tenant_id', 'work_date'], unique=False, postgresql_include=['employee_id', 'matricula', 'status'])
+    op.drop_index('ix_daily_attendance_summary_employee_id', table_name='daily_attendance_summary')
+    op.drop_index('ix_daily_attendance_summary_tenant_id', table_name='daily_attendance_summary')
+
+    op.create_index('ix_bank_hours_ledger_enrollment_event_date', 'bank_hours_ledger', ['employee_id', 'matricula', 'event_date'], unique=False, postgresql_include=['tenant_id', 'minutes_delta', 'source'])
+    op.create_index('ix_bank_hours_ledger_tenant_event_date', 'bank_hours_ledger', ['tenant_id', 'event_date', 'id'], unique=False, postgresql_include=['employee_id', 'matricula', 'minutes_delta'])
+    op.drop_index('ix_bank_hours_ledger_employee_id', table_name='bank_hours_ledger')
+    op.drop_index('ix_bank_hours_ledger_tenant_id', table_name='bank_hours_ledger')
+
+    op.create_index('ix_enrollment_policy_assignment_enrollment_effective_from', 'enrollment_policy_assignment', ['employee_id', 'matricula', 'effective_from'], unique=False, postgresql_include=['effective_to', 'template_id'])
+    op.create_index(op.f('ix_enrollment_policy_assignment_template_id'), 'enrollment_policy_assignment', ['template_id'], unique=False)
+    op.drop_index('ix_enrollment_policy_assignment_employee_id', table_name='enrollment_policy_assignment')
+
+    op.create_index('ix_time_adjustment_request_enrollment_request_date', 'time_adjustment_request', ['employee_id', 'matricula', 'request_date'], unique=False, postgresql_include=['status'])
+    op.drop_index('ix_time_adjustment_request_employee_id', table_name='time_adjustment_request')
+
+    op.create_index(op.f('ix_time_adjustment_item_request_id'), 'time_adjustment_item', ['request_id'], unique=False)
+    op.create_index(op.f('ix_time_adjustment_item_original_punch_id'), 'time_adjustment_item', ['original_punch_id'], unique=False)
+
+    op.execute('ANALYZE time_punch, daily_attendance_summary, bank_hours_ledger')
+
+
+def downgrade():
+    op.drop_index(op.f('ix_time_adjustment_item_original_punch_id'), table_name='time_adjustment_item')
+    op.drop_index(op.f('ix_time_adjustment_item_request_id'), table_name='time_adjustment_item')
+
+    op.create_index('ix_time_adjustment_request_employee_id', 'time_adjustment_request', ['employee_id'], unique=False)
+    op.drop_index('ix_time_adjustment_request_enrollment_request_date', table_name='time_adjustment_request')
+
+    op.create_index('ix_enrollment_policy_assignment_employee_id', 'enrollment_policy_assignment', ['employee_id'], unique=False)
+    op.drop_index(op.f('ix_enrollment_policy_assignment_template_id'), table_name='enrollment_policy_assignment')
+    op.drop_index('ix_enrollment_policy_assignment_enrollment_effective_from', table_name='enrollment_policy_assignment')
+
+    op.create_index('ix_bank_hours_ledger_tenant_id', 'bank_hours_ledger', ['tenant_id'], unique=False)
+    op.create_index('ix_bank_hours_ledger_employee_id', 'bank_hours_ledger', ['employee_id'], unique=False)
+    op.drop_index('ix_bank_hours_ledger_tenant_event_date', table_name='bank_hours_ledger')
+    op.drop_index('ix_bank_hours_ledger_enrollment_event_date', table_name='bank_hours_ledger')
+
+    op.create_index('ix_daily_attendance_summary_tenant_id', 'daily_attendance_summary', ['tenant_id'], unique=False)
+    op.create_index('ix_daily_attendance_summary_employee_id', 'daily_attendance_summary', ['employee_id'], unique=False)
+    op.drop_index('ix_daily_attendance_summary_tenant_work_date', table_name='daily_attendance_summary')
+    op.drop_index('ix_daily_attendance_summary_enrollment_work_date', table_name='daily_attendance_summary')
+
+    op.create_index('ix_time_punch_tenant_id', 'time_punch', ['tenant_id'], unique=False)
+    op.create_index('ix_time_punch_employee_id', 'time_punch', ['employee_id'], unique=False)
+    op.drop_index('ix_time_punch_tenant_punched_at', table_name='time_punch')
+    op.drop_index('ix_time_punch_enrollment_punched_at', table_name='time_punch')
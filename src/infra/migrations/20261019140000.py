@@ -0,0 +1,69 @@
+"""native enum types for punch_type, status and source columns
+
+Revision ID: 2f6a8c1e9d37
+Revises: 7e2b5d9c4a18
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '2f6a8c1e9d37'
+down_revision = '7e2b5d9c4a18'
+branch_labels = None
+depends_on = None
+
+ENUM_TYPES = {
+    'punch_type': ('IN', 'OUT', 'BREAK_START', 'BREAK_END'),
+    'time_adjustment_type': ('ADD_PUNCH', 'EDIT_PUNCH', 'JUSTIFY_ABSENCE', 'REMOVE_PUNCH'),
+    'time_adjustment_status': ('PENDING', 'APPROVED', 'REJECTED', 'APPLIED'),
+    'daily_attendance_status': ('OK', 'INCOMPLETE', 'PENDING_ADJUSTMENT', 'NO_POLICY'),
+    'bank_hours_source': ('DAILY_APURATION', 'MANUAL_ADJUST', 'ADJUSTMENT_REQUEST'),
+    'monthly_closing_status': ('CLOSING', 'CLOSED'),
+}
+
+ENUM_COLUMNS = (
+    ('time_punch', 'punch_type', 'punch_type', False),
+    ('time_adjustment_item', 'proposed_punch_type', 'punch_type', True),
+    ('time_adjustment_request', 'type', 'time_adjustment_type', False),
+    ('time_adjustment_request', 'status', 'time_adjustment_status', False),
+    ('daily_attendance_summary', 'status', 'daily_attendance_status', False),
+    ('bank_hours_ledger', 'source', 'bank_hours_source', False),
+    ('monthly_closing', 'status', 'monthly_closing_status', False),
+)
+
+
+def upgrade():
+    bind = op.get_bind()
+    for name, values in ENUM_TYPES.items():
+        postgresql.ENUM(*values, name=name).create(bind)
+
+    # Altering the partitioned parents rewrites every partition and rebuilds the indexes that carry the column.
+    for table, column, type_name, nullable in ENUM_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.Text(),
+            existing_nullable=nullable,
+            type_=postgresql.ENUM(*ENUM_TYPES[type_name], name=type_name, create_type=False),
+            postgresql_using=f'{column}::{type_name}',
+        )
+
+
+def downgrade():
+    for table, column, type_name, nullable in ENUM_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=postgresql.ENUM(*ENUM_TYPES[type_name], name=type_name, create_type=False),
+            existing_nullable=nullable,
+            type_=sa.Text(),
+            postgresql_using=f'{column}::text',
+        )
+
+    bind = op.get_bind()
+    for name in ENUM_TYPES:
+        postgresql.ENUM(name=name).drop(bind)
@@ -0,0 +1,47 @@
+"""daily attendance rollups per tenant, day and status
+
+Revision ID: 9b4e1d7a3c52
+Revises: 2f6a8c1e9d37
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '9b4e1d7a3c52'
+down_revision = '2f6a8c1e9d37'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('daily_attendance_rollup',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('tenant_id', sa.Integer(), nullable=False),
+    sa.Column('work_date', sa.Date(), nullable=False),
+    sa.Column('status', postgresql.ENUM('OK', 'INCOMPLETE', 'PENDING_ADJUSTMENT', 'NO_POLICY', name='daily_attendance_status', create_type=False), nullable=False),
+    sa.Column('days_count', sa.Integer(), nullable=False),
+    sa.Column('expected_minutes', sa.Integer(), nullable=False),
+    sa.Column('worked_minutes', sa.Integer(), nullable=False),
+    sa.Column('break_minutes', sa.Integer(), nullable=False),
+    sa.Column('overtime_minutes', sa.Integer(), nullable=False),
+    sa.Column('deficit_minutes', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('tenant_id', 'work_date', 'status', name='uq_daily_attendance_rollup_tenant_work_date_status')
+    )
+    # Backfill from the existing summaries; from here on every summary upsert keeps the rollups current.
+    op.execute(
+        'INSERT INTO daily_attendance_rollup '
+        '(tenant_id, work_date, status, days_count, expected_minutes, worked_minutes, break_minutes, '
+        'overtime_minutes, deficit_minutes) '
+        'SELECT tenant_id, work_date, status, count(*), sum(expected_minutes), sum(worked_minutes), '
+        'sum(break_minutes), sum(overtime_minutes), sum(deficit_minutes) '
+        'FROM daily_attendance_summary GROUP BY tenant_id, work_date, status'
+    )
+
+
+def downgrade():
+    op.drop_table('daily_attendance_rollup')
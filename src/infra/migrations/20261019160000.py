@@ -0,0 +1,41 @@
+"""attendance anomaly findings
+
+Revision ID: 5c8f2a6e1b94
+Revises: 9b4e1d7a3c52
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '5c8f2a6e1b94'
+down_revision = '9b4e1d7a3c52'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('attendance_anomaly',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('tenant_id', sa.Integer(), nullable=False),
+    sa.Column('employee_id', sa.Integer(), nullable=False),
+    sa.Column('matricula', sa.Text(), nullable=False),
+    sa.Column('work_date', sa.Date(), nullable=False),
+    sa.Column('anomaly_type', postgresql.ENUM('RAPID_PUNCHES', 'IMPOSSIBLE_SHIFT', 'SHARED_PUNCH_TIME', 'RECURRING_MISSING_OUT', name='attendance_anomaly_type'), nullable=False),
+    sa.Column('detail', sa.Text(), nullable=False),
+    sa.Column('punch_id', sa.Integer(), nullable=True),
+    sa.Column('detected_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_attendance_anomaly_tenant_work_date', 'attendance_anomaly', ['tenant_id', 'work_date'], unique=False)
+    op.create_index('ix_attendance_anomaly_enrollment_work_date', 'attendance_anomaly', ['employee_id', 'matricula', 'work_date'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_attendance_anomaly_enrollment_work_date', table_name='attendance_anomaly')
+    op.drop_index('ix_attendance_anomaly_tenant_work_date', table_name='attendance_anomaly')
+    op.drop_table('attendance_anomaly')
+    postgresql.ENUM(name='attendance_anomaly_type').drop(op.get_bind())
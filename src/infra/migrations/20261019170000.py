@@ -0,0 +1,39 @@
+"""transactional outbox for queue events
+
+Revision ID: 3d7a9f2c6e15
+Revises: 5c8f2a6e1b94
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '3d7a9f2c6e15'
+down_revision = '5c8f2a6e1b94'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('outbox_event',
+    sa.Column('id', sa.BigInteger(), nullable=False),
+    sa.Column('tenant_id', sa.Integer(), nullable=False),
+    sa.Column('topic', sa.Text(), nullable=False),
+    sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('available_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('sent_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    # Only unsent rows are indexed, so the relay's lookup stays small however many sent rows await purging.
+    op.create_index('ix_outbox_event_pending', 'outbox_event', ['available_at', 'id'], unique=False, postgresql_where=sa.text('sent_at IS NULL'))
+
+
+def downgrade():
+    op.drop_index('ix_outbox_event_pending', table_name='outbox_event', postgresql_where=sa.text('sent_at IS NULL'))
+    op.drop_table('outbox_event')
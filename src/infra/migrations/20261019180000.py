@@ -0,0 +1,38 @@
+"""holiday calendar and weekly rest days of work policy templates
+
+Revision ID: 8b4e1f7a2c53
+Revises: 3d7a9f2c6e15
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '8b4e1f7a2c53'
+down_revision = '3d7a9f2c6e15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('holiday',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('tenant_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.Text(), nullable=False),
+    sa.Column('start_date', sa.Date(), nullable=False),
+    sa.Column('end_date', sa.Date(), nullable=False),
+    sa.CheckConstraint('end_date >= start_date', name='ck_holiday_period'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_holiday_tenant_start_date', 'holiday', ['tenant_id', 'start_date'], unique=False)
+    # Existing templates keep expecting minutes on every weekday, so recalculated history does not change silently.
+    op.add_column('work_policy_template', sa.Column('rest_weekdays', postgresql.ARRAY(sa.SmallInteger()), server_default='{}', nullable=False))
+
+
+def downgrade():
+    op.drop_column('work_policy_template', 'rest_weekdays')
+    op.drop_index('ix_holiday_tenant_start_date', table_name='holiday')
+    op.drop_table('holiday')
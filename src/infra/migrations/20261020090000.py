@@ -0,0 +1,29 @@
+"""index resource_version by scope for cross-tenant versions
+
+Revision ID: 5c2e8a1f9d47
+Revises: 8b4e1f7a2c53
+Create Date: 2026-10-20 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c2e8a1f9d47'
+down_revision = '8b4e1f7a2c53'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Summaries and ledger entries went back to one counter per tenant; the per-enrollment rows are never read.
+    op.execute(
+        "DELETE FROM resource_version "
+        "WHERE scope LIKE 'daily\\_attendance\\_summaries:%' OR scope LIKE 'bank\\_hours\\_ledgers:%'"
+    )
+    op.create_index('ix_resource_version_scope', 'resource_version', ['scope'], unique=False, postgresql_include=['version'])
+
+
+def downgrade():
+    op.drop_index('ix_resource_version_scope', table_name='resource_version')
@@ -0,0 +1,32 @@
+"""flag daily attendance summaries made stale by holiday changes
+
+Revision ID: 9d3b7c61e2a8
+Revises: 5c2e8a1f9d47
+Create Date: 2026-10-20 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d3b7c61e2a8'
+down_revision = '5c2e8a1f9d47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('daily_attendance_summary', sa.Column('stale', sa.Boolean(), server_default=sa.false(), nullable=False))
+    op.create_index(
+        'ix_daily_attendance_summary_tenant_work_date_stale',
+        'daily_attendance_summary',
+        ['tenant_id', 'work_date'],
+        unique=False,
+        postgresql_where=sa.text('stale'),
+    )
+
+
+def downgrade():
+    op.drop_index('ix_daily_attendance_summary_tenant_work_date_stale', table_name='daily_attendance_summary')
+    op.drop_column('daily_attendance_summary', 'stale')
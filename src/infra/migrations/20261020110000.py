@@ -0,0 +1,53 @@
+"""shard daily attendance rollups by employee
+
+Revision ID: 4a7e2c9b5d16
+Revises: 9d3b7c61e2a8
+Create Date: 2026-10-20 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4a7e2c9b5d16'
+down_revision = '9d3b7c61e2a8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing rows become shard 0; reads sum the shards, so totals are unchanged.
+    op.add_column('daily_attendance_rollup', sa.Column('shard', sa.SmallInteger(), server_default='0', nullable=False))
+    op.drop_constraint('uq_daily_attendance_rollup_tenant_work_date_status', 'daily_attendance_rollup', type_='unique')
+    op.create_unique_constraint(
+        'uq_daily_attendance_rollup_tenant_work_date_status_shard',
+        'daily_attendance_rollup',
+        ['tenant_id', 'work_date', 'status', 'shard'],
+    )
+
+
+def downgrade():
+    op.drop_constraint(
+        'uq_daily_attendance_rollup_tenant_work_date_status_shard', 'daily_attendance_rollup', type_='unique'
+    )
+    op.execute(
+        "CREATE TEMPORARY TABLE daily_attendance_rollup_merged ON COMMIT DROP AS "
+        "SELECT tenant_id, work_date, status, sum(days_count) AS days_count, "
+        "sum(expected_minutes) AS expected_minutes, sum(worked_minutes) AS worked_minutes, "
+        "sum(break_minutes) AS break_minutes, sum(overtime_minutes) AS overtime_minutes, "
+        "sum(deficit_minutes) AS deficit_minutes "
+        "FROM daily_attendance_rollup GROUP BY tenant_id, work_date, status"
+    )
+    op.execute("DELETE FROM daily_attendance_rollup")
+    op.execute(
+        "INSERT INTO daily_attendance_rollup (tenant_id, work_date, status, days_count, expected_minutes, "
+        "worked_minutes, break_minutes, overtime_minutes, deficit_minutes) "
+        "SELECT * FROM daily_attendance_rollup_merged"
+    )
+    op.drop_column('daily_attendance_rollup', 'shard')
+    op.create_unique_constraint(
+        'uq_daily_attendance_rollup_tenant_work_date_status',
+        'daily_attendance_rollup',
+        ['tenant_id', 'work_date', 'status'],
+    )
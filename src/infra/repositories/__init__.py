@@ -1,9 +1,17 @@
 # pyright: reportUnusedImport=false
+from .attendance_anomaly_repository import AttendanceAnomalyRepository
 from .bank_hours_ledger_repository import BankHoursLedgerRepository
+from .daily_attendance_rollup_repository import DailyAttendanceRollupRepository
 from .daily_attendance_summary_repository import DailyAttendanceSummaryRepository
 from .enrollment_policy_assignment_repository import EnrollmentPolicyAssignmentRepository
+from .holiday_repository import HolidayRepository
+from .monthly_closing_repository import MonthlyClosingRepository
+from .monthly_closing_total_repository import MonthlyClosingTotalRepository
+from .outbox_event_repository import OutboxEventRepository
 from .repository_manager import RepositoryManager
+from .resource_version_repository import ResourceVersionRepository
 from .time_adjustment_item_repository import TimeAdjustmentItemRepository
 from .time_adjustment_request_repository import TimeAdjustmentRequestRepository
+from .time_punch_archive_repository import TimePunchArchiveRepository
 from .time_punch_repository import TimePunchRepository
 from .work_policy_template_repository import WorkPolicyTemplateRepository
@@ -0,0 +1,79 @@
+from datetime import date
+from typing import List, Optional
+
+from sqlalchemy import delete, insert
+
+from application.repositories import AttendanceAnomalyRepositoryInterface
+from application.repositories.types import DBPaginatedResult
+from domain import AttendanceAnomaly
+from domain.enums import AttendanceAnomalyType
+from infra.database_manager import DatabaseManagerConnection
+from infra.mappers.attendance_anomaly_mapper import attendance_anomaly
+
+INSERT_COLUMNS = [column.name for column in attendance_anomaly.columns if column.name != "id"]
+
+
+class AttendanceAnomalyRepository(AttendanceAnomalyRepositoryInterface):
+    def __init__(self, db_manager: DatabaseManagerConnection):
+        self.session = db_manager.session
+
+    def replace_in_period(
+        self, tenant_id: int, start_date: date, end_date: date, anomalies: List[AttendanceAnomaly]
+    ) -> int:
+        # A new pass over the period supersedes the findings of the previous one.
+        self.session.execute(
+            delete(attendance_anomaly)
+            .where(attendance_anomaly.c.tenant_id == tenant_id)
+            .where(attendance_anomaly.c.work_date >= start_date)
+            .where(attendance_anomaly.c.work_date <= end_date)
+        )
+        if len(anomalies) > 0:
+            self.session.execute(
+                insert(attendance_anomaly),
+                [{name: getattr(anomaly, name) for name in INSERT_COLUMNS} for anomaly in anomalies],
+            )
+        self.session.commit()
+        return len(anomalies)
+
+    def find_all(
+        self,
+        page: int,
+        per_page: int,
+        tenant_id: Optional[int] = None,
+        employee_id: Optional[int] = None,
+        matricula: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        anomaly_type: Optional[AttendanceAnomalyType] = None,
+    ) -> DBPaginatedResult[AttendanceAnomaly]:
+        query = self.session.query(AttendanceAnomaly)
+
+        if tenant_id is not None:
+            query = query.filter(AttendanceAnomaly.tenant_id == tenant_id)
+
+        if employee_id is not None:
+            query = query.filter(AttendanceAnomaly.employee_id == employee_id)
+
+        if matricula is not None:
+            query = query.filter(AttendanceAnomaly.matricula == matricula)
+
+        if start_date is not None:
+            query = query.filter(AttendanceAnomaly.work_date >= start_date)
+
+        if end_date is not None:
+            query = query.filter(AttendanceAnomaly.work_date <= end_date)
+
+        if anomaly_type is not None:
+            query = query.filter(AttendanceAnomaly.anomaly_type == anomaly_type)
+
+        total = query.count()
+        data = (
+            query.order_by(AttendanceAnomaly.work_date.desc(), AttendanceAnomaly.id.desc())
+            .offset(page * per_page)
+            .limit(per_page)
+            .all()
+        )
+        return DBPaginatedResult(
+            data=data,
+            total_count=total,
+        )
@@ -1,24 +1,54 @@
 from datetime import date
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple, Union
 
-from sqlalchemy import func
+from sqlalchemy import ColumnElement, delete, func, insert, select
 
 from application.repositories import BankHoursLedgerRepositoryInterface
 from application.repositories.types import DBPaginatedResult
-from domain import BankHoursLedger
-from domain.enums import BankHoursSource
+from domain import BankHoursLedger, BankHoursLedgerRow
+from domain.enums import BankHoursSource, OutboxTopic, ResourceScope
 from infra.database_manager import DatabaseManagerConnection
+from infra.mappers.bank_hours_ledger_mapper import bank_hours_ledger
+
+from .outbox_event_repository import OutboxEventRepository
+from .resource_version_repository import ResourceVersionRepository
+
+ROW_COLUMNS = [bank_hours_ledger.c[name] for name in BankHoursLedgerRow._fields]
+INSERT_COLUMNS = [name for name in BankHoursLedgerRow._fields if name != "id"]
 
 
 class BankHoursLedgerRepository(BankHoursLedgerRepositoryInterface):
     def __init__(self, db_manager: DatabaseManagerConnection):
         self.session = db_manager.session
+        self.resource_version_repository = ResourceVersionRepository(db_manager)
+        self.outbox_event_repository = OutboxEventRepository(db_manager)
 
     def create(self, entry: BankHoursLedger) -> BankHoursLedger:
         self.session.add(entry)
+        self.__bump_versions([entry])
+        self.session.flush()
+        self.outbox_event_repository.add(
+            OutboxTopic.BANK_HOURS_LEDGER_CREATED,
+            [BankHoursLedgerRow._make(getattr(entry, name) for name in BankHoursLedgerRow._fields)],
+        )
         self.session.commit()
         self.session.refresh(entry)
-        return self.__normalize_entry(entry)
+        return entry
+
+    def create_many(self, entries: List[BankHoursLedger]) -> List[BankHoursLedgerRow]:
+        if len(entries) == 0:
+            return []
+
+        # Batched into multi-row INSERT ... RETURNING statements; rows come back in the order of entries.
+        result = self.session.execute(
+            insert(bank_hours_ledger).returning(*ROW_COLUMNS, sort_by_parameter_order=True),
+            [{name: getattr(entry, name) for name in INSERT_COLUMNS} for entry in entries],
+        )
+        created = list(map(BankHoursLedgerRow._make, result))
+        self.__bump_versions(created)
+        self.outbox_event_repository.add(OutboxTopic.BANK_HOURS_LEDGER_CREATED, created)
+        self.session.commit()
+        return created
 
     def find_by_id(self, entry_id: int) -> Optional[BankHoursLedger]:
         entry = (
@@ -26,7 +56,7 @@ class BankHoursLedgerRepository(BankHoursLedgerRepositoryInterface):
             .filter(BankHoursLedger.id == entry_id)
             .first()
         )
-        return self.__normalize_entry(entry) if entry is not None else None
+        return entry
 
     def find_all(
         self,
@@ -39,26 +69,16 @@ class BankHoursLedgerRepository(BankHoursLedgerRepositoryInterface):
         end_date: Optional[date] = None,
         source: Optional[BankHoursSource] = None,
     ) -> DBPaginatedResult[BankHoursLedger]:
-        query = self.session.query(BankHoursLedger)
-
-        if tenant_id is not None:
-            query = query.filter(BankHoursLedger.tenant_id == tenant_id)
-
-        if employee_id is not None:
-            query = query.filter(BankHoursLedger.employee_id == employee_id)
-
-        if matricula is not None:
-            query = query.filter(BankHoursLedger.matricula == matricula)
-
-        if start_date is not None:
-            query = query.filter(BankHoursLedger.event_date >= start_date)
-
-        if end_date is not None:
-            query = query.filter(BankHoursLedger.event_date <= end_date)
-
-        if source is not None:
-            query = query.filter(BankHoursLedger.source == source)
-
+        query = self.session.query(BankHoursLedger).filter(
+            *self.__filter_conditions(
+                tenant_id=tenant_id,
+                employee_id=employee_id,
+                matricula=matricula,
+                start_date=start_date,
+                end_date=end_date,
+                source=source,
+            )
+        )
         total = query.count()
         data = (
             query.order_by(BankHoursLedger.event_date.desc(), BankHoursLedger.id.desc())
@@ -67,10 +87,41 @@ class BankHoursLedgerRepository(BankHoursLedgerRepositoryInterface):
             .all()
         )
         return DBPaginatedResult(
-            data=[self.__normalize_entry(entry) for entry in data],
+            data=data,
             total_count=total,
         )
 
+    def find_all_rows(
+        self,
+        page: int,
+        per_page: int,
+        tenant_id: Optional[int] = None,
+        employee_id: Optional[int] = None,
+        matricula: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        source: Optional[BankHoursSource] = None,
+    ) -> DBPaginatedResult[BankHoursLedgerRow]:
+        conditions = self.__filter_conditions(
+            tenant_id=tenant_id,
+            employee_id=employee_id,
+            matricula=matricula,
+            start_date=start_date,
+            end_date=end_date,
+            source=source,
+        )
+        total = self.session.execute(
+            select(func.count()).select_from(bank_hours_ledger).where(*conditions)
+        ).scalar_one()
+        result = self.session.execute(
+            select(*ROW_COLUMNS)
+            .where(*conditions)
+            .order_by(bank_hours_ledger.c.event_date.desc(), bank_hours_ledger.c.id.desc())
+            .offset(page * per_page)
+            .limit(per_page)
+        )
+        return DBPaginatedResult(data=list(map(BankHoursLedgerRow._make, result)), total_count=total)
+
     def get_balance_until(self, employee_id: int, matricula: str, until_date: date) -> int:
         result = (
             self.session.query(func.coalesce(func.sum(BankHoursLedger.minutes_delta), 0))
@@ -81,20 +132,80 @@ class BankHoursLedgerRepository(BankHoursLedgerRepositoryInterface):
         )
         return int(result or 0)
 
+    def get_balances_around_period(
+        self, tenant_id: int, employee_id: int, matricula: str, start_date: date, end_date: date
+    ) -> Tuple[int, int]:
+        opening, closing = (
+            self.session.query(
+                func.coalesce(
+                    func.sum(BankHoursLedger.minutes_delta).filter(BankHoursLedger.event_date < start_date), 0
+                ),
+                func.coalesce(func.sum(BankHoursLedger.minutes_delta), 0),
+            )
+            .filter(BankHoursLedger.tenant_id == tenant_id)
+            .filter(BankHoursLedger.employee_id == employee_id)
+            .filter(BankHoursLedger.matricula == matricula)
+            .filter(BankHoursLedger.event_date <= end_date)
+            .one()
+        )
+        return int(opening), int(closing)
+
     def delete_auto_generated_for_day(
         self, employee_id: int, matricula: str, event_date: date, source: BankHoursSource
     ) -> None:
-        (
-            self.session.query(BankHoursLedger)
-            .filter(BankHoursLedger.employee_id == employee_id)
-            .filter(BankHoursLedger.matricula == matricula)
-            .filter(BankHoursLedger.event_date == event_date)
-            .filter(BankHoursLedger.source == source)
-            .delete(synchronize_session=False)
+        self.delete_auto_generated_for_days(employee_id, matricula, [event_date], source)
+
+    def delete_auto_generated_for_days(
+        self, employee_id: int, matricula: str, event_dates: Sequence[date], source: BankHoursSource
+    ) -> None:
+        if len(event_dates) == 0:
+            return
+
+        result = self.session.execute(
+            delete(BankHoursLedger)
+            .where(BankHoursLedger.employee_id == employee_id)
+            .where(BankHoursLedger.matricula == matricula)
+            .where(BankHoursLedger.event_date.in_(event_dates))
+            .where(BankHoursLedger.source == source)
+            .returning(*ROW_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+        # Runs inside the caller's transaction and never commits, like the version bump and the outbox events.
+        deleted = list(map(BankHoursLedgerRow._make, result))
+        self.__bump_versions(deleted)
+        self.outbox_event_repository.add(OutboxTopic.BANK_HOURS_LEDGER_DELETED, deleted)
+
+    def __bump_versions(self, entries: Sequence[Union[BankHoursLedger, BankHoursLedgerRow]]) -> None:
+        self.resource_version_repository.bump_many(
+            (ResourceScope.BANK_HOURS_LEDGERS, entry.tenant_id, None) for entry in entries
         )
-        self.session.commit()
 
-    def __normalize_entry(self, entry: BankHoursLedger) -> BankHoursLedger:
-        if isinstance(entry.source, str):
-            entry.source = BankHoursSource(entry.source)
-        return entry
+    def __filter_conditions(
+        self,
+        tenant_id: Optional[int],
+        employee_id: Optional[int],
+        matricula: Optional[str],
+        start_date: Optional[date],
+        end_date: Optional[date],
+        source: Optional[BankHoursSource],
+    ) -> List[ColumnElement[bool]]:
+        conditions: List[ColumnElement[bool]] = []
+        if tenant_id is not None:
+            conditions.append(bank_hours_ledger.c.tenant_id == tenant_id)
+
+        if employee_id is not None:
+            conditions.append(bank_hours_ledger.c.employee_id == employee_id)
+
+        if matricula is not None:
+            conditions.append(bank_hours_ledger.c.matricula == matricula)
+
+        if start_date is not None:
+            conditions.append(bank_hours_ledger.c.event_date >= start_date)
+
+        if end_date is not None:
+            conditions.append(bank_hours_ledger.c.event_date <= end_date)
+
+        if source is not None:
+            conditions.append(bank_hours_ledger.c.source == source)
+
+        return conditions
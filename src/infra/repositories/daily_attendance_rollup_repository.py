@@ -0,0 +1,143 @@
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from application.repositories import DailyAttendanceRollupRepositoryInterface
+from domain import AttendanceRollupRow, AttendanceRollupTotals, DailyAttendanceSummary, DailyAttendanceSummaryRow
+from domain.enums import DailyAttendanceStatus
+from infra.database_manager import DatabaseManagerConnection
+from infra.mappers.daily_attendance_rollup_mapper import daily_attendance_rollup
+from infra.mappers.daily_attendance_summary_mapper import daily_attendance_summary
+
+ROLLUP_SHARDS = 16
+
+MINUTE_COLUMNS = ("expected_minutes", "worked_minutes", "break_minutes", "overtime_minutes", "deficit_minutes")
+
+STATUS_DAY_COLUMNS = (
+    (DailyAttendanceStatus.OK, "ok_days"),
+    (DailyAttendanceStatus.INCOMPLETE, "incomplete_days"),
+    (DailyAttendanceStatus.PENDING_ADJUSTMENT, "pending_adjustment_days"),
+    (DailyAttendanceStatus.NO_POLICY, "no_policy_days"),
+)
+
+
+class DailyAttendanceRollupRepository(DailyAttendanceRollupRepositoryInterface):
+    def __init__(self, db_manager: DatabaseManagerConnection):
+        self.session = db_manager.session
+
+    def record_change(
+        self, previous: Optional[DailyAttendanceSummaryRow], current: DailyAttendanceSummary
+    ) -> None:
+        self.record_changes([(previous, current)])
+
+    def record_changes(
+        self, changes: Sequence[Tuple[Optional[DailyAttendanceSummaryRow], DailyAttendanceSummary]]
+    ) -> None:
+        # Runs inside the summary upsert transaction. The previous version leaves its status bucket and the current
+        # one enters its own, folded into a single statement; a change within one status is just the minute deltas.
+        # The employee's shard spreads a busy tenant-day over several rows.
+        deltas: Dict[Tuple[int, date, DailyAttendanceStatus, int], Dict[str, int]] = {}
+        for previous, current in changes:
+            shard = current.employee_id % ROLLUP_SHARDS
+            for summary, sign in ((previous, -1), (current, 1)):
+                if summary is None:
+                    continue
+                delta = deltas.setdefault(
+                    (current.tenant_id, current.work_date, summary.status, shard),
+                    dict.fromkeys(("days_count",) + MINUTE_COLUMNS, 0),
+                )
+                delta["days_count"] += sign
+                for column in MINUTE_COLUMNS:
+                    delta[column] += sign * getattr(summary, column)
+
+        # Rows are locked in key order so concurrent upserts touching the same rows cannot deadlock.
+        rows = [
+            {"tenant_id": tenant_id, "work_date": work_date, "status": status, "shard": shard, **delta}
+            for (tenant_id, work_date, status, shard), delta in sorted(
+                deltas.items(), key=lambda item: (item[0][0], item[0][1], item[0][2].value, item[0][3])
+            )
+            if any(delta.values())
+        ]
+        if len(rows) == 0:
+            return
+
+        statement = insert(daily_attendance_rollup).values(rows)
+        self.session.execute(
+            statement.on_conflict_do_update(
+                constraint="uq_daily_attendance_rollup_tenant_work_date_status_shard",
+                set_={
+                    column: daily_attendance_rollup.c[column] + statement.excluded[column]
+                    for column in ("days_count",) + MINUTE_COLUMNS
+                },
+            )
+        )
+
+    def rebuild(self, tenant_id: int, start_date: date, end_date: date) -> int:
+        self.session.execute(
+            delete(daily_attendance_rollup)
+            .where(daily_attendance_rollup.c.tenant_id == tenant_id)
+            .where(daily_attendance_rollup.c.work_date >= start_date)
+            .where(daily_attendance_rollup.c.work_date <= end_date)
+        )
+        shard = daily_attendance_summary.c.employee_id % ROLLUP_SHARDS
+        rows = (
+            select(
+                daily_attendance_summary.c.tenant_id,
+                daily_attendance_summary.c.work_date,
+                daily_attendance_summary.c.status,
+                shard,
+                func.count(),
+                *[func.sum(daily_attendance_summary.c[column]) for column in MINUTE_COLUMNS],
+            )
+            .where(daily_attendance_summary.c.tenant_id == tenant_id)
+            .where(daily_attendance_summary.c.work_date >= start_date)
+            .where(daily_attendance_summary.c.work_date <= end_date)
+            .group_by(
+                daily_attendance_summary.c.tenant_id,
+                daily_attendance_summary.c.work_date,
+                daily_attendance_summary.c.status,
+                shard,
+            )
+        )
+        result = self.session.execute(
+            insert(daily_attendance_rollup).from_select(
+                ["tenant_id", "work_date", "status", "shard", "days_count", *MINUTE_COLUMNS], rows
+            )
+        )
+        self.session.commit()
+        return int(result.rowcount or 0)
+
+    def find_daily_rows(self, tenant_id: int, start_date: date, end_date: date) -> List[AttendanceRollupRow]:
+        result = self.session.execute(
+            select(daily_attendance_rollup.c.work_date, *self.__aggregates())
+            .where(daily_attendance_rollup.c.tenant_id == tenant_id)
+            .where(daily_attendance_rollup.c.work_date >= start_date)
+            .where(daily_attendance_rollup.c.work_date <= end_date)
+            .group_by(daily_attendance_rollup.c.work_date)
+            .order_by(daily_attendance_rollup.c.work_date.asc())
+        )
+        return list(map(AttendanceRollupRow._make, result))
+
+    def find_totals(self, tenant_id: int, start_date: date, end_date: date) -> AttendanceRollupTotals:
+        result = self.session.execute(
+            select(*self.__aggregates())
+            .where(daily_attendance_rollup.c.tenant_id == tenant_id)
+            .where(daily_attendance_rollup.c.work_date >= start_date)
+            .where(daily_attendance_rollup.c.work_date <= end_date)
+        ).one()
+        return AttendanceRollupTotals._make(result)
+
+    def __aggregates(self) -> List[Any]:
+        days = [
+            func.coalesce(
+                func.sum(daily_attendance_rollup.c.days_count).filter(daily_attendance_rollup.c.status == status),
+                0,
+            ).label(label)
+            for status, label in STATUS_DAY_COLUMNS
+        ]
+        minutes = [
+            func.coalesce(func.sum(daily_attendance_rollup.c[column]), 0).label(column) for column in MINUTE_COLUMNS
+        ]
+        return days + minutes
@@ -1,30 +1,43 @@
-from datetime import date
-from typing import Optional
+from datetime import date, datetime, time
+from typing import List, Optional, Tuple
+
+from sqlalchemy import ColumnElement, exists, func, select, tuple_, update
 
 from application.repositories import DailyAttendanceSummaryRepositoryInterface
 from application.repositories.types import DBPaginatedResult
-from domain import DailyAttendanceSummary
-from domain.enums import DailyAttendanceStatus
+from domain import DailyAttendanceSummary, DailyAttendanceSummaryRow, MonthlyTimesheet, TimePunch
+from domain.enums import DailyAttendanceStatus, OutboxTopic, ResourceScope
 from infra.database_manager import DatabaseManagerConnection
+from infra.mappers.daily_attendance_summary_mapper import daily_attendance_summary
+
+from .daily_attendance_rollup_repository import DailyAttendanceRollupRepository
+from .outbox_event_repository import OutboxEventRepository
+from .resource_version_repository import ResourceVersionRepository
+
+ROW_COLUMNS = [daily_attendance_summary.c[name] for name in DailyAttendanceSummaryRow._fields]
 
 
 class DailyAttendanceSummaryRepository(DailyAttendanceSummaryRepositoryInterface):
     def __init__(self, db_manager: DatabaseManagerConnection):
         self.session = db_manager.session
+        self.resource_version_repository = ResourceVersionRepository(db_manager)
+        self.daily_attendance_rollup_repository = DailyAttendanceRollupRepository(db_manager)
+        self.outbox_event_repository = OutboxEventRepository(db_manager)
 
     def upsert(self, summary: DailyAttendanceSummary) -> DailyAttendanceSummary:
-        existing = self.find_by_employee_and_matricula_and_date(
-            summary.employee_id,
-            summary.matricula,
-            summary.work_date,
-        )
+        existing = self.__find_for_update(summary.employee_id, summary.matricula, summary.work_date)
 
         if existing is None:
             self.session.add(summary)
+            self.__bump_versions(summary)
+            self.daily_attendance_rollup_repository.record_change(None, summary)
+            self.session.flush()
+            self.outbox_event_repository.add(OutboxTopic.DAILY_ATTENDANCE_SUMMARY_UPSERTED, [self.__to_row(summary)])
             self.session.commit()
             self.session.refresh(summary)
-            return self.__normalize_summary(summary)
+            return summary
 
+        previous = self.__to_row(existing)
         existing.expected_minutes = summary.expected_minutes
         existing.worked_minutes = summary.worked_minutes
         existing.break_minutes = summary.break_minutes
@@ -32,9 +45,71 @@ class DailyAttendanceSummaryRepository(DailyAttendanceSummaryRepositoryInterface
         existing.deficit_minutes = summary.deficit_minutes
         existing.status = summary.status
 
+        if self.session.is_modified(existing):
+            self.__bump_versions(existing)
+            self.daily_attendance_rollup_repository.record_change(previous, existing)
+            self.outbox_event_repository.add(OutboxTopic.DAILY_ATTENDANCE_SUMMARY_UPSERTED, [self.__to_row(existing)])
+        # Cleared after the modification check: a stale day that recalculates to the same values is not a change.
+        existing.stale = False
         self.session.commit()
         self.session.refresh(existing)
-        return self.__normalize_summary(existing)
+        return existing
+
+    def upsert_many(self, summaries: List[DailyAttendanceSummary]) -> List[DailyAttendanceSummaryRow]:
+        # The batched form of upsert for recalculations of many days: one locking read, one flush, one rollup, version
+        # and outbox statement each, and a single commit. Rows are returned because the commit expires the instances.
+        if len(summaries) == 0:
+            return []
+
+        existing_by_day = {
+            (summary.employee_id, summary.matricula, summary.work_date): summary
+            for summary in self.__find_many_for_update(summaries)
+        }
+        persisted: List[DailyAttendanceSummary] = []
+        changes: List[Tuple[Optional[DailyAttendanceSummaryRow], DailyAttendanceSummary]] = []
+        for summary in summaries:
+            existing = existing_by_day.get((summary.employee_id, summary.matricula, summary.work_date))
+            if existing is None:
+                self.session.add(summary)
+                changes.append((None, summary))
+                persisted.append(summary)
+                continue
+
+            previous = self.__to_row(existing)
+            existing.expected_minutes = summary.expected_minutes
+            existing.worked_minutes = summary.worked_minutes
+            existing.break_minutes = summary.break_minutes
+            existing.overtime_minutes = summary.overtime_minutes
+            existing.deficit_minutes = summary.deficit_minutes
+            existing.status = summary.status
+            if self.session.is_modified(existing):
+                changes.append((previous, existing))
+            existing.stale = False
+            persisted.append(existing)
+
+        self.session.flush()
+        if len(changes) > 0:
+            self.resource_version_repository.bump_many(
+                version for _, current in changes for version in self.__version_keys(current)
+            )
+            self.daily_attendance_rollup_repository.record_changes(changes)
+            self.outbox_event_repository.add(
+                OutboxTopic.DAILY_ATTENDANCE_SUMMARY_UPSERTED, [self.__to_row(current) for _, current in changes]
+            )
+        rows = [self.__to_row(summary) for summary in persisted]
+        self.session.commit()
+        return rows
+
+    def mark_stale_in_period(self, tenant_id: int, start_date: date, end_date: date) -> None:
+        # Does not commit: runs in the transaction of the change that made the days stale.
+        self.session.execute(
+            update(daily_attendance_summary)
+            .where(daily_attendance_summary.c.tenant_id == tenant_id)
+            .where(daily_attendance_summary.c.work_date >= start_date)
+            .where(daily_attendance_summary.c.work_date <= end_date)
+            .where(~daily_attendance_summary.c.stale)
+            .values(stale=True)
+        )
 
     def find_by_id(self, summary_id: int) -> Optional[DailyAttendanceSummary]:
         summary = (
@@ -42,7 +117,7 @@ class DailyAttendanceSummaryRepository(DailyAttendanceSummaryRepositoryInterface
             .filter(DailyAttendanceSummary.id == summary_id)
             .first()
         )
-        return self.__normalize_summary(summary) if summary is not None else None
+        return summary
 
     def find_by_employee_and_matricula_and_date(
         self, employee_id: int, matricula: str, work_date: date
@@ -54,7 +129,79 @@ class DailyAttendanceSummaryRepository(DailyAttendanceSummaryRepositoryInterface
             .filter(DailyAttendanceSummary.work_date == work_date)
             .first()
         )
-        return self.__normalize_summary(summary) if summary is not None else None
+        return summary
+
+    def find_by_employee_and_matricula_and_period(
+        self, employee_id: int, matricula: str, start_date: date, end_date: date
+    ) -> List[DailyAttendanceSummary]:
+        data = (
+            self.session.query(DailyAttendanceSummary)
+            .filter(DailyAttendanceSummary.employee_id == employee_id)
+            .filter(DailyAttendanceSummary.matricula == matricula)
+            .filter(DailyAttendanceSummary.work_date >= start_date)
+            .filter(DailyAttendanceSummary.work_date <= end_date)
+            .order_by(DailyAttendanceSummary.work_date.asc())
+            .all()
+        )
+        return data
+
+    def find_rows_by_enrollment_and_period(
+        self, tenant_id: int, employee_id: int, matricula: str, start_date: date, end_date: date
+    ) -> List[DailyAttendanceSummaryRow]:
+        result = self.session.execute(
+            select(*ROW_COLUMNS)
+            .where(daily_attendance_summary.c.tenant_id == tenant_id)
+            .where(daily_attendance_summary.c.employee_id == employee_id)
+            .where(daily_attendance_summary.c.matricula == matricula)
+            .where(daily_attendance_summary.c.work_date >= start_date)
+            .where(daily_attendance_summary.c.work_date <= end_date)
+            .order_by(daily_attendance_summary.c.work_date.asc())
+        )
+        return list(map(DailyAttendanceSummaryRow._make, result))
+
+    def find_dirty_days(self, tenant_id: int, start_date: date, end_date: date) -> List[Tuple[int, str, date]]:
+        punch_date = func.date(TimePunch.punched_at)
+        punch_days_without_summary = (
+            self.session.query(TimePunch.employee_id, TimePunch.matricula, punch_date.label("work_date"))
+            .filter(TimePunch.tenant_id == tenant_id)
+            .filter(TimePunch.punched_at >= datetime.combine(start_date, time.min))
+            .filter(TimePunch.punched_at <= datetime.combine(end_date, time.max))
+            .filter(
+                ~exists()
+                .where(DailyAttendanceSummary.employee_id == TimePunch.employee_id)
+                .where(DailyAttendanceSummary.matricula == TimePunch.matricula)
+                .where(DailyAttendanceSummary.work_date == punch_date)
+            )
+        )
+        days_to_recalculate = (
+            self.session.query(
+                DailyAttendanceSummary.employee_id,
+                DailyAttendanceSummary.matricula,
+                DailyAttendanceSummary.work_date,
+            )
+            .filter(DailyAttendanceSummary.tenant_id == tenant_id)
+            .filter(DailyAttendanceSummary.work_date >= start_date)
+            .filter(DailyAttendanceSummary.work_date <= end_date)
+            .filter(
+                (DailyAttendanceSummary.status == DailyAttendanceStatus.NO_POLICY)
+                | daily_attendance_summary.c.stale
+            )
+        )
+        data = punch_days_without_summary.union(days_to_recalculate).all()
+        return sorted((row[0], row[1], row[2]) for row in data)
+
+    def find_rows_with_worked_minutes_above(
+        self, tenant_id: int, start_date: date, end_date: date, worked_minutes: int
+    ) -> List[DailyAttendanceSummaryRow]:
+        result = self.session.execute(
+            select(*ROW_COLUMNS)
+            .where(daily_attendance_summary.c.tenant_id == tenant_id)
+            .where(daily_attendance_summary.c.work_date >= start_date)
+            .where(daily_attendance_summary.c.work_date <= end_date)
+            .where(daily_attendance_summary.c.worked_minutes > worked_minutes)
+            .order_by(daily_attendance_summary.c.work_date.asc(), daily_attendance_summary.c.employee_id.asc())
+        )
+        return list(map(DailyAttendanceSummaryRow._make, result))
 
     def find_all(
         self,
@@ -67,41 +214,142 @@ class DailyAttendanceSummaryRepository(DailyAttendanceSummaryRepositoryInterface
         end_date: Optional[date] = None,
         status: Optional[DailyAttendanceStatus] = None,
     ) -> DBPaginatedResult[DailyAttendanceSummary]:
-        query = self.session.query(DailyAttendanceSummary)
+        query = self.session.query(DailyAttendanceSummary).filter(
+            *self.__filter_conditions(
+                tenant_id=tenant_id,
+                employee_id=employee_id,
+                matricula=matricula,
+                start_date=start_date,
+                end_date=end_date,
+                status=status,
+            )
+        )
+        total = query.count()
+        data = (
+            query.order_by(DailyAttendanceSummary.work_date.desc())
+            .offset(page * per_page)
+            .limit(per_page)
+            .all()
+        )
+        return DBPaginatedResult(
+            data=data,
+            total_count=total,
+        )
 
+    def find_all_rows(
+        self,
+        page: int,
+        per_page: int,
+        tenant_id: Optional[int] = None,
+        employee_id: Optional[int] = None,
+        matricula: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        status: Optional[DailyAttendanceStatus] = None,
+    ) -> DBPaginatedResult[DailyAttendanceSummaryRow]:
+        conditions = self.__filter_conditions(
+            tenant_id=tenant_id,
+            employee_id=employee_id,
+            matricula=matricula,
+            start_date=start_date,
+            end_date=end_date,
+            status=status,
+        )
+        total = self.session.execute(
+            select(func.count()).select_from(daily_attendance_summary).where(*conditions)
+        ).scalar_one()
+        result = self.session.execute(
+            select(*ROW_COLUMNS)
+            .where(*conditions)
+            .order_by(daily_attendance_summary.c.work_date.desc())
+            .offset(page * per_page)
+            .limit(per_page)
+        )
+        return DBPaginatedResult(data=list(map(DailyAttendanceSummaryRow._make, result)), total_count=total)
+
+    def __filter_conditions(
+        self,
+        tenant_id: Optional[int],
+        employee_id: Optional[int],
+        matricula: Optional[str],
+        start_date: Optional[date],
+        end_date: Optional[date],
+        status: Optional[DailyAttendanceStatus],
+    ) -> List[ColumnElement[bool]]:
+        conditions: List[ColumnElement[bool]] = []
         if tenant_id is not None:
-            query = query.filter(DailyAttendanceSummary.tenant_id == tenant_id)
+            conditions.append(daily_attendance_summary.c.tenant_id == tenant_id)
 
         if employee_id is not None:
-            query = query.filter(DailyAttendanceSummary.employee_id == employee_id)
+            conditions.append(daily_attendance_summary.c.employee_id == employee_id)
 
         if matricula is not None:
-            query = query.filter(DailyAttendanceSummary.matricula == matricula)
+            conditions.append(daily_attendance_summary.c.matricula == matricula)
 
         if start_date is not None:
-            query = query.filter(DailyAttendanceSummary.work_date >= start_date)
+            conditions.append(daily_attendance_summary.c.work_date >= start_date)
 
         if end_date is not None:
-            query = query.filter(DailyAttendanceSummary.work_date <= end_date)
+            conditions.append(daily_attendance_summary.c.work_date <= end_date)
 
         if status is not None:
-            query = query.filter(DailyAttendanceSummary.status == status)
+            conditions.append(daily_attendance_summary.c.status == status)
 
-        total = query.count()
+        return conditions
+
+    def __find_for_update(
+        self, employee_id: int, matricula: str, work_date: date
+    ) -> Optional[DailyAttendanceSummary]:
+        # The row stays locked until the upsert commits, so a concurrent upsert of the same day waits and then reads
+        # the committed values as its previous version; without the lock both would subtract the same previous
+        # values from the rollup. populate_existing refreshes an instance the session already holds.
+        summary = (
+            self.session.query(DailyAttendanceSummary)
+            .filter(DailyAttendanceSummary.employee_id == employee_id)
+            .filter(DailyAttendanceSummary.matricula == matricula)
+            .filter(DailyAttendanceSummary.work_date == work_date)
+            .populate_existing()
+            .with_for_update()
+            .first()
+        )
+        return summary
+
+    def __find_many_for_update(self, summaries: List[DailyAttendanceSummary]) -> List[DailyAttendanceSummary]:
+        # Same lock as __find_for_update for every day of the batch, taken in day order.
+        days = {(summary.employee_id, summary.matricula, summary.work_date) for summary in summaries}
         data = (
-            query.order_by(DailyAttendanceSummary.work_date.desc())
-            .offset(page * per_page)
-            .limit(per_page)
+            self.session.query(DailyAttendanceSummary)
+            .filter(
+                tuple_(
+                    DailyAttendanceSummary.employee_id,
+                    DailyAttendanceSummary.matricula,
+                    DailyAttendanceSummary.work_date,
+                ).in_(sorted(days))
+            )
+            .order_by(
+                DailyAttendanceSummary.employee_id.asc(),
+                DailyAttendanceSummary.matricula.asc(),
+                DailyAttendanceSummary.work_date.asc(),
+            )
+            .populate_existing()
+            .with_for_update()
             .all()
         )
-        return DBPaginatedResult(
-            data=[self.__normalize_summary(summary) for summary in data],
-            total_count=total,
-        )
+        return data
 
-    def __normalize_summary(
-        self, summary: DailyAttendanceSummary
-    ) -> DailyAttendanceSummary:
-        if isinstance(summary.status, str):
-            summary.status = DailyAttendanceStatus(summary.status)
-        return summary
+    def __bump_versions(self, summary: DailyAttendanceSummary) -> None:
+        # One statement: the tenant counter behind the list ETag and the enrollment/month key of the timesheet cache.
+        self.resource_version_repository.bump_many(self.__version_keys(summary))
+
+    def __version_keys(self, summary: DailyAttendanceSummary) -> List[Tuple[ResourceScope, int, Optional[str]]]:
+        return [
+            (ResourceScope.DAILY_ATTENDANCE_SUMMARIES, summary.tenant_id, None),
+            (
+                ResourceScope.TIMESHEETS,
+                summary.tenant_id,
+                MonthlyTimesheet.version_key(summary.employee_id, summary.matricula, summary.work_date),
+            ),
+        ]
+
+    def __to_row(self, summary: DailyAttendanceSummary) -> DailyAttendanceSummaryRow:
+        return DailyAttendanceSummaryRow._make(getattr(summary, name) for name in DailyAttendanceSummaryRow._fields)
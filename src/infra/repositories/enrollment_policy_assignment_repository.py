@@ -2,6 +2,7 @@ from datetime import date
 from typing import Any, Dict, List, Optional
 
 from sqlalchemy import or_
+from sqlalchemy.orm import joinedload
 
 from application.repositories import EnrollmentPolicyAssignmentRepositoryInterface
 from application.repositories.types import DBPaginatedResult
@@ -52,8 +53,10 @@ class EnrollmentPolicyAssignmentRepository(EnrollmentPolicyAssignmentRepositoryI
     def find_current_by_employee_and_matricula_and_date(
         self, employee_id: int, matricula: str, reference_date: date
     ) -> Optional[EnrollmentPolicyAssignment]:
+        # The recalculation always reads the template; loading it here saves the lazy load that would follow.
         return (
             self.session.query(EnrollmentPolicyAssignment)
+            .options(joinedload(EnrollmentPolicyAssignment.template))
             .filter(EnrollmentPolicyAssignment.employee_id == employee_id)
             .filter(EnrollmentPolicyAssignment.matricula == matricula)
             .filter(EnrollmentPolicyAssignment.effective_from <= reference_date)
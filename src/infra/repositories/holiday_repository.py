@@ -0,0 +1,84 @@
+from datetime import date
+from typing import List, Optional, Tuple
+
+from sqlalchemy import select
+
+from application.repositories import HolidayRepositoryInterface
+from application.repositories.types import DBPaginatedResult
+from domain import Holiday
+from domain.enums import ResourceScope
+from infra.database_manager import DatabaseManagerConnection
+from infra.mappers.holiday_mapper import holiday
+
+from .daily_attendance_summary_repository import DailyAttendanceSummaryRepository
+from .resource_version_repository import ResourceVersionRepository
+
+
+class HolidayRepository(HolidayRepositoryInterface):
+    def __init__(self, db_manager: DatabaseManagerConnection):
+        self.session = db_manager.session
+        self.resource_version_repository = ResourceVersionRepository(db_manager)
+        self.daily_attendance_summary_repository = DailyAttendanceSummaryRepository(db_manager)
+
+    def create(self, entry: Holiday) -> Holiday:
+        self.session.add(entry)
+        self.__mark_summaries_stale(entry)
+        self.resource_version_repository.bump(ResourceScope.HOLIDAYS, entry.tenant_id)
+        self.session.commit()
+        self.session.refresh(entry)
+        return entry
+
+    def delete(self, holiday_id: int) -> None:
+        entry = self.find_by_id(holiday_id)
+        if entry is None:
+            return
+        self.session.delete(entry)
+        self.__mark_summaries_stale(entry)
+        self.resource_version_repository.bump(ResourceScope.HOLIDAYS, entry.tenant_id)
+        self.session.commit()
+
+    def find_by_id(self, holiday_id: int) -> Optional[Holiday]:
+        return self.session.query(Holiday).filter(Holiday.id == holiday_id).first()
+
+    def find_periods_by_tenant(self, tenant_id: int) -> List[Tuple[date, date]]:
+        result = self.session.execute(
+            select(holiday.c.start_date, holiday.c.end_date)
+            .where(holiday.c.tenant_id == tenant_id)
+            .order_by(holiday.c.start_date.asc())
+        )
+        return [(row.start_date, row.end_date) for row in result]
+
+    def find_all(
+        self,
+        page: int,
+        per_page: int,
+        tenant_id: Optional[int] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> DBPaginatedResult[Holiday]:
+        query = self.session.query(Holiday)
+
+        if tenant_id is not None:
+            query = query.filter(Holiday.tenant_id == tenant_id)
+
+        # Overlap with the requested window, so a holiday spanning the boundary is still listed.
+        if start_date is not None:
+            query = query.filter(Holiday.end_date >= start_date)
+
+        if end_date is not None:
+            query = query.filter(Holiday.start_date <= end_date)
+
+        total = query.count()
+        data = (
+            query.order_by(Holiday.start_date.asc(), Holiday.id.asc())
+            .offset(page * per_page)
+            .limit(per_page)
+            .all()
+        )
+        return DBPaginatedResult(data=data, total_count=total)
+
+    def __mark_summaries_stale(self, entry: Holiday) -> None:
+        # Expected minutes of the covered days changed; summaries already written are left for the month closing.
+        self.daily_attendance_summary_repository.mark_stale_in_period(
+            entry.tenant_id, entry.start_date, entry.end_date
+        )
@@ -0,0 +1,94 @@
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from application.repositories import MonthlyClosingRepositoryInterface
+from application.repositories.types import DBPaginatedResult
+from domain import MonthlyClosing
+from infra.database_manager import DatabaseManagerConnection
+
+
+class MonthlyClosingRepository(MonthlyClosingRepositoryInterface):
+    def __init__(self, db_manager: DatabaseManagerConnection):
+        self.session = db_manager.session
+
+    def create(self, closing: MonthlyClosing) -> MonthlyClosing:
+        self.session.add(closing)
+        self.session.commit()
+        self.session.refresh(closing)
+        return closing
+
+    def update(self, closing_id: int, data: Dict[str, Any]) -> Optional[MonthlyClosing]:
+        closing = self.find_by_id(closing_id)
+        if closing is None:
+            return None
+
+        for key, value in data.items():
+            setattr(closing, key, value)
+
+        self.session.commit()
+        self.session.refresh(closing)
+        return closing
+
+    def delete(self, closing_id: int) -> None:
+        closing = self.find_by_id(closing_id)
+        if closing is None:
+            return
+        # monthly_closing_total rows go with it through ON DELETE CASCADE.
+        self.session.delete(closing)
+        self.session.commit()
+
+    def find_by_id(self, closing_id: int) -> Optional[MonthlyClosing]:
+        closing = self.session.query(MonthlyClosing).filter(MonthlyClosing.id == closing_id).first()
+        return closing
+
+    def find_by_tenant_and_month(self, tenant_id: int, month: date) -> Optional[MonthlyClosing]:
+        closing = (
+            self.session.query(MonthlyClosing)
+            .filter(MonthlyClosing.tenant_id == tenant_id)
+            .filter(MonthlyClosing.month == month)
+            .first()
+        )
+        return closing
+
+    def find_closed_months(self, tenant_id: int, months: List[date]) -> List[date]:
+        if len(months) == 0:
+            return []
+
+        data = (
+            self.session.query(MonthlyClosing.month)
+            .filter(MonthlyClosing.tenant_id == tenant_id)
+            .filter(MonthlyClosing.month.in_(months))
+            .all()
+        )
+        return [row.month for row in data]
+
+    def find_all(
+        self,
+        page: int,
+        per_page: int,
+        tenant_id: Optional[int] = None,
+        start_month: Optional[date] = None,
+        end_month: Optional[date] = None,
+    ) -> DBPaginatedResult[MonthlyClosing]:
+        query = self.session.query(MonthlyClosing)
+
+        if tenant_id is not None:
+            query = query.filter(MonthlyClosing.tenant_id == tenant_id)
+
+        if start_month is not None:
+            query = query.filter(MonthlyClosing.month >= start_month)
+
+        if end_month is not None:
+            query = query.filter(MonthlyClosing.month <= end_month)
+
+        total = query.count()
+        data = (
+            query.order_by(MonthlyClosing.month.desc(), MonthlyClosing.id.desc())
+            .offset(page * per_page)
+            .limit(per_page)
+            .all()
+        )
+        return DBPaginatedResult(
+            data=data,
+            total_count=total,
+        )
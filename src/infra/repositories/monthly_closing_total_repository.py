@@ -0,0 +1,187 @@
+from datetime import date
+from typing import Any, Optional
+
+from sqlalchemy import and_, delete, func, insert, literal, or_, select
+
+from application.repositories import MonthlyClosingTotalRepositoryInterface
+from application.repositories.types import DBPaginatedResult
+from domain import MonthlyClosing, MonthlyClosingTotal, MonthlyTimesheet
+from domain.enums import DailyAttendanceStatus, MonthlyClosingStatus
+from infra.database_manager import DatabaseManagerConnection
+from infra.mappers.bank_hours_ledger_mapper import bank_hours_ledger
+from infra.mappers.daily_attendance_summary_mapper import daily_attendance_summary
+from infra.mappers.monthly_closing_mapper import monthly_closing
+from infra.mappers.monthly_closing_total_mapper import monthly_closing_total
+
+
+class MonthlyClosingTotalRepository(MonthlyClosingTotalRepositoryInterface):
+    def __init__(self, db_manager: DatabaseManagerConnection):
+        self.session = db_manager.session
+
+    def materialize(self, closing: MonthlyClosing) -> int:
+        start_date, end_date = MonthlyTimesheet.month_bounds(closing.month)
+
+        def days_with(status: DailyAttendanceStatus):
+            return func.count().filter(daily_attendance_summary.c.status == status.value)
+
+        summary_totals = (
+            select(
+                daily_attendance_summary.c.employee_id,
+                daily_attendance_summary.c.matricula,
+                func.sum(daily_attendance_summary.c.expected_minutes).label("expected_minutes"),
+                func.sum(daily_attendance_summary.c.worked_minutes).label("worked_minutes"),
+                func.sum(daily_attendance_summary.c.break_minutes).label("break_minutes"),
+                func.sum(daily_attendance_summary.c.overtime_minutes).label("overtime_minutes"),
+                func.sum(daily_attendance_summary.c.deficit_minutes).label("deficit_minutes"),
+                days_with(DailyAttendanceStatus.OK).label("ok_days"),
+                days_with(DailyAttendanceStatus.INCOMPLETE).label("incomplete_days"),
+                days_with(DailyAttendanceStatus.PENDING_ADJUSTMENT).label("pending_adjustment_days"),
+                days_with(DailyAttendanceStatus.NO_POLICY).label("no_policy_days"),
+            )
+            .where(daily_attendance_summary.c.tenant_id == closing.tenant_id)
+            .where(daily_attendance_summary.c.work_date >= start_date)
+            .where(daily_attendance_summary.c.work_date <= end_date)
+            .group_by(daily_attendance_summary.c.employee_id, daily_attendance_summary.c.matricula)
+            .cte("summary_totals")
+        )
+        ledger_balances = (
+            select(
+                bank_hours_ledger.c.employee_id,
+                bank_hours_ledger.c.matricula,
+                func.coalesce(
+                    func.sum(bank_hours_ledger.c.minutes_delta).filter(bank_hours_ledger.c.event_date < start_date),
+                    0,
+                ).label("opening_balance_minutes"),
+                func.sum(bank_hours_ledger.c.minutes_delta).label("closing_balance_minutes"),
+            )
+            .where(bank_hours_ledger.c.tenant_id == closing.tenant_id)
+            .where(bank_hours_ledger.c.event_date <= end_date)
+            .group_by(bank_hours_ledger.c.employee_id, bank_hours_ledger.c.matricula)
+            .cte("ledger_balances")
+        )
+
+        def either(column: str):
+            return func.coalesce(summary_totals.c[column], ledger_balances.c[column])
+
+        def summed(column: str):
+            return func.coalesce(summary_totals.c[column], 0)
+
+        def balance(column: str):
+            return func.coalesce(ledger_balances.c[column], 0)
+
+        # Enrollments with summaries in the month, plus enrollments that only carry a bank hours balance.
+        rows = select(
+            literal(closing.id),
+            literal(closing.tenant_id),
+            either("employee_id"),
+            either("matricula"),
+            literal(start_date),
+            summed("expected_minutes"),
+            summed("worked_minutes"),
+            summed("break_minutes"),
+            summed("overtime_minutes"),
+            summed("deficit_minutes"),
+            summed("ok_days"),
+            summed("incomplete_days"),
+            summed("pending_adjustment_days"),
+            summed("no_policy_days"),
+            balance("opening_balance_minutes"),
+            balance("closing_balance_minutes"),
+        ).select_from(
+            summary_totals.join(
+                ledger_balances,
+                and_(
+                    summary_totals.c.employee_id == ledger_balances.c.employee_id,
+                    summary_totals.c.matricula == ledger_balances.c.matricula,
+                ),
+                full=True,
+            )
+        ).where(
+            or_(
+                summary_totals.c.employee_id.isnot(None),
+                ledger_balances.c.closing_balance_minutes != 0,
+            )
+        )
+
+        # Resuming an interrupted closing rebuilds its rows in the same transaction.
+        self.session.execute(
+            delete(monthly_closing_total).where(monthly_closing_total.c.monthly_closing_id == closing.id)
+        )
+        result = self.session.execute(
+            insert(monthly_closing_total).from_select(
+                [
+                    "monthly_closing_id",
+                    "tenant_id",
+                    "employee_id",
+                    "matricula",
+                    "month",
+                    "expected_minutes",
+                    "worked_minutes",
+                    "break_minutes",
+                    "overtime_minutes",
+                    "deficit_minutes",
+                    "ok_days",
+                    "incomplete_days",
+                    "pending_adjustment_days",
+                    "no_policy_days",
+                    "opening_balance_minutes",
+                    "closing_balance_minutes",
+                ],
+                rows,
+            )
+        )
+        self.session.commit()
+        return int(result.rowcount or 0)
+
+    def find_closed_by_enrollment_and_month(
+        self, tenant_id: int, employee_id: int, matricula: str, month: date
+    ) -> Optional[MonthlyClosingTotal]:
+        return (
+            self.session.query(MonthlyClosingTotal)
+            .join(monthly_closing, monthly_closing.c.id == MonthlyClosingTotal.monthly_closing_id)
+            .filter(MonthlyClosingTotal.tenant_id == tenant_id)
+            .filter(MonthlyClosingTotal.employee_id == employee_id)
+            .filter(MonthlyClosingTotal.matricula == matricula)
+            .filter(MonthlyClosingTotal.month == month)
+            .filter(monthly_closing.c.status == MonthlyClosingStatus.CLOSED.value)
+            .first()
+        )
+
+    def find_all_rows(
+        self,
+        page: int,
+        per_page: int,
+        monthly_closing_id: int,
+        employee_id: Optional[int] = None,
+        matricula: Optional[str] = None,
+    ) -> DBPaginatedResult[Any]:
+        query = self.session.query(
+            MonthlyClosingTotal.employee_id,
+            MonthlyClosingTotal.matricula,
+            MonthlyClosingTotal.expected_minutes,
+            MonthlyClosingTotal.worked_minutes,
+            MonthlyClosingTotal.break_minutes,
+            MonthlyClosingTotal.overtime_minutes,
+            MonthlyClosingTotal.deficit_minutes,
+            MonthlyClosingTotal.ok_days,
+            MonthlyClosingTotal.incomplete_days,
+            MonthlyClosingTotal.pending_adjustment_days,
+            MonthlyClosingTotal.no_policy_days,
+            MonthlyClosingTotal.opening_balance_minutes,
+            MonthlyClosingTotal.closing_balance_minutes,
+        ).filter(MonthlyClosingTotal.monthly_closing_id == monthly_closing_id)
+
+        if employee_id is not None:
+            query = query.filter(MonthlyClosingTotal.employee_id == employee_id)
+
+        if matricula is not None:
+            query = query.filter(MonthlyClosingTotal.matricula == matricula)
+
+        total = query.count()
+        data = (
+            query.order_by(MonthlyClosingTotal.employee_id.asc(), MonthlyClosingTotal.matricula.asc())
+            .offset(page * per_page)
+            .limit(per_page)
+            .all()
+        )
+        return DBPaginatedResult(data=list(data), total_count=total)
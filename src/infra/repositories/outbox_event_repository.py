@@ -0,0 +1,96 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, NamedTuple, Sequence
+
+from sqlalchemy import Interval, delete, event, func, insert, literal, select, update
+from sqlalchemy.orm import Session, SessionTransaction
+
+from application.repositories import OutboxEventRepositoryInterface
+from domain import OutboxEventRow
+from domain.enums import OutboxTopic
+from infra.database_manager import DatabaseManagerConnection
+from infra.mappers.outbox_event_mapper import outbox_event
+
+ROW_COLUMNS = [outbox_event.c[name] for name in OutboxEventRow._fields]
+
+# Session.info key of the events added since the transaction began.
+PENDING_EVENTS_KEY = "outbox_pending_events"
+
+
+@event.listens_for(Session, "before_commit")
+def _insert_pending_events(session: Session) -> None:
+    # Every event of the transaction goes out in one multi-row INSERT, right before the commit of the writes.
+    rows: List[Dict[str, Any]] = session.info.pop(PENDING_EVENTS_KEY, [])
+    if len(rows) > 0:
+        session.execute(insert(outbox_event), rows)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_pending_events(session: Session, transaction: SessionTransaction) -> None:
+    # A rollback (or a session closed without committing) drops the events together with the writes.
+    if transaction.parent is None:
+        session.info.pop(PENDING_EVENTS_KEY, None)
+
+
+class OutboxEventRepository(OutboxEventRepositoryInterface):
+    def __init__(self, db_manager: DatabaseManagerConnection):
+        self.session = db_manager.session
+
+    def add(self, topic: OutboxTopic, rows: Sequence[NamedTuple]) -> None:
+        # Never commits and runs no statement: the events are inserted by the caller's commit, so they exist only
+        # if the write they describe does.
+        self.session.info.setdefault(PENDING_EVENTS_KEY, []).extend(
+            {"tenant_id": getattr(row, "tenant_id"), "topic": topic.value, "payload": row._asdict()} for row in rows
+        )
+
+    def claim_batch(self, limit: int, max_attempts: int) -> List[OutboxEventRow]:
+        # Row locks last until the relay commits the outcome; concurrent relays skip them instead of sending twice.
+        result = self.session.execute(
+            select(*ROW_COLUMNS)
+            .where(outbox_event.c.sent_at.is_(None))
+            .where(outbox_event.c.available_at <= func.now())
+            .where(outbox_event.c.attempts < max_attempts)
+            .order_by(outbox_event.c.available_at.asc(), outbox_event.c.id.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return list(map(OutboxEventRow._make, result))
+
+    def mark_sent(self, event_ids: List[int]) -> None:
+        if len(event_ids) > 0:
+            self.session.execute(
+                update(outbox_event).where(outbox_event.c.id.in_(event_ids)).values(sent_at=func.now())
+            )
+        self.session.commit()
+
+    def mark_failed(
+        self, event_ids: List[int], error: str, base_delay_seconds: int, max_delay_seconds: int
+    ) -> None:
+        if len(event_ids) > 0:
+            delay_seconds = func.least(
+                base_delay_seconds * func.power(2, outbox_event.c.attempts), max_delay_seconds
+            )
+            self.session.execute(
+                update(outbox_event)
+                .where(outbox_event.c.id.in_(event_ids))
+                .values(
+                    attempts=outbox_event.c.attempts + 1,
+                    last_error=error,
+                    available_at=func.now() + literal(timedelta(seconds=1), Interval) * delay_seconds,
+                )
+            )
+        self.session.commit()
+
+    def count_pending(self, max_attempts: int) -> int:
+        return self.session.execute(
+            select(func.count())
+            .select_from(outbox_event)
+            .where(outbox_event.c.sent_at.is_(None))
+            .where(outbox_event.c.attempts < max_attempts)
+        ).scalar_one()
+
+    def delete_sent_before(self, sent_before: datetime) -> int:
+        deleted = self.session.execute(
+            delete(outbox_event).where(outbox_event.c.sent_at < sent_before)
+        ).rowcount
+        self.session.commit()
+        return deleted
@@ -1,19 +1,43 @@
 from application.repositories import RepositoryManagerInterface
+from application.repositories.attendance_anomaly_repository_interface import (
+    AttendanceAnomalyRepositoryInterface,
+)
 from application.repositories.bank_hours_ledger_repository_interface import (
     BankHoursLedgerRepositoryInterface,
 )
+from application.repositories.daily_attendance_rollup_repository_interface import (
+    DailyAttendanceRollupRepositoryInterface,
+)
 from application.repositories.daily_attendance_summary_repository_interface import (
     DailyAttendanceSummaryRepositoryInterface,
 )
 from application.repositories.enrollment_policy_assignment_repository_interface import (
     EnrollmentPolicyAssignmentRepositoryInterface,
 )
+from application.repositories.holiday_repository_interface import (
+    HolidayRepositoryInterface,
+)
+from application.repositories.monthly_closing_repository_interface import (
+    MonthlyClosingRepositoryInterface,
+)
+from application.repositories.monthly_closing_total_repository_interface import (
+    MonthlyClosingTotalRepositoryInterface,
+)
+from application.repositories.outbox_event_repository_interface import (
+    OutboxEventRepositoryInterface,
+)
+from application.repositories.resource_version_repository_interface import (
+    ResourceVersionRepositoryInterface,
+)
 from application.repositories.time_adjustment_item_repository_interface import (
     TimeAdjustmentItemRepositoryInterface,
 )
 from application.repositories.time_adjustment_request_repository_interface import (
     TimeAdjustmentRequestRepositoryInterface,
 )
+from application.repositories.time_punch_archive_repository_interface import (
+    TimePunchArchiveRepositoryInterface,
+)
 from application.repositories.time_punch_repository_interface import (
     TimePunchRepositoryInterface,
 )
@@ -22,11 +46,19 @@ from application.repositories.work_policy_template_repository_interface import (
 )
 from infra.database_manager import DatabaseManagerConnection
 
+from .attendance_anomaly_repository import AttendanceAnomalyRepository
 from .bank_hours_ledger_repository import BankHoursLedgerRepository
+from .daily_attendance_rollup_repository import DailyAttendanceRollupRepository
 from .daily_attendance_summary_repository import DailyAttendanceSummaryRepository
 from .enrollment_policy_assignment_repository import EnrollmentPolicyAssignmentRepository
+from .holiday_repository import HolidayRepository
+from .monthly_closing_repository import MonthlyClosingRepository
+from .monthly_closing_total_repository import MonthlyClosingTotalRepository
+from .outbox_event_repository import OutboxEventRepository
+from .resource_version_repository import ResourceVersionRepository
 from .time_adjustment_item_repository import TimeAdjustmentItemRepository
 from .time_adjustment_request_repository import TimeAdjustmentRequestRepository
+from .time_punch_archive_repository import TimePunchArchiveRepository
 from .time_punch_repository import TimePunchRepository
 from .work_policy_template_repository import WorkPolicyTemplateRepository
 
@@ -59,3 +91,27 @@ class RepositoryManager(RepositoryManagerInterface):
 
     def bank_hours_ledger_repository(self) -> BankHoursLedgerRepositoryInterface:
         return BankHoursLedgerRepository(self.db_manager)
+
+    def resource_version_repository(self) -> ResourceVersionRepositoryInterface:
+        return ResourceVersionRepository(self.db_manager)
+
+    def monthly_closing_repository(self) -> MonthlyClosingRepositoryInterface:
+        return MonthlyClosingRepository(self.db_manager)
+
+    def monthly_closing_total_repository(self) -> MonthlyClosingTotalRepositoryInterface:
+        return MonthlyClosingTotalRepository(self.db_manager)
+
+    def time_punch_archive_repository(self) -> TimePunchArchiveRepositoryInterface:
+        return TimePunchArchiveRepository(self.db_manager)
+
+    def daily_attendance_rollup_repository(self) -> DailyAttendanceRollupRepositoryInterface:
+        return DailyAttendanceRollupRepository(self.db_manager)
+
+    def attendance_anomaly_repository(self) -> AttendanceAnomalyRepositoryInterface:
+        return AttendanceAnomalyRepository(self.db_manager)
+
+    def outbox_event_repository(self) -> OutboxEventRepositoryInterface:
+        return OutboxEventRepository(self.db_manager)
+
+    def holiday_repository(self) -> HolidayRepositoryInterface:
+        return HolidayRepository(self.db_manager)
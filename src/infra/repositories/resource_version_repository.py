@@ -0,0 +1,52 @@
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from application.repositories import ResourceVersionRepositoryInterface
+from domain.enums import ResourceScope
+from infra.database_manager import DatabaseManagerConnection
+from infra.mappers.resource_version_mapper import resource_version
+
+
+class ResourceVersionRepository(ResourceVersionRepositoryInterface):
+    def __init__(self, db_manager: DatabaseManagerConnection):
+        self.session = db_manager.session
+
+    def get_version(
+        self, scope: ResourceScope, tenant_id: Optional[int] = None, key: Optional[str] = None
+    ) -> int:
+        # A point read on the primary key for one tenant. Without a tenant, versions only grow, so the sum over
+        # every tenant (one row each, read from ix_resource_version_scope) changes whenever any tenant is bumped.
+        query = select(func.coalesce(func.sum(resource_version.c.version), 0)).where(
+            resource_version.c.scope == self.__scope_value(scope, key)
+        )
+        if tenant_id is not None:
+            query = query.where(resource_version.c.tenant_id == tenant_id)
+        return int(self.session.execute(query).scalar_one())
+
+    def bump(self, scope: ResourceScope, tenant_id: int, key: Optional[str] = None) -> None:
+        self.bump_many([(scope, tenant_id, key)])
+
+    def bump_many(self, versions: Iterable[Tuple[ResourceScope, int, Optional[str]]]) -> None:
+        # Runs inside the caller's transaction: the bumps commit together with the write. Rows are
+        # deduplicated (one upsert cannot touch a row twice) and sorted so concurrent writers lock
+        # them in the same order.
+        rows: List[Tuple[int, str]] = sorted(
+            {(tenant_id, self.__scope_value(scope, key)) for scope, tenant_id, key in versions}
+        )
+        if len(rows) == 0:
+            return
+
+        statement = insert(resource_version).values(
+            [{"tenant_id": tenant_id, "scope": scope, "version": 1} for tenant_id, scope in rows]
+        )
+        self.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[resource_version.c.tenant_id, resource_version.c.scope],
+                set_={"version": resource_version.c.version + 1},
+            )
+        )
+
+    def __scope_value(self, scope: ResourceScope, key: Optional[str]) -> str:
+        return scope.value if key is None else f"{scope.value}:{key}"
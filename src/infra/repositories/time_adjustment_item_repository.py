@@ -1,8 +1,11 @@
+from datetime import datetime
 from typing import List
 
+from sqlalchemy import ColumnElement, exists, select
+
 from application.repositories import TimeAdjustmentItemRepositoryInterface
-from domain import TimeAdjustmentItem
-from domain.enums import PunchType
+from domain import TimeAdjustmentItem, TimeAdjustmentRequest, TimePunch
+from domain.enums import TimeAdjustmentStatus
 from infra.database_manager import DatabaseManagerConnection
 
 
@@ -15,7 +18,7 @@ class TimeAdjustmentItemRepository(TimeAdjustmentItemRepositoryInterface):
         self.session.commit()
         for item in items:
             self.session.refresh(item)
-        return [self.__normalize_item(item) for item in items]
+        return items
 
     def find_by_request_id(self, request_id: int) -> List[TimeAdjustmentItem]:
         items = (
@@ -24,7 +27,7 @@ class TimeAdjustmentItemRepository(TimeAdjustmentItemRepositoryInterface):
             .order_by(TimeAdjustmentItem.id.asc())
             .all()
         )
-        return [self.__normalize_item(item) for item in items]
+        return items
 
     def delete_by_request_id(self, request_id: int) -> None:
         (
@@ -34,7 +37,31 @@ class TimeAdjustmentItemRepository(TimeAdjustmentItemRepositoryInterface):
         )
         self.session.commit()
 
-    def __normalize_item(self, item: TimeAdjustmentItem) -> TimeAdjustmentItem:
-        if isinstance(item.proposed_punch_type, str):
-            item.proposed_punch_type = PunchType(item.proposed_punch_type)
-        return item
+    # original_punch_id has no foreign key (time_punch is partitioned by month), so deleting or archiving a punch
+    # checks here that no request that can still be applied points at it.
+    def has_open_items_for_punch(self, punch_id: int) -> bool:
+        return bool(
+            self.session.execute(
+                select(exists().where(self.__is_open()).where(TimeAdjustmentItem.original_punch_id == punch_id))
+            ).scalar_one()
+        )
+
+    def has_open_items_for_punches_in_period(self, tenant_id: int, start_at: datetime, end_at: datetime) -> bool:
+        return bool(
+            self.session.execute(
+                select(
+                    exists()
+                    .where(self.__is_open())
+                    .where(TimeAdjustmentRequest.tenant_id == tenant_id)
+                    .where(TimePunch.id == TimeAdjustmentItem.original_punch_id)
+                    .where(TimePunch.tenant_id == tenant_id)
+                    .where(TimePunch.punched_at >= start_at)
+                    .where(TimePunch.punched_at < end_at)
+                )
+            ).scalar_one()
+        )
+
+    def __is_open(self) -> ColumnElement[bool]:
+        return (TimeAdjustmentRequest.id == TimeAdjustmentItem.request_id) & TimeAdjustmentRequest.status.in_(
+            [TimeAdjustmentStatus.PENDING, TimeAdjustmentStatus.APPROVED]
+        )
@@ -1,10 +1,12 @@
 from datetime import date
 from typing import Any, Dict, Optional
 
+from sqlalchemy import exists, select
+
 from application.repositories import TimeAdjustmentRequestRepositoryInterface
 from application.repositories.types import DBPaginatedResult
 from domain import TimeAdjustmentRequest
-from domain.enums import PunchType, TimeAdjustmentStatus, TimeAdjustmentType
+from domain.enums import TimeAdjustmentStatus
 from infra.database_manager import DatabaseManagerConnection
 
 
@@ -16,7 +18,7 @@ class TimeAdjustmentRequestRepository(TimeAdjustmentRequestRepositoryInterface):
         self.session.add(request)
         self.session.commit()
         self.session.refresh(request)
-        return self.__normalize_request(request)
+        return request
 
     def update(
         self, request_id: int, data: Dict[str, Any]
@@ -30,7 +32,7 @@ class TimeAdjustmentRequestRepository(TimeAdjustmentRequestRepositoryInterface):
 
         self.session.commit()
         self.session.refresh(request)
-        return self.__normalize_request(request)
+        return request
 
     def delete(self, request_id: int) -> None:
         request = self.find_by_id(request_id)
@@ -45,7 +47,23 @@ class TimeAdjustmentRequestRepository(TimeAdjustmentRequestRepositoryInterface):
             .filter(TimeAdjustmentRequest.id == request_id)
             .first()
         )
-        return self.__normalize_request(request) if request is not None else None
+        return request
+
+    def exists_with_status_for_enrollment_and_date(
+        self, tenant_id: int, employee_id: int, matricula: str, request_date: date, status: TimeAdjustmentStatus
+    ) -> bool:
+        return bool(
+            self.session.execute(
+                select(
+                    exists()
+                    .where(TimeAdjustmentRequest.tenant_id == tenant_id)
+                    .where(TimeAdjustmentRequest.employee_id == employee_id)
+                    .where(TimeAdjustmentRequest.matricula == matricula)
+                    .where(TimeAdjustmentRequest.request_date == request_date)
+                    .where(TimeAdjustmentRequest.status == status)
+                )
+            ).scalar_one()
+        )
 
     def find_all(
         self,
@@ -86,18 +104,6 @@ class TimeAdjustmentRequestRepository(TimeAdjustmentRequestRepositoryInterface):
             .all()
         )
         return DBPaginatedResult(
-            data=[self.__normalize_request(request) for request in data],
+            data=data,
             total_count=total,
         )
-
-    def __normalize_request(
-        self, request: TimeAdjustmentRequest
-    ) -> TimeAdjustmentRequest:
-        if isinstance(request.request_type, str):
-            request.request_type = TimeAdjustmentType(request.request_type)
-        if isinstance(request.status, str):
-            request.status = TimeAdjustmentStatus(request.status)
-        for item in (request.items or []):
-            if isinstance(item.proposed_punch_type, str):
-                item.proposed_punch_type = PunchType(item.proposed_punch_type)
-        return request
@@ -0,0 +1,146 @@
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import ColumnElement, delete, insert, select, text
+
+from application.repositories import TimePunchArchiveRepositoryInterface
+from config import PUNCH_ARCHIVE_URI
+from domain import MonthlyTimesheet, TimePunch, TimePunchArchive
+from domain.enums import PunchType
+from infra.database_manager import DatabaseManagerConnection
+from infra.mappers.time_punch_mapper import time_punch
+from infra.storage import ROW_GROUP_SIZE, ParquetPunchStorage
+
+
+class TimePunchArchiveRepository(TimePunchArchiveRepositoryInterface):
+    def __init__(self, db_manager: DatabaseManagerConnection):
+        self.session = db_manager.session
+        self.__storage: Optional[ParquetPunchStorage] = None
+
+    def archive_month(self, tenant_id: int, month: date) -> TimePunchArchive:
+        start_at, end_at = self.__month_range(month)
+        location = f"time_punch/tenant_id={tenant_id}/{start_at:%Y-%m}.parquet"
+        time_zone = self.session.execute(text("SHOW TimeZone")).scalar_one()
+
+        # Streamed through a server-side cursor, one row group per chunk. The file is complete before any row leaves
+        # Postgres; a failure after this point leaves an orphan file that the next run overwrites.
+        in_month = self.__in_month(tenant_id, start_at, end_at)
+        row_count = self.__get_storage().write(location, self.__iter_row_chunks(in_month))
+        archive = TimePunchArchive(
+            tenant_id=tenant_id,
+            month=start_at.date(),
+            location=location,
+            row_count=row_count,
+            time_zone=time_zone,
+            archived_at=datetime.now(timezone.utc),
+        )
+
+        # time_punch is partitioned by month for every tenant at once, so the month partition also holds punches of
+        # tenants that were not archived; only this tenant's rows are deleted and the partition stays attached.
+        self.session.add(archive)
+        deleted = self.session.execute(delete(time_punch).where(in_month)).rowcount
+        if deleted != row_count:
+            self.session.rollback()
+            raise RuntimeError(f"Punches of {start_at:%Y-%m} changed while being archived for tenant {tenant_id}.")
+        self.session.commit()
+        self.session.refresh(archive)
+        return archive
+
+    def restore(self, archive: TimePunchArchive) -> int:
+        storage = self.__get_storage()
+        rows = storage.read_all(archive.location)
+        if len(rows) > 0:
+            zone = ZoneInfo(archive.time_zone)
+            for row in rows:
+                row["punched_at"] = row["punched_at"].astimezone(zone)
+            self.session.execute(insert(time_punch), rows)
+        self.session.delete(archive)
+        self.session.commit()
+        storage.delete(archive.location)
+        return len(rows)
+
+    def find_by_tenant_and_month(self, tenant_id: int, month: date) -> Optional[TimePunchArchive]:
+        return (
+            self.session.query(TimePunchArchive)
+            .filter(TimePunchArchive.tenant_id == tenant_id)
+            .filter(TimePunchArchive.month == month.replace(day=1))
+            .first()
+        )
+
+    def find_punches(
+        self,
+        employee_id: int,
+        matricula: str,
+        start_at: datetime,
+        end_at: datetime,
+        tenant_id: Optional[int] = None,
+    ) -> List[TimePunch]:
+        query = (
+            self.session.query(TimePunchArchive)
+            .filter(TimePunchArchive.month >= start_at.date().replace(day=1))
+            .filter(TimePunchArchive.month <= end_at.date())
+        )
+        if tenant_id is not None:
+            query = query.filter(TimePunchArchive.tenant_id == tenant_id)
+        archives = query.all()
+        if len(archives) == 0:
+            return []
+
+        punches = []
+        storage = self.__get_storage()
+        for archive in archives:
+            # Naive bounds mean the database time zone, the same way Postgres reads them for the hot table.
+            zone = ZoneInfo(archive.time_zone)
+            rows = storage.read(
+                archive.location,
+                employee_id=employee_id,
+                matricula=matricula,
+                start_at=start_at if start_at.tzinfo is not None else start_at.replace(tzinfo=zone),
+                end_at=end_at if end_at.tzinfo is not None else end_at.replace(tzinfo=zone),
+            )
+            for row in rows:
+                punch = TimePunch(
+                    tenant_id=row["tenant_id"],
+                    employee_id=row["employee_id"],
+                    matricula=row["matricula"],
+                    punched_at=row["punched_at"].astimezone(zone),
+                    punch_type=PunchType(row["punch_type"]),
+                    source=row["source"],
+                    note=row["note"],
+                )
+                punch.id = row["id"]
+                punches.append(punch)
+        return punches
+
+    def __iter_row_chunks(self, in_month: ColumnElement[bool]) -> Iterator[Sequence[Any]]:
+        result = self.session.execute(
+            select(time_punch)
+            .where(in_month)
+            .order_by(
+                time_punch.c.employee_id.asc(),
+                time_punch.c.matricula.asc(),
+                time_punch.c.punched_at.asc(),
+                time_punch.c.id.asc(),
+            ),
+            execution_options={"stream_results": True, "yield_per": ROW_GROUP_SIZE},
+        )
+        yield from result.partitions()
+
+    def __in_month(self, tenant_id: int, start_at: datetime, end_at: datetime) -> ColumnElement[bool]:
+        return (
+            (time_punch.c.tenant_id == tenant_id)
+            & (time_punch.c.punched_at >= start_at)
+            & (time_punch.c.punched_at < end_at)
+        )
+
+    def __month_range(self, month: date) -> Tuple[datetime, datetime]:
+        start_date, end_date = MonthlyTimesheet.month_bounds(month)
+        return datetime.combine(start_date, time.min), datetime.combine(end_date + timedelta(days=1), time.min)
+
+    def __get_storage(self) -> ParquetPunchStorage:
+        if self.__storage is None:
+            if PUNCH_ARCHIVE_URI is None:
+                raise RuntimeError("PUNCH_ARCHIVE_URI is not configured.")
+            self.__storage = ParquetPunchStorage(PUNCH_ARCHIVE_URI)
+        return self.__storage
@@ -1,47 +1,72 @@
-from datetime import date, datetime
-from typing import Any, Dict, List, Optional
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
-from sqlalchemy import func
+from sqlalchemy import ColumnElement, func, select
 
 from application.repositories import TimePunchRepositoryInterface
 from application.repositories.types import DBPaginatedResult
-from domain import TimePunch
-from domain.enums import PunchType
+from domain import MonthlyTimesheet, TimePunch, TimePunchRow
+from domain.enums import OutboxTopic, PunchType, ResourceScope
 from infra.database_manager import DatabaseManagerConnection
+from infra.mappers.time_punch_mapper import time_punch
+
+from .outbox_event_repository import OutboxEventRepository
+from .resource_version_repository import ResourceVersionRepository
+from .time_punch_archive_repository import TimePunchArchiveRepository
+
+ROW_COLUMNS = [time_punch.c[name] for name in TimePunchRow._fields]
 
 
 class TimePunchRepository(TimePunchRepositoryInterface):
     def __init__(self, db_manager: DatabaseManagerConnection):
         self.session = db_manager.session
+        self.resource_version_repository = ResourceVersionRepository(db_manager)
+        self.time_punch_archive_repository = TimePunchArchiveRepository(db_manager)
+        self.outbox_event_repository = OutboxEventRepository(db_manager)
 
     def create(self, punch: TimePunch) -> TimePunch:
         self.session.add(punch)
+        self.__bump_timesheets([punch])
+        self.session.flush()
+        self.outbox_event_repository.add(OutboxTopic.TIME_PUNCH_CREATED, [self.__to_row(punch)])
         self.session.commit()
         self.session.refresh(punch)
-        return self.__normalize_punch(punch)
+        return punch
+
+    def create_many(self, punches: List[TimePunch]) -> None:
+        self.session.add_all(punches)
+        self.__bump_timesheets(punches)
+        self.session.flush()
+        self.outbox_event_repository.add(OutboxTopic.TIME_PUNCH_CREATED, [self.__to_row(punch) for punch in punches])
+        self.session.commit()
 
     def update(self, punch_id: int, data: Dict[str, Any]) -> Optional[TimePunch]:
         punch = self.find_by_id(punch_id)
         if punch is None:
             return None
 
+        previous_punched_at = punch.punched_at
         for key, value in data.items():
             setattr(punch, key, value)
 
+        self.__bump_timesheets([punch], extra_days=[previous_punched_at.date()])
+        self.outbox_event_repository.add(OutboxTopic.TIME_PUNCH_UPDATED, [self.__to_row(punch)])
         self.session.commit()
         self.session.refresh(punch)
-        return self.__normalize_punch(punch)
+        return punch
 
     def delete(self, punch_id: int) -> None:
         punch = self.find_by_id(punch_id)
         if punch is None:
             return
         self.session.delete(punch)
+        self.__bump_timesheets([punch])
+        self.outbox_event_repository.add(OutboxTopic.TIME_PUNCH_DELETED, [self.__to_row(punch)])
         self.session.commit()
 
     def find_by_id(self, punch_id: int) -> Optional[TimePunch]:
         punch = self.session.query(TimePunch).filter(TimePunch.id == punch_id).first()
-        return self.__normalize_punch(punch) if punch is not None else None
+        return punch
 
     def find_duplicate(
         self,
@@ -58,7 +83,7 @@ class TimePunchRepository(TimePunchRepositoryInterface):
             .filter(TimePunch.punch_type == punch_type)
             .first()
         )
-        return self.__normalize_punch(punch) if punch is not None else None
+        return punch
 
     def find_last_by_employee_and_matricula(
         self, employee_id: int, matricula: str
@@ -70,10 +95,15 @@ class TimePunchRepository(TimePunchRepositoryInterface):
             .order_by(TimePunch.punched_at.desc())
             .first()
         )
-        return self.__normalize_punch(punch) if punch is not None else None
+        return punch
 
     def find_by_employee_and_matricula_and_period(
-        self, employee_id: int, matricula: str, start_at: datetime, end_at: datetime
+        self,
+        employee_id: int,
+        matricula: str,
+        start_at: datetime,
+        end_at: datetime,
+        tenant_id: Optional[int] = None,
     ) -> List[TimePunch]:
         data = (
             self.session.query(TimePunch)
@@ -84,20 +114,44 @@ class TimePunchRepository(TimePunchRepositoryInterface):
             .order_by(TimePunch.punched_at.asc())
             .all()
         )
-        return [self.__normalize_punch(punch) for punch in data]
+        archived = self.__find_archived(employee_id, matricula, start_at, end_at, tenant_id)
+        if len(archived) > 0:
+            data = sorted([*archived, *data], key=lambda punch: (punch.punched_at, punch.id))
+        return data
 
     def find_by_employee_and_matricula_and_date(
         self, employee_id: int, matricula: str, work_date: date
     ) -> List[TimePunch]:
+        day_start, day_end = self.__day_bounds(work_date)
         data = (
             self.session.query(TimePunch)
             .filter(TimePunch.employee_id == employee_id)
             .filter(TimePunch.matricula == matricula)
-            .filter(func.date(TimePunch.punched_at) == work_date)
+            .filter(TimePunch.punched_at >= day_start)
+            .filter(TimePunch.punched_at < day_end)
             .order_by(TimePunch.punched_at.asc())
             .all()
         )
-        return [self.__normalize_punch(punch) for punch in data]
+        return data
+
+    def find_rows_by_enrollment_and_period(
+        self, tenant_id: int, employee_id: int, matricula: str, start_at: datetime, end_at: datetime
+    ) -> List[TimePunchRow]:
+        result = self.session.execute(
+            select(*ROW_COLUMNS)
+            .where(time_punch.c.tenant_id == tenant_id)
+            .where(time_punch.c.employee_id == employee_id)
+            .where(time_punch.c.matricula == matricula)
+            .where(time_punch.c.punched_at >= start_at)
+            .where(time_punch.c.punched_at <= end_at)
+            .order_by(time_punch.c.punched_at.asc(), time_punch.c.id.asc())
+        )
+        data = list(map(TimePunchRow._make, result))
+        archived = self.__find_archived(employee_id, matricula, start_at, end_at, tenant_id)
+        if len(archived) > 0:
+            rows = [TimePunchRow(*(getattr(punch, name) for name in TimePunchRow._fields)) for punch in archived]
+            return sorted([*rows, *data], key=lambda row: (row.punched_at, row.id))
+        return data
 
     def find_other_matriculas_with_punch_on_date(
         self,
@@ -106,16 +160,90 @@ class TimePunchRepository(TimePunchRepositoryInterface):
         work_date: date,
         matricula_to_exclude: str,
     ) -> List[TimePunch]:
+        day_start, day_end = self.__day_bounds(work_date)
         data = (
             self.session.query(TimePunch)
             .filter(TimePunch.tenant_id == tenant_id)
             .filter(TimePunch.employee_id == employee_id)
             .filter(TimePunch.matricula != matricula_to_exclude)
-            .filter(func.date(TimePunch.punched_at) == work_date)
+            .filter(TimePunch.punched_at >= day_start)
+            .filter(TimePunch.punched_at < day_end)
             .order_by(TimePunch.punched_at.asc())
             .all()
         )
-        return [self.__normalize_punch(punch) for punch in data]
+        return data
+
+    def find_enrollments_with_punch_in_period(
+        self,
+        tenant_id: int,
+        start_at: datetime,
+        end_at: datetime,
+        employee_id: Optional[int] = None,
+    ) -> List[Tuple[int, str]]:
+        query = (
+            self.session.query(TimePunch.employee_id, TimePunch.matricula)
+            .filter(TimePunch.tenant_id == tenant_id)
+            .filter(TimePunch.punched_at >= start_at)
+            .filter(TimePunch.punched_at <= end_at)
+        )
+
+        if employee_id is not None:
+            query = query.filter(TimePunch.employee_id == employee_id)
+
+        data = (
+            query.distinct()
+            .order_by(TimePunch.employee_id.asc(), TimePunch.matricula.asc())
+            .all()
+        )
+        return [(row.employee_id, row.matricula) for row in data]
+
+    def iter_row_chunks_in_period(
+        self, tenant_id: int, start_at: datetime, end_at: datetime, chunk_size: int
+    ) -> Iterator[List[TimePunchRow]]:
+        # Server-side cursor: only one chunk is held in memory, and every enrollment's punches arrive contiguous and
+        # in order. Committing on this session while iterating closes the cursor.
+        result = self.session.execute(
+            select(*ROW_COLUMNS)
+            .where(time_punch.c.tenant_id == tenant_id)
+            .where(time_punch.c.punched_at >= start_at)
+            .where(time_punch.c.punched_at <= end_at)
+            .order_by(
+                time_punch.c.employee_id.asc(),
+                time_punch.c.matricula.asc(),
+                time_punch.c.punched_at.asc(),
+                time_punch.c.id.asc(),
+            ),
+            execution_options={"stream_results": True, "yield_per": chunk_size},
+        )
+        for partition in result.partitions():
+            yield list(map(TimePunchRow._make, partition))
+
+    def find_rows_sharing_punch_time(
+        self, tenant_id: int, start_at: datetime, end_at: datetime, min_employees: int
+    ) -> List[TimePunchRow]:
+        punched_second = func.date_trunc("second", time_punch.c.punched_at)
+        in_period = (
+            (time_punch.c.tenant_id == tenant_id)
+            & (time_punch.c.punched_at >= start_at)
+            & (time_punch.c.punched_at <= end_at)
+        )
+        clusters = (
+            select(time_punch.c.source, punched_second.label("punched_second"))
+            .where(in_period)
+            .group_by(time_punch.c.source, punched_second)
+            .having(func.count(func.distinct(time_punch.c.employee_id)) >= min_employees)
+            .subquery()
+        )
+        result = self.session.execute(
+            select(*ROW_COLUMNS)
+            .join(
+                clusters,
+                (clusters.c.source == time_punch.c.source) & (clusters.c.punched_second == punched_second),
+            )
+            .where(in_period)
+            .order_by(time_punch.c.punched_at.asc(), time_punch.c.source.asc(), time_punch.c.employee_id.asc())
+        )
+        return list(map(TimePunchRow._make, result))
 
     def find_all(
         self,
@@ -128,39 +256,123 @@ class TimePunchRepository(TimePunchRepositoryInterface):
         end_at: Optional[datetime] = None,
         punch_type: Optional[PunchType] = None,
     ) -> DBPaginatedResult[TimePunch]:
-        query = self.session.query(TimePunch)
+        query = self.session.query(TimePunch).filter(
+            *self.__filter_conditions(
+                tenant_id=tenant_id,
+                employee_id=employee_id,
+                matricula=matricula,
+                start_at=start_at,
+                end_at=end_at,
+                punch_type=punch_type,
+            )
+        )
+        total = query.count()
+        data = (
+            query.order_by(TimePunch.punched_at.desc())
+            .offset(page * per_page)
+            .limit(per_page)
+            .all()
+        )
+        return DBPaginatedResult(
+            data=data,
+            total_count=total,
+        )
+
+    def find_all_rows(
+        self,
+        page: int,
+        per_page: int,
+        tenant_id: Optional[int] = None,
+        employee_id: Optional[int] = None,
+        matricula: Optional[str] = None,
+        start_at: Optional[datetime] = None,
+        end_at: Optional[datetime] = None,
+        punch_type: Optional[PunchType] = None,
+    ) -> DBPaginatedResult[TimePunchRow]:
+        # Core select straight into TimePunchRow: no identity map, no instrumented state and no enum fixups.
+        conditions = self.__filter_conditions(
+            tenant_id=tenant_id,
+            employee_id=employee_id,
+            matricula=matricula,
+            start_at=start_at,
+            end_at=end_at,
+            punch_type=punch_type,
+        )
+        total = self.session.execute(select(func.count()).select_from(time_punch).where(*conditions)).scalar_one()
+        result = self.session.execute(
+            select(*ROW_COLUMNS)
+            .where(*conditions)
+            .order_by(time_punch.c.punched_at.desc())
+            .offset(page * per_page)
+            .limit(per_page)
+        )
+        return DBPaginatedResult(data=list(map(TimePunchRow._make, result)), total_count=total)
 
+    def __filter_conditions(
+        self,
+        tenant_id: Optional[int],
+        employee_id: Optional[int],
+        matricula: Optional[str],
+        start_at: Optional[datetime],
+        end_at: Optional[datetime],
+        punch_type: Optional[PunchType],
+    ) -> List[ColumnElement[bool]]:
+        conditions: List[ColumnElement[bool]] = []
         if tenant_id is not None:
-            query = query.filter(TimePunch.tenant_id == tenant_id)
+            conditions.append(time_punch.c.tenant_id == tenant_id)
 
         if employee_id is not None:
-            query = query.filter(TimePunch.employee_id == employee_id)
+            conditions.append(time_punch.c.employee_id == employee_id)
 
         if matricula is not None:
-            query = query.filter(TimePunch.matricula == matricula)
+            conditions.append(time_punch.c.matricula == matricula)
 
         if start_at is not None:
-            query = query.filter(TimePunch.punched_at >= start_at)
+            conditions.append(time_punch.c.punched_at >= start_at)
 
         if end_at is not None:
-            query = query.filter(TimePunch.punched_at <= end_at)
+            conditions.append(time_punch.c.punched_at <= end_at)
 
         if punch_type is not None:
-            query = query.filter(TimePunch.punch_type == punch_type)
+            conditions.append(time_punch.c.punch_type == punch_type)
 
-        total = query.count()
-        data = (
-            query.order_by(TimePunch.punched_at.desc())
-            .offset(page * per_page)
-            .limit(per_page)
-            .all()
+        return conditions
+
+    def __find_archived(
+        self,
+        employee_id: int,
+        matricula: str,
+        start_at: datetime,
+        end_at: datetime,
+        tenant_id: Optional[int],
+    ) -> List[TimePunch]:
+        # Only closed months are archived and a month can only be closed after it ends, so ranges starting in the
+        # current month skip the archive catalog altogether.
+        if start_at.date() >= date.today().replace(day=1):
+            return []
+        return self.time_punch_archive_repository.find_punches(
+            employee_id=employee_id,
+            matricula=matricula,
+            start_at=start_at,
+            end_at=end_at,
+            tenant_id=tenant_id,
         )
-        return DBPaginatedResult(
-            data=[self.__normalize_punch(punch) for punch in data],
-            total_count=total,
+
+    def __day_bounds(self, work_date: date) -> Tuple[datetime, datetime]:
+        # A range on the raw column (instead of date(punched_at)) lets the planner prune monthly partitions.
+        day_start = datetime.combine(work_date, time.min)
+        return day_start, day_start + timedelta(days=1)
+
+    def __bump_timesheets(self, punches: List[TimePunch], extra_days: Optional[List[date]] = None) -> None:
+        keys: Set[Tuple[int, str]] = set()
+        for punch in punches:
+            days = [punch.punched_at.date(), *(extra_days or [])]
+            for day in days:
+                keys.add((punch.tenant_id, MonthlyTimesheet.version_key(punch.employee_id, punch.matricula, day)))
+
+        self.resource_version_repository.bump_many(
+            (ResourceScope.TIMESHEETS, tenant_id, key) for tenant_id, key in keys
         )
 
-    def __normalize_punch(self, punch: TimePunch) -> TimePunch:
-        if isinstance(punch.punch_type, str):
-            punch.punch_type = PunchType(punch.punch_type)
-        return punch
+    def __to_row(self, punch: TimePunch) -> TimePunchRow:
+        return TimePunchRow._make(getattr(punch, name) for name in TimePunchRow._fields)
@@ -0,0 +1,2 @@
+# pyright: reportUnusedImport=false
+from .parquet_punch_storage import ROW_GROUP_SIZE, ParquetPunchStorage
@@ -0,0 +1,104 @@
+import posixpath
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Sequence
+
+PUNCH_COLUMNS = ("id", "tenant_id", "employee_id", "matricula", "punched_at", "punch_type", "source", "note")
+
+# Rows are written sorted by enrollment, so row group statistics let a filtered read skip most of a tenant's month.
+# Archiving streams the month in chunks of this size and writes each chunk as one row group.
+ROW_GROUP_SIZE = 50_000
+
+
+class ParquetPunchStorage:
+    def __init__(self, uri: str):
+        # pyarrow costs several hundred milliseconds to import; only archival and archived reads pay for it.
+        from pyarrow import fs
+
+        self.filesystem, self.root = fs.FileSystem.from_uri(uri)
+
+    def write(self, location: str, chunks: Iterable[Sequence[Any]]) -> int:
+        import pyarrow.parquet as pq
+
+        path = self.__path(location)
+        self.filesystem.create_dir(posixpath.dirname(path), recursive=True)
+        # Only the chunk being written is held in memory, however many punches the month has.
+        count = 0
+        with pq.ParquetWriter(
+            path, self.__schema(), filesystem=self.filesystem, compression="zstd"
+        ) as writer:
+            for rows in chunks:
+                if len(rows) == 0:
+                    continue
+                writer.write_table(self.__to_table(rows), row_group_size=len(rows))
+                count += len(rows)
+
+        written = pq.read_metadata(path, filesystem=self.filesystem).num_rows
+        if written != count:
+            raise IOError(f"Archive {location} has {written} rows, expected {count}.")
+        return count
+
+    def read(
+        self,
+        location: str,
+        employee_id: int,
+        matricula: str,
+        start_at: datetime,
+        end_at: datetime,
+    ) -> List[Dict[str, Any]]:
+        return self.__read(
+            location,
+            filters=[
+                ("employee_id", "==", employee_id),
+                ("matricula", "==", matricula),
+                ("punched_at", ">=", start_at),
+                ("punched_at", "<=", end_at),
+            ],
+        )
+
+    def read_all(self, location: str) -> List[Dict[str, Any]]:
+        return self.__read(location, filters=None)
+
+    def delete(self, location: str) -> None:
+        self.filesystem.delete_file(self.__path(location))
+
+    def __read(self, location: str, filters: Any) -> List[Dict[str, Any]]:
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(
+            self.__path(location),
+            filesystem=self.filesystem,
+            columns=list(PUNCH_COLUMNS),
+            filters=filters,
+        )
+        return table.to_pylist()
+
+    def __schema(self) -> Any:
+        import pyarrow as pa
+
+        return pa.schema(
+            [
+                ("id", pa.int32()),
+                ("tenant_id", pa.int32()),
+                ("employee_id", pa.int32()),
+                ("matricula", pa.string()),
+                ("punched_at", pa.timestamp("us", tz="UTC")),
+                ("punch_type", pa.string()),
+                ("source", pa.string()),
+                ("note", pa.string()),
+            ]
+        )
+
+    def __to_table(self, rows: Sequence[Any]) -> Any:
+        import pyarrow as pa
+
+        schema = self.__schema()
+        return pa.table(
+            {
+                name: pa.array([getattr(row, name) for row in rows], schema.field(name).type)
+                for name in PUNCH_COLUMNS
+            },
+            schema=schema,
+        )
+
+    def __path(self, location: str) -> str:
+        return posixpath.join(self.root, location)
@@ -0,0 +1,38 @@
+import argparse
+import sys
+from datetime import datetime
+
+from infra.jobs import PartitionMaintenance
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Pre-create future monthly partitions of time_punch and bank_hours_ledger "
+        "and optionally detach old time_punch partitions."
+    )
+    parser.add_argument("--months-ahead", type=int, default=3)
+    parser.add_argument(
+        "--detach-before",
+        type=lambda value: datetime.strptime(value, "%Y-%m").date(),
+        default=None,
+        help="YYYY-MM; time_punch partitions of earlier months are detached (kept as standalone tables)",
+    )
+    args = parser.parse_args()
+
+    report = PartitionMaintenance(
+        months_ahead=args.months_ahead,
+        detach_before=args.detach_before,
+    ).execute()
+
+    for name in report.created:
+        print(f"created {name}")
+    for name, rows in report.rows_moved.items():
+        print(f"moved {rows} rows from default partition into {name}", file=sys.stderr)
+    for name in report.detached:
+        print(f"detached {name}")
+    print(f"created={len(report.created)} detached={len(report.detached)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,38 @@
+import argparse
+import sys
+from datetime import date
+
+from application.exceptions import APIError
+from application.usecases.attendance_analytics import RebuildAttendanceRollupsUseCase
+from infra.database_manager import DatabaseManagerConnection
+from infra.mappers import import_mappers
+from infra.repositories import RepositoryManager
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Rebuild the daily attendance rollups of a tenant from its daily summaries."
+    )
+    parser.add_argument("--tenant-id", type=int, required=True)
+    parser.add_argument("--start-date", type=date.fromisoformat, required=True)
+    parser.add_argument("--end-date", type=date.fromisoformat, required=True)
+    args = parser.parse_args()
+
+    import_mappers()
+    db_manager = DatabaseManagerConnection()
+    try:
+        rows = RebuildAttendanceRollupsUseCase(RepositoryManager(db_manager=db_manager)).execute(
+            args.tenant_id, args.start_date, args.end_date
+        )
+    except APIError as error:
+        print(error.message, file=sys.stderr)
+        return 1
+    finally:
+        db_manager.close_session()
+
+    print(f"rollups={rows} period={args.start_date}..{args.end_date}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+import argparse
+import sys
+from datetime import date
+
+from application.exceptions import APIError
+from infra.jobs import ParallelRecalculationExecutor, RecalculationReport
+from infra.mappers import import_mappers
+
+
+def print_progress(report: RecalculationReport) -> None:
+    print(
+        f"\r{report.employees_done}/{report.employees_total} employees, "
+        f"{report.summaries_count} summaries, {len(report.errors)} errors",
+        end="",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Recalculate daily attendance summaries of a tenant in parallel."
+    )
+    parser.add_argument("--tenant-id", type=int, required=True)
+    parser.add_argument("--start-date", type=date.fromisoformat, required=True)
+    parser.add_argument("--end-date", type=date.fromisoformat, required=True)
+    parser.add_argument("--employee-id", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    import_mappers()
+    try:
+        report = ParallelRecalculationExecutor(
+            workers=args.workers, on_progress=print_progress
+        ).execute(
+            tenant_id=args.tenant_id,
+            start_date=args.start_date,
+            end_date=args.end_date,
+            employee_id=args.employee_id,
+        )
+    except APIError as error:
+        print(error.message, file=sys.stderr)
+        return 1
+    print(file=sys.stderr)
+
+    for error in report.errors:
+        print(error, file=sys.stderr)
+    print(
+        f"employees={report.employees_done} summaries={report.summaries_count} "
+        f"errors={len(report.errors)}"
+    )
+    return 1 if len(report.errors) > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+import argparse
+import signal
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from types import FrameType
+from typing import Optional
+
+from application.dtos import RelayOutboxEventsDTO
+from application.usecases.outbox_events import RelayOutboxEventsUseCase
+from infra.database_manager import DatabaseManagerConnection
+from infra.integrations import IntegrationManager
+from infra.mappers import import_mappers
+from infra.repositories import RepositoryManager
+
+PURGE_INTERVAL_SECONDS = 3600
+
+
+class Relay:
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.data = RelayOutboxEventsDTO(
+            batch_size=args.batch_size,
+            max_attempts=args.max_attempts,
+            retry_base_seconds=args.retry_base_seconds,
+            retry_max_seconds=args.retry_max_seconds,
+        )
+        self.integration_manager = IntegrationManager()
+        self.stopping = False
+        self.sent = 0
+        self.failed = 0
+
+    def stop(self, signum: int, frame: Optional[FrameType]) -> None:
+        _ = signum, frame
+        self.stopping = True
+
+    def run(self) -> None:
+        consecutive_failures = 0
+        purged_at = 0.0
+        while not self.stopping:
+            db_manager = DatabaseManagerConnection()
+            try:
+                repository_manager = RepositoryManager(db_manager=db_manager)
+                result = RelayOutboxEventsUseCase(repository_manager, self.integration_manager).execute(self.data)
+                if result.claimed == 0 and time.monotonic() - purged_at >= PURGE_INTERVAL_SECONDS:
+                    cutoff = datetime.now(timezone.utc) - timedelta(days=self.args.retention_days)
+                    repository_manager.outbox_event_repository().delete_sent_before(cutoff)
+                    purged_at = time.monotonic()
+            finally:
+                db_manager.close_session()
+
+            self.sent += result.sent
+            self.failed += result.failed
+            if result.claimed > 0:
+                print(f"sent={result.sent} failed={result.failed}", flush=True)
+
+            if result.failed > 0:
+                if self.args.once:
+                    return
+                # The queue is refusing messages: back off instead of polling it again right away. The failed rows
+                # also wait for their own retry time in the table.
+                consecutive_failures += 1
+                delay = self.data.retry_base_seconds * 2 ** (consecutive_failures - 1)
+                self.__sleep(min(delay, self.data.retry_max_seconds))
+                continue
+
+            consecutive_failures = 0
+            if result.claimed < self.data.batch_size:
+                if self.args.once:
+                    return
+                self.__sleep(self.args.poll_interval)
+
+    def __sleep(self, seconds: float) -> None:
+        deadline = time.monotonic() + seconds
+        while not self.stopping and time.monotonic() < deadline:
+            time.sleep(min(0.5, deadline - time.monotonic()))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Relay pending outbox events to the configured queue.")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--max-attempts", type=int, default=10)
+    parser.add_argument("--retry-base-seconds", type=int, default=5)
+    parser.add_argument("--retry-max-seconds", type=int, default=900)
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds to wait when the outbox is drained")
+    parser.add_argument("--retention-days", type=int, default=7, help="Days sent events are kept before purging")
+    parser.add_argument("--once", action="store_true", help="Exit once the outbox is drained")
+    args = parser.parse_args()
+
+    import_mappers()
+    relay = Relay(args)
+    signal.signal(signal.SIGTERM, relay.stop)
+    signal.signal(signal.SIGINT, relay.stop)
+    relay.run()
+
+    print(f"sent={relay.sent} failed={relay.failed}")
+    return 1 if relay.failed > 0 and args.once else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
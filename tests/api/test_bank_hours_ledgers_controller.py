@@ -0,0 +1,136 @@
+# pylint: disable=W0613
+# pyright: reportUnknownParameterType=false
+# pyright: reportMissingParameterType=false
+from datetime import date
+from http import HTTPStatus
+from typing import Any, Dict, Iterator
+
+import orjson
+import pytest
+from sqlalchemy import select
+
+from api.controllers import BankHoursLedgersController
+from application.exceptions import APIError
+from benchmarks.synthetic_tenant import drop_synthetic_tenant, employee_id_for
+from infra.database_manager import DatabaseManagerConnection
+from infra.mappers.bank_hours_ledger_mapper import bank_hours_ledger
+
+TENANT_ID = 920_003
+EMPLOYEE_ID = employee_id_for(TENANT_ID, 1)
+HEADER = "employeeId,matricula,eventDate,minutesDelta,referenceId"
+PARSE_ERROR = "employeeId, minutesDelta and referenceId must be integers and eventDate YYYY-MM-DD."
+
+
+@pytest.fixture
+def db_manager(database) -> Iterator[DatabaseManagerConnection]:
+    drop_synthetic_tenant(TENANT_ID)
+    db_manager = DatabaseManagerConnection()
+    try:
+        yield db_manager
+    finally:
+        db_manager.close_session()
+        drop_synthetic_tenant(TENANT_ID)
+
+
+def import_csv(db_manager: DatabaseManagerConnection, content: bytes) -> Dict[str, Any]:
+    response = BankHoursLedgersController(db_manager).import_csv(requester_tenant_id=TENANT_ID, content=content)
+    return orjson.loads(response.body)
+
+
+def test_should_import_rows_and_report_physical_line_numbers(db_manager):
+    content = "\r\n".join(
+        [
+            HEADER,
+            f"{EMPLOYEE_ID},MAT-0001,2026-02-25,30,",
+            "",
+            f"{EMPLOYEE_ID},MAT-0001,2026-02-26,-15,77",
+            f"{EMPLOYEE_ID},MAT-0001,2026-02-31,10,",
+            "",
+        ]
+    ).encode()
+
+    report = import_csv(db_manager, content)
+
+    assert report["created"] == 2
+    assert report["failed"] == 1
+    assert [(row["line"], row["error"]) for row in report["rows"]] == [(2, None), (4, None), (5, PARSE_ERROR)]
+    stored = db_manager.session.execute(
+        select(
+            bank_hours_ledger.c.id,
+            bank_hours_ledger.c.event_date,
+            bank_hours_ledger.c.minutes_delta,
+            bank_hours_ledger.c.reference_id,
+        )
+        .where(bank_hours_ledger.c.tenant_id == TENANT_ID)
+        .order_by(bank_hours_ledger.c.id)
+    ).all()
+    assert [tuple(row) for row in stored] == [
+        (report["rows"][0]["id"], date(2026, 2, 25), 30, None),
+        (report["rows"][1]["id"], date(2026, 2, 26), -15, 77),
+    ]
+
+
+def test_should_accept_utf8_bom_before_header(db_manager):
+    content = "\ufeff" + "\n".join([HEADER, f"{EMPLOYEE_ID},MAT-0001,2026-02-25,30,"])
+
+    report = import_csv(db_manager, content.encode())
+
+    assert report["created"] == 1
+    assert report["rows"][0]["line"] == 2
+
+
+@pytest.mark.parametrize(
+    "row",
+    [
+        "abc,MAT-0001,2026-02-25,30,",
+        f"{EMPLOYEE_ID},MAT-0001,25/02/2026,30,",
+        f"{EMPLOYEE_ID},MAT-0001,2026-02-25,1.5,",
+        f"{EMPLOYEE_ID},MAT-0001,2026-02-25,30,ref",
+        f"{EMPLOYEE_ID},MAT-0001",
+    ],
+)
+def test_should_report_rows_that_cannot_be_parsed(db_manager, row):
+    report = import_csv(db_manager, "\n".join([HEADER, row]).encode())
+
+    assert report == {"created": 0, "failed": 1, "rows": [{"line": 2, "id": None, "error": PARSE_ERROR}]}
+
+
+def test_should_keep_line_numbers_after_quoted_multiline_field(db_manager):
+    content = "\n".join(
+        [
+            HEADER,
+            f'{EMPLOYEE_ID},"MAT-\n0001",2026-02-25,30,',
+            f"{EMPLOYEE_ID},MAT-0001,2026-02-25,0,",
+        ]
+    )
+
+    report = import_csv(db_manager, content.encode())
+
+    assert [(row["line"], row["error"]) for row in report["rows"]] == [
+        (3, None),
+        (4, "minutes_delta cannot be zero."),
+    ]
+
+
+def test_should_reject_header_missing_required_columns(db_manager):
+    with pytest.raises(APIError) as error:
+        import_csv(db_manager, b"employeeId,matricula,referenceId\n1,MAT-0001,\n")
+
+    assert error.value.status_code == HTTPStatus.BAD_REQUEST
+    assert error.value.message == "CSV header is missing columns: eventDate, minutesDelta."
+
+
+def test_should_reject_empty_file(db_manager):
+    with pytest.raises(APIError) as error:
+        import_csv(db_manager, b"")
+
+    assert error.value.status_code == HTTPStatus.BAD_REQUEST
+    assert error.value.message == "CSV header is missing columns: employeeId, matricula, eventDate, minutesDelta."
+
+
+def test_should_reject_content_that_is_not_utf8(db_manager):
+    with pytest.raises(APIError) as error:
+        import_csv(db_manager, (HEADER + "\n1,MATRÍCULA,2026-02-25,30,\n").encode("latin-1"))
+
+    assert error.value.status_code == HTTPStatus.BAD_REQUEST
+    assert error.value.message == "CSV must be UTF-8 encoded."
@@ -0,0 +1,135 @@
+from datetime import date, datetime
+from typing import Dict, Iterator, List, Set, Tuple
+
+from application.dtos import DetectAttendanceAnomaliesDTO
+from application.usecases.attendance_anomalies import detect_attendance_anomalies_usecase
+from application.usecases.attendance_anomalies.detect_attendance_anomalies_usecase import (
+    DetectAttendanceAnomaliesUseCase,
+)
+from domain import AttendanceAnomaly, TimePunchRow
+from domain.enums import AttendanceAnomalyType, PunchType
+
+TENANT_ID = 1
+PUNCHES = [
+    (1, "MAT-1", datetime(2026, 1, 5, 8, 0), PunchType.IN),
+    (1, "MAT-1", datetime(2026, 1, 5, 12, 0), PunchType.BREAK_START),
+    (1, "MAT-1", datetime(2026, 1, 5, 13, 0), PunchType.BREAK_END),
+    (1, "MAT-1", datetime(2026, 1, 5, 17, 0), PunchType.OUT),
+    (1, "MAT-1", datetime(2026, 1, 6, 8, 0), PunchType.IN),
+    (1, "MAT-1", datetime(2026, 1, 6, 8, 0, 30), PunchType.IN),
+    (1, "MAT-1", datetime(2026, 1, 7, 8, 0), PunchType.IN),
+    (1, "MAT-2", datetime(2026, 1, 5, 8, 0), PunchType.IN),
+    (1, "MAT-2", datetime(2026, 1, 5, 8, 0, 20), PunchType.OUT),
+    (1, "MAT-2", datetime(2026, 1, 6, 8, 0), PunchType.IN),
+    (2, "MAT-3", datetime(2026, 1, 5, 8, 0), PunchType.IN),
+    (2, "MAT-3", datetime(2026, 1, 5, 17, 0), PunchType.OUT),
+    (2, "MAT-3", datetime(2026, 1, 6, 8, 0), PunchType.IN),
+    (2, "MAT-3", datetime(2026, 1, 7, 8, 0), PunchType.IN),
+    (2, "MAT-3", datetime(2026, 1, 8, 8, 0), PunchType.IN),
+    (2, "MAT-3", datetime(2026, 1, 8, 8, 0, 10), PunchType.OUT),
+]
+ROWS = [
+    TimePunchRow(index + 1, TENANT_ID, employee_id, matricula, punched_at, punch_type, "web", None)
+    for index, (employee_id, matricula, punched_at, punch_type) in enumerate(PUNCHES)
+]
+
+AnomalyKey = Tuple[int, str, date, AttendanceAnomalyType, str, object]
+
+
+class InMemoryTimePunchRepository:
+    def iter_row_chunks_in_period(
+        self, tenant_id: int, start_at: datetime, end_at: datetime, chunk_size: int
+    ) -> Iterator[List[TimePunchRow]]:
+        rows = [row for row in ROWS if row.tenant_id == tenant_id and start_at <= row.punched_at <= end_at]
+        for offset in range(0, len(rows), chunk_size):
+            yield rows[offset : offset + chunk_size]
+
+    def find_rows_sharing_punch_time(
+        self, tenant_id: int, start_at: datetime, end_at: datetime, min_employees: int
+    ) -> List[TimePunchRow]:
+        _ = (tenant_id, start_at, end_at, min_employees)
+        return []
+
+
+class InMemoryDailyAttendanceSummaryRepository:
+    def find_rows_with_worked_minutes_above(
+        self, tenant_id: int, start_date: date, end_date: date, max_worked_minutes: int
+    ) -> list:
+        _ = (tenant_id, start_date, end_date, max_worked_minutes)
+        return []
+
+
+class InMemoryAttendanceAnomalyRepository:
+    def __init__(self):
+        self.anomalies: List[AttendanceAnomaly] = []
+
+    def replace_in_period(
+        self, tenant_id: int, start_date: date, end_date: date, anomalies: List[AttendanceAnomaly]
+    ) -> int:
+        _ = (tenant_id, start_date, end_date)
+        self.anomalies.extend(anomalies)
+        return len(anomalies)
+
+
+class InMemoryRepositoryManager:
+    def __init__(self):
+        self.anomalies = InMemoryAttendanceAnomalyRepository()
+
+    def time_punch_repository(self) -> InMemoryTimePunchRepository:
+        return InMemoryTimePunchRepository()
+
+    def daily_attendance_summary_repository(self) -> InMemoryDailyAttendanceSummaryRepository:
+        return InMemoryDailyAttendanceSummaryRepository()
+
+    def attendance_anomaly_repository(self) -> InMemoryAttendanceAnomalyRepository:
+        return self.anomalies
+
+
+def detect(monkeypatch, chunk_rows: int) -> Set[AnomalyKey]:
+    monkeypatch.setattr(detect_attendance_anomalies_usecase, "CHUNK_ROWS", chunk_rows)
+    repository_manager = InMemoryRepositoryManager()
+    DetectAttendanceAnomaliesUseCase(repository_manager).execute(  # type: ignore[arg-type]
+        DetectAttendanceAnomaliesDTO(
+            tenant_id=TENANT_ID,
+            start_date=date(2026, 1, 1),
+            end_date=date(2026, 1, 31),
+            missing_out_min_days=2,
+        )
+    )
+    keys = [
+        (
+            anomaly.employee_id,
+            anomaly.matricula,
+            anomaly.work_date,
+            anomaly.anomaly_type,
+            anomaly.detail,
+            anomaly.punch_id,
+        )
+        for anomaly in repository_manager.anomalies.anomalies
+    ]
+    assert len(keys) == len(set(keys))
+    return set(keys)
+
+
+def test_should_detect_sequence_anomalies_of_each_enrollment(monkeypatch):
+    found = detect(monkeypatch, chunk_rows=len(ROWS))
+
+    assert {(key[1], key[2], key[3], key[5]) for key in found} == {
+        ("MAT-1", date(2026, 1, 6), AttendanceAnomalyType.RAPID_PUNCHES, 6),
+        ("MAT-2", date(2026, 1, 5), AttendanceAnomalyType.RAPID_PUNCHES, 9),
+        ("MAT-3", date(2026, 1, 8), AttendanceAnomalyType.RAPID_PUNCHES, 16),
+        ("MAT-1", date(2026, 1, 6), AttendanceAnomalyType.RECURRING_MISSING_OUT, None),
+        ("MAT-1", date(2026, 1, 7), AttendanceAnomalyType.RECURRING_MISSING_OUT, None),
+        ("MAT-3", date(2026, 1, 6), AttendanceAnomalyType.RECURRING_MISSING_OUT, None),
+        ("MAT-3", date(2026, 1, 7), AttendanceAnomalyType.RECURRING_MISSING_OUT, None),
+    }
+
+
+def test_should_find_the_same_anomalies_whatever_the_chunk_boundaries(monkeypatch):
+    # Every size splits some enrollment across chunks, down to one punch per chunk.
+    expected = detect(monkeypatch, chunk_rows=len(ROWS))
+
+    found: Dict[int, Set[AnomalyKey]] = {size: detect(monkeypatch, chunk_rows=size) for size in range(1, len(ROWS))}
+
+    for size, anomalies in found.items():
+        assert anomalies == expected, f"chunk_rows={size}"
@@ -0,0 +1,3 @@
+# pylint: disable=W0611
+# pyright: reportUnusedImport=false
+from tests.fixtures.database import database
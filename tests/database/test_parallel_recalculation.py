@@ -0,0 +1,131 @@
+# pylint: disable=W0613
+# pyright: reportUnknownParameterType=false
+# pyright: reportMissingParameterType=false
+import sys
+from datetime import date
+from typing import Dict, Iterator, List, Tuple
+
+import pytest
+from sqlalchemy import select
+
+from benchmarks.synthetic_tenant import (
+    SyntheticTenant,
+    SyntheticTenantConfig,
+    SyntheticTenantGenerator,
+    drop_synthetic_tenant,
+)
+from domain import DailyAttendanceSummaryRow
+from domain.enums import BankHoursSource, DailyAttendanceStatus
+from infra.database_manager import SessionLocal
+from infra.jobs import ParallelRecalculationExecutor
+from infra.mappers.bank_hours_ledger_mapper import bank_hours_ledger
+from infra.mappers.daily_attendance_rollup_mapper import daily_attendance_rollup
+from infra.mappers.daily_attendance_summary_mapper import daily_attendance_summary
+from infra.repositories.daily_attendance_rollup_repository import ROLLUP_SHARDS
+from recalculate import main
+
+TENANT_ID = 920_004
+START_DATE = date(2026, 1, 1)
+END_DATE = date(2026, 1, 31)
+
+RollupDay = Tuple[date, DailyAttendanceStatus, int, int, int]
+
+
+@pytest.fixture(scope="module")
+def tenant(database) -> Iterator[SyntheticTenant]:
+    drop_synthetic_tenant(TENANT_ID)
+    try:
+        yield SyntheticTenantGenerator(
+            SyntheticTenantConfig(tenant_id=TENANT_ID, employees=3, months=1, start_date=START_DATE, adjustment_rate=0)
+        ).generate()
+    finally:
+        drop_synthetic_tenant(TENANT_ID)
+
+
+def stored_summaries() -> List[DailyAttendanceSummaryRow]:
+    with SessionLocal() as session:
+        result = session.execute(
+            select(*(daily_attendance_summary.c[name] for name in DailyAttendanceSummaryRow._fields))
+            .where(daily_attendance_summary.c.tenant_id == TENANT_ID)
+            .order_by(daily_attendance_summary.c.id)
+        )
+        return list(map(DailyAttendanceSummaryRow._make, result))
+
+
+def stored_apuration() -> List[Tuple[int, date, int]]:
+    with SessionLocal() as session:
+        result = session.execute(
+            select(bank_hours_ledger.c.reference_id, bank_hours_ledger.c.event_date, bank_hours_ledger.c.minutes_delta)
+            .where(bank_hours_ledger.c.tenant_id == TENANT_ID)
+            .where(bank_hours_ledger.c.source == BankHoursSource.DAILY_APURATION)
+            .order_by(bank_hours_ledger.c.reference_id)
+        )
+        return [tuple(row) for row in result]
+
+
+def stored_rollup_days() -> List[RollupDay]:
+    with SessionLocal() as session:
+        result = session.execute(
+            select(
+                daily_attendance_rollup.c.work_date,
+                daily_attendance_rollup.c.status,
+                daily_attendance_rollup.c.shard,
+                daily_attendance_rollup.c.days_count,
+                daily_attendance_rollup.c.worked_minutes,
+            )
+            .where(daily_attendance_rollup.c.tenant_id == TENANT_ID)
+            .where(daily_attendance_rollup.c.days_count != 0)
+        )
+        return sorted((tuple(row) for row in result), key=rollup_order)
+
+
+def expected_rollup_days(summaries: List[DailyAttendanceSummaryRow]) -> List[RollupDay]:
+    rows: Dict[Tuple[date, DailyAttendanceStatus, int], Tuple[int, int]] = {}
+    for summary in summaries:
+        key = (summary.work_date, summary.status, summary.employee_id % ROLLUP_SHARDS)
+        days, worked = rows.get(key, (0, 0))
+        rows[key] = (days + 1, worked + summary.worked_minutes)
+    return sorted((key + value for key, value in rows.items()), key=rollup_order)
+
+
+def rollup_order(row: RollupDay) -> Tuple[date, str, int]:
+    return row[0], row[1].value, row[2]
+
+
+def test_should_recalculate_every_enrollment_in_batches(tenant):
+    report = ParallelRecalculationExecutor(workers=2).execute(TENANT_ID, START_DATE, END_DATE)
+
+    summaries = stored_summaries()
+    assert report.errors == []
+    assert report.employees_done == report.employees_total == len(tenant.enrollments)
+    assert report.summaries_count == len(summaries) > 0
+    assert stored_apuration() == [
+        (summary.id, summary.work_date, summary.overtime_minutes - summary.deficit_minutes)
+        for summary in summaries
+        if summary.status == DailyAttendanceStatus.OK and summary.overtime_minutes != summary.deficit_minutes
+    ]
+    assert stored_rollup_days() == expected_rollup_days(summaries)
+
+
+def test_should_keep_results_when_run_again(tenant, monkeypatch, capsys):
+    ParallelRecalculationExecutor(workers=1).execute(TENANT_ID, START_DATE, END_DATE)
+    summaries = stored_summaries()
+    apuration = stored_apuration()
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "recalculate.py",
+            f"--tenant-id={TENANT_ID}",
+            f"--start-date={START_DATE}",
+            f"--end-date={END_DATE}",
+            "--workers=2",
+        ],
+    )
+
+    assert main() == 0
+
+    assert capsys.readouterr().out == f"employees={len(tenant.enrollments)} summaries={len(summaries)} errors=0\n"
+    assert stored_summaries() == summaries
+    assert stored_apuration() == apuration
+    assert stored_rollup_days() == expected_rollup_days(summaries)
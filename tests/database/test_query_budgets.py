@@ -0,0 +1,41 @@
+# pylint: disable=W0613
+# pyright: reportUnknownParameterType=false
+# pyright: reportMissingParameterType=false
+from typing import Iterator
+
+import pytest
+
+from benchmarks.synthetic_tenant import (
+    SyntheticTenantConfig,
+    SyntheticTenantGenerator,
+    drop_synthetic_tenant,
+)
+from tests.fixtures.query_budget_check import QUERY_BUDGETS, SHIFT, QueryBudgetCheck
+
+TENANT_ID = 920_001
+
+
+@pytest.fixture(scope="module")
+def budget_check(database) -> Iterator[QueryBudgetCheck]:
+    drop_synthetic_tenant(TENANT_ID)
+    tenant = SyntheticTenantGenerator(
+        SyntheticTenantConfig(tenant_id=TENANT_ID, employees=2, months=1, adjustment_rate=0)
+    ).generate()
+    try:
+        yield QueryBudgetCheck(tenant)
+    finally:
+        drop_synthetic_tenant(TENANT_ID)
+
+
+@pytest.mark.parametrize("scenario", list(QUERY_BUDGETS))
+def test_should_stay_within_query_budget(budget_check, scenario):
+    counter = budget_check.measure(scenario)
+
+    assert counter.count <= QUERY_BUDGETS[scenario], "\n".join(counter.statements)
+
+
+def test_should_not_grow_queries_with_time_adjustment_items(budget_check):
+    single = budget_check.measure_apply_time_adjustment_request(1)
+    full_shift = budget_check.measure_apply_time_adjustment_request(len(SHIFT))
+
+    assert full_shift.count <= single.count, "\n".join(full_shift.statements)
@@ -0,0 +1,46 @@
+# pylint: disable=W0613
+# pyright: reportUnknownParameterType=false
+# pyright: reportMissingParameterType=false
+from datetime import date
+from typing import Iterator
+
+import pytest
+
+from benchmarks.synthetic_tenant import (
+    SyntheticTenant,
+    SyntheticTenantConfig,
+    SyntheticTenantGenerator,
+    drop_synthetic_tenant,
+)
+from tests.fixtures.explain_check import ExplainCheck
+
+TENANT_ID = 920_002
+
+
+@pytest.fixture(scope="module")
+def tenant(database) -> Iterator[SyntheticTenant]:
+    drop_synthetic_tenant(TENANT_ID)
+    try:
+        yield SyntheticTenantGenerator(
+            SyntheticTenantConfig(
+                tenant_id=TENANT_ID,
+                employees=5,
+                months=2,
+                start_date=date(2026, 1, 1),
+                adjustment_rate=0.05,
+            )
+        ).generate()
+    finally:
+        drop_synthetic_tenant(TENANT_ID)
+
+
+def test_should_not_plan_sequential_scans(tenant):
+    results = ExplainCheck(tenant).run()
+
+    failures = [
+        f"{result.scenario}: {', '.join(result.seq_scans)}\n    {result.statement}"
+        for result in results
+        if result.seq_scans
+    ]
+    assert results
+    assert not failures, "\n".join(failures)
@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from domain.attendance_anomaly_kernel import count_occurrences, detect_punch_anomalies
+from domain.day_timeline_kernel import punch_columns
+from domain.enums import PunchType
+
+START = datetime(2026, 1, 5, 8, 0)
+
+
+def at(seconds: int) -> datetime:
+    return START + timedelta(seconds=seconds)
+
+
+def test_should_flag_punches_closer_than_min_gap_within_the_same_group():
+    rows = [
+        ("b", at(10), PunchType.IN),
+        ("a", at(4 * 3600 + 59), PunchType.BREAK_START),
+        ("a", at(0), PunchType.IN),
+        ("a", at(4 * 3600), PunchType.BREAK_START),
+        ("a", at(5 * 3600), PunchType.BREAK_END),
+        ("a", at(9 * 3600), PunchType.OUT),
+    ]
+    _, group_keys, punched_at, punch_types = punch_columns(rows)
+
+    batch = detect_punch_anomalies(group_keys, punched_at, punch_types, min_gap_seconds=60)
+
+    # Only the repeated BREAK_START is rapid; "b" punching 10s after "a" belongs to another group.
+    assert batch.rapid_punches.tolist() == [1]
+    assert batch.rapid_gap_seconds.tolist() == [59]
+
+
+def test_should_order_same_timestamp_punches_by_type_priority():
+    rows = [
+        ("a", at(0), PunchType.OUT),
+        ("a", at(0), PunchType.IN),
+    ]
+    _, group_keys, punched_at, punch_types = punch_columns(rows)
+
+    batch = detect_punch_anomalies(group_keys, punched_at, punch_types, min_gap_seconds=60)
+
+    # IN sorts first, so the OUT is the rapid punch and it closes the shift.
+    assert batch.rapid_punches.tolist() == [0]
+    assert batch.rapid_gap_seconds.tolist() == [0]
+    assert batch.open_groups.tolist() == []
+
+
+def test_should_report_groups_left_open():
+    rows = [
+        ("closed", at(0), PunchType.IN),
+        ("closed", at(3600), PunchType.OUT),
+        ("working", at(0), PunchType.IN),
+        ("on_break", at(0), PunchType.IN),
+        ("on_break", at(3600), PunchType.BREAK_START),
+        ("back", at(0), PunchType.IN),
+        ("back", at(3600), PunchType.BREAK_START),
+        ("back", at(7200), PunchType.BREAK_END),
+    ]
+    keys, group_keys, punched_at, punch_types = punch_columns(rows)
+
+    batch = detect_punch_anomalies(group_keys, punched_at, punch_types, min_gap_seconds=60)
+
+    assert sorted(keys[code] for code in batch.open_groups.tolist()) == ["back", "on_break", "working"]
+    assert batch.rapid_punches.size == 0
+
+
+def test_should_return_empty_batch_without_punches():
+    empty = np.zeros(0, dtype=np.int64)
+
+    batch = detect_punch_anomalies(empty, empty, empty, min_gap_seconds=60)
+
+    assert batch.rapid_punches.size == 0
+    assert batch.rapid_gap_seconds.size == 0
+    assert batch.open_groups.size == 0
+
+
+def test_should_count_occurrences_of_each_value():
+    assert count_occurrences(np.array([3, 1, 3, 2, 3])).tolist() == [3, 1, 3, 1, 3]
+    assert count_occurrences(np.zeros(0, dtype=np.int64)).tolist() == []
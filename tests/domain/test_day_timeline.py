@@ -0,0 +1,179 @@
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+import pytest
+
+from domain import DayTimeline, TimePunch
+from domain.enums import PunchType
+
+DAY = datetime(2026, 1, 5)
+
+
+def at(hour: int, minute: int = 0) -> datetime:
+    return DAY + timedelta(hours=hour, minutes=minute)
+
+
+def timeline(punches: List[Tuple[datetime, PunchType]]) -> DayTimeline:
+    return DayTimeline(
+        TimePunch(
+            tenant_id=1,
+            employee_id=1,
+            matricula="MAT-0001",
+            punched_at=punched_at,
+            punch_type=punch_type,
+        )
+        for punched_at, punch_type in punches
+    )
+
+
+def appended(punches: List[Tuple[datetime, PunchType]]) -> DayTimeline:
+    result = DayTimeline()
+    for punched_at, punch_type in punches:
+        assert result.can_append(punched_at, punch_type)
+        result.append(punched_at, punch_type)
+    return result
+
+
+INVALID_SEQUENCES = [
+    (
+        [(at(8), PunchType.IN), (at(9), PunchType.IN)],
+        "Invalid sequence: IN cannot happen twice in a row.",
+    ),
+    (
+        [(at(8), PunchType.OUT)],
+        "Invalid sequence: OUT requires an open shift.",
+    ),
+    (
+        [(at(8), PunchType.IN), (at(12), PunchType.BREAK_START), (at(13), PunchType.OUT)],
+        "Invalid sequence: OUT is not allowed while break is open.",
+    ),
+    (
+        [(at(12), PunchType.BREAK_START)],
+        "Invalid sequence: BREAK_START requires IN before it.",
+    ),
+    (
+        [(at(8), PunchType.IN), (at(12), PunchType.BREAK_START), (at(13), PunchType.BREAK_START)],
+        "Invalid sequence: BREAK_START already opened.",
+    ),
+    (
+        [(at(13), PunchType.BREAK_END)],
+        "Invalid sequence: BREAK_END requires IN before it.",
+    ),
+    (
+        [(at(8), PunchType.IN), (at(13), PunchType.BREAK_END)],
+        "Invalid sequence: BREAK_END requires BREAK_START.",
+    ),
+]
+
+
+@pytest.mark.parametrize("punches, error", INVALID_SEQUENCES)
+def test_should_flag_invalid_transitions(punches: List[Tuple[datetime, PunchType]], error: str):
+    built = timeline(punches)
+    extended = appended(punches)
+
+    for result in (built, extended):
+        assert result.error == error
+        assert not result.is_valid
+        assert not result.is_complete
+        assert result.minutes() == (0, 0, False)
+        assert result.punches_count == len(punches)
+
+
+def test_should_keep_first_error_and_count_later_punches():
+    result = appended([(at(8), PunchType.OUT), (at(9), PunchType.IN), (at(17), PunchType.OUT)])
+
+    assert result.error == "Invalid sequence: OUT requires an open shift."
+    assert result.punches_count == 3
+
+
+def test_should_refuse_to_append_before_the_last_punch():
+    result = appended([(at(8), PunchType.IN), (at(12), PunchType.BREAK_START)])
+
+    assert not result.can_append(at(11, 59), PunchType.OUT)
+    # Same instant, but IN sorts before BREAK_START.
+    assert not result.can_append(at(12), PunchType.IN)
+    assert result.can_append(at(12), PunchType.BREAK_START)
+    assert result.can_append(at(12), PunchType.BREAK_END)
+
+    with pytest.raises(ValueError):
+        result.append(at(11, 59), PunchType.BREAK_END)
+    assert result.punches_count == 2
+    assert result.minutes() == (240, 0, False)
+
+
+def test_should_order_same_timestamp_punches_by_type_priority():
+    result = timeline(
+        [
+            (at(17), PunchType.OUT),
+            (at(12), PunchType.BREAK_END),
+            (at(12), PunchType.BREAK_START),
+            (at(8), PunchType.IN),
+        ]
+    )
+
+    assert result.is_valid
+    assert result.minutes() == (540, 0, True)
+
+
+def test_should_place_in_before_out_on_the_same_timestamp():
+    # IN has the lowest priority, so an OUT and IN at the same instant never close and reopen a shift.
+    result = timeline(
+        [
+            (at(8), PunchType.IN),
+            (at(12), PunchType.OUT),
+            (at(12), PunchType.IN),
+            (at(17), PunchType.OUT),
+        ]
+    )
+
+    assert result.error == "Invalid sequence: IN cannot happen twice in a row."
+
+
+def test_should_count_minutes_of_closed_shift():
+    result = timeline(
+        [
+            (at(8), PunchType.IN),
+            (at(12), PunchType.BREAK_START),
+            (at(13), PunchType.BREAK_END),
+            (at(17, 30), PunchType.OUT),
+        ]
+    )
+
+    assert result.minutes() == (510, 60, True)
+
+
+def test_should_count_minutes_of_open_shift():
+    after_break = timeline([(at(8), PunchType.IN), (at(12), PunchType.BREAK_START), (at(13), PunchType.BREAK_END)])
+    inside_break = timeline([(at(8), PunchType.IN), (at(12), PunchType.BREAK_START)])
+    just_started = timeline([(at(8), PunchType.IN)])
+
+    assert after_break.minutes() == (240, 60, False)
+    assert inside_break.minutes() == (240, 0, False)
+    assert just_started.minutes() == (0, 0, False)
+    assert DayTimeline().minutes() == (0, 0, True)
+
+
+def test_should_truncate_partial_minutes():
+    result = timeline([(at(8), PunchType.IN), (at(8, 59) + timedelta(seconds=59), PunchType.OUT)])
+
+    assert result.minutes() == (59, 0, True)
+
+
+EQUIVALENCE_SEQUENCES = [
+    [(at(8), PunchType.IN), (at(12), PunchType.BREAK_START), (at(13), PunchType.BREAK_END), (at(17), PunchType.OUT)],
+    [(at(8), PunchType.IN), (at(12), PunchType.OUT), (at(13), PunchType.IN), (at(18), PunchType.OUT)],
+    [(at(8), PunchType.IN), (at(12), PunchType.BREAK_START), (at(12), PunchType.BREAK_END)],
+    [(at(8), PunchType.IN), (at(8), PunchType.OUT), (at(9), PunchType.IN)],
+    [(at(8), PunchType.IN), (at(10), PunchType.IN), (at(17), PunchType.OUT)],
+]
+
+
+@pytest.mark.parametrize("punches", EQUIVALENCE_SEQUENCES)
+def test_should_match_replay_when_appending(punches: List[Tuple[datetime, PunchType]]):
+    for size in range(len(punches) + 1):
+        replayed = timeline(list(reversed(punches[:size])))
+        extended = appended(punches[:size])
+
+        assert extended.minutes() == replayed.minutes()
+        assert extended.error == replayed.error
+        assert extended.punches_count == replayed.punches_count == size
@@ -0,0 +1,101 @@
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from domain import DayTimeline, TimePunch
+from domain.day_timeline_kernel import compute_day_timelines, punch_columns
+from domain.enums import PunchType
+
+CYCLE = [PunchType.IN, PunchType.BREAK_START, PunchType.BREAK_END, PunchType.OUT]
+SEEDS = range(50)
+
+
+def random_day(generator: random.Random, start: datetime) -> List[Tuple[datetime, PunchType]]:
+    # Mostly well-formed shifts, with dropped, repeated, shuffled and simultaneous punches mixed in.
+    punches = []
+    punched_at = start
+    for index in range(generator.randint(0, 10)):
+        punched_at += timedelta(
+            minutes=generator.choice([0, 0, 1, generator.randint(1, 300)]),
+            seconds=generator.randint(0, 59),
+            microseconds=generator.choice([0, generator.randint(0, 999_999)]),
+        )
+        if generator.random() < 0.8:
+            punch_type = CYCLE[index % len(CYCLE)]
+        else:
+            punch_type = generator.choice(CYCLE)
+        punches.append((punched_at, punch_type))
+    generator.shuffle(punches)
+    return punches
+
+
+def random_days(seed: int) -> Dict[int, List[Tuple[datetime, PunchType]]]:
+    generator = random.Random(seed)
+    tzinfo = generator.choice([None, timezone.utc, timezone(timedelta(hours=-3))])
+    days = {}
+    for day in range(200):
+        start = datetime(2026, 1, 1, 6, 0, tzinfo=tzinfo) + timedelta(days=day % 60)
+        punches = random_day(generator, start)
+        if len(punches) > 0:
+            days[day] = punches
+    return days
+
+
+def scalar_timeline(punches: List[Tuple[datetime, PunchType]]) -> DayTimeline:
+    return DayTimeline(
+        TimePunch(
+            tenant_id=1,
+            employee_id=1,
+            matricula="MAT-0001",
+            punched_at=punched_at,
+            punch_type=punch_type,
+        )
+        for punched_at, punch_type in punches
+    )
+
+
+def test_should_match_day_timeline_for_random_punch_days():
+    for seed in SEEDS:
+        days = random_days(seed)
+        rows = [(day, punched_at, punch_type) for day, punches in days.items() for punched_at, punch_type in punches]
+        random.Random(seed).shuffle(rows)
+
+        keys, group_keys, punched_at, punch_types = punch_columns(rows)
+        batch = compute_day_timelines(group_keys, punched_at, punch_types)
+
+        assert len(batch.group_keys) == len(days)
+        for index, code in enumerate(batch.group_keys):
+            day = keys[code]
+            timeline = scalar_timeline(days[day])
+            assert (
+                int(batch.worked_minutes[index]),
+                int(batch.break_minutes[index]),
+                bool(batch.is_complete[index]),
+            ) == timeline.minutes(), f"seed={seed} day={day}"
+            assert bool(batch.is_valid[index]) == timeline.is_valid, f"seed={seed} day={day}"
+            assert int(batch.punches_count[index]) == timeline.punches_count, f"seed={seed} day={day}"
+
+
+def test_should_accept_datetime64_timestamps():
+    rows = [
+        (0, datetime(2026, 1, 5, 8, 0), PunchType.IN),
+        (0, datetime(2026, 1, 5, 12, 0), PunchType.BREAK_START),
+        (0, datetime(2026, 1, 5, 13, 0), PunchType.BREAK_END),
+        (0, datetime(2026, 1, 5, 17, 30), PunchType.OUT),
+    ]
+    _, group_keys, punched_at, punch_types = punch_columns(rows)
+
+    batch = compute_day_timelines(group_keys, punched_at.astype("datetime64[us]"), punch_types)
+
+    assert batch.worked_minutes.tolist() == [510]
+    assert batch.break_minutes.tolist() == [60]
+    assert batch.is_complete.tolist() == [True]
+
+
+def test_should_return_empty_batch_without_punches():
+    batch = compute_day_timelines(np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0))
+
+    assert batch.group_keys.size == 0
+    assert batch.is_valid.size == 0
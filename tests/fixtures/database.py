@@ -0,0 +1,22 @@
+from typing import Iterator
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from config import HOST_DB
+from infra.database_manager import SessionLocal
+from infra.mappers import import_mappers
+
+
+@pytest.fixture(scope="session")
+def database() -> Iterator[None]:
+    if HOST_DB is None:
+        pytest.skip("HOST_DB is not configured.")
+    try:
+        with SessionLocal() as session:
+            session.execute(text("SELECT 1"))
+    except OperationalError as error:
+        pytest.skip(f"Database is not reachable: {error.orig}")
+    import_mappers()
+    yield
@@ -0,0 +1,184 @@
+from dataclasses import dataclass
+from datetime import datetime, time
+from typing import Any, Callable, Dict, List, Tuple
+
+from sqlalchemy import text
+
+from application.dtos import CloseMonthDTO, GetMonthlyTimesheetDTO
+from application.repositories import RepositoryManagerInterface
+from application.usecases.monthly_closings import CloseMonthUseCase, ReopenMonthUseCase
+from application.usecases.timesheets import GetMonthlyTimesheetUseCase
+from domain import MonthlyTimesheet
+from domain.enums import DailyAttendanceStatus, TimeAdjustmentStatus
+from infra.database_manager import DatabaseManagerConnection
+from infra.repositories.repository_manager import RepositoryManager
+
+from benchmarks.synthetic_tenant import SyntheticTenant
+
+from .query_budget_check import QUERY_BUDGETS, QueryBudgetCheck
+from .query_counter import count_queries
+
+EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+
+@dataclass
+class PlanResult:
+    scenario: str
+    statement: str
+    seq_scans: List[str]
+
+
+Scenario = Callable[[RepositoryManagerInterface], object]
+
+
+def find_seq_scans(plan: Dict[str, Any]) -> List[str]:
+    found = []
+    if plan.get("Node Type") == "Seq Scan":
+        found.append(plan.get("Relation Name", "?"))
+    for child in plan.get("Plans", []):
+        found.extend(find_seq_scans(child))
+    return found
+
+
+class ExplainCheck:
+    def __init__(self, tenant: SyntheticTenant):
+        self.tenant = tenant
+        self.tenant_id = tenant.config.tenant_id
+        self.employee_id, self.matricula = tenant.enrollments[0]
+        self.start_date, self.end_date = MonthlyTimesheet.month_bounds(tenant.config.start_date)
+        self.start_at = datetime.combine(self.start_date, time.min)
+        self.end_at = datetime.combine(self.end_date, time.max)
+
+    def run(self) -> List[PlanResult]:
+        captured: Dict[str, Tuple[str, Any]] = {}
+        budget_check = QueryBudgetCheck(self.tenant)
+        with count_queries() as counter:
+            for name in QUERY_BUDGETS:
+                budget_check.measure(name)
+        self.__collect(captured, "write_use_cases", counter.statements, counter.parameters)
+
+        for name, scenario in self.__read_scenarios().items():
+            db_manager = DatabaseManagerConnection()
+            try:
+                with count_queries() as counter:
+                    scenario(RepositoryManager(db_manager))
+            finally:
+                db_manager.close_session()
+            self.__collect(captured, name, counter.statements, counter.parameters)
+
+        return self.__explain(captured)
+
+    def __read_scenarios(self) -> Dict[str, Scenario]:
+        return {
+            "list_time_punches": lambda manager: manager.time_punch_repository().find_all(
+                page=0, per_page=20, tenant_id=self.tenant_id, start_at=self.start_at, end_at=self.end_at
+            ),
+            "list_time_punch_rows_by_enrollment": lambda manager: manager.time_punch_repository().find_all_rows(
+                page=0, per_page=20, tenant_id=self.tenant_id, employee_id=self.employee_id, matricula=self.matricula
+            ),
+            "enrollments_with_punch_in_period": (
+                lambda manager: manager.time_punch_repository().find_enrollments_with_punch_in_period(
+                    tenant_id=self.tenant_id, start_at=self.start_at, end_at=self.end_at
+                )
+            ),
+            "list_daily_attendance_summaries": (
+                lambda manager: manager.daily_attendance_summary_repository().find_all(
+                    page=0,
+                    per_page=20,
+                    tenant_id=self.tenant_id,
+                    start_date=self.start_date,
+                    end_date=self.end_date,
+                    status=DailyAttendanceStatus.INCOMPLETE,
+                )
+            ),
+            "dirty_days": lambda manager: manager.daily_attendance_summary_repository().find_dirty_days(
+                tenant_id=self.tenant_id, start_date=self.start_date, end_date=self.end_date
+            ),
+            "list_bank_hours_ledger_rows": lambda manager: manager.bank_hours_ledger_repository().find_all_rows(
+                page=0, per_page=20, tenant_id=self.tenant_id, start_date=self.start_date, end_date=self.end_date
+            ),
+            "attendance_rollup_days": lambda manager: manager.daily_attendance_rollup_repository().find_daily_rows(
+                tenant_id=self.tenant_id, start_date=self.start_date, end_date=self.end_date
+            ),
+            "attendance_rollup_totals": lambda manager: manager.daily_attendance_rollup_repository().find_totals(
+                tenant_id=self.tenant_id, start_date=self.start_date, end_date=self.end_date
+            ),
+            "list_attendance_anomalies": lambda manager: manager.attendance_anomaly_repository().find_all(
+                page=0, per_page=20, tenant_id=self.tenant_id, start_date=self.start_date, end_date=self.end_date
+            ),
+            "claim_outbox_events": lambda manager: manager.outbox_event_repository().claim_batch(
+                limit=500, max_attempts=10
+            ),
+            "holiday_periods": lambda manager: manager.holiday_repository().find_periods_by_tenant(self.tenant_id),
+            "list_holidays": lambda manager: manager.holiday_repository().find_all(
+                page=0, per_page=20, tenant_id=self.tenant_id, start_date=self.start_date, end_date=self.end_date
+            ),
+            "bank_hours_balance": lambda manager: manager.bank_hours_ledger_repository().get_balance_until(
+                employee_id=self.employee_id, matricula=self.matricula, until_date=self.end_date
+            ),
+            "list_enrollment_policy_assignments": (
+                lambda manager: manager.enrollment_policy_assignment_repository().find_all(
+                    page=0, per_page=20, tenant_id=self.tenant_id, template_id=self.tenant.template_ids[0]
+                )
+            ),
+            "list_time_adjustment_requests": (
+                lambda manager: manager.time_adjustment_request_repository().find_all(
+                    page=0, per_page=20, tenant_id=self.tenant_id, status=TimeAdjustmentStatus.PENDING
+                )
+            ),
+            "list_work_policy_templates": lambda manager: manager.work_policy_template_repository().find_all(
+                page=0, per_page=20, tenant_id=self.tenant_id, name="Jornada"
+            ),
+            "monthly_timesheet": lambda manager: GetMonthlyTimesheetUseCase(manager).execute(
+                GetMonthlyTimesheetDTO(
+                    tenant_id=self.tenant_id,
+                    employee_id=self.employee_id,
+                    matricula=self.matricula,
+                    month=self.start_date,
+                )
+            ),
+            "close_and_reopen_month": self.__close_and_reopen_month,
+        }
+
+    def __close_and_reopen_month(self, manager: RepositoryManagerInterface) -> None:
+        closing = CloseMonthUseCase(manager).execute(CloseMonthDTO(tenant_id=self.tenant_id, month=self.start_date))
+        manager.monthly_closing_total_repository().find_all_rows(page=0, per_page=20, monthly_closing_id=closing.id)
+        GetMonthlyTimesheetUseCase(manager).execute(
+            GetMonthlyTimesheetDTO(
+                tenant_id=self.tenant_id,
+                employee_id=self.employee_id,
+                matricula=self.matricula,
+                month=self.start_date,
+            )
+        )
+        ReopenMonthUseCase(manager).execute(closing.id, self.tenant_id)
+
+    def __collect(
+        self,
+        captured: Dict[str, Tuple[str, Any]],
+        scenario: str,
+        statements: List[str],
+        parameters: List[Any],
+    ) -> None:
+        for statement, statement_parameters in zip(statements, parameters):
+            if statement_parameters is None or statement in captured:
+                continue
+            if statement.upper().startswith(EXPLAINABLE):
+                captured[statement] = (scenario, statement_parameters)
+
+    def __explain(self, captured: Dict[str, Tuple[str, Any]]) -> List[PlanResult]:
+        db_manager = DatabaseManagerConnection()
+        try:
+            # With sequential scans priced out, the planner only picks one when no index can serve the
+            # predicate, so the result does not depend on how many rows the seeded tenant has.
+            db_manager.session.execute(text("SET LOCAL enable_seqscan = off"))
+            connection = db_manager.session.connection()
+            results = []
+            for statement, (scenario, parameters) in captured.items():
+                plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar_one()
+                results.append(PlanResult(scenario, statement, find_seq_scans(plan[0]["Plan"])))
+            return results
+        finally:
+            db_manager.session.rollback()
+            db_manager.close_session()
+
@@ -0,0 +1,302 @@
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict
+
+from application.dtos import (
+    CreateBankHoursLedgerEntryDTO,
+    CreateEnrollmentPolicyAssignmentDTO,
+    CreateTimeAdjustmentItemDTO,
+    CreateTimeAdjustmentRequestDTO,
+    CreateTimePunchDTO,
+    CreateWorkPolicyTemplateDTO,
+    DecideTimeAdjustmentRequestDTO,
+    ImportBankHoursLedgerEntriesDTO,
+    ImportBankHoursLedgerEntryDTO,
+    RecalculateDailyAttendanceSummariesByPeriodDTO,
+    RecalculateDailyAttendanceSummaryDTO,
+    UpdateEnrollmentPolicyAssignmentDTO,
+    UpdateWorkPolicyTemplateDTO,
+)
+from application.repositories import RepositoryManagerInterface
+from application.usecases.bank_hours_ledgers import (
+    CreateBankHoursLedgerEntryUseCase,
+    ImportBankHoursLedgerEntriesUseCase,
+)
+from application.usecases.daily_attendance_summaries import (
+    RecalculateDailyAttendanceSummariesByPeriodUseCase,
+    RecalculateDailyAttendanceSummaryUseCase,
+)
+from application.usecases.enrollment_policy_assignments import (
+    CreateEnrollmentPolicyAssignmentUseCase,
+    DeleteEnrollmentPolicyAssignmentUseCase,
+    UpdateEnrollmentPolicyAssignmentUseCase,
+)
+from application.usecases.time_adjustment_requests import (
+    ApplyTimeAdjustmentRequestUseCase,
+    CreateTimeAdjustmentRequestUseCase,
+    DecideTimeAdjustmentRequestUseCase,
+    DeleteTimeAdjustmentRequestUseCase,
+)
+from application.usecases.time_punches import CreateTimePunchUseCase, DeleteTimePunchUseCase
+from application.usecases.work_policy_templates import (
+    CreateWorkPolicyTemplateUseCase,
+    DeleteWorkPolicyTemplateUseCase,
+    UpdateWorkPolicyTemplateUseCase,
+)
+from domain.enums import BankHoursSource, PunchType, TimeAdjustmentStatus, TimeAdjustmentType
+from infra.database_manager import DatabaseManagerConnection
+from infra.repositories.repository_manager import RepositoryManager
+
+from benchmarks.synthetic_tenant import REST_WEEKDAYS, SyntheticTenant, employee_id_for
+
+from .query_counter import QueryCounter, count_queries
+
+# Upper bounds on SQL statements per execution. Raising one of these should be a
+# deliberate decision in review, never a side effect of an unrelated change.
+QUERY_BUDGETS: Dict[str, int] = {
+    "create_work_policy_template": 3,
+    "update_work_policy_template": 6,
+    "delete_work_policy_template": 4,
+    "create_enrollment_policy_assignment": 6,
+    "update_enrollment_policy_assignment": 8,
+    "delete_enrollment_policy_assignment": 4,
+    "create_time_punch": 19,
+    "delete_time_punch": 15,
+    "recalculate_daily_summary": 17,
+    "recalculate_daily_summaries_by_period": 25,
+    "create_time_adjustment_request": 5,
+    "decide_time_adjustment_request": 5,
+    "apply_time_adjustment_request": 22,
+    "delete_time_adjustment_request": 5,
+    "create_bank_hours_ledger_entry": 6,
+    "import_bank_hours_ledger_entries": 6,
+}
+
+SHIFT = [(PunchType.IN, 8), (PunchType.BREAK_START, 12), (PunchType.BREAK_END, 13), (PunchType.OUT, 17)]
+
+
+Prepare = Callable[[RepositoryManagerInterface], Callable[[], object]]
+
+
+class QueryBudgetCheck:
+    def __init__(self, tenant: SyntheticTenant):
+        self.tenant = tenant
+        self.tenant_id = tenant.config.tenant_id
+        self.employee_id, self.matricula = tenant.enrollments[0]
+        self.free_day = tenant.end_date
+
+    def measure(self, name: str) -> QueryCounter:
+        scenarios: Dict[str, Prepare] = {
+            "create_work_policy_template": self.__create_work_policy_template,
+            "update_work_policy_template": self.__update_work_policy_template,
+            "delete_work_policy_template": self.__delete_work_policy_template,
+            "create_enrollment_policy_assignment": self.__create_enrollment_policy_assignment,
+            "update_enrollment_policy_assignment": self.__update_enrollment_policy_assignment,
+            "delete_enrollment_policy_assignment": self.__delete_enrollment_policy_assignment,
+            "create_time_punch": self.__create_time_punch,
+            "delete_time_punch": self.__delete_time_punch,
+            "recalculate_daily_summary": self.__recalculate_daily_summary,
+            "recalculate_daily_summaries_by_period": self.__recalculate_daily_summaries_by_period,
+            "create_time_adjustment_request": self.__create_time_adjustment_request,
+            "decide_time_adjustment_request": self.__decide_time_adjustment_request,
+            "apply_time_adjustment_request": lambda manager: self.__apply_time_adjustment_request(manager, 1),
+            "delete_time_adjustment_request": self.__delete_time_adjustment_request,
+            "create_bank_hours_ledger_entry": self.__create_bank_hours_ledger_entry,
+            "import_bank_hours_ledger_entries": self.__import_bank_hours_ledger_entries,
+        }
+        return self.__measure(scenarios[name])
+
+    def measure_apply_time_adjustment_request(self, items: int) -> QueryCounter:
+        return self.__measure(lambda manager: self.__apply_time_adjustment_request(manager, items))
+
+    def __measure(self, prepare: Prepare) -> QueryCounter:
+        db_manager = DatabaseManagerConnection()
+        try:
+            execute = prepare(RepositoryManager(db_manager))
+            db_manager.session.expunge_all()
+            with count_queries() as counter:
+                execute()
+            return counter
+        finally:
+            db_manager.close_session()
+
+    def __next_free_day(self) -> date:
+        # Working days only: a full shift on a rest day is all overtime and writes an apuration entry, so counts would
+        # depend on which scenarios ran before.
+        self.free_day += timedelta(days=1)
+        while self.free_day.weekday() in REST_WEEKDAYS:
+            self.free_day += timedelta(days=1)
+        return self.free_day
+
+    def __at(self, day: date, hour: int) -> datetime:
+        return datetime.combine(day, datetime.min.time()) + timedelta(hours=hour)
+
+    def __create_template(self, manager: RepositoryManagerInterface, name: str) -> int:
+        return CreateWorkPolicyTemplateUseCase(manager).execute(
+            CreateWorkPolicyTemplateDTO(
+                tenant_id=self.tenant_id, name=name, daily_work_minutes=480, break_minutes=60
+            )
+        ).id
+
+    def __create_assignment(self, manager: RepositoryManagerInterface, index: int) -> int:
+        return CreateEnrollmentPolicyAssignmentUseCase(manager).execute(
+            self.__assignment_dto(index)
+        ).id
+
+    def __assignment_dto(self, index: int) -> CreateEnrollmentPolicyAssignmentDTO:
+        return CreateEnrollmentPolicyAssignmentDTO(
+            tenant_id=self.tenant_id,
+            employee_id=employee_id_for(self.tenant_id, 90_000 + index),
+            matricula=f"MAT-BUDGET-{index}",
+            template_id=self.tenant.template_ids[0],
+            effective_from=self.tenant.config.start_date,
+        )
+
+    def __create_punch(self, manager: RepositoryManagerInterface, punched_at: datetime) -> int:
+        return CreateTimePunchUseCase(manager).execute(
+            CreateTimePunchDTO(
+                tenant_id=self.tenant_id,
+                employee_id=self.employee_id,
+                matricula=self.matricula,
+                punched_at=punched_at,
+                punch_type=PunchType.IN,
+                source="budget",
+            )
+        ).id
+
+    def __create_adjustment(self, manager: RepositoryManagerInterface, items: int) -> int:
+        request_date = self.__next_free_day()
+        return CreateTimeAdjustmentRequestUseCase(manager).execute(
+            CreateTimeAdjustmentRequestDTO(
+                tenant_id=self.tenant_id,
+                employee_id=self.employee_id,
+                matricula=self.matricula,
+                request_date=request_date,
+                request_type=TimeAdjustmentType.ADD_PUNCH,
+                reason="Query budget",
+                requester_user_id=self.employee_id,
+                items=[
+                    CreateTimeAdjustmentItemDTO(
+                        proposed_punch_type=punch_type,
+                        proposed_punched_at=self.__at(request_date, hour),
+                    )
+                    for punch_type, hour in SHIFT[:items]
+                ],
+            )
+        ).id
+
+    def __create_work_policy_template(self, manager: RepositoryManagerInterface):
+        return lambda: self.__create_template(manager, "Budget create")
+
+    def __update_work_policy_template(self, manager: RepositoryManagerInterface):
+        template_id = self.__create_template(manager, "Budget update")
+        return lambda: UpdateWorkPolicyTemplateUseCase(manager).execute(
+            template_id, self.tenant_id, UpdateWorkPolicyTemplateDTO(name="Budget updated", break_minutes=30)
+        )
+
+    def __delete_work_policy_template(self, manager: RepositoryManagerInterface):
+        template_id = self.__create_template(manager, "Budget delete")
+        return lambda: DeleteWorkPolicyTemplateUseCase(manager).execute(template_id, self.tenant_id)
+
+    def __create_enrollment_policy_assignment(self, manager: RepositoryManagerInterface):
+        return lambda: self.__create_assignment(manager, 1)
+
+    def __update_enrollment_policy_assignment(self, manager: RepositoryManagerInterface):
+        assignment_id = self.__create_assignment(manager, 2)
+        return lambda: UpdateEnrollmentPolicyAssignmentUseCase(manager).execute(
+            assignment_id,
+            self.tenant_id,
+            UpdateEnrollmentPolicyAssignmentDTO(
+                template_id=self.tenant.template_ids[1], effective_to=self.tenant.end_date
+            ),
+        )
+
+    def __delete_enrollment_policy_assignment(self, manager: RepositoryManagerInterface):
+        assignment_id = self.__create_assignment(manager, 3)
+        return lambda: DeleteEnrollmentPolicyAssignmentUseCase(manager).execute(
+            assignment_id, self.tenant_id
+        )
+
+    def __create_time_punch(self, manager: RepositoryManagerInterface):
+        punched_at = self.__at(self.__next_free_day(), 8)
+        return lambda: self.__create_punch(manager, punched_at)
+
+    def __delete_time_punch(self, manager: RepositoryManagerInterface):
+        punch_id = self.__create_punch(manager, self.__at(self.__next_free_day(), 8))
+        return lambda: DeleteTimePunchUseCase(manager).execute(punch_id, self.tenant_id)
+
+    def __recalculate_daily_summary(self, manager: RepositoryManagerInterface):
+        return lambda: RecalculateDailyAttendanceSummaryUseCase(manager).execute(
+            RecalculateDailyAttendanceSummaryDTO(
+                tenant_id=self.tenant_id,
+                employee_id=self.employee_id,
+                matricula=self.matricula,
+                work_date=self.tenant.config.start_date,
+            )
+        )
+
+    def __recalculate_daily_summaries_by_period(self, manager: RepositoryManagerInterface):
+        # One working week: the per-day cost is the single-day recalculation minus the punch query and the work
+        # calendar lookup, which run once for the whole period.
+        return lambda: RecalculateDailyAttendanceSummariesByPeriodUseCase(manager).execute(
+            RecalculateDailyAttendanceSummariesByPeriodDTO(
+                tenant_id=self.tenant_id,
+                employee_id=self.employee_id,
+                matricula=self.matricula,
+                start_date=self.tenant.config.start_date,
+                end_date=self.tenant.config.start_date + timedelta(days=6),
+            )
+        )
+
+    def __create_time_adjustment_request(self, manager: RepositoryManagerInterface):
+        return lambda: self.__create_adjustment(manager, 1)
+
+    def __decide_time_adjustment_request(self, manager: RepositoryManagerInterface):
+        request_id = self.__create_adjustment(manager, 1)
+        return lambda: self.__approve(manager, request_id)
+
+    def __approve(self, manager: RepositoryManagerInterface, request_id: int):
+        return DecideTimeAdjustmentRequestUseCase(manager).execute(
+            request_id,
+            self.tenant_id,
+            DecideTimeAdjustmentRequestDTO(
+                status=TimeAdjustmentStatus.APPROVED, decided_by_user_id=self.employee_id
+            ),
+        )
+
+    def __apply_time_adjustment_request(self, manager: RepositoryManagerInterface, items: int):
+        request_id = self.__create_adjustment(manager, items)
+        self.__approve(manager, request_id)
+        return lambda: ApplyTimeAdjustmentRequestUseCase(manager).execute(request_id, self.tenant_id)
+
+    def __delete_time_adjustment_request(self, manager: RepositoryManagerInterface):
+        request_id = self.__create_adjustment(manager, 1)
+        return lambda: DeleteTimeAdjustmentRequestUseCase(manager).execute(request_id, self.tenant_id)
+
+    def __create_bank_hours_ledger_entry(self, manager: RepositoryManagerInterface):
+        return lambda: CreateBankHoursLedgerEntryUseCase(manager).execute(
+            CreateBankHoursLedgerEntryDTO(
+                tenant_id=self.tenant_id,
+                employee_id=self.employee_id,
+                matricula=self.matricula,
+                event_date=self.tenant.config.start_date,
+                minutes_delta=30,
+                source=BankHoursSource.MANUAL_ADJUST,
+            )
+        )
+
+    def __import_bank_hours_ledger_entries(self, manager: RepositoryManagerInterface):
+        # A thousand rows fit in one insertmanyvalues batch, so the budget does not grow with the file.
+        entries = [
+            ImportBankHoursLedgerEntryDTO(
+                line=line,
+                employee_id=self.employee_id,
+                matricula=self.matricula,
+                event_date=self.tenant.config.start_date + timedelta(days=line % 28),
+                minutes_delta=line,
+            )
+            for line in range(2, 1002)
+        ]
+        return lambda: ImportBankHoursLedgerEntriesUseCase(manager).execute(
+            ImportBankHoursLedgerEntriesDTO(tenant_id=self.tenant_id, entries=entries)
+        )
+
@@ -0,0 +1,33 @@
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@dataclass
+class QueryCounter:
+    statements: List[str] = field(default_factory=list)
+    # Bound parameters of each statement, None for executemany batches.
+    parameters: List[Any] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    counter = QueryCounter()
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        _ = (conn, cursor, context)
+        counter.statements.append(" ".join(statement.split()))
+        counter.parameters.append(None if executemany else parameters)
+
+    event.listen(Engine, "after_cursor_execute", record)
+    try:
+        yield counter
+    finally:
+        event.remove(Engine, "after_cursor_execute", record)
@@ -0,0 +1,122 @@
+import asyncio
+import threading
+from datetime import date, datetime
+
+from domain import AttendanceChange, TimePunchRow
+from domain.enums import AttendanceChangeType, PunchType
+from infra.integrations import AttendanceChangeBroker
+from infra.integrations.attendance_change_broker import encode_frame
+
+
+def punch_change(tenant_id: int, punch_id: int) -> AttendanceChange:
+    punched_at = datetime(2026, 1, 5, 8, 0)
+    return AttendanceChange(
+        change_type=AttendanceChangeType.TIME_PUNCH_CREATED,
+        tenant_id=tenant_id,
+        employee_id=501,
+        matricula="MAT-0001",
+        work_date=date(2026, 1, 5),
+        punch=TimePunchRow(punch_id, tenant_id, 501, "MAT-0001", punched_at, PunchType.IN, "web", None),
+    )
+
+
+def test_should_encode_change_as_server_sent_event():
+    frame = encode_frame(punch_change(1, 10))
+
+    assert frame.startswith(b"event: TIME_PUNCH_CREATED\ndata: {")
+    assert b'"punch":{"id":10,' in frame
+    assert frame.endswith(b"}\n\n")
+
+
+def test_should_deliver_changes_only_to_subscribers_of_the_tenant():
+    async def scenario():
+        broker = AttendanceChangeBroker(buffer_size=10)
+        broker.publish(punch_change(1, 1))
+        tenant = broker.subscribe(1)
+        other_tenant = broker.subscribe(2)
+
+        broker.publish(punch_change(1, 2))
+        broker.publish(punch_change(1, 3))
+
+        assert await tenant.next_frames(timeout=1) == encode_frame(punch_change(1, 2)) + encode_frame(
+            punch_change(1, 3)
+        )
+        assert await other_tenant.next_frames(timeout=0.01) == b""
+
+    asyncio.run(scenario())
+
+
+def test_should_drop_subscriber_that_falls_behind():
+    async def scenario():
+        broker = AttendanceChangeBroker(buffer_size=2)
+        slow = broker.subscribe(1)
+        reading = broker.subscribe(1)
+
+        broker.publish(punch_change(1, 1))
+        broker.publish(punch_change(1, 2))
+        assert await reading.next_frames(timeout=1) != b""
+        broker.publish(punch_change(1, 3))
+        await asyncio.sleep(0)
+
+        assert slow.closed
+        assert not reading.closed
+        assert broker.subscriber_count() == 1
+        # Frames queued before the overflow are still handed over before the stream ends.
+        assert await slow.next_frames(timeout=1) == encode_frame(punch_change(1, 1)) + encode_frame(
+            punch_change(1, 2)
+        )
+        assert await reading.next_frames(timeout=1) == encode_frame(punch_change(1, 3))
+
+    asyncio.run(scenario())
+
+
+def test_should_wake_waiting_reader_on_close():
+    async def scenario():
+        broker = AttendanceChangeBroker(buffer_size=10)
+        subscription = broker.subscribe(1)
+        reader = asyncio.ensure_future(subscription.next_frames(timeout=30))
+        await asyncio.sleep(0)
+
+        subscription.close()
+
+        assert await asyncio.wait_for(reader, timeout=1) == b""
+        assert subscription.closed
+
+    asyncio.run(scenario())
+
+
+def test_should_return_empty_frames_after_timeout():
+    async def scenario():
+        broker = AttendanceChangeBroker(buffer_size=10)
+        subscription = broker.subscribe(1)
+
+        assert await subscription.next_frames(timeout=0.01) == b""
+        assert not subscription.closed
+
+    asyncio.run(scenario())
+
+
+def test_should_accept_publish_from_another_thread():
+    async def scenario():
+        broker = AttendanceChangeBroker(buffer_size=10)
+        subscription = broker.subscribe(1)
+        publisher = threading.Thread(target=broker.publish, args=(punch_change(1, 7),))
+
+        publisher.start()
+        frames = await subscription.next_frames(timeout=5)
+        publisher.join()
+
+        assert frames == encode_frame(punch_change(1, 7))
+
+    asyncio.run(scenario())
+
+
+def test_should_ignore_publish_after_serving_loop_closed():
+    broker = AttendanceChangeBroker(buffer_size=10)
+
+    async def scenario():
+        broker.subscribe(1)
+
+    asyncio.run(scenario())
+
+    broker.publish(punch_change(1, 1))